@@ -18,6 +18,8 @@ from homeassistant.exceptions import ConfigEntryNotReady, ServiceValidationError
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import device_registry as dr
 
+from .bed_group import BedGroup
+from .command_queue import CommandPriority
 from .const import (
     BED_TYPE_ERGOMOTION,
     BED_TYPE_KEESON,
@@ -32,7 +34,10 @@ from .const import (
     requires_pairing,
 )
 from .coordinator import AdjustableBedCoordinator
+from .gatt_cache import async_remove_gatt_cache
+from .motion_model import async_remove_motion_models
 from .unsupported import create_pairing_required_issue
+from .usage_model import async_remove_usage_model
 
 # Service constants
 SERVICE_GOTO_PRESET = "goto_preset"
@@ -41,10 +46,12 @@ SERVICE_STOP_ALL = "stop_all"
 SERVICE_RUN_DIAGNOSTICS = "run_diagnostics"
 SERVICE_GENERATE_SUPPORT_REPORT = "generate_support_report"
 SERVICE_SET_POSITION = "set_position"
+SERVICE_SET_POSITIONS = "set_positions"
 SERVICE_TIMED_MOVE = "timed_move"
 ATTR_PRESET = "preset"
 ATTR_MOTOR = "motor"
 ATTR_POSITION = "position"
+ATTR_POSITIONS = "positions"
 ATTR_TARGET_ADDRESS = "target_address"
 ATTR_CAPTURE_DURATION = "capture_duration"
 ATTR_INCLUDE_LOGS = "include_logs"
@@ -188,6 +195,7 @@ async def _async_register_services(hass: HomeAssistant) -> None:
 
         _LOGGER.info("Service goto_preset called: preset=%d", preset)
 
+        coordinators: list[AdjustableBedCoordinator] = []
         for device_id in device_ids:
             coordinator = await _get_coordinator_from_device(hass, device_id)
             if coordinator:
@@ -214,9 +222,7 @@ async def _async_register_services(hass: HomeAssistant) -> None:
                             "requested_preset": str(preset),
                         },
                     )
-                await coordinator.async_execute_controller_command(
-                    lambda ctrl, p=preset: ctrl.preset_memory(p)  # type: ignore[misc]
-                )
+                coordinators.append(coordinator)
             else:
                 raise ServiceValidationError(
                     f"Could not find Adjustable Bed device with ID {device_id}",
@@ -225,6 +231,15 @@ async def _async_register_services(hass: HomeAssistant) -> None:
                     translation_placeholders={"device_id": device_id},
                 )
 
+        # Validate every bed before moving any, then move them together
+        await BedGroup(coordinators).async_run(
+            lambda coord, anchor: coord.async_execute_controller_command(
+                lambda ctrl, p=preset: ctrl.preset_memory(p),  # type: ignore[misc]
+                priority=CommandPriority.PRESET,
+                pulse_anchor=anchor,
+            )
+        )
+
     async def handle_save_preset(call: ServiceCall) -> None:
         """Handle save_preset service call."""
         preset = call.data[ATTR_PRESET]
@@ -261,6 +276,7 @@ async def _async_register_services(hass: HomeAssistant) -> None:
                 await coordinator.async_execute_controller_command(
                     lambda ctrl, p=preset: ctrl.program_memory(p),  # type: ignore[misc]
                     cancel_running=False,
+                    priority=CommandPriority.PRESET,
                 )
             else:
                 raise ServiceValidationError(
@@ -277,14 +293,20 @@ async def _async_register_services(hass: HomeAssistant) -> None:
         _LOGGER.info("Service stop_all called")
 
         missing_device_ids: list[str] = []
+        coordinators: list[AdjustableBedCoordinator] = []
 
         for device_id in device_ids:
             coordinator = await _get_coordinator_from_device(hass, device_id)
             if coordinator:
-                await coordinator.async_stop_command()
+                coordinators.append(coordinator)
             else:
                 missing_device_ids.append(device_id)
 
+        # Stop all beds at once; never wait for a connection to do so
+        await BedGroup(coordinators).async_run(
+            lambda coord, _anchor: coord.async_stop_command(), prepare=False
+        )
+
         if missing_device_ids:
             raise ServiceValidationError(
                 f"Could not find Adjustable Bed device(s) with ID(s): {', '.join(missing_device_ids)}",
@@ -328,138 +350,121 @@ async def _async_register_services(hass: HomeAssistant) -> None:
         ),
     )
 
-    async def handle_set_position(call: ServiceCall) -> None:
-        """Handle set_position service call."""
-        device_ids = call.data.get(CONF_DEVICE_ID, [])
-        motor = call.data[ATTR_MOTOR]
-        position = call.data[ATTR_POSITION]
-
-        _LOGGER.info(
-            "Service set_position called: motor=%s, position=%.1f%%",
-            motor,
-            position,
-        )
-
-        for device_id in device_ids:
-            coordinator = await _get_coordinator_from_device(hass, device_id)
-            if not coordinator:
-                raise ServiceValidationError(
-                    f"Could not find Adjustable Bed device with ID {device_id}",
-                    translation_domain=DOMAIN,
-                    translation_key="device_not_found",
-                    translation_placeholders={"device_id": device_id},
-                )
-
-            # Get config entry for bed type and motor count
-            entry: ConfigEntry | None = None
-            for entry_id, coord in hass.data[DOMAIN].items():
-                if coord is coordinator:
-                    entry = hass.config_entries.async_get_entry(entry_id)
-                    break
+    def _position_motor_configs(
+        coordinator: AdjustableBedCoordinator, device_id: str, targets: dict[str, float]
+    ) -> dict[str, dict[str, Any]]:
+        """Validate motor position targets for a device and return their motor configs."""
+        # Get config entry for bed type and motor count
+        entry: ConfigEntry | None = None
+        for entry_id, coord in hass.data[DOMAIN].items():
+            if coord is coordinator:
+                entry = hass.config_entries.async_get_entry(entry_id)
+                break
 
-            if not entry:
-                raise ServiceValidationError(
-                    f"Could not find config entry for device {device_id}",
-                    translation_domain=DOMAIN,
-                    translation_key="device_not_found",
-                    translation_placeholders={"device_id": device_id},
-                )
+        if not entry:
+            raise ServiceValidationError(
+                f"Could not find config entry for device {device_id}",
+                translation_domain=DOMAIN,
+                translation_key="device_not_found",
+                translation_placeholders={"device_id": device_id},
+            )
 
-            bed_type = entry.data.get(CONF_BED_TYPE)
-            motor_count = entry.data.get(CONF_MOTOR_COUNT, DEFAULT_MOTOR_COUNT)
-            protocol_variant = entry.data.get(CONF_PROTOCOL_VARIANT)
+        bed_type = entry.data.get(CONF_BED_TYPE)
+        motor_count = entry.data.get(CONF_MOTOR_COUNT, DEFAULT_MOTOR_COUNT)
+        protocol_variant = entry.data.get(CONF_PROTOCOL_VARIANT)
 
-            # Validate bed supports position feedback
-            # Special case: BED_TYPE_KEESON only supports position feedback with ergomotion variant
-            has_position_feedback = bed_type in BEDS_WITH_POSITION_FEEDBACK or (
-                bed_type == BED_TYPE_KEESON
-                and protocol_variant == KEESON_VARIANT_ERGOMOTION
+        # Validate bed supports position feedback
+        # Special case: BED_TYPE_KEESON only supports position feedback with ergomotion variant
+        has_position_feedback = bed_type in BEDS_WITH_POSITION_FEEDBACK or (
+            bed_type == BED_TYPE_KEESON
+            and protocol_variant == KEESON_VARIANT_ERGOMOTION
+        )
+        if not has_position_feedback:
+            raise ServiceValidationError(
+                f"Device '{coordinator.name}' (type: {bed_type}) does not support position feedback",
+                translation_domain=DOMAIN,
+                translation_key="position_feedback_not_supported",
+                translation_placeholders={
+                    "device_name": coordinator.name,
+                    "bed_type": bed_type or "unknown",
+                },
             )
-            if not has_position_feedback:
-                raise ServiceValidationError(
-                    f"Device '{coordinator.name}' (type: {bed_type}) does not support position feedback",
-                    translation_domain=DOMAIN,
-                    translation_key="position_feedback_not_supported",
-                    translation_placeholders={
-                        "device_name": coordinator.name,
-                        "bed_type": bed_type or "unknown",
-                    },
-                )
 
-            # Validate angle sensing is enabled
-            if coordinator.disable_angle_sensing:
-                raise ServiceValidationError(
-                    f"Angle sensing is disabled for device '{coordinator.name}'",
-                    translation_domain=DOMAIN,
-                    translation_key="angle_sensing_disabled",
-                    translation_placeholders={"device_name": coordinator.name},
-                )
-
-            # Define motor configurations
-            # For Keeson/Ergomotion: only head and feet are valid, they map to back/legs keys
-            # For standard beds: based on motor_count (2=back/legs, 3=+head, 4=+feet)
-            is_keeson_ergomotion = bed_type in (BED_TYPE_KEESON, BED_TYPE_ERGOMOTION)
+        # Validate angle sensing is enabled
+        if coordinator.disable_angle_sensing:
+            raise ServiceValidationError(
+                f"Angle sensing is disabled for device '{coordinator.name}'",
+                translation_domain=DOMAIN,
+                translation_key="angle_sensing_disabled",
+                translation_placeholders={"device_name": coordinator.name},
+            )
 
-            if is_keeson_ergomotion:
-                # Keeson/Ergomotion only have head and feet motors
-                valid_motors = {"head", "feet"}
-                motor_configs = {
-                    "head": {
-                        "position_key": "back",  # Maps to "back" in position_data
-                        "move_up_fn": lambda ctrl: ctrl.move_head_up(),
-                        "move_down_fn": lambda ctrl: ctrl.move_head_down(),
-                        "move_stop_fn": lambda ctrl: ctrl.move_head_stop(),
-                        "max_value": 100.0,  # Percentage
-                    },
-                    "feet": {
-                        "position_key": "legs",  # Maps to "legs" in position_data
-                        "move_up_fn": lambda ctrl: ctrl.move_feet_up(),
-                        "move_down_fn": lambda ctrl: ctrl.move_feet_down(),
-                        "move_stop_fn": lambda ctrl: ctrl.move_feet_stop(),
-                        "max_value": 100.0,  # Percentage
-                    },
-                }
-            else:
-                # Standard beds: motor availability depends on motor_count
-                motor_configs = {
-                    "back": {
-                        "position_key": "back",
-                        "move_up_fn": lambda ctrl: ctrl.move_back_up(),
-                        "move_down_fn": lambda ctrl: ctrl.move_back_down(),
-                        "move_stop_fn": lambda ctrl: ctrl.move_back_stop(),
-                        "max_value": 68.0,  # Degrees
-                        "min_motors": 2,
-                    },
-                    "legs": {
-                        "position_key": "legs",
-                        "move_up_fn": lambda ctrl: ctrl.move_legs_up(),
-                        "move_down_fn": lambda ctrl: ctrl.move_legs_down(),
-                        "move_stop_fn": lambda ctrl: ctrl.move_legs_stop(),
-                        "max_value": 45.0,  # Degrees
-                        "min_motors": 2,
-                    },
-                    "head": {
-                        "position_key": "head",
-                        "move_up_fn": lambda ctrl: ctrl.move_head_up(),
-                        "move_down_fn": lambda ctrl: ctrl.move_head_down(),
-                        "move_stop_fn": lambda ctrl: ctrl.move_head_stop(),
-                        "max_value": 68.0,  # Degrees
-                        "min_motors": 3,
-                    },
-                    "feet": {
-                        "position_key": "feet",
-                        "move_up_fn": lambda ctrl: ctrl.move_feet_up(),
-                        "move_down_fn": lambda ctrl: ctrl.move_feet_down(),
-                        "move_stop_fn": lambda ctrl: ctrl.move_feet_stop(),
-                        "max_value": 45.0,  # Degrees
-                        "min_motors": 4,
-                    },
-                }
-                # Filter to valid motors based on motor_count
-                valid_motors = {
-                    m for m, cfg in motor_configs.items() if motor_count >= cfg.get("min_motors", 2)
-                }
+        # Define motor configurations
+        # For Keeson/Ergomotion: only head and feet are valid, they map to back/legs keys
+        # For standard beds: based on motor_count (2=back/legs, 3=+head, 4=+feet)
+        is_keeson_ergomotion = bed_type in (BED_TYPE_KEESON, BED_TYPE_ERGOMOTION)
+
+        if is_keeson_ergomotion:
+            # Keeson/Ergomotion only have head and feet motors
+            valid_motors = {"head", "feet"}
+            motor_configs: dict[str, dict[str, Any]] = {
+                "head": {
+                    "position_key": "back",  # Maps to "back" in position_data
+                    "move_up_fn": lambda ctrl: ctrl.move_head_up(),
+                    "move_down_fn": lambda ctrl: ctrl.move_head_down(),
+                    "move_stop_fn": lambda ctrl: ctrl.move_head_stop(),
+                    "max_value": 100.0,  # Percentage
+                },
+                "feet": {
+                    "position_key": "legs",  # Maps to "legs" in position_data
+                    "move_up_fn": lambda ctrl: ctrl.move_feet_up(),
+                    "move_down_fn": lambda ctrl: ctrl.move_feet_down(),
+                    "move_stop_fn": lambda ctrl: ctrl.move_feet_stop(),
+                    "max_value": 100.0,  # Percentage
+                },
+            }
+        else:
+            # Standard beds: motor availability depends on motor_count
+            motor_configs = {
+                "back": {
+                    "position_key": "back",
+                    "move_up_fn": lambda ctrl: ctrl.move_back_up(),
+                    "move_down_fn": lambda ctrl: ctrl.move_back_down(),
+                    "move_stop_fn": lambda ctrl: ctrl.move_back_stop(),
+                    "max_value": 68.0,  # Degrees
+                    "min_motors": 2,
+                },
+                "legs": {
+                    "position_key": "legs",
+                    "move_up_fn": lambda ctrl: ctrl.move_legs_up(),
+                    "move_down_fn": lambda ctrl: ctrl.move_legs_down(),
+                    "move_stop_fn": lambda ctrl: ctrl.move_legs_stop(),
+                    "max_value": 45.0,  # Degrees
+                    "min_motors": 2,
+                },
+                "head": {
+                    "position_key": "head",
+                    "move_up_fn": lambda ctrl: ctrl.move_head_up(),
+                    "move_down_fn": lambda ctrl: ctrl.move_head_down(),
+                    "move_stop_fn": lambda ctrl: ctrl.move_head_stop(),
+                    "max_value": 68.0,  # Degrees
+                    "min_motors": 3,
+                },
+                "feet": {
+                    "position_key": "feet",
+                    "move_up_fn": lambda ctrl: ctrl.move_feet_up(),
+                    "move_down_fn": lambda ctrl: ctrl.move_feet_down(),
+                    "move_stop_fn": lambda ctrl: ctrl.move_feet_stop(),
+                    "max_value": 45.0,  # Degrees
+                    "min_motors": 4,
+                },
+            }
+            # Filter to valid motors based on motor_count
+            valid_motors = {
+                m for m, cfg in motor_configs.items() if motor_count >= cfg.get("min_motors", 2)
+            }
 
+        for motor, position in targets.items():
             # Validate motor is valid for this bed
             if motor not in valid_motors:
                 raise ServiceValidationError(
@@ -474,8 +479,7 @@ async def _async_register_services(hass: HomeAssistant) -> None:
                     },
                 )
 
-            config = motor_configs[motor]
-            max_value = config["max_value"]
+            max_value = motor_configs[motor]["max_value"]
 
             # Validate position is in range
             if position < 0 or position > max_value:
@@ -493,15 +497,50 @@ async def _async_register_services(hass: HomeAssistant) -> None:
                     },
                 )
 
-            # Call async_seek_position
-            await coordinator.async_seek_position(
+        return {motor: motor_configs[motor] for motor in targets}
+
+    async def handle_set_position(call: ServiceCall) -> None:
+        """Handle set_position service call."""
+        device_ids = call.data.get(CONF_DEVICE_ID, [])
+        motor = call.data[ATTR_MOTOR]
+        position = call.data[ATTR_POSITION]
+
+        _LOGGER.info(
+            "Service set_position called: motor=%s, position=%.1f%%",
+            motor,
+            position,
+        )
+
+        member_configs: dict[int, dict[str, object]] = {}
+        coordinators: list[AdjustableBedCoordinator] = []
+        for device_id in device_ids:
+            coordinator = await _get_coordinator_from_device(hass, device_id)
+            if not coordinator:
+                raise ServiceValidationError(
+                    f"Could not find Adjustable Bed device with ID {device_id}",
+                    translation_domain=DOMAIN,
+                    translation_key="device_not_found",
+                    translation_placeholders={"device_id": device_id},
+                )
+
+            member_configs[id(coordinator)] = _position_motor_configs(
+                coordinator, device_id, {motor: position}
+            )[motor]
+            coordinators.append(coordinator)
+
+        async def _seek(coord: AdjustableBedCoordinator, anchor: float | None) -> None:
+            config = member_configs[id(coord)]
+            await coord.async_seek_position(
                 position_key=cast(str, config["position_key"]),
                 target_angle=position,
                 move_up_fn=config["move_up_fn"],  # type: ignore[arg-type]
                 move_down_fn=config["move_down_fn"],  # type: ignore[arg-type]
                 move_stop_fn=config["move_stop_fn"],  # type: ignore[arg-type]
+                pulse_anchor=anchor,
             )
 
+        await BedGroup(coordinators).async_run(_seek)
+
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_POSITION,
@@ -516,6 +555,57 @@ async def _async_register_services(hass: HomeAssistant) -> None:
         ),
     )
 
+    async def handle_set_positions(call: ServiceCall) -> None:
+        """Handle set_positions service call (several motors at once)."""
+        device_ids = call.data.get(CONF_DEVICE_ID, [])
+        positions: dict[str, float] = call.data[ATTR_POSITIONS]
+
+        _LOGGER.info("Service set_positions called: positions=%s", positions)
+
+        member_targets: dict[int, dict[str, float]] = {}
+        coordinators: list[AdjustableBedCoordinator] = []
+        for device_id in device_ids:
+            coordinator = await _get_coordinator_from_device(hass, device_id)
+            if not coordinator:
+                raise ServiceValidationError(
+                    f"Could not find Adjustable Bed device with ID {device_id}",
+                    translation_domain=DOMAIN,
+                    translation_key="device_not_found",
+                    translation_placeholders={"device_id": device_id},
+                )
+
+            configs = _position_motor_configs(coordinator, device_id, positions)
+            member_targets[id(coordinator)] = {
+                cast(str, configs[motor]["position_key"]): position
+                for motor, position in positions.items()
+            }
+            coordinators.append(coordinator)
+
+        await BedGroup(coordinators).async_run(
+            lambda coord, anchor: coord.async_seek_positions(
+                member_targets[id(coord)], pulse_anchor=anchor
+            )
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_POSITIONS,
+        handle_set_positions,
+        schema=vol.Schema(
+            {
+                vol.Required(CONF_DEVICE_ID): cv.ensure_list,
+                vol.Required(ATTR_POSITIONS): vol.All(
+                    {
+                        vol.In(["back", "legs", "head", "feet"]): vol.All(
+                            vol.Coerce(float), vol.Range(min=0)
+                        )
+                    },
+                    vol.Length(min=1),
+                ),
+            }
+        ),
+    )
+
     async def handle_timed_move(call: ServiceCall) -> None:
         """Handle timed_move service call."""
         device_ids = call.data.get(CONF_DEVICE_ID, [])
@@ -530,6 +620,8 @@ async def _async_register_services(hass: HomeAssistant) -> None:
             duration_ms,
         )
 
+        member_commands: dict[int, Callable[[BedController], Coroutine[Any, Any, None]]] = {}
+        coordinators: list[AdjustableBedCoordinator] = []
         for device_id in device_ids:
             coordinator = await _get_coordinator_from_device(hass, device_id)
             if not coordinator:
@@ -679,7 +771,14 @@ async def _async_register_services(hass: HomeAssistant) -> None:
                     # Always send stop command
                     await asyncio.shield(_stop_fn(ctrl))
 
-            await coordinator.async_execute_controller_command(timed_movement)
+            member_commands[id(coordinator)] = timed_movement
+            coordinators.append(coordinator)
+
+        await BedGroup(coordinators).async_run(
+            lambda coord, anchor: coord.async_execute_controller_command(
+                member_commands[id(coord)], pulse_anchor=anchor
+            )
+        )
 
     hass.services.async_register(
         DOMAIN,
@@ -928,6 +1027,13 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove stored data for a deleted config entry."""
+    await async_remove_motion_models(hass, entry.entry_id)
+    await async_remove_usage_model(hass, entry.entry_id)
+    await async_remove_gatt_cache(hass, entry.data[CONF_ADDRESS])
+
+
 async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options updates."""
     await hass.config_entries.async_reload(entry.entry_id)
@@ -940,6 +1046,7 @@ def _async_unregister_services(hass: HomeAssistant) -> None:
         SERVICE_SAVE_PRESET,
         SERVICE_STOP_ALL,
         SERVICE_SET_POSITION,
+        SERVICE_SET_POSITIONS,
         SERVICE_TIMED_MOVE,
         SERVICE_RUN_DIAGNOSTICS,
         SERVICE_GENERATE_SUPPORT_REPORT,
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from typing import Any
 
 from bleak import BleakClient
 from bleak.backends.device import BLEDevice
@@ -11,11 +12,26 @@ from bleak.exc import BleakError
 from homeassistant.components import bluetooth
 from homeassistant.core import HomeAssistant
 
-from .const import ADAPTER_AUTO, DEVICE_INFO_CHARS, DEVICE_INFO_SERVICE_UUID
+from .const import ADAPTER_AUTO, DEVICE_INFO_CHARS, DEVICE_INFO_SERVICE_UUID, DOMAIN
 
 # Sentinel value indicating RSSI is unavailable
 RSSI_UNAVAILABLE = -999
 
+# Adapter scoring: smoothing of RSSI sightings and connection history
+ADAPTER_RSSI_ALPHA = 0.3
+ADAPTER_HISTORY_ALPHA = 0.3
+# Weight kept by older connection outcomes on each new one
+ADAPTER_HISTORY_DECAY = 0.9
+# RSSI-based success prior: 0.1 at ADAPTER_RSSI_FLOOR, rising to 0.95 over the span
+ADAPTER_RSSI_FLOOR = -100
+ADAPTER_RSSI_SPAN = 40
+# Pseudo-attempts the prior is worth against real history
+ADAPTER_PRIOR_WEIGHT = 2.0
+ADAPTER_PRIOR_LATENCY = 3.0
+ADAPTER_PRIOR_FAILURE_COST = 10.0
+
+DATA_ADAPTER_SCORER = f"{DOMAIN}_adapter_scorer"
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -29,22 +45,172 @@ class AdapterSelectionResult:
     available_sources: list[str]
 
 
+@dataclass
+class _Sighting:
+    """One adapter currently seeing the device."""
+
+    source: str
+    rssi: int
+    device: BLEDevice
+
+
+@dataclass
+class _SourceHistory:
+    """Decayed connection outcomes through one adapter."""
+
+    attempts: float = 0.0
+    successes: float = 0.0
+    latency: float | None = None  # Seconds for a successful connect (EWMA)
+    failure_cost: float | None = None  # Seconds lost on a failed attempt (EWMA)
+
+
+class AdapterScorer:
+    """Pick the adapter with the best expected time to connect.
+
+    Instantaneous RSSI is a noisy predictor of whether a connection through
+    an adapter will work: a proxy can see the bed well and still have no
+    free connection slot, or a marginal local adapter can connect reliably.
+    The scorer keeps, for each bed address, a smoothed RSSI per adapter that
+    saw it, and for each adapter the decayed success rate, connect latency
+    and cost of failed attempts from past connections. The expected time to
+    connect through an adapter is
+
+        latency + failure_cost * (1 - p) / p
+
+    where p is the success rate, pulled towards an RSSI-based prior while an
+    adapter has little history. One scorer is shared by all beds.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty history."""
+        self._rssi: dict[str, dict[str, float]] = {}
+        self._history: dict[str, _SourceHistory] = {}
+
+    def observe(self, address: str, source: str, rssi: int) -> float:
+        """Record an RSSI sighting and return the smoothed RSSI."""
+        sightings = self._rssi.setdefault(address, {})
+        previous = sightings.get(source)
+        smoothed = (
+            float(rssi)
+            if previous is None
+            else previous + ADAPTER_RSSI_ALPHA * (rssi - previous)
+        )
+        sightings[source] = smoothed
+        return smoothed
+
+    def record(self, source: str, success: bool, elapsed: float) -> None:
+        """Record the outcome of a connection attempt through an adapter."""
+        history = self._history.setdefault(source, _SourceHistory())
+        history.attempts = history.attempts * ADAPTER_HISTORY_DECAY + 1
+        history.successes = history.successes * ADAPTER_HISTORY_DECAY + (1 if success else 0)
+        if success:
+            history.latency = _ewma(history.latency, elapsed)
+        else:
+            history.failure_cost = _ewma(history.failure_cost, elapsed)
+
+    def expected_connect_time(self, source: str, rssi: float) -> float:
+        """Return the expected seconds to connect through an adapter."""
+        history = self._history.get(source, _SourceHistory())
+        prior = min(max((rssi - ADAPTER_RSSI_FLOOR) / ADAPTER_RSSI_SPAN, 0.1), 0.95)
+        success_rate = (history.successes + ADAPTER_PRIOR_WEIGHT * prior) / (
+            history.attempts + ADAPTER_PRIOR_WEIGHT
+        )
+        latency = history.latency if history.latency is not None else ADAPTER_PRIOR_LATENCY
+        failure_cost = (
+            history.failure_cost
+            if history.failure_cost is not None
+            else ADAPTER_PRIOR_FAILURE_COST
+        )
+        return latency + failure_cost * (1 - success_rate) / success_rate
+
+    def as_dict(self, address: str) -> dict[str, Any]:
+        """Return scores for the adapters seeing an address, for diagnostics."""
+        return {
+            source: {
+                "rssi": round(rssi, 1),
+                "expected_connect_time": round(self.expected_connect_time(source, rssi), 2),
+                "attempts": round(self._history.get(source, _SourceHistory()).attempts, 2),
+            }
+            for source, rssi in self._rssi.get(address, {}).items()
+        }
+
+
+def _ewma(previous: float | None, value: float) -> float:
+    return value if previous is None else previous + ADAPTER_HISTORY_ALPHA * (value - previous)
+
+
+def adapter_scorer(hass: HomeAssistant) -> AdapterScorer:
+    """Return the adapter scorer shared by all beds of this Home Assistant instance."""
+    scorer: AdapterScorer | None = hass.data.get(DATA_ADAPTER_SCORER)
+    if scorer is None:
+        scorer = hass.data[DATA_ADAPTER_SCORER] = AdapterScorer()
+    return scorer
+
+
+def _sightings(hass: HomeAssistant, address: str) -> list[_Sighting]:
+    """Return the connectable adapters currently seeing an address.
+
+    Uses Home Assistant's per-address scanner index; falls back to one pass
+    over all discovered devices if the index isn't available.
+    """
+    sightings: list[_Sighting] = []
+    try:
+        for scanner_device in bluetooth.async_scanner_devices_by_address(
+            hass, address, connectable=True
+        ):
+            sightings.append(
+                _Sighting(
+                    source=getattr(scanner_device.scanner, "source", "unknown"),
+                    rssi=_coerce_rssi(getattr(scanner_device.advertisement, "rssi", None)),
+                    device=scanner_device.ble_device,
+                )
+            )
+        return sightings
+    except Exception as err:
+        _LOGGER.debug("Scanner index lookup failed, scanning discovered devices: %s", err)
+
+    try:
+        for service_info in bluetooth.async_discovered_service_info(hass, connectable=True):
+            if service_info.address.upper() == address:
+                sightings.append(
+                    _Sighting(
+                        source=getattr(service_info, "source", "unknown"),
+                        rssi=_coerce_rssi(getattr(service_info, "rssi", None)),
+                        device=service_info.device,
+                    )
+                )
+    except (OSError, TimeoutError) as err:
+        _LOGGER.debug("Error listing discovered devices: %s", err)
+    return sightings
+
+
+def _coerce_rssi(value: Any) -> int:
+    """Safely coerce RSSI to int, handling None/malformed values."""
+    try:
+        return int(value) if value is not None else RSSI_UNAVAILABLE
+    except (ValueError, TypeError):
+        return RSSI_UNAVAILABLE
+
+
 async def select_adapter(
     hass: HomeAssistant,
     address: str,
     preferred_adapter: str | None,
+    scorer: AdapterScorer | None = None,
 ) -> AdapterSelectionResult:
     """Select the best Bluetooth adapter for connection.
 
     This function handles adapter discovery and selection logic:
     - If a preferred adapter is configured, looks for device from that adapter
-    - Otherwise, selects the adapter with the best RSSI (strongest signal)
+    - Otherwise, selects the adapter with the best expected time to connect
+      (or, without a scorer, the best RSSI)
     - Falls back to default Home Assistant lookup if needed
 
     Args:
         hass: Home Assistant instance
         address: The BLE device address to find
         preferred_adapter: Preferred adapter source, or None/ADAPTER_AUTO for automatic
+        scorer: Connection history used to rank adapters in automatic mode
 
     Returns:
         AdapterSelectionResult with device, source, rssi, and available sources
@@ -52,7 +218,11 @@ async def select_adapter(
     device: BLEDevice | None = None
     source: str | None = None
     rssi: int | None = None
-    available_sources: list[str] = []
+    address = address.upper()
+    sightings = _sightings(hass, address)
+    available_sources = [
+        f"{sighting.source} (RSSI: {sighting.rssi})" for sighting in sightings
+    ]
 
     if preferred_adapter and preferred_adapter != ADAPTER_AUTO:
         # Look for device from specific adapter/source
@@ -61,97 +231,74 @@ async def select_adapter(
             address,
             preferred_adapter,
         )
-
-        # Log all sources that can see this device
-        try:
-            for service_info in bluetooth.async_discovered_service_info(hass, connectable=True):
-                if service_info.address.upper() == address.upper():
-                    svc_source = getattr(service_info, "source", "unknown")
-                    svc_rssi = getattr(service_info, "rssi", "N/A")
-                    available_sources.append(f"{svc_source} (RSSI: {svc_rssi})")
-
-                    if svc_source == preferred_adapter:
-                        device = service_info.device
-                        source = svc_source
-                        rssi = svc_rssi if isinstance(svc_rssi, int) else None
-                        _LOGGER.info(
-                            "✓ Found device %s via preferred adapter %s (RSSI: %s)",
-                            address,
-                            preferred_adapter,
-                            svc_rssi,
-                        )
-                        break
-
-            if available_sources:
+        if available_sources:
+            _LOGGER.info(
+                "Adapters that can see device %s: %s",
+                address,
+                ", ".join(available_sources),
+            )
+        for sighting in sightings:
+            if sighting.source == preferred_adapter:
+                device = sighting.device
+                source = sighting.source
+                rssi = sighting.rssi if sighting.rssi != RSSI_UNAVAILABLE else None
                 _LOGGER.info(
-                    "Adapters that can see device %s: %s",
-                    address,
-                    ", ".join(available_sources),
-                )
-
-            if device is None and available_sources:
-                _LOGGER.warning(
-                    "⚠ Device %s not found via preferred adapter %s, falling back to automatic selection",
+                    "✓ Found device %s via preferred adapter %s (RSSI: %s)",
                     address,
                     preferred_adapter,
+                    rssi,
                 )
-        except Exception as err:
-            _LOGGER.debug("Error looking up device from specific adapter: %s", err)
+                break
+
+        if device is None and available_sources:
+            _LOGGER.warning(
+                "⚠ Device %s not found via preferred adapter %s, falling back to automatic selection",
+                address,
+                preferred_adapter,
+            )
 
     # Fall back to auto selection if no preferred adapter or device not found
-    # Auto mode: pick the adapter with the best RSSI (strongest signal)
+    if device is None and sightings:
+        best: _Sighting | None = None
+        best_score = float("inf")
+        for sighting in sightings:
+            if scorer is not None:
+                score = scorer.expected_connect_time(
+                    sighting.source, scorer.observe(address, sighting.source, sighting.rssi)
+                )
+            else:
+                # Without history, rank by signal strength alone
+                score = -float(sighting.rssi)
+            _LOGGER.debug(
+                "Auto-select candidate: source=%s, rssi=%s, score=%.2f",
+                sighting.source,
+                sighting.rssi,
+                score,
+            )
+            if best is None or score < best_score:
+                best = sighting
+                best_score = score
+
+        if best is not None:
+            device = best.device
+            source = best.source
+            rssi = best.rssi if best.rssi != RSSI_UNAVAILABLE else None
+            _LOGGER.info(
+                "Auto-selected adapter %s (RSSI: %s, score: %.1f)", source, rssi, best_score
+            )
+
+    # Final fallback to default lookup
     if device is None:
-        best_rssi = RSSI_UNAVAILABLE
-        best_source: str | None = None
-        # Capture discovery snapshot once and reuse for both RSSI selection and device lookup
-        try:
-            discovered_services = list(
-                bluetooth.async_discovered_service_info(hass, connectable=True)
+        device = bluetooth.async_ble_device_from_address(hass, address, connectable=True)
+        if device:
+            fallback_source = "unknown"
+            if hasattr(device, "details") and isinstance(device.details, dict):
+                fallback_source = device.details.get("source", "unknown")
+            source = fallback_source
+            _LOGGER.info(
+                "Using fallback adapter selection, device found via: %s",
+                fallback_source,
             )
-        except (OSError, TimeoutError) as err:
-            _LOGGER.debug("Error during auto adapter selection: %s", err)
-            discovered_services = []
-
-        # Find the adapter with best RSSI
-        for svc_info in discovered_services:
-            if svc_info.address.upper() == address.upper():
-                svc_rssi = getattr(svc_info, "rssi", None)
-                # Safely coerce RSSI to int, handling None/malformed values
-                try:
-                    rssi_value = int(svc_rssi) if svc_rssi is not None else RSSI_UNAVAILABLE
-                except (ValueError, TypeError):
-                    rssi_value = RSSI_UNAVAILABLE
-                svc_source = getattr(svc_info, "source", "unknown")
-                _LOGGER.debug("Auto-select candidate: source=%s, rssi=%s", svc_source, rssi_value)
-                if rssi_value > best_rssi:
-                    best_rssi = rssi_value
-                    best_source = svc_source
-
-        if best_source:
-            _LOGGER.info("Auto-selected adapter %s with best RSSI %d", best_source, best_rssi)
-            # Get device from the best adapter using the same snapshot
-            for svc_info in discovered_services:
-                if (
-                    svc_info.address.upper() == address.upper()
-                    and getattr(svc_info, "source", None) == best_source
-                ):
-                    device = svc_info.device
-                    source = best_source
-                    rssi = best_rssi if best_rssi != RSSI_UNAVAILABLE else None
-                    break
-
-        # Final fallback to default lookup
-        if device is None:
-            device = bluetooth.async_ble_device_from_address(hass, address, connectable=True)
-            if device:
-                fallback_source = "unknown"
-                if hasattr(device, "details") and isinstance(device.details, dict):
-                    fallback_source = device.details.get("source", "unknown")
-                source = fallback_source
-                _LOGGER.info(
-                    "Using fallback adapter selection, device found via: %s",
-                    fallback_source,
-                )
 
     return AdapterSelectionResult(
         device=device,
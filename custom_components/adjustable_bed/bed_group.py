@@ -0,0 +1,170 @@
+"""Drive several beds together, e.g. both halves of a split-king.
+
+Each half of a split bed (Okin CB24 with bed selection A/B, two Linak frames,
+...) is its own config entry with its own coordinator. A service call that
+targets both used to run them one after another, so the second half started
+moving only after the first had finished, or at best several hundred
+milliseconds later.
+
+BedGroup runs a command on all members concurrently. Members are connected
+first (connecting is by far the slowest and least predictable step), then every
+member waits for one shared monotonic start deadline and is given that deadline
+as the pulse anchor of its command, so the pulse trains of all halves start
+together and stay in phase. After each run every member keeps a summary of it
+(start skew, mean positions and their spread) for diagnostics.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from typing import TYPE_CHECKING, Any, Final
+
+if TYPE_CHECKING:
+    from .coordinator import AdjustableBedCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Time between the last member becoming ready and the shared start deadline.
+# Covers the event loop scheduling every member's command before it is due.
+GROUP_START_LEAD: Final = 0.05
+
+
+class BedGroup:
+    """Run commands on several bed coordinators in lockstep."""
+
+    def __init__(
+        self,
+        coordinators: Sequence[AdjustableBedCoordinator],
+        start_lead: float = GROUP_START_LEAD,
+    ) -> None:
+        """Initialize the group.
+
+        Args:
+            coordinators: Member coordinators. Duplicates are dropped.
+            start_lead: Seconds between preparation and the shared start.
+        """
+        members: list[AdjustableBedCoordinator] = []
+        for coordinator in coordinators:
+            if all(coordinator is not member for member in members):
+                members.append(coordinator)
+        self._members = members
+        self._start_lead = start_lead
+        self._last_start_skew: float | None = None
+
+    @property
+    def members(self) -> list[AdjustableBedCoordinator]:
+        """Return the member coordinators."""
+        return list(self._members)
+
+    @property
+    def last_start_skew_ms(self) -> float | None:
+        """Return how far apart the members' first pulses went out in the last run."""
+        if self._last_start_skew is None:
+            return None
+        return self._last_start_skew * 1000
+
+    @property
+    def positions(self) -> dict[str, float]:
+        """Return the mean position of every key reported by all members."""
+        if not self._members:
+            return {}
+        shared = set(self._members[0].position_data)
+        for member in self._members[1:]:
+            shared &= set(member.position_data)
+        return {
+            key: sum(member.position_data[key] for member in self._members) / len(self._members)
+            for key in sorted(shared)
+        }
+
+    @property
+    def position_spread(self) -> dict[str, float]:
+        """Return the difference between the highest and lowest member per key."""
+        spread: dict[str, float] = {}
+        for key in self.positions:
+            values = [member.position_data[key] for member in self._members]
+            spread[key] = max(values) - min(values)
+        return spread
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return the last group run and the aggregated positions for diagnostics."""
+        skew_ms = self.last_start_skew_ms
+        return {
+            "members": [member.name for member in self._members],
+            "start_skew_ms": round(skew_ms, 1) if skew_ms is not None else None,
+            "positions": self.positions,
+            "position_spread": self.position_spread,
+        }
+
+    async def async_run(
+        self,
+        member_fn: Callable[[AdjustableBedCoordinator, float | None], Awaitable[Any]],
+        prepare: bool = True,
+    ) -> None:
+        """Run ``member_fn`` for every member, starting them together.
+
+        Args:
+            member_fn: Called once per member coordinator with the shared
+                start deadline to pass on as the command's pulse anchor (None
+                for a single member), e.g. a seek or an
+                async_execute_controller_command call.
+            prepare: Connect all members before picking the start deadline.
+                Disable for commands that must not wait for a connection
+                (stop).
+
+        Raises:
+            The first exception raised by a member, after all members finished.
+        """
+        if len(self._members) == 1:
+            await member_fn(self._members[0], None)
+            return
+        if not self._members:
+            return
+
+        if prepare:
+            await asyncio.gather(
+                *(member.async_prepare_command() for member in self._members),
+                return_exceptions=True,
+            )
+
+        deadline = time.monotonic() + self._start_lead
+
+        async def _run_member(member: AdjustableBedCoordinator) -> None:
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await member_fn(member, deadline)
+
+        results = await asyncio.gather(
+            *(_run_member(member) for member in self._members),
+            return_exceptions=True,
+        )
+
+        # Skew between the first pulses actually sent, so it includes each
+        # member's command queue wait and write latency
+        first_pulses = [
+            fired
+            for member in self._members
+            if (fired := member.first_pulse_at(deadline)) is not None
+        ]
+        self._last_start_skew = None
+        if len(first_pulses) > 1:
+            self._last_start_skew = max(first_pulses) - min(first_pulses)
+            _LOGGER.debug(
+                "Bed group %s started within %.1fms",
+                ", ".join(member.name for member in self._members),
+                self._last_start_skew * 1000,
+            )
+        stats = self.stats
+        for member in self._members:
+            member.note_group_run(stats)
+
+        for member, result in zip(self._members, results, strict=True):
+            if isinstance(result, BaseException):
+                _LOGGER.warning("Bed group command failed on %s: %s", member.name, result)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
@@ -9,13 +9,21 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable, Iterator, Mapping
+from contextlib import asynccontextmanager, contextmanager
 from typing import TYPE_CHECKING, Any
 
 from bleak import BleakClient
 from bleak.exc import BleakError
 
+from ..const import BURST_GAP_READ_INTERVAL, BURST_GAP_READ_PERCENTILE, BURST_MIN_GAP
+from ..latency import LATENCY_PHASE_GATT_WRITE, LATENCY_PHASE_POSITION_READ
+from ..setup_pipeline import SetupStep
+from .capabilities import CapabilitySnapshot
+from .pulse import PulseStats, PulseTimeline
+
 if TYPE_CHECKING:
     from ..coordinator import AdjustableBedCoordinator
 
@@ -53,6 +61,12 @@ class BedController(ABC):
         self._notify_callback: Callable[[str, float], None] | None = None
         self._raw_notify_callback: Callable[[str, bytes], None] | None = None
         self._ble_lock = asyncio.Lock()
+        self._last_pulse_stats: PulseStats | None = None
+        # Task holding _ble_lock for a whole burst pulse train, if any
+        self._burst_owner: asyncio.Task[Any] | None = None
+        self._last_burst_gap_reads = 0
+        self._next_gap_read = 0.0
+        self._capabilities: CapabilitySnapshot | None = None
 
     @property
     def ble_lock(self) -> asyncio.Lock:
@@ -64,6 +78,117 @@ class BedController(ABC):
         """
         return self._ble_lock
 
+    @property
+    def burst_active(self) -> bool:
+        """Return True while a burst pulse train is holding the BLE channel."""
+        return self._burst_owner is not None
+
+    @property
+    def last_burst_gap_reads(self) -> int:
+        """Return the number of position reads interleaved into the last burst."""
+        return self._last_burst_gap_reads
+
+    @asynccontextmanager
+    async def _ble_access(self) -> AsyncIterator[None]:
+        """Acquire the BLE lock for a single GATT operation.
+
+        Behaves like ``async with self._ble_lock`` except when the current task
+        already holds the lock for a burst pulse train, in which case the
+        operation runs inside the burst instead of deadlocking on the lock.
+        Use this for reads that may be scheduled into burst gaps.
+        """
+        if self._burst_owner is not None and self._burst_owner is asyncio.current_task():
+            yield
+            return
+        async with self._ble_lock:
+            yield
+
+    @asynccontextmanager
+    async def _burst_channel(self, enabled: bool) -> AsyncIterator[None]:
+        """Reserve the BLE channel for a whole pulse train when burst mode is enabled."""
+        if not enabled:
+            yield
+            return
+        async with self._ble_lock:
+            self._burst_owner = asyncio.current_task()
+            self._last_burst_gap_reads = 0
+            self._next_gap_read = time.monotonic() + BURST_GAP_READ_INTERVAL
+            try:
+                yield
+            finally:
+                self._burst_owner = None
+
+    async def _read_in_burst_gap(self, timeline: PulseTimeline, next_read: float) -> float:
+        """Run a scheduled position read if it fits before the next pulse.
+
+        Called between frames of a burst train. Reads are spaced
+        BURST_GAP_READ_INTERVAL apart and only started when the measured
+        position read latency (BURST_GAP_READ_PERCENTILE) fits in the time
+        left until the next pulse deadline. A started read is never cut short:
+        cancelling it would leave the GATT operation outstanding on proxies and
+        the next pulse write would fail with "operation in progress".
+
+        Args:
+            timeline: The timeline of the running pulse train.
+            next_read: Monotonic time the next read is due.
+
+        Returns:
+            Monotonic time the following read is due.
+        """
+        if (
+            self._coordinator.disable_angle_sensing
+            or type(self).read_non_notifying_positions
+            is BedController.read_non_notifying_positions
+        ):
+            # Nothing to read: the controller doesn't poll positions during movement
+            return next_read
+        now = time.monotonic()
+        deadline = timeline.next_deadline()
+        if now < next_read or deadline is None or deadline - now < BURST_MIN_GAP:
+            return next_read
+        expected = self._coordinator.latency_percentile(
+            LATENCY_PHASE_POSITION_READ, BURST_GAP_READ_PERCENTILE
+        )
+        if expected is None or expected > deadline - now:
+            # No measured read latency yet, or the read wouldn't fit
+            return next_read
+        read_start = time.monotonic()
+        try:
+            await self.read_non_notifying_positions()
+            self._last_burst_gap_reads += 1
+        except BleakError as err:
+            _LOGGER.debug("Burst gap read failed (non-fatal): %s", err)
+        finally:
+            self._coordinator.record_latency(
+                LATENCY_PHASE_POSITION_READ, time.monotonic() - read_start
+            )
+        return now + BURST_GAP_READ_INTERVAL
+
+    @asynccontextmanager
+    async def _pulse_train(
+        self, repeat_count: int, repeat_delay_ms: int
+    ) -> AsyncIterator[PulseTimeline]:
+        """Provide the PulseTimeline for a repeat loop, reserving the channel in burst mode.
+
+        Every repeat loop should run inside this context, take the BLE lock
+        for each write with ``async with self._ble_access()`` and await
+        _wait_next_pulse() between writes. When burst mode is enabled the
+        whole train holds the BLE lock and position reads are scheduled into
+        the gaps between pulses.
+        """
+        burst = repeat_count > 1 and self._coordinator.burst_mode
+        async with self._burst_channel(burst):
+            with self._pulse_timeline(repeat_delay_ms) as timeline:
+                yield timeline
+
+    async def _wait_next_pulse(self, timeline: PulseTimeline) -> None:
+        """Wait for the next pulse deadline, running a burst gap read if one is due."""
+        if self._burst_owner is not None and self._burst_owner is asyncio.current_task():
+            self._next_gap_read = await self._read_in_burst_gap(timeline, self._next_gap_read)
+        # Sleep only until the next pulse deadline so write latency
+        # doesn't stretch the pulse period
+        await timeline.wait_next()
+
     def set_raw_notify_callback(self, callback: Callable[[str, bytes], None] | None) -> None:
         """Set a callback to receive raw notification data.
 
@@ -103,6 +228,58 @@ class BedController(ABC):
         """Return the BLE client."""
         return self._coordinator.client
 
+    @property
+    def last_pulse_stats(self) -> PulseStats | None:
+        """Return timing statistics for the most recent multi-pulse write."""
+        return self._last_pulse_stats
+
+    @contextmanager
+    def _pulse_timeline(self, repeat_delay_ms: int) -> Iterator[PulseTimeline]:
+        """Provide a PulseTimeline for a repeat loop and record its stats on exit.
+
+        Write loops (via _pulse_train()) call timeline.fire() before each
+        write and wait for the next deadline between writes instead of
+        sleeping for the full repeat delay, so the pulse period stays fixed regardless of
+        write latency. While the bed is driven as part of a group, the
+        timeline is anchored to the group's shared start deadline and its
+        first pulse is reported for the group's start skew.
+        """
+        timeline = PulseTimeline(repeat_delay_ms, self._coordinator.pulse_anchor)
+        try:
+            yield timeline
+        finally:
+            if timeline.first_fire is not None:
+                self._coordinator.note_first_pulse(timeline.first_fire)
+            stats = timeline.stats()
+            if stats is not None:
+                self._last_pulse_stats = stats
+                _LOGGER.debug(
+                    "Pulse train on %s: %d pulses, period %.1fms (target %.1fms), "
+                    "jitter %.1fms (max %.1fms), slipped %d",
+                    self._coordinator.address,
+                    stats.pulse_count,
+                    stats.achieved_period_ms,
+                    stats.target_period_ms,
+                    stats.jitter_ms,
+                    stats.max_jitter_ms,
+                    stats.slipped,
+                )
+
+    @property
+    def notifying_position_keys(self) -> frozenset[str]:
+        """Return position keys that push updates via notifications while moving.
+
+        Position seeking waits for these updates instead of polling. Keys not
+        listed here are read with read_non_notifying_positions() (or
+        read_positions() when no key notifies). Default: none.
+        """
+        return frozenset()
+
+    @property
+    def position_read_stats(self) -> dict[str, int] | None:
+        """Return position read counters for diagnostics, if the controller tracks them."""
+        return None
+
     @property
     def auto_stops_on_idle(self) -> bool:
         """Return True if motors auto-stop when commands stop arriving.
@@ -174,14 +351,20 @@ class BedController(ABC):
         This is a helper method that handles the common pattern of:
         - Checking connection state
         - Writing to a characteristic with optional response
-        - Repeating the command with delays
+        - Repeating the command on a fixed pulse timeline
         - Checking for cancellation between writes
 
+        When the coordinator has burst mode enabled, multi-pulse trains hold
+        the BLE lock for their whole duration and run non-notifying position
+        reads in the gaps between frames.
+
         Args:
             char_uuid: The characteristic UUID to write to
             command: The command bytes to send
             repeat_count: Number of times to repeat the command (default: 1)
-            repeat_delay_ms: Delay between repeats in milliseconds (default: 100)
+            repeat_delay_ms: Pulse period in milliseconds (default: 100). Each
+                            repeat is scheduled relative to the first write, so
+                            write latency is absorbed rather than added.
             cancel_event: Optional event that signals cancellation. If set,
                          the command loop will exit early.
             response: Whether to wait for a write response from the device.
@@ -208,26 +391,32 @@ class BedController(ABC):
             repeat_delay_ms,
         )
 
-        for i in range(repeat_count):
-            if effective_cancel is not None and effective_cancel.is_set():
-                _LOGGER.debug("Command cancelled after %d/%d writes", i, repeat_count)
-                return
-
-            try:
-                # Acquire BLE lock for each individual write to prevent conflicts
-                # with concurrent position reads during movement
-                async with self._ble_lock:
-                    await self.client.write_gatt_char(char_uuid, command, response=response)
-            except BleakError:
-                _LOGGER.exception(
-                    "Failed to write command %s to %s",
-                    command.hex(),
-                    char_uuid,
-                )
-                raise
-
-            if i < repeat_count - 1:
-                await asyncio.sleep(repeat_delay_ms / 1000)
+        async with self._pulse_train(repeat_count, repeat_delay_ms) as timeline:
+            for i in range(repeat_count):
+                if effective_cancel is not None and effective_cancel.is_set():
+                    _LOGGER.debug("Command cancelled after %d/%d writes", i, repeat_count)
+                    return
+
+                timeline.fire()
+                try:
+                    # Acquire BLE lock for each individual write to prevent conflicts
+                    # with concurrent position reads during movement (no-op in burst)
+                    async with self._ble_access():
+                        write_start = time.monotonic()
+                        await self.client.write_gatt_char(char_uuid, command, response=response)
+                        self._coordinator.record_latency(
+                            LATENCY_PHASE_GATT_WRITE, time.monotonic() - write_start
+                        )
+                except BleakError:
+                    _LOGGER.exception(
+                        "Failed to write command %s to %s",
+                        command.hex(),
+                        char_uuid,
+                    )
+                    raise
+
+                if i < repeat_count - 1:
+                    await self._wait_next_pulse(timeline)
 
     async def write_command(
         self,
@@ -353,6 +542,27 @@ class BedController(ABC):
             except (BleakError, ConnectionError):
                 _LOGGER.debug("Failed to send STOP during preset cleanup", exc_info=True)
 
+    def connection_lost(self) -> None:
+        """Forget per-connection state when the BLE link closes.
+
+        The coordinator keeps the controller for the next connection as long as
+        the bed's GATT layout doesn't change, so resolved variants,
+        characteristic choices and calibration survive reconnects. Subscriptions
+        and other state tied to the old link must be reset here; overrides
+        should call super().
+        """
+        self._burst_owner = None
+
+    def post_connect_steps(self) -> list[SetupStep]:
+        """Return protocol setup steps to run after each connect.
+
+        Steps run in the coordinator's post-connect pipeline alongside its own
+        notification (SETUP_STEP_NOTIFY) and device information
+        (SETUP_STEP_DEVICE_INFO) steps. Steps without dependencies between them
+        may run concurrently, so declare every ordering the protocol needs.
+        """
+        return []
+
     async def read_non_notifying_positions(self) -> None:  # noqa: B027
         """Read positions only for motors that don't support notifications.
 
@@ -407,6 +617,36 @@ class BedController(ABC):
             f"{self.__class__.__name__} does not support direct position control"
         )
 
+    # Combined motor movement (optional)
+    # Beds whose protocol can drive several motors in one frame should override these
+
+    def supports_combined_move(self, directions: Mapping[str, bool]) -> bool:
+        """Return True if move_motors() can drive these motors in one burst.
+
+        Args:
+            directions: Position key ("back", "legs", "head", "feet") -> True to
+                move up, False to move down.
+
+        Default: only single motors, which map onto the move_*_up/down methods.
+        """
+        return len(directions) == 1
+
+    async def move_motors(self, directions: Mapping[str, bool]) -> None:
+        """Drive several motors together for one burst, then stop them.
+
+        Only called with combinations accepted by supports_combined_move().
+        The default implementation handles a single motor.
+
+        Args:
+            directions: Position key -> True to move up, False to move down.
+        """
+        if len(directions) != 1:
+            raise NotImplementedError(
+                f"{self.__class__.__name__} cannot move {', '.join(directions)} together"
+            )
+        ((motor, up),) = directions.items()
+        await getattr(self, f"move_{motor}_{'up' if up else 'down'}")()
+
     # Motor control methods
     # These move motors for a fixed duration (~1-2 seconds) then auto-stop.
     # Implementations should use try/finally to ensure stop is always sent.
@@ -666,6 +906,22 @@ class BedController(ABC):
         """
         return None
 
+    @property
+    def capabilities(self) -> CapabilitySnapshot:
+        """Return the capability snapshot, reading the properties on first use.
+
+        Entity setup reads capabilities from here rather than from the
+        individual properties. Controllers whose capabilities change after
+        construction must call invalidate_capabilities() when they do.
+        """
+        if self._capabilities is None:
+            self._capabilities = CapabilitySnapshot.from_controller(self)
+        return self._capabilities
+
+    def invalidate_capabilities(self) -> None:
+        """Drop the capability snapshot so the next read rebuilds it."""
+        self._capabilities = None
+
     # Lumbar motor control (optional - only some beds have this)
 
     async def move_lumbar_up(self) -> None:
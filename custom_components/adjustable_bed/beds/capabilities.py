@@ -0,0 +1,161 @@
+"""Immutable snapshot of what a bed controller can do.
+
+Entity setup asks every controller the same questions for every entity
+description: dozens of ``supports_*``/``has_*`` properties plus scalar limits
+such as the memory slot count. Controllers answer them from remote codes,
+feature flags discovered over BLE or the motor count, and the platforms used
+to look each one up again with ``getattr``.
+
+CapabilitySnapshot collects all of them once per controller: the boolean
+capabilities as one Capability bitset, the limits and option lists as frozen
+fields. BedController.capabilities builds it on first use and keeps it until
+the controller calls invalidate_capabilities(), which controllers that learn
+their features at runtime (feature discovery, config queries) do whenever
+that information changes.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from enum import IntFlag
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    from .base import BedController
+
+
+class Capability(IntFlag):
+    """Boolean controller capabilities."""
+
+    NONE = 0
+
+    # Presets
+    PRESET_FLAT = 1 << 0
+    PRESET_ZERO_G = 1 << 1
+    PRESET_ANTI_SNORE = 1 << 2
+    PRESET_TV = 1 << 3
+    PRESET_LOUNGE = 1 << 4
+    PRESET_INCLINE = 1 << 5
+    PRESET_YOGA = 1 << 6
+    MEMORY_PRESETS = 1 << 7
+    MEMORY_PROGRAMMING = 1 << 8
+
+    # Lights
+    LIGHTS = 1 << 9
+    UNDER_BED_LIGHTS = 1 << 10
+    LIGHT_CYCLE = 1 << 11
+    DISCRETE_LIGHT_CONTROL = 1 << 12
+    LIGHT_LEVEL_CONTROL = 1 << 13
+    LIGHT_TIMER = 1 << 14
+
+    # Motors
+    MOTOR_CONTROL = 1 << 15
+    DISCRETE_MOTOR_CONTROL = 1 << 16
+    STOP_ALL = 1 << 17
+    POSITION_FEEDBACK = 1 << 18
+    DIRECT_POSITION_CONTROL = 1 << 19
+    LUMBAR = 1 << 20
+    NECK = 1 << 21
+    PILLOW = 1 << 22
+    TILT = 1 << 23
+    HIP = 1 << 24
+
+    # Massage and fans
+    MASSAGE = 1 << 25
+    MASSAGE_INTENSITY_CONTROL = 1 << 26
+    MASSAGE_TIMER = 1 << 27
+    CIRCULATION_MASSAGE = 1 << 28
+    FAN_CONTROL = 1 << 29
+
+
+# BedController property backing each capability
+CAPABILITY_PROPERTIES: Final[Mapping[str, Capability]] = MappingProxyType(
+    {
+        "supports_preset_flat": Capability.PRESET_FLAT,
+        "supports_preset_zero_g": Capability.PRESET_ZERO_G,
+        "supports_preset_anti_snore": Capability.PRESET_ANTI_SNORE,
+        "supports_preset_tv": Capability.PRESET_TV,
+        "supports_preset_lounge": Capability.PRESET_LOUNGE,
+        "supports_preset_incline": Capability.PRESET_INCLINE,
+        "supports_preset_yoga": Capability.PRESET_YOGA,
+        "supports_memory_presets": Capability.MEMORY_PRESETS,
+        "supports_memory_programming": Capability.MEMORY_PROGRAMMING,
+        "supports_lights": Capability.LIGHTS,
+        "supports_under_bed_lights": Capability.UNDER_BED_LIGHTS,
+        "supports_light_cycle": Capability.LIGHT_CYCLE,
+        "supports_discrete_light_control": Capability.DISCRETE_LIGHT_CONTROL,
+        "supports_light_level_control": Capability.LIGHT_LEVEL_CONTROL,
+        "supports_light_timer": Capability.LIGHT_TIMER,
+        "supports_motor_control": Capability.MOTOR_CONTROL,
+        "has_discrete_motor_control": Capability.DISCRETE_MOTOR_CONTROL,
+        "supports_stop_all": Capability.STOP_ALL,
+        "supports_position_feedback": Capability.POSITION_FEEDBACK,
+        "supports_direct_position_control": Capability.DIRECT_POSITION_CONTROL,
+        "has_lumbar_support": Capability.LUMBAR,
+        "has_neck_support": Capability.NECK,
+        "has_pillow_support": Capability.PILLOW,
+        "has_tilt_support": Capability.TILT,
+        "has_hip_support": Capability.HIP,
+        "supports_massage": Capability.MASSAGE,
+        "supports_massage_intensity_control": Capability.MASSAGE_INTENSITY_CONTROL,
+        "supports_massage_timer": Capability.MASSAGE_TIMER,
+        "supports_circulation_massage": Capability.CIRCULATION_MASSAGE,
+        "supports_fan_control": Capability.FAN_CONTROL,
+    }
+)
+
+
+@dataclass(frozen=True, slots=True)
+class CapabilitySnapshot:
+    """Capabilities and limits of one controller at one point in time."""
+
+    flags: Capability
+    memory_slot_count: int
+    massage_intensity_zones: tuple[str, ...]
+    massage_intensity_max: int
+    massage_timer_options: tuple[int, ...]
+    light_level_max: int
+    light_timer_options: tuple[str, ...]
+    light_auto_off_seconds: int | None
+    fan_level_max: int
+    motor_translation_keys: Mapping[str, str] | None
+
+    @classmethod
+    def from_controller(cls, controller: BedController) -> CapabilitySnapshot:
+        """Read every capability property of ``controller`` once."""
+        flags = Capability.NONE
+        for name, capability in CAPABILITY_PROPERTIES.items():
+            if getattr(controller, name):
+                flags |= capability
+        translation_keys = controller.motor_translation_keys
+        return cls(
+            flags=flags,
+            memory_slot_count=controller.memory_slot_count,
+            massage_intensity_zones=tuple(controller.massage_intensity_zones),
+            massage_intensity_max=controller.massage_intensity_max,
+            massage_timer_options=tuple(controller.massage_timer_options),
+            light_level_max=controller.light_level_max,
+            light_timer_options=tuple(controller.light_timer_options),
+            light_auto_off_seconds=controller.light_auto_off_seconds,
+            fan_level_max=controller.fan_level_max,
+            motor_translation_keys=(
+                MappingProxyType(dict(translation_keys)) if translation_keys is not None else None
+            ),
+        )
+
+    def has(self, capability: Capability) -> bool:
+        """Return True if every flag in ``capability`` is set."""
+        return capability in self.flags
+
+    def supports(self, name: str) -> bool:
+        """Return the snapshot value of a capability property, by property name.
+
+        Entity descriptions name their required capability by property (e.g.
+        ``"supports_preset_zero_g"``).
+
+        Raises:
+            KeyError: If ``name`` isn't a capability property.
+        """
+        return CAPABILITY_PROPERTIES[name] in self.flags
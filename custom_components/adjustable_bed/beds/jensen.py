@@ -20,6 +20,7 @@ from bleak.backends.characteristic import BleakGATTCharacteristic
 from bleak.exc import BleakError
 
 from ..const import JENSEN_CHAR_UUID, JENSEN_SERVICE_UUID
+from ..setup_pipeline import SETUP_STEP_NOTIFY, SetupStep
 from .base import BedController
 
 if TYPE_CHECKING:
@@ -234,6 +235,10 @@ class JensenController(BedController):
         """Return True if bed has fan (determined dynamically)."""
         return bool(self._features & JensenFeatureFlags.FAN)
 
+    def post_connect_steps(self) -> list[SetupStep]:
+        """Query the configuration once start_notify has unlocked the bed."""
+        return [SetupStep("query_config", self.query_config, after=(SETUP_STEP_NOTIFY,))]
+
     async def query_config(self) -> None:
         """Query bed capabilities after connection.
 
@@ -303,6 +308,7 @@ class JensenController(BedController):
             self._features = JensenFeatureFlags.NONE
         finally:
             self._config_loaded = True
+            self.invalidate_capabilities()
             # Clean up temporary attributes
             self._config_received = None
             self._config_data = None
@@ -202,20 +202,22 @@ class JiecangController(BedController):
             repeat_delay_ms,
         )
 
-        for i in range(repeat_count):
-            if effective_cancel is not None and effective_cancel.is_set():
-                _LOGGER.info("Command cancelled after %d/%d writes", i, repeat_count)
-                return
-
-            try:
-                async with self._ble_lock:
-                    await self.client.write_gatt_char(self._char_uuid, command, response=True)
-            except BleakError:
-                _LOGGER.exception("Failed to write command")
-                raise
-
-            if i < repeat_count - 1:
-                await asyncio.sleep(repeat_delay_ms / 1000)
+        async with self._pulse_train(repeat_count, repeat_delay_ms) as timeline:
+            for i in range(repeat_count):
+                if effective_cancel is not None and effective_cancel.is_set():
+                    _LOGGER.info("Command cancelled after %d/%d writes", i, repeat_count)
+                    return
+
+                timeline.fire()
+                try:
+                    async with self._ble_access():
+                        await self.client.write_gatt_char(self._char_uuid, command, response=True)
+                except BleakError:
+                    _LOGGER.exception("Failed to write command")
+                    raise
+
+                if i < repeat_count - 1:
+                    await self._wait_next_pulse(timeline)
 
     async def _move_motor(self, command: bytes, repeat_count: int = 25) -> None:
         """Move a motor with the given command, then send stop."""
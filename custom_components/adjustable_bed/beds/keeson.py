@@ -15,7 +15,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from typing import TYPE_CHECKING, Any
 
 from bleak.backends.characteristic import BleakGATTCharacteristic
@@ -41,6 +41,14 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Keeson has head and feet motors; back/legs position keys map onto them
+_MOTOR_FOR_POSITION_KEY: dict[str, str] = {
+    "back": "head",
+    "head": "head",
+    "legs": "feet",
+    "feet": "feet",
+}
+
 
 class KeesonCommands:
     """Keeson command constants (32-bit values)."""
@@ -130,6 +138,7 @@ class KeesonController(BedController):
         super().__init__(coordinator)
         self._variant = variant
         self._notify_callback: Callable[[str, float], None] | None = None
+        self._notifying_keys: frozenset[str] = frozenset()
         self._motor_state: dict[str, bool | None] = {}
 
         # Position feedback state (for ergomotion variant)
@@ -274,6 +283,11 @@ class KeesonController(BedController):
         """Return the UUID of the control characteristic."""
         return self._char_uuid
 
+    @property
+    def notifying_position_keys(self) -> frozenset[str]:
+        """Return the motors reported via notifications (ergomotion variant only)."""
+        return self._notifying_keys
+
     # Capability properties
     @property
     def supports_preset_zero_g(self) -> bool:
@@ -447,6 +461,7 @@ class KeesonController(BedController):
                 self._notify_char_uuid,
                 self._on_notification,
             )
+            self._notifying_keys = frozenset({"back", "legs"})
             _LOGGER.debug("Started position notifications for Keeson/Ergomotion bed")
         except BleakError:
             _LOGGER.warning("Failed to start notifications")
@@ -540,8 +555,14 @@ class KeesonController(BedController):
         if self._foot_position is not None:
             self._notify_callback("legs", float(self._foot_position))
 
+    def connection_lost(self) -> None:
+        """Forget position subscriptions of the closed link."""
+        super().connection_lost()
+        self._notifying_keys = frozenset()
+
     async def stop_notify(self) -> None:
         """Stop listening for position notifications."""
+        self._notifying_keys = frozenset()
         if self._variant != KEESON_VARIANT_ERGOMOTION:
             return
 
@@ -622,6 +643,10 @@ class KeesonController(BedController):
     async def _move_motor(self, motor: str, direction: bool | None) -> None:
         """Move a motor in a direction or stop it, always sending STOP at the end."""
         self._motor_state[motor] = direction
+        await self._send_motor_state()
+
+    async def _send_motor_state(self) -> None:
+        """Drive the motors in _motor_state with one combined value, then STOP."""
         command = self._get_move_command()
 
         try:
@@ -642,6 +667,17 @@ class KeesonController(BedController):
             except Exception:
                 _LOGGER.debug("Failed to send STOP command during cleanup")
 
+    def supports_combined_move(self, directions: Mapping[str, bool]) -> bool:
+        """Return True if every position key maps to a different Keeson motor."""
+        motors = [_MOTOR_FOR_POSITION_KEY.get(key) for key in directions]
+        return None not in motors and len(set(motors)) == len(motors)
+
+    async def move_motors(self, directions: Mapping[str, bool]) -> None:
+        """Drive head and feet together by summing their move values."""
+        for key, up in directions.items():
+            self._motor_state[_MOTOR_FOR_POSITION_KEY[key]] = up
+        await self._send_motor_state()
+
     # Motor control methods
     async def move_head_up(self) -> None:
         """Move head up."""
@@ -231,26 +231,28 @@ class LeggettWilinkeController(BedController):
             repeat_delay_ms,
         )
 
-        for i in range(repeat_count):
-            if effective_cancel is not None and effective_cancel.is_set():
-                _LOGGER.info("Command cancelled after %d/%d writes", i, repeat_count)
-                return
-
-            try:
-                async with self._ble_lock:
-                    await self.client.write_gatt_char(self._char_uuid, command, response=True)
-            except BleakError as err:
-                _LOGGER.exception("Failed to write command")
-                if "not found" in str(err).lower() or "invalid" in str(err).lower():
-                    _LOGGER.warning(
-                        "Characteristic %s may not exist on this device.",
-                        self._char_uuid,
-                    )
-                    self.log_discovered_services(level=logging.INFO)
-                raise
-
-            if i < repeat_count - 1:
-                await asyncio.sleep(repeat_delay_ms / 1000)
+        async with self._pulse_train(repeat_count, repeat_delay_ms) as timeline:
+            for i in range(repeat_count):
+                if effective_cancel is not None and effective_cancel.is_set():
+                    _LOGGER.info("Command cancelled after %d/%d writes", i, repeat_count)
+                    return
+
+                timeline.fire()
+                try:
+                    async with self._ble_access():
+                        await self.client.write_gatt_char(self._char_uuid, command, response=True)
+                except BleakError as err:
+                    _LOGGER.exception("Failed to write command")
+                    if "not found" in str(err).lower() or "invalid" in str(err).lower():
+                        _LOGGER.warning(
+                            "Characteristic %s may not exist on this device.",
+                            self._char_uuid,
+                        )
+                        self.log_discovered_services(level=logging.INFO)
+                    raise
+
+                if i < repeat_count - 1:
+                    await self._wait_next_pulse(timeline)
 
     async def _send_command(self, command_byte: int, repeat: int | None = None) -> None:
         """Send a command to the bed."""
@@ -395,6 +395,7 @@ class LimossController(BedController):
             self._reported_motor_count = motor_count if motor_count > 0 else None
             self._memory_slot_count = memory_count
             self._vibration_count = vibration_count
+            self.invalidate_capabilities()
 
             _LOGGER.info(
                 "Limoss capabilities: buttons=%d motors=%d vibration=%d memory=%d",
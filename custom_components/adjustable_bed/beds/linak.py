@@ -8,7 +8,8 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import logging
-from collections.abc import Callable
+import time
+from collections.abc import Callable, Mapping
 from typing import TYPE_CHECKING, Any
 
 from bleak.exc import BleakError
@@ -23,6 +24,7 @@ from ..const import (
     LINAK_POSITION_FEET_UUID,
     LINAK_POSITION_HEAD_UUID,
     LINAK_POSITION_LEG_UUID,
+    POSITION_READ_FRESHNESS,
 )
 from .base import BedController
 
@@ -96,6 +98,11 @@ class LinakController(BedController):
         super().__init__(coordinator)
         self._notify_callback: Callable[[str, float], None] | None = None
         self._notify_handles: dict[str, int] = {}
+        self._notifying_keys: frozenset[str] = frozenset()
+        # Monotonic time each position was last updated (notification or read)
+        self._position_updated_at: dict[str, float] = {}
+        self._position_reads = 0
+        self._position_reads_skipped = 0
         _LOGGER.debug(
             "LinakController initialized (motor_count: %d)",
             coordinator.motor_count,
@@ -135,6 +142,15 @@ class LinakController(BedController):
         """
         return True
 
+    @property
+    def notifying_position_keys(self) -> frozenset[str]:
+        """Return motors whose position notifications were subscribed.
+
+        The back motor accepts the subscription on most Linak beds but never
+        sends updates, so it is always polled via read_non_notifying_positions().
+        """
+        return self._notifying_keys
+
     @property
     def memory_slot_count(self) -> int:
         """Return 4 - Linak beds support memory slots 1-4."""
@@ -229,41 +245,31 @@ class LinakController(BedController):
             [name for name, _, _, _ in position_chars],
         )
 
-        successful = []
-        failed = []
+        client = self.client
 
-        for name, uuid, max_pos, max_angle in position_chars:
+        def make_handler(
+            n: str, mp: int, ma: float, char_uuid: str
+        ) -> Callable[[Any, bytearray], None]:
+            def handler(_: Any, data: bytearray) -> None:
+                _LOGGER.debug(
+                    "Notification received for %s: raw_data=%s (%d bytes)",
+                    n,
+                    data.hex(),
+                    len(data),
+                )
+                self.forward_raw_notification(char_uuid, bytes(data))
+                self._handle_position_data(n, data, mp, ma)
+
+            return handler
+
+        async def subscribe(name: str, uuid: str, max_pos: int, max_angle: float) -> bool:
             _LOGGER.debug(
                 "Attempting to start notifications for %s (UUID: %s)...",
                 name,
                 uuid,
             )
             try:
-
-                def make_handler(
-                    n: str, mp: int, ma: float, char_uuid: str
-                ) -> Callable[[Any, bytearray], None]:
-                    def handler(_: Any, data: bytearray) -> None:
-                        _LOGGER.debug(
-                            "Notification received for %s: raw_data=%s (%d bytes)",
-                            n,
-                            data.hex(),
-                            len(data),
-                        )
-                        self.forward_raw_notification(char_uuid, bytes(data))
-                        self._handle_position_data(n, data, mp, ma)
-
-                    return handler
-
-                await self.client.start_notify(uuid, make_handler(name, max_pos, max_angle, uuid))
-                _LOGGER.debug(
-                    "Successfully started notifications for %s position (UUID: %s, max_pos: %d, max_angle: %.1f°)",
-                    name,
-                    uuid,
-                    max_pos,
-                    max_angle,
-                )
-                successful.append(name)
+                await client.start_notify(uuid, make_handler(name, max_pos, max_angle, uuid))
             except BleakError as err:
                 _LOGGER.debug(
                     "Could not start notifications for %s position (UUID: %s): %s (type: %s)",
@@ -272,7 +278,23 @@ class LinakController(BedController):
                     err,
                     type(err).__name__,
                 )
-                failed.append(name)
+                return False
+            _LOGGER.debug(
+                "Successfully started notifications for %s position (UUID: %s, max_pos: %d, max_angle: %.1f°)",
+                name,
+                uuid,
+                max_pos,
+                max_angle,
+            )
+            return True
+
+        # Subscriptions are independent, so request them all at once instead of
+        # paying one GATT round-trip per motor
+        results = await asyncio.gather(*(subscribe(*char) for char in position_chars))
+        successful = [char[0] for char, ok in zip(position_chars, results, strict=True) if ok]
+        failed = [char[0] for char, ok in zip(position_chars, results, strict=True) if not ok]
+
+        self._notifying_keys = frozenset(successful) - {"back"}
 
         if successful:
             _LOGGER.info(
@@ -328,11 +350,26 @@ class LinakController(BedController):
             max_angle,
         )
 
+        self._position_updated_at[name] = time.monotonic()
         if self._notify_callback:
             self._notify_callback(name, angle)
 
+    @property
+    def position_read_stats(self) -> dict[str, int]:
+        """Return how many position reads were made and skipped as still fresh."""
+        return {
+            "reads": self._position_reads,
+            "skipped_fresh": self._position_reads_skipped,
+        }
+
+    def connection_lost(self) -> None:
+        """Forget position subscriptions of the closed link."""
+        super().connection_lost()
+        self._notifying_keys = frozenset()
+
     async def stop_notify(self) -> None:
         """Stop listening for position notifications."""
+        self._notifying_keys = frozenset()
         if self.client is None or not self.client.is_connected:
             return
 
@@ -378,16 +415,40 @@ class LinakController(BedController):
                 ("feet", LINAK_POSITION_FEET_UUID, LINAK_FEET_MAX_POSITION, feet_max_angle)
             )
 
-        for name, uuid, max_pos, max_angle in position_chars:
-            try:
-                # Acquire BLE lock to prevent conflicts with concurrent writes
-                async with self._ble_lock:
+        # Skip notifying motors updated moments ago - they push every change, so
+        # a recent value is current. Polled motors (back) are always read.
+        now = time.monotonic()
+        planned = [
+            char
+            for char in position_chars
+            if char[0] not in self._notifying_keys
+            or now - self._position_updated_at.get(char[0], float("-inf"))
+            >= POSITION_READ_FRESHNESS
+        ]
+        skipped = len(position_chars) - len(planned)
+        self._position_reads_skipped += skipped
+        if skipped:
+            _LOGGER.debug(
+                "Skipping %d fresh position read(s), reading: %s",
+                skipped,
+                [name for name, _, _, _ in planned],
+            )
+        if not planned:
+            return
+
+        # Acquire BLE lock once for all reads to prevent conflicts with concurrent
+        # writes; the reads then run back-to-back
+        async with self._ble_access():
+            for name, uuid, max_pos, max_angle in planned:
+                self._position_reads += 1
+                try:
                     data = await self.client.read_gatt_char(uuid)
+                except BleakError:
+                    _LOGGER.debug("Could not read position for %s", name)
+                    continue
                 if data:
                     _LOGGER.debug("Read position for %s: %s", name, data.hex())
                     self._handle_position_data(name, bytearray(data), max_pos, max_angle)
-            except BleakError:
-                _LOGGER.debug("Could not read position for %s", name)
 
     async def read_non_notifying_positions(self) -> None:
         """Read positions only for motors that don't support notifications.
@@ -403,7 +464,9 @@ class LinakController(BedController):
         back_max_angle = self._coordinator.back_max_angle
         try:
             # Acquire BLE lock to prevent conflicts with concurrent writes
-            async with self._ble_lock:
+            # (runs inside the held lock when scheduled into a burst gap)
+            async with self._ble_access():
+                self._position_reads += 1
                 data = await self.client.read_gatt_char(LINAK_POSITION_BACK_UUID)
             if data:
                 _LOGGER.debug("Polled back position: %s", data.hex())
@@ -480,6 +543,24 @@ class LinakController(BedController):
         """Stop all motors."""
         await self.write_command(LinakCommands.MOVE_STOP, cancel_event=asyncio.Event())
 
+    def supports_combined_move(self, directions: Mapping[str, bool]) -> bool:
+        """Return True for single motors, or every motor of the bed moving up.
+
+        Linak only has an all-motors frame for moving up (MOVE_ALL_UP). The
+        matching all-down value (0x00) is INITIALIZE_DOWN and must not be used.
+        """
+        if len(directions) == 1:
+            return True
+        motors = ("back", "legs", "head", "feet")[: max(2, self._coordinator.motor_count)]
+        return set(directions) == set(motors) and all(directions.values())
+
+    async def move_motors(self, directions: Mapping[str, bool]) -> None:
+        """Drive motors together using MOVE_ALL_UP."""
+        if len(directions) == 1:
+            await super().move_motors(directions)
+            return
+        await self._move_with_stop(LinakCommands.MOVE_ALL_UP)
+
     # Preset methods
     async def preset_flat(self) -> None:
         """Go to flat position (uses memory 1 which is typically flat)."""
@@ -25,12 +25,14 @@ from typing import TYPE_CHECKING, cast
 from bleak.backends.characteristic import BleakGATTCharacteristic
 from bleak.exc import BleakError
 
+from ..command_queue import CommandPriority
 from ..const import (
     OCTO_CHAR_UUID,
     OCTO_LIGHT_AUTO_OFF_SECONDS,
     OCTO_PIN_KEEPALIVE_INTERVAL,
     OCTO_STAR2_CHAR_UUID,
 )
+from ..setup_pipeline import SETUP_STEP_NOTIFY, SetupStep
 from .base import BedController
 
 if TYPE_CHECKING:
@@ -285,6 +287,7 @@ class OctoController(BedController):
             self._has_lights = True
             _LOGGER.info("Light feature detected: bed has under-bed lights")
 
+        self.invalidate_capabilities()
         # Signal that we received at least one feature response
         self._features_loaded.set()
 
@@ -326,20 +329,22 @@ class OctoController(BedController):
             repeat_delay_ms,
         )
 
-        for i in range(repeat_count):
-            if effective_cancel is not None and effective_cancel.is_set():
-                _LOGGER.info("Command cancelled after %d/%d writes", i, repeat_count)
-                return
+        async with self._pulse_train(repeat_count, repeat_delay_ms) as timeline:
+            for i in range(repeat_count):
+                if effective_cancel is not None and effective_cancel.is_set():
+                    _LOGGER.info("Command cancelled after %d/%d writes", i, repeat_count)
+                    return
 
-            try:
-                async with self._ble_lock:
-                    await self.client.write_gatt_char(OCTO_CHAR_UUID, command, response=True)
-            except BleakError:
-                _LOGGER.exception("Failed to write command")
-                raise
+                timeline.fire()
+                try:
+                    async with self._ble_access():
+                        await self.client.write_gatt_char(OCTO_CHAR_UUID, command, response=True)
+                except BleakError:
+                    _LOGGER.exception("Failed to write command")
+                    raise
 
-            if i < repeat_count - 1:
-                await asyncio.sleep(repeat_delay_ms / 1000)
+                if i < repeat_count - 1:
+                    await self._wait_next_pulse(timeline)
 
     async def _write_octo_command(
         self,
@@ -370,6 +375,11 @@ class OctoController(BedController):
             except BleakError as err:
                 _LOGGER.debug("Could not start notifications: %s", err)
 
+    def connection_lost(self) -> None:
+        """Forget the notification subscription of the closed link."""
+        super().connection_lost()
+        self._notifications_started = False
+
     async def stop_notify(self) -> None:
         """Stop listening for notifications."""
         self._notifications_started = False
@@ -436,6 +446,28 @@ class OctoController(BedController):
         """Return number of memory preset slots."""
         return self._memory_count if self._memory_count is not None else 0
 
+    def post_connect_steps(self) -> list[SetupStep]:
+        """Discover features, then authenticate and keep the PIN alive."""
+        return [
+            # discover_features subscribes itself if start_notify skipped it
+            SetupStep(
+                "discover_features", self._async_discover_features_once, after=(SETUP_STEP_NOTIFY,)
+            ),
+            SetupStep("send_pin", self._async_authenticate, after=("discover_features",)),
+        ]
+
+    async def _async_discover_features_once(self) -> None:
+        """Discover features unless a previous connection already completed discovery."""
+        if self._features_complete.is_set():
+            _LOGGER.debug("Reusing Octo features discovered on a previous connection")
+            return
+        await self.discover_features()
+
+    async def _async_authenticate(self) -> None:
+        """Send the initial PIN and start the keep-alive if the bed requires it."""
+        await self.send_pin()
+        await self.start_keepalive()
+
     async def discover_features(self) -> bool:
         """Discover bed features including PIN requirement and lights.
 
@@ -474,6 +506,7 @@ class OctoController(BedController):
         self._pin_locked = None
         self._has_lights = None
         self._memory_count = None
+        self.invalidate_capabilities()
 
         _LOGGER.debug("Requesting bed features...")
 
@@ -493,6 +526,7 @@ class OctoController(BedController):
                     self._has_lights = False
                 if self._memory_count is None:
                     self._memory_count = 0
+                self.invalidate_capabilities()
 
                 _LOGGER.info(
                     "Feature discovery complete: hasPin=%s, pinLocked=%s, hasLights=%s, memorySlots=%d",
@@ -509,6 +543,7 @@ class OctoController(BedController):
                 self._pin_locked = bool(self._pin)
                 self._has_lights = True  # Assume lights exist for backward compatibility
                 self._memory_count = 0  # Assume no memory support if not reported
+                self.invalidate_capabilities()
                 return False
 
         except BleakError as err:
@@ -784,6 +819,8 @@ class OctoController(BedController):
                         lambda c: cast("OctoController", c).send_pin(),
                         cancel_running=False,
                         skip_disconnect=True,
+                        priority=CommandPriority.BACKGROUND,
+                        coalesce_key="octo_keepalive",
                     )
                 else:
                     _LOGGER.debug("Keep-alive: not connected, skipping PIN send")
@@ -869,20 +906,22 @@ class OctoStar2Controller(BedController):
             repeat_delay_ms,
         )
 
-        for i in range(repeat_count):
-            if effective_cancel is not None and effective_cancel.is_set():
-                _LOGGER.info("Command cancelled after %d/%d writes", i, repeat_count)
-                return
-
-            try:
-                async with self._ble_lock:
-                    await self.client.write_gatt_char(OCTO_STAR2_CHAR_UUID, command, response=True)
-            except BleakError:
-                _LOGGER.exception("Failed to write command")
-                raise
-
-            if i < repeat_count - 1:
-                await asyncio.sleep(repeat_delay_ms / 1000)
+        async with self._pulse_train(repeat_count, repeat_delay_ms) as timeline:
+            for i in range(repeat_count):
+                if effective_cancel is not None and effective_cancel.is_set():
+                    _LOGGER.info("Command cancelled after %d/%d writes", i, repeat_count)
+                    return
+
+                timeline.fire()
+                try:
+                    async with self._ble_access():
+                        await self.client.write_gatt_char(OCTO_STAR2_CHAR_UUID, command, response=True)
+                except BleakError:
+                    _LOGGER.exception("Failed to write command")
+                    raise
+
+                if i < repeat_count - 1:
+                    await self._wait_next_pulse(timeline)
 
     async def start_notify(
         self, callback: Callable[[str, float], None] | None = None
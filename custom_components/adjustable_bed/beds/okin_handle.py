@@ -155,21 +155,23 @@ class OkinHandleController(BedController):
             repeat_delay_ms,
         )
 
-        for i in range(repeat_count):
-            if effective_cancel is not None and effective_cancel.is_set():
-                _LOGGER.info("Command cancelled after %d/%d writes", i, repeat_count)
-                return
-
-            try:
-                # Write to handle directly (Bleak supports integer handles)
-                async with self._ble_lock:
-                    await self.client.write_gatt_char(DEWERTOKIN_WRITE_HANDLE, command, response=True)
-            except BleakError:
-                _LOGGER.exception("Failed to write command")
-                raise
-
-            if i < repeat_count - 1:
-                await asyncio.sleep(repeat_delay_ms / 1000)
+        async with self._pulse_train(repeat_count, repeat_delay_ms) as timeline:
+            for i in range(repeat_count):
+                if effective_cancel is not None and effective_cancel.is_set():
+                    _LOGGER.info("Command cancelled after %d/%d writes", i, repeat_count)
+                    return
+
+                timeline.fire()
+                try:
+                    # Write to handle directly (Bleak supports integer handles)
+                    async with self._ble_access():
+                        await self.client.write_gatt_char(DEWERTOKIN_WRITE_HANDLE, command, response=True)
+                except BleakError:
+                    _LOGGER.exception("Failed to write command")
+                    raise
+
+                if i < repeat_count - 1:
+                    await self._wait_next_pulse(timeline)
 
     async def _send_stop(self) -> None:
         """Send STOP command with fresh cancel event."""
@@ -273,23 +273,25 @@ class OkinUuidController(BedController):
             repeat_delay_ms,
         )
 
-        for i in range(repeat_count):
-            if effective_cancel is not None and effective_cancel.is_set():
-                _LOGGER.info("Command cancelled after %d/%d writes", i, repeat_count)
-                return
+        async with self._pulse_train(repeat_count, repeat_delay_ms) as timeline:
+            for i in range(repeat_count):
+                if effective_cancel is not None and effective_cancel.is_set():
+                    _LOGGER.info("Command cancelled after %d/%d writes", i, repeat_count)
+                    return
 
-            try:
-                # Acquire BLE lock to prevent conflicts with concurrent position reads
-                async with self._ble_lock:
-                    await self.client.write_gatt_char(
-                        OKIMAT_WRITE_CHAR_UUID, command, response=True
-                    )
-            except BleakError:
-                _LOGGER.exception("Failed to write command")
-                raise
-
-            if i < repeat_count - 1:
-                await asyncio.sleep(repeat_delay_ms / 1000)
+                timeline.fire()
+                try:
+                    # Acquire BLE lock to prevent conflicts with concurrent position reads
+                    async with self._ble_access():
+                        await self.client.write_gatt_char(
+                            OKIMAT_WRITE_CHAR_UUID, command, response=True
+                        )
+                except BleakError:
+                    _LOGGER.exception("Failed to write command")
+                    raise
+
+                if i < repeat_count - 1:
+                    await self._wait_next_pulse(timeline)
 
     async def start_notify(
         self, callback: Callable[[str, float], None] | None = None
@@ -0,0 +1,160 @@
+"""Deadline-based pulse timing for repeated motor commands.
+
+Most beds keep a motor running only while commands keep arriving, so movement
+is sent as a train of identical writes spaced ``repeat_delay_ms`` apart. Sleeping
+for the full delay *after* each write makes the real period equal to the write
+round-trip plus the delay, which drifts badly over Bluetooth proxies.
+
+PulseTimeline instead fires each pulse on a fixed monotonic timeline anchored at
+the first write and only sleeps for whatever time is left until the next
+deadline, so write latency is absorbed instead of accumulated.
+
+A timeline can also be given a shared start anchor. Its pulses then fall on the
+anchor's lattice (``anchor + n * period``), which keeps the pulse trains of two
+beds that are driven together (see bed_group.py) in phase.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class PulseStats:
+    """Timing statistics for one completed pulse train."""
+
+    pulse_count: int
+    target_period_ms: float
+    achieved_period_ms: float
+    jitter_ms: float
+    max_jitter_ms: float
+    slipped: int
+    duration_ms: float
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a JSON-friendly dict for diagnostics."""
+        return {
+            "pulse_count": self.pulse_count,
+            "target_period_ms": round(self.target_period_ms, 1),
+            "achieved_period_ms": round(self.achieved_period_ms, 1),
+            "jitter_ms": round(self.jitter_ms, 1),
+            "max_jitter_ms": round(self.max_jitter_ms, 1),
+            "slipped": self.slipped,
+            "duration_ms": round(self.duration_ms, 1),
+        }
+
+
+class PulseTimeline:
+    """Schedule repeated writes on a fixed timeline.
+
+    Usage inside a write loop::
+
+        for i in range(repeat_count):
+            timeline.fire()
+            await client.write_gatt_char(...)
+            if i < repeat_count - 1:
+                await timeline.wait_next()
+
+    Pulse ``n`` is due at ``anchor + n * period``. If a write overruns its slot
+    the next pulse is sent immediately. If a whole slot is missed (e.g. a proxy
+    stalled for longer than one period), the timeline is re-anchored rather than
+    firing a catch-up burst, which some controllers treat as a new button press.
+    """
+
+    def __init__(self, period_ms: float, start_anchor: float | None = None) -> None:
+        """Initialize the timeline.
+
+        Args:
+            period_ms: Target interval between pulse starts in milliseconds.
+            start_anchor: Optional monotonic time shared with other timelines.
+                A first pulse fired after it is anchored to the next lattice
+                point of this anchor, so the second pulse lands back on the
+                lattice at least one full period after the first.
+        """
+        self._period = max(period_ms, 0) / 1000
+        self._start_anchor = start_anchor
+        self._anchor: float | None = None
+        self._first_fire: float | None = None
+        self._last_fire: float | None = None
+        self._fired = 0
+        self._slipped = 0
+        self._interval_sum = 0.0
+        self._deviation_sum = 0.0
+        self._max_deviation = 0.0
+
+    @property
+    def fired(self) -> int:
+        """Return the number of pulses fired so far."""
+        return self._fired
+
+    @property
+    def first_fire(self) -> float | None:
+        """Return the monotonic time the first pulse was fired, or None before it."""
+        return self._first_fire
+
+    def fire(self) -> None:
+        """Record that a pulse is being sent now."""
+        now = time.monotonic()
+        if self._anchor is None:
+            self._anchor = self._initial_anchor(now)
+            self._first_fire = now
+        if self._last_fire is not None:
+            interval = now - self._last_fire
+            deviation = abs(interval - self._period)
+            self._interval_sum += interval
+            self._deviation_sum += deviation
+            self._max_deviation = max(self._max_deviation, deviation)
+        self._last_fire = now
+        self._fired += 1
+
+    def _initial_anchor(self, now: float) -> float:
+        """Return the anchor for a timeline whose first pulse fires at ``now``."""
+        start = self._start_anchor
+        if start is None or self._period <= 0 or now < start:
+            return now
+        # Snap forward onto the shared lattice so later pulses stay in phase.
+        # Snapping back would bring the second pulse due early, up to almost
+        # back-to-back with the first.
+        offset = (now - start) % self._period
+        if offset == 0:
+            return now
+        return now - offset + self._period
+
+    def next_deadline(self) -> float | None:
+        """Return the monotonic time the next pulse is due, or None before the first."""
+        if self._anchor is None:
+            return None
+        return self._anchor + self._fired * self._period
+
+    async def wait_next(self) -> None:
+        """Sleep until the next pulse is due, compensating for write latency."""
+        deadline = self.next_deadline()
+        if deadline is None:
+            return
+        now = time.monotonic()
+        remaining = deadline - now
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+        elif self._period > 0 and -remaining >= self._period:
+            # Missed at least one whole slot: restart the timeline from now
+            # instead of firing back-to-back pulses to catch up.
+            self._anchor = now - self._fired * self._period
+            self._slipped += 1
+
+    def stats(self) -> PulseStats | None:
+        """Return statistics for the pulses fired so far, or None for single writes."""
+        if self._fired < 2 or self._first_fire is None or self._last_fire is None:
+            return None
+        intervals = self._fired - 1
+        return PulseStats(
+            pulse_count=self._fired,
+            target_period_ms=self._period * 1000,
+            achieved_period_ms=self._interval_sum / intervals * 1000,
+            jitter_ms=self._deviation_sum / intervals * 1000,
+            max_jitter_ms=self._max_deviation * 1000,
+            slipped=self._slipped,
+            duration_ms=(self._last_fire - self._first_fire) * 1000,
+        )
@@ -240,22 +240,24 @@ class RemacroController(BedController):
             repeat_delay_ms,
         )
 
-        for i in range(repeat_count):
-            if effective_cancel is not None and effective_cancel.is_set():
-                _LOGGER.info("Command cancelled after %d/%d writes", i, repeat_count)
-                return
-
-            try:
-                async with self._ble_lock:
-                    await self.client.write_gatt_char(
-                        REMACRO_WRITE_CHAR_UUID, command, response=False
-                    )
-            except BleakError:
-                _LOGGER.exception("Failed to write command")
-                raise
-
-            if i < repeat_count - 1:
-                await asyncio.sleep(repeat_delay_ms / 1000)
+        async with self._pulse_train(repeat_count, repeat_delay_ms) as timeline:
+            for i in range(repeat_count):
+                if effective_cancel is not None and effective_cancel.is_set():
+                    _LOGGER.info("Command cancelled after %d/%d writes", i, repeat_count)
+                    return
+
+                timeline.fire()
+                try:
+                    async with self._ble_access():
+                        await self.client.write_gatt_char(
+                            REMACRO_WRITE_CHAR_UUID, command, response=False
+                        )
+                except BleakError:
+                    _LOGGER.exception("Failed to write command")
+                    raise
+
+                if i < repeat_count - 1:
+                    await self._wait_next_pulse(timeline)
 
     async def _send_command(self, command: int, repeat_count: int = 1) -> None:
         """Build and send a command packet."""
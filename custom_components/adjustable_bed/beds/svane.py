@@ -197,24 +197,26 @@ class SvaneController(BedController):
             repeat_delay_ms,
         )
 
-        for i in range(repeat_count):
-            if effective_cancel is not None and effective_cancel.is_set():
-                _LOGGER.info("Command cancelled after %d/%d writes", i, repeat_count)
-                return
+        async with self._pulse_train(repeat_count, repeat_delay_ms) as timeline:
+            for i in range(repeat_count):
+                if effective_cancel is not None and effective_cancel.is_set():
+                    _LOGGER.info("Command cancelled after %d/%d writes", i, repeat_count)
+                    return
 
-            try:
-                async with self._ble_lock:
-                    await self.client.write_gatt_char(char, command, response=True)
-            except BleakError:
-                _LOGGER.exception(
-                    "Failed to write to service %s char %s",
-                    service_uuid[:8],
-                    char_uuid[:8],
-                )
-                raise
+                timeline.fire()
+                try:
+                    async with self._ble_access():
+                        await self.client.write_gatt_char(char, command, response=True)
+                except BleakError:
+                    _LOGGER.exception(
+                        "Failed to write to service %s char %s",
+                        service_uuid[:8],
+                        char_uuid[:8],
+                    )
+                    raise
 
-            if i < repeat_count - 1:
-                await asyncio.sleep(repeat_delay_ms / 1000)
+                if i < repeat_count - 1:
+                    await self._wait_next_pulse(timeline)
 
     async def write_command(
         self,
@@ -281,21 +283,23 @@ class SvaneController(BedController):
             repeat_delay_ms,
         )
 
-        for i in range(repeat_count):
-            if effective_cancel is not None and effective_cancel.is_set():
-                _LOGGER.info("Preset command cancelled after %d/%d writes", i, repeat_count)
-                return
-
-            for char in position_chars:
-                try:
-                    async with self._ble_lock:
-                        await self.client.write_gatt_char(char, command, response=True)
-                except BleakError:
-                    _LOGGER.exception("Failed to write preset command to %s", char.uuid[:8])
-                    raise
-
-            if i < repeat_count - 1:
-                await asyncio.sleep(repeat_delay_ms / 1000)
+        async with self._pulse_train(repeat_count, repeat_delay_ms) as timeline:
+            for i in range(repeat_count):
+                if effective_cancel is not None and effective_cancel.is_set():
+                    _LOGGER.info("Preset command cancelled after %d/%d writes", i, repeat_count)
+                    return
+
+                timeline.fire()
+                for char in position_chars:
+                    try:
+                        async with self._ble_access():
+                            await self.client.write_gatt_char(char, command, response=True)
+                    except BleakError:
+                        _LOGGER.exception("Failed to write preset command to %s", char.uuid[:8])
+                        raise
+
+                if i < repeat_count - 1:
+                    await self._wait_next_pulse(timeline)
 
         # Compatibility fallback: some Svane firmware revisions still react to
         # preset commands on MEMORY characteristics.
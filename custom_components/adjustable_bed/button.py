@@ -13,6 +13,8 @@ from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .beds.capabilities import Capability
+from .command_queue import CommandPriority
 from .const import (
     CONF_HAS_MASSAGE,
     DOMAIN,
@@ -43,6 +45,8 @@ class AdjustableBedButtonEntityDescription(ButtonEntityDescription):
     memory_slot: int | None = None
     # Whether this is a memory programming button (requires supports_memory_programming)
     is_program_button: bool = False
+    # Command queue priority when other commands are waiting
+    priority: CommandPriority = CommandPriority.ACCESSORY
 
 
 BUTTON_DESCRIPTIONS: tuple[AdjustableBedButtonEntityDescription, ...] = (
@@ -55,6 +59,7 @@ BUTTON_DESCRIPTIONS: tuple[AdjustableBedButtonEntityDescription, ...] = (
         cancel_movement=True,
         required_capability="supports_memory_presets",
         memory_slot=1,
+        priority=CommandPriority.PRESET,
     ),
     AdjustableBedButtonEntityDescription(
         key="preset_memory_2",
@@ -64,6 +69,7 @@ BUTTON_DESCRIPTIONS: tuple[AdjustableBedButtonEntityDescription, ...] = (
         cancel_movement=True,
         required_capability="supports_memory_presets",
         memory_slot=2,
+        priority=CommandPriority.PRESET,
     ),
     AdjustableBedButtonEntityDescription(
         key="preset_memory_3",
@@ -73,6 +79,7 @@ BUTTON_DESCRIPTIONS: tuple[AdjustableBedButtonEntityDescription, ...] = (
         cancel_movement=True,
         required_capability="supports_memory_presets",
         memory_slot=3,
+        priority=CommandPriority.PRESET,
     ),
     AdjustableBedButtonEntityDescription(
         key="preset_memory_4",
@@ -82,6 +89,7 @@ BUTTON_DESCRIPTIONS: tuple[AdjustableBedButtonEntityDescription, ...] = (
         cancel_movement=True,
         required_capability="supports_memory_presets",
         memory_slot=4,
+        priority=CommandPriority.PRESET,
     ),
     AdjustableBedButtonEntityDescription(
         key="preset_flat",
@@ -90,6 +98,7 @@ BUTTON_DESCRIPTIONS: tuple[AdjustableBedButtonEntityDescription, ...] = (
         press_fn=lambda ctrl: ctrl.preset_flat(),
         cancel_movement=True,
         required_capability="supports_preset_flat",
+        priority=CommandPriority.PRESET,
     ),
     AdjustableBedButtonEntityDescription(
         key="preset_zero_g",
@@ -98,6 +107,7 @@ BUTTON_DESCRIPTIONS: tuple[AdjustableBedButtonEntityDescription, ...] = (
         press_fn=lambda ctrl: ctrl.preset_zero_g(),
         cancel_movement=True,
         required_capability="supports_preset_zero_g",
+        priority=CommandPriority.PRESET,
     ),
     AdjustableBedButtonEntityDescription(
         key="preset_anti_snore",
@@ -106,6 +116,7 @@ BUTTON_DESCRIPTIONS: tuple[AdjustableBedButtonEntityDescription, ...] = (
         press_fn=lambda ctrl: ctrl.preset_anti_snore(),
         cancel_movement=True,
         required_capability="supports_preset_anti_snore",
+        priority=CommandPriority.PRESET,
     ),
     AdjustableBedButtonEntityDescription(
         key="preset_tv",
@@ -114,6 +125,7 @@ BUTTON_DESCRIPTIONS: tuple[AdjustableBedButtonEntityDescription, ...] = (
         press_fn=lambda ctrl: ctrl.preset_tv(),
         cancel_movement=True,
         required_capability="supports_preset_tv",
+        priority=CommandPriority.PRESET,
     ),
     AdjustableBedButtonEntityDescription(
         key="preset_lounge",
@@ -122,6 +134,7 @@ BUTTON_DESCRIPTIONS: tuple[AdjustableBedButtonEntityDescription, ...] = (
         press_fn=lambda ctrl: cast(Any, ctrl).preset_lounge(),
         cancel_movement=True,
         required_capability="supports_preset_lounge",
+        priority=CommandPriority.PRESET,
     ),
     AdjustableBedButtonEntityDescription(
         key="preset_incline",
@@ -130,6 +143,7 @@ BUTTON_DESCRIPTIONS: tuple[AdjustableBedButtonEntityDescription, ...] = (
         press_fn=lambda ctrl: cast(Any, ctrl).preset_incline(),
         cancel_movement=True,
         required_capability="supports_preset_incline",
+        priority=CommandPriority.PRESET,
     ),
     AdjustableBedButtonEntityDescription(
         key="preset_yoga",
@@ -138,6 +152,7 @@ BUTTON_DESCRIPTIONS: tuple[AdjustableBedButtonEntityDescription, ...] = (
         press_fn=lambda ctrl: ctrl.preset_yoga(),
         cancel_movement=True,
         required_capability="supports_preset_yoga",
+        priority=CommandPriority.PRESET,
     ),
     # Program buttons (config category)
     AdjustableBedButtonEntityDescription(
@@ -149,6 +164,7 @@ BUTTON_DESCRIPTIONS: tuple[AdjustableBedButtonEntityDescription, ...] = (
         required_capability="supports_memory_presets",
         memory_slot=1,
         is_program_button=True,
+        priority=CommandPriority.PRESET,
     ),
     AdjustableBedButtonEntityDescription(
         key="program_memory_2",
@@ -159,6 +175,7 @@ BUTTON_DESCRIPTIONS: tuple[AdjustableBedButtonEntityDescription, ...] = (
         required_capability="supports_memory_presets",
         memory_slot=2,
         is_program_button=True,
+        priority=CommandPriority.PRESET,
     ),
     AdjustableBedButtonEntityDescription(
         key="program_memory_3",
@@ -169,6 +186,7 @@ BUTTON_DESCRIPTIONS: tuple[AdjustableBedButtonEntityDescription, ...] = (
         required_capability="supports_memory_presets",
         memory_slot=3,
         is_program_button=True,
+        priority=CommandPriority.PRESET,
     ),
     AdjustableBedButtonEntityDescription(
         key="program_memory_4",
@@ -179,6 +197,7 @@ BUTTON_DESCRIPTIONS: tuple[AdjustableBedButtonEntityDescription, ...] = (
         required_capability="supports_memory_presets",
         memory_slot=4,
         is_program_button=True,
+        priority=CommandPriority.PRESET,
     ),
     # Stop button
     AdjustableBedButtonEntityDescription(
@@ -354,6 +373,7 @@ BUTTON_DESCRIPTIONS: tuple[AdjustableBedButtonEntityDescription, ...] = (
         press_fn=lambda ctrl: ctrl.move_head_up(),
         cancel_movement=True,
         required_capability="has_discrete_motor_control",
+        priority=CommandPriority.MOTOR,
     ),
     AdjustableBedButtonEntityDescription(
         key="head_down",
@@ -362,6 +382,7 @@ BUTTON_DESCRIPTIONS: tuple[AdjustableBedButtonEntityDescription, ...] = (
         press_fn=lambda ctrl: ctrl.move_head_down(),
         cancel_movement=True,
         required_capability="has_discrete_motor_control",
+        priority=CommandPriority.MOTOR,
     ),
     AdjustableBedButtonEntityDescription(
         key="legs_up",
@@ -370,6 +391,7 @@ BUTTON_DESCRIPTIONS: tuple[AdjustableBedButtonEntityDescription, ...] = (
         press_fn=lambda ctrl: ctrl.move_legs_up(),
         cancel_movement=True,
         required_capability="has_discrete_motor_control",
+        priority=CommandPriority.MOTOR,
     ),
     AdjustableBedButtonEntityDescription(
         key="legs_down",
@@ -378,6 +400,7 @@ BUTTON_DESCRIPTIONS: tuple[AdjustableBedButtonEntityDescription, ...] = (
         press_fn=lambda ctrl: ctrl.move_legs_down(),
         cancel_movement=True,
         required_capability="has_discrete_motor_control",
+        priority=CommandPriority.MOTOR,
     ),
 )
 
@@ -391,6 +414,7 @@ async def async_setup_entry(
     coordinator: AdjustableBedCoordinator = hass.data[DOMAIN][entry.entry_id]
     has_massage = entry.data.get(CONF_HAS_MASSAGE, False)
     controller = coordinator.controller
+    capabilities = controller.capabilities if controller is not None else None
 
     entities = []
     for description in BUTTON_DESCRIPTIONS:
@@ -398,26 +422,23 @@ async def async_setup_entry(
             continue
         # Skip toggle_light if controller supports discrete light control (use switch instead)
         if description.key == "toggle_light":
-            if controller and getattr(controller, "supports_discrete_light_control", False):
+            if capabilities is not None and capabilities.has(Capability.DISCRETE_LIGHT_CONTROL):
                 continue
         # Skip buttons that require capabilities the controller doesn't have
         if description.required_capability is not None:
-            if controller is None:
+            if capabilities is None:
                 continue
-            if not getattr(controller, description.required_capability, False):
+            if not capabilities.supports(description.required_capability):
                 continue
         # Check memory slot count for memory preset/program buttons
-        if description.memory_slot is not None and controller is not None:
-            slot_count = getattr(
-                controller, "memory_slot_count", 4
-            )  # Default to 4 for backward compat
-            if description.memory_slot > slot_count:
+        if description.memory_slot is not None and capabilities is not None:
+            if description.memory_slot > capabilities.memory_slot_count:
                 continue
         # Skip program buttons if controller doesn't support memory programming
         if (
             description.is_program_button
-            and controller is not None
-            and not getattr(controller, "supports_memory_programming", False)
+            and capabilities is not None
+            and not capabilities.has(Capability.MEMORY_PROGRAMMING)
         ):
             continue
         entities.append(AdjustableBedButton(coordinator, description))
@@ -483,6 +504,9 @@ class AdjustableBedButton(AdjustableBedEntity, ButtonEntity):
             await self._coordinator.async_execute_controller_command(
                 self.entity_description.press_fn,
                 cancel_running=self.entity_description.cancel_movement,
+                priority=self.entity_description.priority,
+                # Repeated presses while the first is still queued collapse into one
+                coalesce_key=f"button:{self.entity_description.key}",
             )
             _LOGGER.debug("Button action completed: %s", self.entity_description.key)
         except Exception:
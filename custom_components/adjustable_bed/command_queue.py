@@ -0,0 +1,243 @@
+"""Priority command queue for Adjustable Bed coordinators.
+
+Every BLE command for a bed runs one at a time. A plain asyncio.Lock hands the
+radio out in arrival order, so a stop pressed behind a handful of light toggles
+and keep-alives has to wait for all of them. CommandQueue serializes commands
+the same way but grants the next slot by priority (then arrival order), and
+lets callers:
+
+- coalesce: a request whose key matches a command that is still queued joins
+  that command instead of queueing a second identical one (repeated presses
+  of the same dashboard button)
+- supersede: a request replaces a queued command with the same key, which is
+  then rejected without touching the radio (a newer seek target for a motor)
+
+The running command is never preempted here. Cancelling in-flight work is
+still done through the coordinator's cancel event.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from typing import Any
+
+
+class CommandPriority(IntEnum):
+    """Command priorities, lowest value is served first."""
+
+    STOP = 0
+    MOTOR = 1
+    PRESET = 2
+    ACCESSORY = 3  # Lights, massage, timers
+    BACKGROUND = 4  # Keep-alives and position polls
+
+
+class CommandTicket:
+    """A queued or running command slot."""
+
+    __slots__ = (
+        "priority",
+        "key",
+        "seq",
+        "enqueued_at",
+        "wait_seconds",
+        "coalesced",
+        "superseded",
+        "_granted",
+        "_done",
+    )
+
+    def __init__(self, priority: CommandPriority, key: str | None, seq: int) -> None:
+        """Initialize the ticket."""
+        loop = asyncio.get_running_loop()
+        self.priority = priority
+        self.key = key
+        self.seq = seq
+        self.enqueued_at = time.monotonic()
+        self.wait_seconds = 0.0
+        self.coalesced = False
+        self.superseded = False
+        self._granted: asyncio.Future[None] = loop.create_future()
+        self._done: asyncio.Future[None] = loop.create_future()
+
+    @property
+    def skipped(self) -> bool:
+        """Return True if the caller must not run its command body."""
+        return self.coalesced or self.superseded
+
+    def __lt__(self, other: CommandTicket) -> bool:
+        """Order tickets by priority, then arrival."""
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+class CommandQueue:
+    """Serialize commands, granting the next slot by priority.
+
+    Usage::
+
+        async with queue.slot(CommandPriority.PRESET, key="preset_flat") as ticket:
+            if ticket.skipped:
+                return
+            ...  # exclusive access to the bed
+
+    The queue can also be used directly as an async context manager, in which
+    case it behaves like a lock taken at MOTOR priority.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty queue."""
+        self._waiting: list[CommandTicket] = []
+        self._running: CommandTicket | None = None
+        self._seq = itertools.count()
+        self._max_depth = 0
+        self._granted_count = 0
+        self._coalesced_count = 0
+        self._superseded_count = 0
+        self._last_wait_seconds: float | None = None
+        self._lock_tickets: list[CommandTicket] = []
+
+    @property
+    def depth(self) -> int:
+        """Return the number of commands waiting for a slot."""
+        return len(self._waiting)
+
+    @property
+    def busy(self) -> bool:
+        """Return True while a command holds the slot."""
+        return self._running is not None
+
+    def locked(self) -> bool:
+        """Return True while a command holds the slot (asyncio.Lock compatible)."""
+        return self._running is not None
+
+    def is_queued(self, key: str) -> bool:
+        """Return True if a command with the given key is waiting for a slot."""
+        return self._find_waiting(key) is not None
+
+    def _find_waiting(self, key: str) -> CommandTicket | None:
+        """Return the queued ticket with the given key, if any."""
+        for ticket in self._waiting:
+            if ticket.key == key:
+                return ticket
+        return None
+
+    def _remove_waiting(self, ticket: CommandTicket) -> None:
+        """Remove a ticket from the wait heap."""
+        self._waiting.remove(ticket)
+        heapq.heapify(self._waiting)
+
+    def _grant_next(self) -> None:
+        """Hand the slot to the highest-priority waiter if it is free."""
+        if self._running is not None or not self._waiting:
+            return
+        ticket = heapq.heappop(self._waiting)
+        ticket.wait_seconds = time.monotonic() - ticket.enqueued_at
+        self._last_wait_seconds = ticket.wait_seconds
+        self._granted_count += 1
+        self._running = ticket
+        ticket._granted.set_result(None)
+
+    def _release(self, ticket: CommandTicket) -> None:
+        """Release the slot held by a ticket and wake the next waiter."""
+        if not ticket._done.done():
+            ticket._done.set_result(None)
+        if self._running is ticket:
+            self._running = None
+            self._grant_next()
+
+    async def _acquire(
+        self, priority: CommandPriority, key: str | None, supersede: bool
+    ) -> CommandTicket:
+        """Queue a ticket and wait until it is granted, coalesced or superseded."""
+        if key is not None:
+            existing = self._find_waiting(key)
+            if existing is not None and supersede:
+                self._remove_waiting(existing)
+                existing.superseded = True
+                self._superseded_count += 1
+                existing._granted.set_result(None)
+                existing._done.set_result(None)
+            elif existing is not None:
+                # Identical command already queued: share its outcome
+                follower = CommandTicket(priority, key, next(self._seq))
+                follower.coalesced = True
+                self._coalesced_count += 1
+                await asyncio.shield(existing._done)
+                return follower
+
+        ticket = CommandTicket(priority, key, next(self._seq))
+        heapq.heappush(self._waiting, ticket)
+        self._max_depth = max(self._max_depth, len(self._waiting))
+        self._grant_next()
+        try:
+            await asyncio.shield(ticket._granted)
+        except asyncio.CancelledError:
+            if ticket in self._waiting:
+                self._remove_waiting(ticket)
+                ticket._done.set_result(None)
+            else:
+                self._release(ticket)
+            raise
+        return ticket
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        priority: CommandPriority,
+        key: str | None = None,
+        supersede: bool = False,
+    ) -> AsyncIterator[CommandTicket]:
+        """Wait for exclusive access to the bed.
+
+        Args:
+            priority: Scheduling priority for this command.
+            key: Optional identity used for coalescing or superseding.
+            supersede: If True, a queued command with the same key is rejected
+                and this one takes its place. If False, a queued command with
+                the same key is joined instead and this one is skipped.
+
+        Yields:
+            The ticket. If ticket.skipped is True the slot is not held and the
+            command body must return without touching the bed.
+        """
+        ticket = await self._acquire(priority, key, supersede)
+        try:
+            yield ticket
+        finally:
+            if not ticket.skipped:
+                self._release(ticket)
+
+    async def __aenter__(self) -> None:
+        """Acquire the slot at MOTOR priority, like an asyncio.Lock."""
+        ticket = await self._acquire(CommandPriority.MOTOR, None, False)
+        self._lock_tickets.append(ticket)
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Release a slot acquired through the context manager protocol."""
+        self._release(self._lock_tickets.pop())
+
+    def stats(self) -> dict[str, Any]:
+        """Return queue statistics for diagnostics."""
+        by_priority = {priority.name.lower(): 0 for priority in CommandPriority}
+        for ticket in self._waiting:
+            by_priority[ticket.priority.name.lower()] += 1
+        return {
+            "depth": len(self._waiting),
+            "depth_by_priority": by_priority,
+            "max_depth": self._max_depth,
+            "running": self._running.priority.name.lower() if self._running else None,
+            "granted": self._granted_count,
+            "coalesced": self._coalesced_count,
+            "superseded": self._superseded_count,
+            "last_wait_ms": (
+                round(self._last_wait_seconds * 1000, 1)
+                if self._last_wait_seconds is not None
+                else None
+            ),
+        }
@@ -51,8 +51,10 @@ from .const import (
     BED_TYPE_RICHMAT,
     BEDS_WITH_PERCENTAGE_POSITIONS,
     BEDS_WITH_POSITION_FEEDBACK,
+    CONF_ADAPTIVE_CONNECTION,
     CONF_BACK_MAX_ANGLE,
     CONF_BED_TYPE,
+    CONF_BURST_MODE,
     CONF_CONNECTION_PROFILE,
     CONF_DISABLE_ANGLE_SENSING,
     CONF_DISCONNECT_AFTER_COMMAND,
@@ -65,6 +67,7 @@ from .const import (
     CONF_MOTOR_PULSE_DELAY_MS,
     CONF_OCTO_PIN,
     CONF_POSITION_MODE,
+    CONF_POSITION_UPDATE_INTERVAL_MS,
     CONF_PREFERRED_ADAPTER,
     CONF_PROTOCOL_VARIANT,
     CONF_RICHMAT_REMOTE,
@@ -81,7 +84,9 @@ from .const import (
     CONNECTION_PROFILE_BALANCED,
     CONNECTION_PROFILE_RELIABLE,
     CONNECTION_PROFILES,
+    DEFAULT_ADAPTIVE_CONNECTION,
     DEFAULT_BACK_MAX_ANGLE,
+    DEFAULT_BURST_MODE,
     DEFAULT_CONNECTION_PROFILE,
     DEFAULT_DISABLE_ANGLE_SENSING,
     DEFAULT_DISCONNECT_AFTER_COMMAND,
@@ -93,6 +98,7 @@ from .const import (
     DEFAULT_MOTOR_PULSE_DELAY_MS,
     DEFAULT_OCTO_PIN,
     DEFAULT_POSITION_MODE,
+    DEFAULT_POSITION_UPDATE_INTERVAL_MS,
     DEFAULT_PROTOCOL_VARIANT,
     DOMAIN,
     KEESON_VARIANT_ERGOMOTION,
@@ -1823,6 +1829,14 @@ class AdjustableBedOptionsFlow(OptionsFlowWithConfigEntry):
                     CONF_IDLE_DISCONNECT_SECONDS, DEFAULT_IDLE_DISCONNECT_SECONDS
                 ),
             ): vol.In(range(10, 301)),
+            vol.Optional(
+                CONF_ADAPTIVE_CONNECTION,
+                default=current_data.get(CONF_ADAPTIVE_CONNECTION, DEFAULT_ADAPTIVE_CONNECTION),
+            ): bool,
+            vol.Optional(
+                CONF_BURST_MODE,
+                default=current_data.get(CONF_BURST_MODE, DEFAULT_BURST_MODE),
+            ): bool,
             vol.Optional(
                 CONF_DISABLE_ANGLE_SENSING,
                 default=current_data.get(CONF_DISABLE_ANGLE_SENSING, DEFAULT_DISABLE_ANGLE_SENSING),
@@ -1836,6 +1850,12 @@ class AdjustableBedOptionsFlow(OptionsFlowWithConfigEntry):
                     POSITION_MODE_ACCURACY: "Accuracy",
                 }
             ),
+            vol.Optional(
+                CONF_POSITION_UPDATE_INTERVAL_MS,
+                default=current_data.get(
+                    CONF_POSITION_UPDATE_INTERVAL_MS, DEFAULT_POSITION_UPDATE_INTERVAL_MS
+                ),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=5000)),
         }
 
         # Add variant selection if the bed type has variants
@@ -0,0 +1,323 @@
+"""Connection slot leases shared by all beds on one Bluetooth adapter.
+
+ESPHome Bluetooth proxies (and to a lesser degree local adapters) can hold
+only a few connections at once. Every coordinator used to connect on its own,
+so with several beds on one proxy (a split-king bed is two controllers) the
+connects beyond the proxy's slots failed and fell into retry storms.
+
+ConnectionSlotScheduler is shared by all beds in one Home Assistant instance
+and leases connection slots per adapter source, up to the slots the adapter
+reports as free or held by our own beds. A coordinator takes a lease
+before each connection attempt and keeps it until it disconnects. When the
+adapter is full, requests queue by priority (user command, then background
+reads and reconnects, then keep-alives). A user command that has to wait asks
+the least important idle connection on the adapter to disconnect, so a bed
+that someone is trying to move never waits behind one that is just being kept
+warm. A request that still isn't granted after SLOT_LEASE_TIMEOUT proceeds
+anyway, as it would without the scheduler.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections.abc import Coroutine
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any, Final, Protocol
+
+from habluetooth import get_manager
+
+from .command_queue import CommandPriority
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+# Slots assumed for an adapter that doesn't report its allocations
+SLOT_DEFAULT_CAPACITY: Final = 3
+# Longest a connect waits for a slot before trying anyway
+SLOT_LEASE_TIMEOUT: Final = 30.0
+# A connection must be unused this long before it can be preempted
+SLOT_PREEMPT_MIN_IDLE: Final = 5.0
+
+DATA_CONNECTION_SLOTS: Final = f"{DOMAIN}_connection_slots"
+
+
+class SlotPriority(IntEnum):
+    """Connection slot priorities, lowest value is served first."""
+
+    USER = 0
+    BACKGROUND = 1  # Reconnects, pre-warming, position polls
+    KEEPALIVE = 2
+
+
+def slot_priority_for(priority: CommandPriority) -> SlotPriority:
+    """Return the slot priority for a connect made on behalf of a command."""
+    if priority == CommandPriority.BACKGROUND:
+        return SlotPriority.BACKGROUND
+    return SlotPriority.USER
+
+
+class SlotHolder(Protocol):
+    """A bed that can hold a connection slot."""
+
+    @property
+    def name(self) -> str:
+        """Return the bed name for diagnostics."""
+
+    @property
+    def address(self) -> str:
+        """Return the bed's Bluetooth address."""
+
+    def slot_idle_seconds(self) -> float | None:
+        """Return how long the connection has been unused, or None while busy."""
+
+    def async_release_slot(self) -> Coroutine[Any, Any, None]:
+        """Disconnect so the slot can be given to another bed."""
+
+
+class _Lease:
+    """A granted slot."""
+
+    __slots__ = ("holder", "priority", "source", "granted_at")
+
+    def __init__(self, holder: SlotHolder, priority: SlotPriority, source: str) -> None:
+        self.holder = holder
+        self.priority = priority
+        self.source = source
+        self.granted_at = time.monotonic()
+
+
+class _Waiter:
+    """A queued slot request."""
+
+    __slots__ = ("holder", "priority", "seq", "future")
+
+    def __init__(
+        self, holder: SlotHolder, priority: SlotPriority, seq: int, future: asyncio.Future[None]
+    ) -> None:
+        self.holder = holder
+        self.priority = priority
+        self.seq = seq
+        self.future = future
+
+    def __lt__(self, other: _Waiter) -> bool:
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+class _SourceStats:
+    """Lease statistics for one adapter."""
+
+    __slots__ = ("grants", "waits", "total_wait", "max_wait", "preemptions", "overflows")
+
+    def __init__(self) -> None:
+        self.grants = 0
+        self.waits = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.preemptions = 0
+        self.overflows = 0
+
+
+class ConnectionSlotScheduler:
+    """Lease connection slots per adapter source."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._leases: dict[SlotHolder, _Lease] = {}
+        self._waiting: dict[str, list[_Waiter]] = {}
+        self._preempting: set[SlotHolder] = set()
+        self._stats: dict[str, _SourceStats] = {}
+        self._seq = itertools.count()
+
+    def capacity(self, source: str) -> int:
+        """Return the number of connection slots of an adapter our beds may use.
+
+        Slots held by other integrations are not available to our beds, so
+        the capacity is the adapter's free slots plus those our beds already
+        occupy. At least one slot is always allowed; a connect on a full
+        adapter then fails as it would without the scheduler.
+        """
+        try:
+            current_allocations = get_manager().async_current_allocations
+        except RuntimeError:
+            # Bluetooth isn't set up (yet)
+            return SLOT_DEFAULT_CAPACITY
+        except AttributeError:
+            # habluetooth from before adapters reported slot allocations
+            return SLOT_DEFAULT_CAPACITY
+        allocations = current_allocations(source)
+        if not allocations or allocations[0].slots <= 0:
+            # The adapter hasn't reported its slots
+            return SLOT_DEFAULT_CAPACITY
+        ours = {
+            lease.holder.address.upper()
+            for lease in self._leases.values()
+            if lease.source == source
+        }
+        free: int = allocations[0].free
+        occupied_by_us = sum(1 for address in allocations[0].allocated if address.upper() in ours)
+        return max(free + occupied_by_us, 1)
+
+    def _active(self, source: str) -> int:
+        return sum(1 for lease in self._leases.values() if lease.source == source)
+
+    def _grant(self, holder: SlotHolder, priority: SlotPriority, source: str) -> None:
+        self._leases[holder] = _Lease(holder, priority, source)
+        self._stats.setdefault(source, _SourceStats()).grants += 1
+
+    async def async_acquire(
+        self, source: str, holder: SlotHolder, priority: SlotPriority
+    ) -> float:
+        """Wait for a slot on an adapter.
+
+        A lease the holder has on another adapter is released first.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        lease = self._leases.get(holder)
+        if lease is not None:
+            if lease.source == source:
+                lease.priority = priority
+                return 0.0
+            self.release(holder)
+
+        start = time.monotonic()
+        stats = self._stats.setdefault(source, _SourceStats())
+        waiting = self._waiting.setdefault(source, [])
+        if not waiting and self._active(source) < self.capacity(source):
+            self._grant(holder, priority, source)
+            return 0.0
+
+        waiter = _Waiter(
+            holder, priority, next(self._seq), asyncio.get_running_loop().create_future()
+        )
+        heapq.heappush(waiting, waiter)
+        _LOGGER.debug(
+            "Connection slots on %s are full, %s waits (%s)", source, holder.name, priority.name
+        )
+        if priority == SlotPriority.USER:
+            self._preempt_idle(source)
+        try:
+            async with asyncio.timeout(SLOT_LEASE_TIMEOUT):
+                await asyncio.shield(waiter.future)
+        except TimeoutError:
+            self._remove_waiter(source, waiter)
+            stats.overflows += 1
+            _LOGGER.debug(
+                "No connection slot on %s for %s after %.0fs, connecting anyway",
+                source,
+                holder.name,
+                SLOT_LEASE_TIMEOUT,
+            )
+            self._grant(holder, priority, source)
+        except asyncio.CancelledError:
+            if waiter.future.done():
+                self.release(holder)
+            else:
+                self._remove_waiter(source, waiter)
+            raise
+
+        wait = time.monotonic() - start
+        stats.waits += 1
+        stats.total_wait += wait
+        stats.max_wait = max(stats.max_wait, wait)
+        return wait
+
+    def release(self, holder: SlotHolder) -> None:
+        """Release the holder's lease, if any, and wake the next waiter."""
+        self._preempting.discard(holder)
+        lease = self._leases.pop(holder, None)
+        if lease is not None:
+            self._grant_next(lease.source)
+
+    def _remove_waiter(self, source: str, waiter: _Waiter) -> None:
+        waiting = self._waiting.get(source, [])
+        if waiter in waiting:
+            waiting.remove(waiter)
+            heapq.heapify(waiting)
+
+    def _grant_next(self, source: str) -> None:
+        """Hand free slots on an adapter to the highest-priority waiters."""
+        waiting = self._waiting.get(source, [])
+        capacity = self.capacity(source)
+        while waiting and self._active(source) < capacity:
+            waiter = heapq.heappop(waiting)
+            self._grant(waiter.holder, waiter.priority, source)
+            waiter.future.set_result(None)
+
+    def _preempt_idle(self, source: str) -> None:
+        """Ask the least important idle connection on an adapter to disconnect."""
+        if any(
+            lease.source == source
+            for holder in self._preempting
+            if (lease := self._leases.get(holder)) is not None
+        ):
+            # A slot on this adapter is already being freed
+            return
+        candidates: list[tuple[int, float, _Lease]] = []
+        for holder, lease in self._leases.items():
+            if lease.source != source:
+                continue
+            idle = holder.slot_idle_seconds()
+            if idle is None or idle < SLOT_PREEMPT_MIN_IDLE:
+                continue
+            candidates.append((lease.priority, idle, lease))
+        if not candidates:
+            return
+        _, _, lease = max(candidates, key=lambda candidate: candidate[:2])
+        _LOGGER.info(
+            "Disconnecting idle %s to free a connection slot on %s", lease.holder.name, source
+        )
+        self._preempting.add(lease.holder)
+        self._stats[source].preemptions += 1
+        self._hass.async_create_task(self._async_preempt(lease.holder))
+
+    async def _async_preempt(self, holder: SlotHolder) -> None:
+        try:
+            await holder.async_release_slot()
+        except Exception as err:
+            _LOGGER.debug("Failed to free connection slot held by %s: %s", holder.name, err)
+        finally:
+            self._preempting.discard(holder)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return per-adapter lease state and wait statistics for diagnostics."""
+        sources = set(self._stats) | {lease.source for lease in self._leases.values()}
+        return {
+            source: {
+                "capacity": self.capacity(source),
+                "leases": sorted(
+                    lease.holder.name
+                    for lease in self._leases.values()
+                    if lease.source == source
+                ),
+                "waiting": len(self._waiting.get(source, [])),
+                "grants": self._stats[source].grants,
+                "waits": self._stats[source].waits,
+                "mean_wait_ms": (
+                    round(self._stats[source].total_wait / self._stats[source].waits * 1000, 1)
+                    if self._stats[source].waits
+                    else None
+                ),
+                "max_wait_ms": round(self._stats[source].max_wait * 1000, 1),
+                "preemptions": self._stats[source].preemptions,
+                "overflows": self._stats[source].overflows,
+            }
+            for source in sorted(sources)
+        }
+
+
+def connection_slot_scheduler(hass: HomeAssistant) -> ConnectionSlotScheduler:
+    """Return the scheduler shared by all beds of this Home Assistant instance."""
+    scheduler: ConnectionSlotScheduler | None = hass.data.get(DATA_CONNECTION_SLOTS)
+    if scheduler is None:
+        scheduler = hass.data[DATA_CONNECTION_SLOTS] = ConnectionSlotScheduler(hass)
+    return scheduler
@@ -0,0 +1,179 @@
+"""Per-attempt connection phase timings for Adjustable Bed diagnostics.
+
+A connection is several steps: finding the bed in the scanner data, waiting
+for a connection slot, the GATT connect itself, service discovery,
+controller creation, the post-connect setup pipeline and the initial
+position read. The connect log only gave elapsed times for the first two as
+free text, so a proxy or firmware update that made one step slower was hard
+to spot.
+
+The setup pipeline (see setup_pipeline.py) runs its steps concurrently, so
+its wall-clock time is recorded as one phase and each step under its own
+key (notification subscription, Device Information reads, and controller
+steps such as Octo's send_pin by step name). Step durations overlap and
+don't add up to the pipeline phase; an attempt's total is its wall-clock
+time from start to finish.
+
+ConnectionTimingHistory keeps the phase timings of the last
+CONNECTION_TIMING_HISTORY attempts (successful or not) in a bounded ring.
+Diagnostics show the ring; the optional sensors show the phases of the last
+successful connection.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from statistics import median
+from typing import Any, Final
+
+# Attempts kept per bed
+CONNECTION_TIMING_HISTORY: Final = 20
+
+CONNECT_PHASE_LOOKUP: Final = "scanner_lookup"
+CONNECT_PHASE_SLOT_WAIT: Final = "slot_wait"
+CONNECT_PHASE_ESTABLISH: Final = "establish_connection"
+CONNECT_PHASE_DISCOVERY: Final = "service_discovery"
+CONNECT_PHASE_CONTROLLER: Final = "controller_creation"
+CONNECT_PHASE_SETUP: Final = "post_connect_setup"
+# Setup pipeline steps provided by the coordinator
+CONNECT_PHASE_NOTIFY: Final = "notify_subscribe"
+CONNECT_PHASE_DEVICE_INFO: Final = "device_info_read"
+CONNECT_PHASE_POSITION_READ: Final = "initial_position_read"
+
+# Reporting order; controller setup steps follow by name
+CONNECT_PHASES: Final = (
+    CONNECT_PHASE_LOOKUP,
+    CONNECT_PHASE_SLOT_WAIT,
+    CONNECT_PHASE_ESTABLISH,
+    CONNECT_PHASE_DISCOVERY,
+    CONNECT_PHASE_CONTROLLER,
+    CONNECT_PHASE_SETUP,
+    CONNECT_PHASE_NOTIFY,
+    CONNECT_PHASE_DEVICE_INFO,
+    CONNECT_PHASE_POSITION_READ,
+)
+
+
+def _ordered(names: Iterable[str]) -> list[str]:
+    """Return phase names in reporting order, unknown (step) names last."""
+    unique = set(names)
+    known = [name for name in CONNECT_PHASES if name in unique]
+    return known + sorted(unique.difference(CONNECT_PHASES))
+
+
+class ConnectionAttempt:
+    """Phase timings of one connection attempt."""
+
+    __slots__ = (
+        "attempt",
+        "started",
+        "adapter",
+        "phases",
+        "outcome",
+        "error",
+        "_start",
+        "_end",
+    )
+
+    def __init__(self, attempt: int) -> None:
+        """Start timing an attempt."""
+        self.attempt = attempt
+        self.started = datetime.now(UTC)
+        self.adapter: str | None = None
+        self.phases: dict[str, float] = {}
+        self.outcome: str | None = None
+        self.error: str | None = None
+        self._start = time.monotonic()
+        self._end: float | None = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a phase; a phase that raises is still recorded."""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.record(name, time.monotonic() - start)
+
+    def record(self, name: str, seconds: float) -> None:
+        """Record a phase duration, adding to it if the phase ran before."""
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def finish(self, outcome: str, error: BaseException | None = None) -> None:
+        """Record how the attempt ended."""
+        self.outcome = outcome
+        self._end = time.monotonic()
+        if error is not None:
+            self.error = type(error).__name__
+
+    @property
+    def total(self) -> float:
+        """Return the wall-clock duration of the attempt in seconds.
+
+        Measured from start to finish (or to now while the attempt runs), so
+        concurrent setup steps aren't counted twice. Phases recorded after the
+        attempt finished (the initial position read) are not included.
+        """
+        end = self._end if self._end is not None else time.monotonic()
+        return end - self._start
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the attempt for diagnostics, durations in milliseconds."""
+        return {
+            "attempt": self.attempt,
+            "started": self.started.isoformat(),
+            "adapter": self.adapter,
+            "outcome": self.outcome,
+            "error": self.error,
+            "total_ms": round(self.total * 1000, 1),
+            "phases_ms": {
+                name: round(self.phases[name] * 1000, 1) for name in _ordered(self.phases)
+            },
+        }
+
+
+class ConnectionTimingHistory:
+    """Bounded ring of connection attempts."""
+
+    def __init__(self, maxlen: int = CONNECTION_TIMING_HISTORY) -> None:
+        """Initialize an empty history."""
+        self._attempts: deque[ConnectionAttempt] = deque(maxlen=maxlen)
+        self._last_success: ConnectionAttempt | None = None
+
+    def start(self, attempt: int) -> ConnectionAttempt:
+        """Start timing an attempt and add it to the ring."""
+        timing = ConnectionAttempt(attempt)
+        self._attempts.append(timing)
+        return timing
+
+    def succeeded(self, timing: ConnectionAttempt) -> None:
+        """Mark an attempt as the last successful connection."""
+        timing.finish("connected")
+        self._last_success = timing
+
+    @property
+    def last_success(self) -> ConnectionAttempt | None:
+        """Return the last successful attempt, even if it left the ring."""
+        return self._last_success
+
+    def phase_ms(self, name: str) -> float | None:
+        """Return a phase of the last successful connection in milliseconds."""
+        if self._last_success is None or name not in self._last_success.phases:
+            return None
+        return round(self._last_success.phases[name] * 1000, 1)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the ring and per-phase medians of successful attempts."""
+        successes = [timing for timing in self._attempts if timing.outcome == "connected"]
+        return {
+            "attempts": [timing.as_dict() for timing in self._attempts],
+            "median_ms": {
+                name: round(median(samples) * 1000, 1)
+                for name in _ordered(name for timing in successes for name in timing.phases)
+                if (samples := [t.phases[name] for t in successes if name in t.phases])
+            },
+        }
@@ -58,7 +58,10 @@ CONF_MOTOR_PULSE_COUNT: Final = "motor_pulse_count"
 CONF_MOTOR_PULSE_DELAY_MS: Final = "motor_pulse_delay_ms"
 CONF_DISCONNECT_AFTER_COMMAND: Final = "disconnect_after_command"
 CONF_IDLE_DISCONNECT_SECONDS: Final = "idle_disconnect_seconds"
+CONF_ADAPTIVE_CONNECTION: Final = "adaptive_connection"
 CONF_POSITION_MODE: Final = "position_mode"
+CONF_BURST_MODE: Final = "burst_mode"
+CONF_POSITION_UPDATE_INTERVAL_MS: Final = "position_update_interval_ms"
 CONF_OCTO_PIN: Final = "octo_pin"
 CONF_RICHMAT_REMOTE: Final = "richmat_remote"
 CONF_JENSEN_PIN: Final = "jensen_pin"
@@ -1102,7 +1105,7 @@ def get_richmat_features(remote_code: str) -> RichmatFeatures:
         enabled if the code is not found (safe fallback).
     """
     # Import here to avoid circular dependency
-    from .richmat_features import RICHMAT_REMOTE_FEATURES_GENERATED
+    from .richmat_feature_table import lookup_richmat_features
 
     # Normalize to lowercase for lookup
     code_lower = remote_code.lower() if remote_code else ""
@@ -1116,9 +1119,10 @@ def get_richmat_features(remote_code: str) -> RichmatFeatures:
     if code_upper in RICHMAT_REMOTE_FEATURES:
         return RICHMAT_REMOTE_FEATURES[code_upper]
 
-    # Then check generated features (lowercase keys)
-    if code_lower in RICHMAT_REMOTE_FEATURES_GENERATED:
-        return RICHMAT_REMOTE_FEATURES_GENERATED[code_lower]
+    # Then check generated features (compact table, see richmat_feature_table)
+    generated = lookup_richmat_features(code_lower)
+    if generated is not None:
+        return generated
 
     # Fallback: return all features enabled
     return RICHMAT_REMOTE_FEATURES[RICHMAT_REMOTE_AUTO]
@@ -1321,6 +1325,11 @@ POSITION_SEEK_TIMEOUT: Final = 60.0  # Maximum time in seconds for position seek
 POSITION_CHECK_INTERVAL: Final = 0.3  # Interval between position checks in seconds
 POSITION_STALL_THRESHOLD: Final = 0.5  # Minimum movement in degrees to not be considered stalled
 POSITION_STALL_COUNT: Final = 3  # Number of consecutive stall detections before stopping
+POSITION_QUERY_TIMEOUT: Final = 0.3  # Max wait for a polled position to arrive via notification
+POSITION_READ_FRESHNESS: Final = 0.5  # Skip reading positions updated more recently than this
+BURST_GAP_READ_INTERVAL: Final = 0.5  # Seconds between position reads inside a burst pulse train
+BURST_MIN_GAP: Final = 0.02  # Minimum gap before the next pulse worth spending on a read
+BURST_GAP_READ_PERCENTILE: Final = 95  # Read latency percentile that must fit in a burst gap
 
 # Default values
 DEFAULT_MOTOR_COUNT: Final = 2
@@ -1330,6 +1339,9 @@ DEFAULT_POSITION_MODE: Final = POSITION_MODE_SPEED
 DEFAULT_PROTOCOL_VARIANT: Final = VARIANT_AUTO
 DEFAULT_DISCONNECT_AFTER_COMMAND: Final = False
 DEFAULT_IDLE_DISCONNECT_SECONDS: Final = 40
+DEFAULT_BURST_MODE: Final = False
+DEFAULT_ADAPTIVE_CONNECTION: Final = False
+DEFAULT_POSITION_UPDATE_INTERVAL_MS: Final = 250
 DEFAULT_OCTO_PIN: Final = ""
 DEFAULT_CONNECTION_PROFILE: Final = CONNECTION_PROFILE_BALANCED
 
@@ -4,30 +4,48 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import itertools
 import logging
 import random
 import time
 import traceback
-from collections.abc import Callable, Coroutine
+from collections.abc import AsyncIterator, Callable, Coroutine
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any, cast
 
 from bleak import BleakClient
 from bleak.backends.device import BLEDevice
 from bleak.exc import BleakError
-from bleak_retry_connector import establish_connection
+from bleak_retry_connector import clear_cache, establish_connection
 from homeassistant.components import bluetooth
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ADDRESS, CONF_NAME
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.util import dt as dt_util
 
 from .adapter import (
+    adapter_scorer,
     detect_esphome_proxy,
     discover_services,
     read_ble_device_info,
     select_adapter,
 )
+from .command_queue import CommandPriority, CommandQueue, CommandTicket
+from .connection_slots import SlotPriority, connection_slot_scheduler, slot_priority_for
+from .connection_timing import (
+    CONNECT_PHASE_CONTROLLER,
+    CONNECT_PHASE_DEVICE_INFO,
+    CONNECT_PHASE_DISCOVERY,
+    CONNECT_PHASE_ESTABLISH,
+    CONNECT_PHASE_LOOKUP,
+    CONNECT_PHASE_NOTIFY,
+    CONNECT_PHASE_POSITION_READ,
+    CONNECT_PHASE_SETUP,
+    CONNECT_PHASE_SLOT_WAIT,
+    ConnectionAttempt,
+    ConnectionTimingHistory,
+)
 from .const import (
     ADAPTER_AUTO,
     BED_TYPE_RELAY,
@@ -62,8 +80,10 @@ from .const import (
     BED_TYPE_RICHMAT,
     BED_TYPE_SERTA,
     BED_TYPE_SOLACE,
+    CONF_ADAPTIVE_CONNECTION,
     CONF_BACK_MAX_ANGLE,
     CONF_BED_TYPE,
+    CONF_BURST_MODE,
     CONF_CB24_BED_SELECTION,
     CONF_CONNECTION_PROFILE,
     CONF_DISABLE_ANGLE_SENSING,
@@ -77,11 +97,14 @@ from .const import (
     CONF_MOTOR_PULSE_DELAY_MS,
     CONF_OCTO_PIN,
     CONF_POSITION_MODE,
+    CONF_POSITION_UPDATE_INTERVAL_MS,
     CONF_PREFERRED_ADAPTER,
     CONF_PROTOCOL_VARIANT,
     CONF_RICHMAT_REMOTE,
     CONNECTION_PROFILES,
+    DEFAULT_ADAPTIVE_CONNECTION,
     DEFAULT_BACK_MAX_ANGLE,
+    DEFAULT_BURST_MODE,
     DEFAULT_CONNECTION_PROFILE,
     DEFAULT_DISABLE_ANGLE_SENSING,
     DEFAULT_DISCONNECT_AFTER_COMMAND,
@@ -93,12 +116,14 @@ from .const import (
     DEFAULT_MOTOR_PULSE_DELAY_MS,
     DEFAULT_OCTO_PIN,
     DEFAULT_POSITION_MODE,
+    DEFAULT_POSITION_UPDATE_INTERVAL_MS,
     DEFAULT_PROTOCOL_VARIANT,
     DOMAIN,
     OKIMAT_SERVICE_UUID,
     POSITION_CHECK_INTERVAL,
     POSITION_MODE_ACCURACY,
     POSITION_OVERSHOOT_TOLERANCE,
+    POSITION_QUERY_TIMEOUT,
     POSITION_SEEK_TIMEOUT,
     POSITION_STALL_COUNT,
     POSITION_STALL_THRESHOLD,
@@ -108,12 +133,48 @@ from .const import (
 )
 from .controller_factory import create_controller
 from .detection import detect_richmat_remote_from_name
+from .gatt_cache import GattServiceCache
+from .latency import (
+    LATENCY_PHASE_AUTH_REFRESH,
+    LATENCY_PHASE_ENSURE_CONNECTED,
+    LATENCY_PHASE_FIRST_COMMAND_COLD,
+    LATENCY_PHASE_FIRST_COMMAND_WARM,
+    LATENCY_PHASE_LOCK_WAIT,
+    LATENCY_PHASE_POSITION_READ,
+    LATENCY_PHASE_SLOT_WAIT,
+    CommandLatencyTracker,
+)
+from .motion_model import MotionModelStore
+from .position_subscriptions import PositionSubscriptions
+from .reconnect import ReconnectPolicy, ReconnectState, adapter_reconnect_accounting
+from .setup_pipeline import (
+    SETUP_STEP_DEVICE_INFO,
+    SETUP_STEP_NOTIFY,
+    SetupStep,
+    async_run_setup_steps,
+)
+from .usage_model import USAGE_PREWARM_LEAD, USAGE_SESSION_GAP, UsageModelStore
 
 if TYPE_CHECKING:
     from .beds.base import BedController
 
 _LOGGER = logging.getLogger(__name__)
 
+# Connect timing phase of setup steps with a known name; others use the step name
+_SETUP_STEP_PHASES = {
+    SETUP_STEP_NOTIFY: CONNECT_PHASE_NOTIFY,
+    SETUP_STEP_DEVICE_INFO: CONNECT_PHASE_DEVICE_INFO,
+}
+
+
+def _setup_step_recorder(timing: ConnectionAttempt) -> Callable[[SetupStep, float], None]:
+    """Return a setup pipeline callback that times each step in ``timing``."""
+
+    def _record(step: SetupStep, elapsed: float) -> None:
+        timing.record(_SETUP_STEP_PHASES.get(step.name, step.name), elapsed)
+
+    return _record
+
 
 class NotConnectedError(Exception):
     """Raised when bed is not connected."""
@@ -179,6 +240,41 @@ class AdjustableBedCoordinator:
         self._idle_disconnect_seconds: int = entry.data.get(
             CONF_IDLE_DISCONNECT_SECONDS, DEFAULT_IDLE_DISCONNECT_SECONDS
         )
+        # Adaptive connection: learn usage to stretch/shorten the idle timeout
+        # and reconnect ahead of likely use
+        self._adaptive_connection: bool = entry.data.get(
+            CONF_ADAPTIVE_CONNECTION, DEFAULT_ADAPTIVE_CONNECTION
+        )
+        self._usage_model = UsageModelStore(hass, entry.entry_id)
+        self._current_idle_timeout: int = self._idle_disconnect_seconds
+        self._prewarm_timer: asyncio.TimerHandle | None = None
+        self._prewarm_at: datetime | None = None
+        self._prewarm_count: int = 0
+        # First user command of a session, for cold/warm connect latency:
+        # when the earliest waiting user command was requested and whether the
+        # link was up then, and that sample once its command holds the slot
+        self._last_user_command: float | None = None
+        self._command_requested: tuple[float, bool] | None = None
+        self._first_command_sample: tuple[float, bool] | None = None
+
+        # Burst mode: hold the BLE channel for whole motor pulse trains
+        self._burst_mode: bool = entry.data.get(CONF_BURST_MODE, DEFAULT_BURST_MODE)
+
+        # Shared pulse start deadline of the running command, set only while a
+        # command started together with other beds holds the command slot
+        self._pulse_anchor: float | None = None
+        self._last_group_run: dict[str, Any] | None = None
+        # (pulse anchor, first pulse sent) of the last command run with an anchor
+        self._anchored_first_pulse: tuple[float, float] | None = None
+
+        # Entity position updates: per-key fan-out, rate limited per entity
+        self._position_subscriptions = PositionSubscriptions(
+            hass.loop,
+            entry.data.get(
+                CONF_POSITION_UPDATE_INTERVAL_MS, DEFAULT_POSITION_UPDATE_INTERVAL_MS
+            )
+            / 1000,
+        )
 
         # Octo-specific configuration
         self._octo_pin: str = entry.data.get(CONF_OCTO_PIN, DEFAULT_OCTO_PIN)
@@ -196,8 +292,19 @@ class AdjustableBedCoordinator:
         self._controller: BedController | None = None
         self._disconnect_timer: asyncio.TimerHandle | None = None
         self._reconnect_timer: asyncio.TimerHandle | None = None
+        # Backoff and circuit breaker for reconnects after unexpected disconnects
+        self._reconnect = ReconnectPolicy(jitter=self._retry_jitter)
+        self._adapter_reconnects = adapter_reconnect_accounting(hass)
+        # Connection history per adapter, used to rank adapters in auto mode
+        self._adapter_scorer = adapter_scorer(hass)
+        self._slot_scheduler = connection_slot_scheduler(hass)
+        self._advertisement_unsub: Callable[[], None] | None = None
         self._lock = asyncio.Lock()
-        self._command_lock = asyncio.Lock()  # Separate lock for command serialization
+        # Priority queue serializing BLE commands (stop > motor > preset > accessory > background)
+        self._command_queue = CommandQueue()
+        # The queue also works as a plain lock (MOTOR priority) for code that
+        # just needs to serialize with commands
+        self._command_lock = self._command_queue
         self._connecting: bool = False  # Track if we're actively connecting
         self._intentional_disconnect: bool = (
             False  # Track intentional disconnects to skip auto-reconnect
@@ -205,10 +312,16 @@ class AdjustableBedCoordinator:
         self._cancel_command = asyncio.Event()  # Signal to cancel current command
         self._cancel_counter: int = 0  # Track cancellation requests to handle queued commands
         self._stop_keepalive_task: asyncio.Task[None] | None = None  # Track keepalive stop task
+        # Controller kept across disconnects, valid while the GATT fingerprint matches
+        self._retained_controller: BedController | None = None
+        self._controller_fingerprint: str | None = None
+        self._controller_creations = 0
 
         # Position data from notifications
         self._position_data: dict[str, float] = {}
         self._position_callbacks: set[Callable[[dict[str, float]], None]] = set()
+        # Set on every update for a key, consumed by position seeking
+        self._position_events: dict[str, asyncio.Event] = {}
 
         # Connection state callbacks
         self._connection_state_callbacks: set[Callable[[bool], None]] = set()
@@ -238,6 +351,14 @@ class AdjustableBedCoordinator:
         self._last_command_start: datetime | None = None
         self._last_command_end: datetime | None = None
         self._last_notify_received: datetime | None = None
+        # Per-phase latency histograms (lock wait, connect check, auth, writes, reads)
+        self._latency = CommandLatencyTracker()
+        self._connect_timings = ConnectionTimingHistory()
+        # Stored GATT layout, validated on reconnect instead of rediscovering
+        self._gatt_cache = GattServiceCache(hass, self._address)
+        # Learned per-motor velocity/coast used to stop seeks early
+        self._motion_models = MotionModelStore(hass, entry.entry_id)
+        self._last_seek_stats: dict[str, Any] | None = None
 
         # Adapter selection details for diagnostics (issue #168)
         self._actual_adapter: str | None = None
@@ -341,6 +462,34 @@ class AdjustableBedCoordinator:
         """Return the motor pulse delay in milliseconds."""
         return self._motor_pulse_delay_ms
 
+    @property
+    def burst_mode(self) -> bool:
+        """Return whether pulse trains hold the BLE channel for their whole duration."""
+        return self._burst_mode
+
+    @property
+    def pulse_anchor(self) -> float | None:
+        """Return the running command's pulse anchor shared with a bed group, if any."""
+        return self._pulse_anchor
+
+    def note_first_pulse(self, fired_at: float) -> None:
+        """Record when a pulse train started, for commands run with a pulse anchor."""
+        anchor = self._pulse_anchor
+        if anchor is None:
+            return
+        if self._anchored_first_pulse is None or self._anchored_first_pulse[0] != anchor:
+            self._anchored_first_pulse = (anchor, fired_at)
+
+    def first_pulse_at(self, anchor: float) -> float | None:
+        """Return when the first pulse of the command run with ``anchor`` went out."""
+        if self._anchored_first_pulse is None or self._anchored_first_pulse[0] != anchor:
+            return None
+        return self._anchored_first_pulse[1]
+
+    def note_group_run(self, stats: dict[str, Any]) -> None:
+        """Remember the last bed group run this bed took part in (diagnostics)."""
+        self._last_group_run = stats
+
     @property
     def controller(self) -> BedController | None:
         """Return the bed controller."""
@@ -401,8 +550,16 @@ class AdjustableBedCoordinator:
             "last_error": self._last_connection_error,
             "last_error_type": self._last_connection_error_type,
             "last_disconnect_reason": self._last_disconnect_reason,
+            "reconnect": self._reconnect.as_dict(),
+            "adapter_reconnects": self._adapter_reconnects.as_dict(),
+            "phase_timings": self._connect_timings.as_dict(),
+            "controller_creations": self._controller_creations,
         }
 
+    def connection_phase_ms(self, phase: str) -> float | None:
+        """Return how long a phase of the last successful connection took, in ms."""
+        return self._connect_timings.phase_ms(phase)
+
     @property
     def adapter_details(self) -> dict[str, Any]:
         """Return adapter selection details for diagnostics."""
@@ -410,17 +567,134 @@ class AdjustableBedCoordinator:
             "preferred": self._preferred_adapter,
             "actual": self._actual_adapter,
             "available": self._available_adapters,
+            "scores": self._adapter_scorer.as_dict(self._address),
+            "connection_slots": self._slot_scheduler.as_dict(),
         }
 
     @property
     def command_timing(self) -> dict[str, Any]:
         """Return command timing for diagnostics."""
+        pulse_stats = self._controller.last_pulse_stats if self._controller else None
         return {
             "last_command_start": self._last_command_start.isoformat() if self._last_command_start else None,
             "last_command_end": self._last_command_end.isoformat() if self._last_command_end else None,
             "last_notify_received": self._last_notify_received.isoformat() if self._last_notify_received else None,
+            "last_pulse_train": pulse_stats.as_dict() if pulse_stats else None,
+            "burst_mode": self._burst_mode,
+            "last_burst_gap_reads": self._controller.last_burst_gap_reads if self._controller else None,
+            "last_seek": self._last_seek_stats,
+            "last_group_run": self._last_group_run,
+            "motion_models": self._motion_models.as_dict(),
+            "position_reads": self._controller.position_read_stats if self._controller else None,
+            "connection_policy": self.connection_policy,
+        }
+
+    @property
+    def connection_policy(self) -> dict[str, Any]:
+        """Return idle disconnect and pre-warm state for diagnostics."""
+        return {
+            "adaptive": self._adaptive_connection,
+            "configured_idle_timeout": self._idle_disconnect_seconds,
+            "current_idle_timeout": self._current_idle_timeout,
+            "next_prewarm": self._prewarm_at.isoformat() if self._prewarm_at else None,
+            "prewarm_count": self._prewarm_count,
+            "usage": self._usage_model.model.stats() if self._adaptive_connection else None,
         }
 
+    @property
+    def latency_stats(self) -> dict[str, Any]:
+        """Return per-phase command latency percentiles for diagnostics."""
+        return self._latency.as_dict()
+
+    def record_latency(self, phase: str, elapsed_seconds: float) -> None:
+        """Record a command phase duration (used by controllers for GATT writes)."""
+        self._latency.record(phase, elapsed_seconds)
+
+    def latency_percentile(self, phase: str, pct: float) -> float | None:
+        """Return a phase latency percentile in seconds, or None before any sample."""
+        percentile_ms = self._latency.histogram(phase).percentile(pct)
+        return percentile_ms / 1000 if percentile_ms is not None else None
+
+    @property
+    def gatt_cache_stats(self) -> dict[str, Any]:
+        """Return stored GATT layout validation statistics for diagnostics."""
+        return self._gatt_cache.stats()
+
+    @property
+    def command_queue_stats(self) -> dict[str, Any]:
+        """Return command queue depth and wait statistics for diagnostics."""
+        return self._command_queue.stats()
+
+    @contextlib.asynccontextmanager
+    async def _command_slot(
+        self,
+        priority: CommandPriority,
+        key: str | None = None,
+        supersede: bool = False,
+        pulse_anchor: float | None = None,
+    ) -> AsyncIterator[CommandTicket]:
+        """Wait for a command slot, recording how long the wait took.
+
+        Args:
+            priority: Scheduling priority for the command.
+            key: Optional identity for coalescing identical queued commands.
+            supersede: Replace (rather than join) a queued command with the same key.
+            pulse_anchor: Start deadline shared with a bed group. Pulse trains
+                of this command align to it; it is cleared with the slot, so
+                no other command sees it.
+
+        Yields:
+            The queue ticket. Callers must return immediately if ticket.skipped.
+        """
+        user_command = priority != CommandPriority.BACKGROUND
+        if user_command:
+            self._note_command_request()
+        async with self._command_queue.slot(priority, key, supersede) as ticket:
+            if not ticket.skipped:
+                self._latency.record(LATENCY_PHASE_LOCK_WAIT, ticket.wait_seconds)
+                if user_command:
+                    await self._async_record_usage()
+            self._pulse_anchor = pulse_anchor
+            try:
+                yield ticket
+            finally:
+                self._pulse_anchor = None
+                # Commands that bailed out before connecting leave no sample
+                self._first_command_sample = None
+
+    def _note_command_request(self) -> None:
+        """Remember when the earliest not yet running user command was requested."""
+        if self._command_requested is None:
+            self._command_requested = (time.monotonic(), self.is_connected)
+
+    async def async_prepare_command(self) -> bool:
+        """Connect ahead of a user command that will follow shortly.
+
+        Used by bed groups, which connect every member before starting the
+        command on all of them. The wait counts towards the first-command
+        latency of the command that follows.
+        """
+        self._note_command_request()
+        return await self.async_ensure_connected(reset_timer=False)
+
+    async def _async_record_usage(self) -> None:
+        """Note a user command for session tracking and the usage model.
+
+        The first command of a session takes the pending request time, so its
+        cold/warm sample covers everything the user waited for: the command
+        queue and any connect started for it (also by a bed group's prepare
+        step) until the link is up.
+        """
+        now = time.monotonic()
+        requested = self._command_requested or (now, self.is_connected)
+        self._command_requested = None
+        if self._last_user_command is None or now - self._last_user_command >= USAGE_SESSION_GAP:
+            self._first_command_sample = requested
+        self._last_user_command = now
+        if self._adaptive_connection:
+            await self._usage_model.async_load()
+            self._usage_model.observe(dt_util.now())
+
     @property
     def device_info(self) -> DeviceInfo:
         """Return device info for this bed."""
@@ -521,13 +795,15 @@ class AdjustableBedCoordinator:
         }
         return normalized not in chipset_manufacturers
 
-    async def async_connect(self) -> bool:
+    async def async_connect(self, slot_priority: SlotPriority = SlotPriority.USER) -> bool:
         """Connect to the bed."""
         _LOGGER.debug("async_connect called for %s", self._address)
         async with self._lock:
-            return await self._async_connect_locked()
+            return await self._async_connect_locked(slot_priority=slot_priority)
 
-    async def _async_connect_locked(self, reset_timer: bool = True) -> bool:
+    async def _async_connect_locked(
+        self, reset_timer: bool = True, slot_priority: SlotPriority = SlotPriority.USER
+    ) -> bool:
         """Connect to the bed (must hold lock)."""
         # Clear intentional disconnect flag when explicitly connecting
         # This ensures the flag persists through late disconnect callbacks
@@ -565,6 +841,7 @@ class AdjustableBedCoordinator:
 
         for attempt in range(self._max_retries):
             attempt_start = time.monotonic()
+            attempt_source: str | None = None
             # Track connection attempt for diagnostics (issue #168)
             self._connection_attempt_count += 1
             self._last_connection_attempt = datetime.now(UTC)
@@ -583,6 +860,8 @@ class AdjustableBedCoordinator:
                 )
                 await asyncio.sleep(pre_retry_delay)
 
+            attempt_timing = self._connect_timings.start(attempt + 1)
+            lookup_start = time.monotonic()
             try:
                 _LOGGER.debug(
                     "Connection attempt %d/%d: Looking up device %s via HA Bluetooth (preferred adapter: %s)",
@@ -616,11 +895,13 @@ class AdjustableBedCoordinator:
 
                 # Select best adapter and get device
                 adapter_result = await select_adapter(
-                    self.hass, self._address, self._preferred_adapter
+                    self.hass, self._address, self._preferred_adapter, self._adapter_scorer
                 )
                 device = adapter_result.device
+                attempt_timing.record(CONNECT_PHASE_LOOKUP, time.monotonic() - lookup_start)
 
                 if device is None:
+                    attempt_timing.finish("device_not_found")
                     lookup_elapsed = time.monotonic() - attempt_start
                     _LOGGER.warning(
                         "Device %s NOT FOUND in Bluetooth scanner after %.1fs (attempt %d/%d). "
@@ -697,6 +978,14 @@ class AdjustableBedCoordinator:
                 # This handles ESPHome Bluetooth proxy connections properly
                 # Using standard BleakClient (not cached) for better compatibility
                 # with devices that have connection stability issues
+                attempt_source = adapter_result.source or "unknown"
+                attempt_timing.adapter = attempt_source
+                # Wait for a free connection slot on the adapter, shared with other beds
+                slot_wait = await self._slot_scheduler.async_acquire(
+                    attempt_source, self, slot_priority
+                )
+                self._latency.record(LATENCY_PHASE_SLOT_WAIT, slot_wait)
+                attempt_timing.record(CONNECT_PHASE_SLOT_WAIT, slot_wait)
                 connect_start = time.monotonic()
                 _LOGGER.info(
                     "Attempting BLE GATT connection to %s (timeout: %.0fs)...",
@@ -755,13 +1044,23 @@ class AdjustableBedCoordinator:
                 # Only attempt pairing if bed requires it AND we haven't already
                 # determined that pairing is unsupported by this adapter
                 use_pairing = bed_requires_pairing and self._pairing_supported is not False
+                # When pairing is required, disable services cache to force fresh
+                # GATT discovery. Some devices expose different services depending
+                # on pairing state, and stale cached services from a previous
+                # non-paired connection will cause characteristic lookups to fail.
+                # Once a paired layout is stored the cache is allowed again: the
+                # services are validated against the stored layout after connecting.
+                await self._gatt_cache.async_load()
+                disable_cache = use_pairing and not self._gatt_cache.has_layout
                 if use_pairing:
                     _LOGGER.info(
-                        "Pairing enabled for %s (bed type: %s, variant: %s) - "
-                        "GATT services cache disabled to force fresh discovery",
+                        "Pairing enabled for %s (bed type: %s, variant: %s) - %s",
                         self._name,
                         self._bed_type,
                         self._protocol_variant,
+                        "GATT services cache disabled to force fresh discovery"
+                        if disable_cache
+                        else "GATT services cache validated against stored layout",
                     )
 
                 # Mark that we're connecting to suppress spurious disconnect warnings
@@ -771,11 +1070,7 @@ class AdjustableBedCoordinator:
                 self._notify_connection_state_change(False)
                 try:
                     # Use max_attempts=1 here since outer loop handles retries
-                    # When pairing is required, disable services cache to force fresh
-                    # GATT discovery. Some devices expose different services depending
-                    # on pairing state, and stale cached services from a previous
-                    # non-paired connection will cause characteristic lookups to fail.
-                    disable_cache = use_pairing
+                    used_services_cache = not disable_cache
                     try:
                         self._client = await establish_connection(
                             BleakClient,
@@ -805,6 +1100,7 @@ class AdjustableBedCoordinator:
                             self._pairing_supported = False
                             # Retry without pairing but still disable cache since
                             # this bed type requires pairing and may have stale data
+                            used_services_cache = False
                             self._client = await establish_connection(
                                 BleakClient,
                                 device,
@@ -845,6 +1141,14 @@ class AdjustableBedCoordinator:
 
                 connect_elapsed = time.monotonic() - connect_start
                 total_elapsed = time.monotonic() - attempt_start
+                attempt_timing.record(CONNECT_PHASE_ESTABLISH, connect_elapsed)
+                if actual_adapter != "unknown":
+                    attempt_timing.adapter = actual_adapter
+                self._adapter_scorer.record(
+                    actual_adapter if actual_adapter != "unknown" else attempt_source,
+                    True,
+                    connect_elapsed,
+                )
                 _LOGGER.info(
                     "✓ CONNECTED to %s in %.1fs (GATT: %.1fs) via adapter: %s",
                     self._address,
@@ -876,43 +1180,73 @@ class AdjustableBedCoordinator:
                     getattr(self._client, "mtu_size", "N/A"),
                 )
 
-                # Discover services and log hierarchy
-                await discover_services(self._client, self._address)
-
-                # Validate expected services are present (for beds requiring pairing)
-                if bed_requires_pairing and self._client.services:
-                    discovered_uuids = {
-                        svc.uuid.lower() for svc in self._client.services
-                    }
+                discovery_start = time.monotonic()
+                missing_expected_service = False
+                if self._gatt_cache.validate(self._client.services):
+                    # Same layout as last time: reuse what was read from it
                     _LOGGER.debug(
-                        "Discovered service UUIDs for %s: %s",
-                        self._name,
-                        sorted(discovered_uuids),
+                        "GATT layout of %s matches stored layout, skipping discovery",
+                        self._address,
                     )
+                    self._ble_manufacturer, self._ble_model = self._gatt_cache.device_info
+                    read_device_info = False
+                else:
+                    if used_services_cache and bed_requires_pairing and self._gatt_cache.has_layout:
+                        # Services came from bleak's cache but differ from the paired
+                        # layout: drop both caches and reconnect with fresh discovery
+                        self._gatt_cache.invalidate()
+                        await clear_cache(self._address)
+                        raise BleakError(
+                            "Cached GATT services don't match the stored paired layout"
+                        )
 
-                    # Get expected service UUID for this bed type
-                    expected_service = OKIMAT_SERVICE_UUID.lower()
-                    if (
-                        self._bed_type
-                        in (BED_TYPE_OKIMAT, BED_TYPE_OKIN_UUID, BED_TYPE_LEGGETT_OKIN)
-                        and expected_service not in discovered_uuids
-                    ):
-                        _LOGGER.warning(
-                            "⚠ Expected OKIN service UUID %s not found in discovered "
-                            "services for %s. This usually means pairing/bonding failed. "
-                            "Discovered services: %s. Try removing and re-adding the "
-                            "device with 'Pair Now' option.",
-                            expected_service,
+                    # Discover services and log hierarchy
+                    await discover_services(self._client, self._address)
+
+                    # Validate expected services are present (for beds requiring pairing)
+                    if bed_requires_pairing and self._client.services:
+                        discovered_uuids = {
+                            svc.uuid.lower() for svc in self._client.services
+                        }
+                        _LOGGER.debug(
+                            "Discovered service UUIDs for %s: %s",
                             self._name,
                             sorted(discovered_uuids),
                         )
 
-                # Read BLE Device Information Service for manufacturer/model
-                ble_manufacturer, ble_model = await read_ble_device_info(
-                    self._client, self._address
-                )
-                self._ble_manufacturer = ble_manufacturer
-                self._ble_model = ble_model
+                        # Get expected service UUID for this bed type
+                        expected_service = OKIMAT_SERVICE_UUID.lower()
+                        if (
+                            self._bed_type
+                            in (BED_TYPE_OKIMAT, BED_TYPE_OKIN_UUID, BED_TYPE_LEGGETT_OKIN)
+                            and expected_service not in discovered_uuids
+                        ):
+                            missing_expected_service = True
+                            _LOGGER.warning(
+                                "⚠ Expected OKIN service UUID %s not found in discovered "
+                                "services for %s. This usually means pairing/bonding failed. "
+                                "Discovered services: %s. Try removing and re-adding the "
+                                "device with 'Pair Now' option.",
+                                expected_service,
+                                self._name,
+                                sorted(discovered_uuids),
+                            )
+
+                    # Device Information is read in the setup pipeline below
+                    read_device_info = True
+                attempt_timing.record(CONNECT_PHASE_DISCOVERY, time.monotonic() - discovery_start)
+
+                async def _async_read_device_info(
+                    client: BleakClient = self._client,
+                    store_layout: bool = not missing_expected_service,
+                ) -> None:
+                    """Read manufacturer/model and store the layout they came from."""
+                    ble_manufacturer, ble_model = await read_ble_device_info(client, self._address)
+                    self._ble_manufacturer = ble_manufacturer
+                    self._ble_model = ble_model
+                    # Don't keep a layout from a failed pairing
+                    if store_layout:
+                        self._gatt_cache.store(client.services, ble_manufacturer, ble_model)
 
                 # If remote is set to auto, infer Richmat remote code from BLE name at runtime.
                 # This preserves compatibility for existing entries created before auto-code storage.
@@ -927,57 +1261,78 @@ class AdjustableBedCoordinator:
                             device.name,
                         )
 
-                # Create the controller
-                _LOGGER.debug("Creating %s controller...", self._bed_type)
-                self._controller = await create_controller(
-                    coordinator=self,
-                    bed_type=self._bed_type,
-                    protocol_variant=self._protocol_variant,
-                    client=self._client,
-                    octo_pin=self._octo_pin,
-                    richmat_remote=richmat_remote,
-                    jensen_pin=self._jensen_pin,
-                    cb24_bed_selection=self._cb24_bed_selection,
-                )
-                _LOGGER.debug("Controller created successfully")
-
-                if self._bed_type == BED_TYPE_LIMOSS and hasattr(
-                    self._controller, "reset_max_raw_estimate"
+                fingerprint = self._gatt_cache.last_fingerprint
+                retained = self._retained_controller
+                self._retained_controller = None
+                if (
+                    retained is not None
+                    and fingerprint is not None
+                    and fingerprint == self._controller_fingerprint
                 ):
-                    # Reset Limoss normalization state on each connection.
-                    cast(Any, self._controller).reset_max_raw_estimate()
+                    # Same GATT layout: keep the resolved variant, characteristic
+                    # choices and calibration of the previous connection
+                    _LOGGER.debug("Reusing %s controller (GATT %s)", self._bed_type, fingerprint)
+                    await self._async_wait_keepalive_stopped()
+                    self._controller = retained
+                else:
+                    # Create the controller
+                    _LOGGER.debug("Creating %s controller...", self._bed_type)
+                    with attempt_timing.phase(CONNECT_PHASE_CONTROLLER):
+                        self._controller = await create_controller(
+                            coordinator=self,
+                            bed_type=self._bed_type,
+                            protocol_variant=self._protocol_variant,
+                            client=self._client,
+                            octo_pin=self._octo_pin,
+                            richmat_remote=richmat_remote,
+                            jensen_pin=self._jensen_pin,
+                            cb24_bed_selection=self._cb24_bed_selection,
+                        )
+                    self._controller_fingerprint = fingerprint
+                    self._controller_creations += 1
+                    _LOGGER.debug("Controller created successfully")
+
+                    if self._bed_type == BED_TYPE_LIMOSS and hasattr(
+                        self._controller, "reset_max_raw_estimate"
+                    ):
+                        # Start Limoss normalization from scratch for a new controller.
+                        cast(Any, self._controller).reset_max_raw_estimate()
 
                 if reset_timer:
                     self._reset_disconnect_timer()
 
-                # Start position notifications (no-op if angle sensing disabled)
-                await self.async_start_notify()
-
-                # For Octo beds: discover features and handle PIN if needed
-                if self._bed_type == BED_TYPE_OCTO:
-                    # Discover features to detect PIN requirement
-                    if hasattr(self._controller, "discover_features"):
-                        await self._controller.discover_features()
-                    # Send initial PIN and start keep-alive if bed requires it
-                    if hasattr(self._controller, "send_pin"):
-                        await self._controller.send_pin()
-                        await self._controller.start_keepalive()  # type: ignore[attr-defined]
-
-                # For Jensen beds: query dynamic features (lights, massage)
-                if self._bed_type == BED_TYPE_JENSEN:
-                    if hasattr(self._controller, "query_config"):
-                        await self._controller.query_config()
+                # Post-connect setup: position notifications (no-op if angle sensing
+                # disabled), Device Information reads and the controller's protocol
+                # steps (Octo feature discovery and PIN, Jensen config query), run
+                # concurrently where they don't depend on each other
+                setup_steps = [SetupStep(SETUP_STEP_NOTIFY, self.async_start_notify)]
+                if read_device_info:
+                    setup_steps.append(SetupStep(SETUP_STEP_DEVICE_INFO, _async_read_device_info))
+                setup_steps.extend(self._controller.post_connect_steps())
+                # Steps overlap, so each is timed under its own key and the
+                # pipeline as a whole by wall clock
+                with attempt_timing.phase(CONNECT_PHASE_SETUP):
+                    await async_run_setup_steps(
+                        setup_steps,
+                        on_step_done=_setup_step_recorder(attempt_timing),
+                    )
 
                 # Store connection metadata for binary sensor
                 self._last_connected = datetime.now(UTC)
                 self._connection_source = actual_adapter
                 self._connection_rssi = adapter_result.rssi
+                self._reconnect.connected()
+                self._stop_advertisement_probe()
+                self._connect_timings.succeeded(attempt_timing)
                 self._notify_connection_state_change(True)
 
                 return True
 
             except (BleakError, TimeoutError, OSError) as err:
                 attempt_elapsed = time.monotonic() - attempt_start
+                attempt_timing.finish("failed", err)
+                if attempt_source is not None:
+                    self._adapter_scorer.record(attempt_source, False, attempt_elapsed)
                 # Categorize the error for clearer diagnostics
                 if isinstance(err, TimeoutError) or "timeout" in str(err).lower():
                     error_category = "CONNECTION TIMEOUT"
@@ -1016,8 +1371,14 @@ class AdjustableBedCoordinator:
                             type(disconnect_err).__name__,
                         )
                     self._client = None
+                self._retain_controller()
                 # Delay is handled at the start of the next iteration with progressive backoff
             except Exception as err:
+                attempt_timing.finish("failed", err)
+                if attempt_source is not None:
+                    self._adapter_scorer.record(
+                        attempt_source, False, time.monotonic() - attempt_start
+                    )
                 # Track connection error for diagnostics (issue #168)
                 self._last_connection_error = str(err)
                 self._last_connection_error_type = type(err).__name__
@@ -1048,6 +1409,7 @@ class AdjustableBedCoordinator:
                             type(disconnect_err).__name__,
                         )
                     self._client = None
+                self._retain_controller()
                 # Delay is handled at the start of the next iteration with progressive backoff
 
         total_elapsed = time.monotonic() - overall_start
@@ -1063,8 +1425,23 @@ class AdjustableBedCoordinator:
             self._max_retries,
             total_elapsed,
         )
+        self._slot_scheduler.release(self)
         return False
 
+    def _retain_controller(self) -> None:
+        """Keep the controller for the next connection and clear the active one."""
+        if self._controller is not None:
+            self._controller.connection_lost()
+            self._retained_controller = self._controller
+        self._controller = None
+
+    async def _async_wait_keepalive_stopped(self) -> None:
+        """Let a keep-alive stop from the last disconnect finish before it is restarted."""
+        task = self._stop_keepalive_task
+        if task is not None and not task.done():
+            with contextlib.suppress(Exception):
+                await task
+
     def _on_disconnect(self, client: BleakClient) -> None:
         """Handle disconnection callback."""
         # Ignore stale disconnect callbacks from old clients
@@ -1086,6 +1463,7 @@ class AdjustableBedCoordinator:
 
         # Store disconnect timestamp for binary sensor
         self._last_disconnected = datetime.now(UTC)
+        self._slot_scheduler.release(self)
 
         # Track disconnect reason for diagnostics (issue #168)
         # If intentional, reason is set by async_disconnect() or _async_idle_disconnect()
@@ -1105,7 +1483,8 @@ class AdjustableBedCoordinator:
                 self._address,
             )
             self._client = None
-            self._controller = None
+            self._retain_controller()
+            self._reconnect.disconnected_intentionally()
             # Keep _position_data for last known state; entity availability handles offline
             # Flag is reset in _async_connect_locked when reconnecting
             self._notify_connection_state_change(False)
@@ -1122,21 +1501,93 @@ class AdjustableBedCoordinator:
             self._address,
         )
         self._client = None
-        self._controller = None
+        self._retain_controller()
         # Keep _position_data for last known state; entity availability handles offline
         self._cancel_disconnect_timer()
         self._notify_connection_state_change(False)
         _LOGGER.debug("Disconnect cleanup complete for %s", self._address)
 
-        # Schedule automatic reconnection attempt
+        # Schedule automatic reconnection attempt with backoff
+        self._schedule_reconnect(self._reconnect.connection_lost())
+
+    def _schedule_reconnect(self, delay: float | None) -> None:
+        """Schedule the next background reconnect, or wait for an advertisement.
+
+        Args:
+            delay: Seconds until the next attempt. None means the circuit is
+                open and only an advertisement from the bed triggers a probe.
+        """
         # Cancel any existing reconnect timer first to prevent multiple concurrent reconnects
         if self._reconnect_timer is not None:
             self._reconnect_timer.cancel()
+            self._reconnect_timer = None
+        if delay is None:
+            self._start_advertisement_probe()
+            return
+        _LOGGER.debug("Scheduling reconnect to %s in %.1fs", self._address, delay)
         self._reconnect_timer = self.hass.loop.call_later(
-            5.0,  # Wait 5 seconds before attempting reconnect
+            delay,
             lambda: asyncio.create_task(self._async_auto_reconnect()),
         )
 
+    def _start_advertisement_probe(self) -> None:
+        """Probe the bed with one reconnect when it is next seen advertising."""
+        if self._advertisement_unsub is not None:
+            return
+        _LOGGER.warning(
+            "Giving up timed reconnects to %s after repeated failures; "
+            "will retry when the bed is seen advertising or on the next command",
+            self._address,
+        )
+
+        @callback
+        def _async_advertisement(
+            service_info: bluetooth.BluetoothServiceInfoBleak,
+            change: bluetooth.BluetoothChange,
+        ) -> None:
+            if self._reconnect_timer is None and self._reconnect.should_probe():
+                _LOGGER.debug("Saw %s advertising, probing connection", self._address)
+                self._schedule_reconnect(0)
+
+        try:
+            self._advertisement_unsub = bluetooth.async_register_callback(
+                self.hass,
+                _async_advertisement,
+                bluetooth.BluetoothCallbackMatcher(address=self._address, connectable=True),
+                bluetooth.BluetoothScanningMode.PASSIVE,
+            )
+        except Exception as err:
+            _LOGGER.debug("Could not watch advertisements from %s: %s", self._address, err)
+
+    def _stop_advertisement_probe(self) -> None:
+        """Stop watching advertisements for a circuit breaker probe."""
+        if self._advertisement_unsub is not None:
+            self._advertisement_unsub()
+            self._advertisement_unsub = None
+
+    async def _async_reconnect_adapter(self) -> str | None:
+        """Return the adapter a background reconnect will go through, if known.
+
+        Prefers the adapter of the last connection, then a configured adapter,
+        then the adapter select_adapter() would pick from current sightings.
+        Returns None when no adapter can be named, so beds of unknown source
+        aren't all accounted to one shared placeholder adapter.
+        """
+        if self._connection_source and self._connection_source != "unknown":
+            return self._connection_source
+        if self._preferred_adapter and self._preferred_adapter != ADAPTER_AUTO:
+            return self._preferred_adapter
+        try:
+            result = await select_adapter(
+                self.hass, self._address, self._preferred_adapter, self._adapter_scorer
+            )
+        except Exception as err:
+            _LOGGER.debug("Could not resolve adapter for %s: %s", self._address, err)
+            return None
+        if result.source is None or result.source == "unknown":
+            return None
+        return result.source
+
     async def _async_auto_reconnect(self) -> None:
         """Attempt automatic reconnection after unexpected disconnect."""
         # Timer has fired, clear the reference
@@ -1147,23 +1598,50 @@ class AdjustableBedCoordinator:
             _LOGGER.debug("Skipping auto-reconnect: already connected or connecting")
             return
 
-        _LOGGER.info("Attempting automatic reconnection to %s", self._address)
+        # One background reconnect per adapter at a time, so a bed that is
+        # powered off doesn't hold the slot other beds need
+        adapter = await self._async_reconnect_adapter()
+        if adapter is not None and not self._adapter_reconnects.try_acquire(adapter):
+            _LOGGER.debug(
+                "Adapter %s busy with another reconnect, deferring reconnect to %s",
+                adapter,
+                self._address,
+            )
+            self._schedule_reconnect(self._reconnect.deferred())
+            return
+
+        self._reconnect.attempt_started()
+        _LOGGER.info(
+            "Attempting automatic reconnection to %s (%s)", self._address, self._reconnect.state
+        )
+        connected = False
         try:
-            connected = await self.async_connect()
-            if connected:
-                _LOGGER.info("Auto-reconnection successful for %s", self._address)
-                # Note: async_start_notify is called automatically in _async_connect_locked
-            else:
-                _LOGGER.warning(
-                    "Auto-reconnection failed for %s. Will retry on next command.",
-                    self._address,
-                )
+            connected = await self.async_connect(slot_priority=SlotPriority.BACKGROUND)
         except Exception as err:
             _LOGGER.warning(
                 "Auto-reconnection error for %s: %s",
                 self._address,
                 err,
             )
+        finally:
+            if adapter is not None:
+                self._adapter_reconnects.release(adapter, connected)
+
+        if connected:
+            _LOGGER.info("Auto-reconnection successful for %s", self._address)
+            # Note: async_start_notify is called automatically in _async_connect_locked
+            return
+        if self._reconnect.state == ReconnectState.IDLE:
+            # Disconnected or unloaded while reconnecting
+            return
+        delay = self._reconnect.attempt_failed()
+        if delay is not None:
+            _LOGGER.warning(
+                "Auto-reconnection failed for %s, retrying in %.0fs",
+                self._address,
+                delay,
+            )
+        self._schedule_reconnect(delay)
 
     async def async_read_initial_positions(self) -> None:
         """Read positions at startup to initialize sensors.
@@ -1182,10 +1660,17 @@ class AdjustableBedCoordinator:
         _LOGGER.debug("Reading initial positions for %s", self._address)
         try:
             async with asyncio.timeout(5.0):
-                # Use command lock to prevent concurrent GATT operations
-                async with self._command_lock:
-                    if self._client is not None and self._client.is_connected:
+                # Use command queue to prevent concurrent GATT operations
+                async with self._command_slot(
+                    CommandPriority.BACKGROUND, key="read_positions"
+                ) as ticket:
+                    if not ticket.skipped and self._client is not None and self._client.is_connected:
+                        read_start = time.monotonic()
                         await self._async_read_positions()
+                        if (last_connect := self._connect_timings.last_success) is not None:
+                            last_connect.record(
+                                CONNECT_PHASE_POSITION_READ, time.monotonic() - read_start
+                            )
                         # Only log success if position_data has values
                         if self._position_data:
                             _LOGGER.info(
@@ -1212,10 +1697,13 @@ class AdjustableBedCoordinator:
         _LOGGER.debug("async_disconnect called for %s", self._address)
         async with self._lock:
             self._cancel_disconnect_timer()
+            self._cancel_prewarm()
             # Cancel any pending reconnect timer
             if self._reconnect_timer is not None:
                 self._reconnect_timer.cancel()
                 self._reconnect_timer = None
+            self._stop_advertisement_probe()
+            self._reconnect.disconnected_intentionally()
             if self._client is not None:
                 _LOGGER.info("Disconnecting from bed at %s", self._address)
                 # Mark as intentional so _on_disconnect doesn't trigger auto-reconnect
@@ -1242,10 +1730,11 @@ class AdjustableBedCoordinator:
                     _LOGGER.debug("Error during disconnect from %s: %s", self._address, err)
                 finally:
                     self._client = None
-                    self._controller = None
+                    self._retain_controller()
                     # Update disconnect timestamp and notify state change
                     # (don't rely on _on_disconnect callback which may not fire on clean disconnect)
                     self._last_disconnected = datetime.now(UTC)
+                    self._slot_scheduler.release(self)
                     self._notify_connection_state_change(False)
                     # Note: _intentional_disconnect is NOT cleared here
                     # It persists until an explicit reconnect to handle late disconnect callbacks
@@ -1253,13 +1742,18 @@ class AdjustableBedCoordinator:
     def _reset_disconnect_timer(self) -> None:
         """Reset the disconnect timer."""
         self._cancel_disconnect_timer()
+        self._current_idle_timeout = self._idle_disconnect_seconds
+        if self._adaptive_connection:
+            self._current_idle_timeout = self._usage_model.model.idle_timeout(
+                dt_util.now(), self._idle_disconnect_seconds
+            )
         _LOGGER.debug(
             "Setting idle disconnect timer for %s (%d seconds)",
             self._address,
-            self._idle_disconnect_seconds,
+            self._current_idle_timeout,
         )
         self._disconnect_timer = self.hass.loop.call_later(
-            self._idle_disconnect_seconds,
+            self._current_idle_timeout,
             lambda: asyncio.create_task(self._async_idle_disconnect()),
         )
 
@@ -1287,25 +1781,106 @@ class AdjustableBedCoordinator:
             self._reset_disconnect_timer()
             _LOGGER.debug("Disconnect timer resumed for %s", self._address)
 
+    def slot_idle_seconds(self) -> float | None:
+        """Return how long the connection has gone without a user command.
+
+        Used by the connection slot scheduler to pick a connection to preempt;
+        None while a command or connect is in progress.
+        """
+        if self._command_queue.busy or self._connecting or self._last_connected is None:
+            return None
+        idle = (datetime.now(UTC) - self._last_connected).total_seconds()
+        if self._last_user_command is not None:
+            idle = min(idle, time.monotonic() - self._last_user_command)
+        return idle
+
+    async def async_release_slot(self) -> None:
+        """Disconnect so another bed on the adapter can use the connection slot."""
+        await self.async_disconnect(reason="slot_preempted")
+
     async def _async_idle_disconnect(self) -> None:
         """Disconnect after idle timeout."""
         _LOGGER.info(
             "Idle timeout reached (%d seconds), disconnecting from %s",
-            self._idle_disconnect_seconds,
+            self._current_idle_timeout,
             self._address,
         )
         await self.async_disconnect(reason="idle_timeout")
+        if self._adaptive_connection:
+            self._schedule_prewarm()
+
+    def _schedule_prewarm(self) -> None:
+        """Schedule a reconnect shortly before the next likely-use window."""
+        self._cancel_prewarm()
+        now = dt_util.now()
+        next_use = self._usage_model.model.next_likely_use(now)
+        if next_use is None:
+            return
+        delay = (next_use - USAGE_PREWARM_LEAD - now).total_seconds()
+        if delay <= 0:
+            return
+        self._prewarm_at = next_use - USAGE_PREWARM_LEAD
+        _LOGGER.debug(
+            "Scheduling connection pre-warm for %s at %s", self._address, self._prewarm_at
+        )
+        self._prewarm_timer = self.hass.loop.call_later(
+            delay,
+            lambda: asyncio.create_task(self._async_prewarm()),
+        )
 
-    async def async_ensure_connected(self, reset_timer: bool = True) -> bool:
+    def _cancel_prewarm(self) -> None:
+        """Cancel a scheduled pre-warm."""
+        if self._prewarm_timer is not None:
+            self._prewarm_timer.cancel()
+            self._prewarm_timer = None
+        self._prewarm_at = None
+
+    async def _async_prewarm(self) -> None:
+        """Connect ahead of predicted use."""
+        self._prewarm_timer = None
+        self._prewarm_at = None
+        if self.is_connected:
+            return
+        _LOGGER.info("Pre-warming connection to %s ahead of likely use", self._address)
+        self._prewarm_count += 1
+        try:
+            connected = await self.async_ensure_connected(
+                slot_priority=SlotPriority.BACKGROUND
+            )
+        except Exception as err:
+            _LOGGER.debug("Pre-warm connection to %s failed: %s", self._address, err)
+            connected = False
+        if not connected:
+            # Try again before the following window
+            self._schedule_prewarm()
+
+    async def async_ensure_connected(
+        self, reset_timer: bool = True, slot_priority: SlotPriority = SlotPriority.USER
+    ) -> bool:
         """Ensure we are connected to the bed."""
-        async with self._lock:
-            if self._client is not None and self._client.is_connected:
-                _LOGGER.debug("Connection check: already connected to %s", self._address)
-                if reset_timer:
-                    self._reset_disconnect_timer()
-                return True
-            _LOGGER.debug("Connection check: reconnecting to %s", self._address)
-            return await self._async_connect_locked(reset_timer=reset_timer)
+        first_command = self._first_command_sample
+        self._first_command_sample = None
+        try:
+            with self._latency.measure(LATENCY_PHASE_ENSURE_CONNECTED):
+                async with self._lock:
+                    if self._client is not None and self._client.is_connected:
+                        _LOGGER.debug("Connection check: already connected to %s", self._address)
+                        if reset_timer:
+                            self._reset_disconnect_timer()
+                        return True
+                    _LOGGER.debug("Connection check: reconnecting to %s", self._address)
+                    return await self._async_connect_locked(
+                        reset_timer=reset_timer, slot_priority=slot_priority
+                    )
+        finally:
+            if first_command is not None:
+                # How long the first command of a session waited for the link,
+                # from when it was requested
+                requested, warm = first_command
+                self._latency.record(
+                    LATENCY_PHASE_FIRST_COMMAND_WARM if warm else LATENCY_PHASE_FIRST_COMMAND_COLD,
+                    time.monotonic() - requested,
+                )
 
     async def _async_refresh_controller_auth(self) -> None:
         """Refresh protocol auth for controllers that require re-authentication."""
@@ -1315,7 +1890,8 @@ class AdjustableBedCoordinator:
         # Jensen can require a fresh PIN unlock command even on reused BLE connections.
         if self._bed_type == BED_TYPE_JENSEN and hasattr(self._controller, "send_pin"):
             _LOGGER.debug("Refreshing Jensen PIN unlock before command on %s", self._address)
-            await cast(Any, self._controller).send_pin()
+            with self._latency.measure(LATENCY_PHASE_AUTH_REFRESH):
+                await cast(Any, self._controller).send_pin()
 
     async def async_write_command(
         self,
@@ -1323,6 +1899,7 @@ class AdjustableBedCoordinator:
         repeat_count: int = 1,
         repeat_delay_ms: int = 100,
         cancel_running: bool = True,
+        priority: CommandPriority = CommandPriority.MOTOR,
     ) -> None:
         """Write a command to the bed.
 
@@ -1336,7 +1913,7 @@ class AdjustableBedCoordinator:
         # Capture cancel count at entry to detect if we get cancelled while waiting
         entry_cancel_count = self._cancel_counter
 
-        async with self._command_lock:
+        async with self._command_slot(priority):
             # Cancel disconnect timer while command is in progress to prevent mid-command disconnect
             self._cancel_disconnect_timer()
 
@@ -1358,7 +1935,9 @@ class AdjustableBedCoordinator:
                     repeat_count,
                     repeat_delay_ms,
                 )
-                if not await self.async_ensure_connected(reset_timer=False):
+                if not await self.async_ensure_connected(
+                    reset_timer=False, slot_priority=slot_priority_for(priority)
+                ):
                     _LOGGER.error("Cannot write command: not connected to bed")
                     raise ConnectionError("Not connected to bed")
 
@@ -1399,6 +1978,9 @@ class AdjustableBedCoordinator:
                         # Speed mode: fire-and-forget with lock to prevent concurrent GATT ops
                         self.hass.async_create_task(self._async_read_positions_background())
             finally:
+                # Motion is over: write the final positions without waiting
+                # out the entity update rate limit
+                self._position_subscriptions.flush()
                 if self._client is not None and self._client.is_connected:
                     self._reset_disconnect_timer()
 
@@ -1414,7 +1996,7 @@ class AdjustableBedCoordinator:
         # This prevents concurrent BLE writes which cause "operation in progress" errors
         # NOTE: Stop is safety-critical and must ALWAYS complete - no early return if
         # cancel_counter changes while waiting (that would leave motors running)
-        async with self._command_lock:
+        async with self._command_slot(CommandPriority.STOP):
             # Cancel disconnect timer while command is in progress
             self._cancel_disconnect_timer()
             try:
@@ -1446,6 +2028,9 @@ class AdjustableBedCoordinator:
                 await self._controller.stop_all()
                 _LOGGER.info("Stop command sent")
             finally:
+                # Motion is over: write the final positions without waiting
+                # out the entity update rate limit
+                self._position_subscriptions.flush()
                 if self._client is not None and self._client.is_connected:
                     # Disconnect immediately if configured to do so
                     if self._disconnect_after_command:
@@ -1463,10 +2048,13 @@ class AdjustableBedCoordinator:
         command_fn: Callable[[BedController], Coroutine[Any, Any, None]],
         cancel_running: bool = True,
         skip_disconnect: bool = False,
+        priority: CommandPriority = CommandPriority.MOTOR,
+        coalesce_key: str | None = None,
+        pulse_anchor: float | None = None,
     ) -> None:
         """Execute a controller command with proper serialization.
 
-        This ensures commands are serialized through the command lock,
+        This ensures commands are serialized through the command queue,
         optionally cancels any running command, and properly resets the disconnect timer.
 
         Args:
@@ -1474,7 +2062,16 @@ class AdjustableBedCoordinator:
             cancel_running: If True, cancel any running command before executing.
             skip_disconnect: If True, skip the disconnect_after_command behavior.
                 Use this for keep-alive commands that need the connection to persist.
+            priority: Queue priority used when other commands are waiting.
+            coalesce_key: If set and an identical command is already queued, join
+                it instead of queueing (and cancelling) a second copy.
+            pulse_anchor: Start deadline shared with a bed group (see BedGroup).
         """
+        if coalesce_key is not None and self._command_queue.is_queued(coalesce_key):
+            # Repeated press while the first is still queued - let the queued one run
+            _LOGGER.debug("Coalescing queued command %s", coalesce_key)
+            cancel_running = False
+
         if cancel_running:
             # Cancel any running command immediately
             self._cancel_counter += 1
@@ -1483,7 +2080,12 @@ class AdjustableBedCoordinator:
         # Capture cancel count at entry
         entry_cancel_count = self._cancel_counter
 
-        async with self._command_lock:
+        async with self._command_slot(
+            priority, key=coalesce_key, pulse_anchor=pulse_anchor
+        ) as ticket:
+            if ticket.skipped:
+                return
+
             # Cancel disconnect timer while command is in progress to prevent mid-command disconnect
             self._cancel_disconnect_timer()
 
@@ -1507,7 +2109,13 @@ class AdjustableBedCoordinator:
                 # Clear cancel signal for this command
                 self._cancel_command.clear()
 
-                if not await self.async_ensure_connected(reset_timer=False):
+                slot_priority = slot_priority_for(priority)
+                if skip_disconnect and slot_priority == SlotPriority.BACKGROUND:
+                    # Keep-alives only hold a connection open, they yield to any other bed
+                    slot_priority = SlotPriority.KEEPALIVE
+                if not await self.async_ensure_connected(
+                    reset_timer=False, slot_priority=slot_priority
+                ):
                     _LOGGER.error("Cannot execute command: not connected to bed")
                     raise ConnectionError("Not connected to bed")
 
@@ -1560,6 +2168,9 @@ class AdjustableBedCoordinator:
                     self._reset_disconnect_timer()
                 raise
             finally:
+                # Motion is over: write the final positions without waiting
+                # out the entity update rate limit
+                self._position_subscriptions.flush()
                 if self._client is not None and self._client.is_connected:
                     # Disconnect immediately if configured to do so (unless skip_disconnect)
                     if self._disconnect_after_command and not skip_disconnect:
@@ -1649,8 +2260,9 @@ class AdjustableBedCoordinator:
             return
 
         try:
-            async with asyncio.timeout(3.0):
-                await self._controller.read_positions(self._motor_count)
+            with self._latency.measure(LATENCY_PHASE_POSITION_READ):
+                async with asyncio.timeout(3.0):
+                    await self._controller.read_positions(self._motor_count)
         except TimeoutError:
             _LOGGER.debug("Position read timed out")
         except Exception as err:
@@ -1659,12 +2271,14 @@ class AdjustableBedCoordinator:
     async def _async_read_positions_background(self) -> None:
         """Read positions in background with proper lock serialization.
 
-        This method acquires the command lock to prevent concurrent GATT operations.
+        This method takes a background-priority command slot to prevent concurrent
+        GATT operations. Reads that pile up behind other commands coalesce into one.
         Use this for fire-and-forget position reads (speed mode) to avoid
         "operation in progress" errors from overlapping BLE operations.
         """
-        async with self._command_lock:
-            await self._async_read_positions()
+        async with self._command_slot(CommandPriority.BACKGROUND, key="read_positions") as ticket:
+            if not ticket.skipped:
+                await self._async_read_positions()
 
     async def _async_poll_positions_during_movement(self, stop_event: asyncio.Event) -> None:
         """Poll positions periodically during movement.
@@ -1679,9 +2293,12 @@ class AdjustableBedCoordinator:
         poll_interval = 0.5  # 500ms between polls
         while not stop_event.is_set():
             try:
-                # Only read motors that don't send notifications
-                async with asyncio.timeout(0.4):
-                    await self._controller.read_non_notifying_positions()
+                # A burst pulse train holds the BLE channel and schedules its own
+                # reads into the gaps between frames - don't race it for the lock
+                if not self._controller.burst_active:
+                    # Only read motors that don't send notifications
+                    async with asyncio.timeout(0.4):
+                        await self._controller.read_non_notifying_positions()
             except TimeoutError:
                 pass  # Timeout is expected during rapid polling
             except Exception as err:
@@ -1701,6 +2318,9 @@ class AdjustableBedCoordinator:
         self._position_data[position] = angle
         # Track notification timing for diagnostics (issue #168)
         self._last_notify_received = datetime.now(UTC)
+        if (event := self._position_events.get(position)) is not None:
+            event.set()
+        self._position_subscriptions.update(position, angle)
         # Copy to safely iterate while callbacks might unregister themselves
         for callback_fn in list(self._position_callbacks):
             try:
@@ -1708,6 +2328,54 @@ class AdjustableBedCoordinator:
             except Exception as err:
                 _LOGGER.warning("Position callback error: %s", err)
 
+    def _position_event(self, position_key: str) -> asyncio.Event:
+        """Return the update event for a position key, cleared for a fresh wait."""
+        event = self._position_events.get(position_key)
+        if event is None:
+            event = self._position_events[position_key] = asyncio.Event()
+        event.clear()
+        return event
+
+    async def _async_wait_position_update(self, event: asyncio.Event, timeout: float) -> bool:
+        """Wait for the next position update behind an event.
+
+        Returns True if an update arrived within the timeout. The event is
+        cleared afterwards, so updates arriving while the caller processes
+        this one wake the next wait immediately.
+        """
+        try:
+            async with asyncio.timeout(timeout):
+                await event.wait()
+        except TimeoutError:
+            return False
+        event.clear()
+        return True
+
+    async def _async_poll_seek_position(self, position_key: str, event: asyncio.Event) -> None:
+        """Poll a position that is not pushed by notifications during a seek.
+
+        Tries the controller's narrow non-notifying read first, falling back to a
+        full read if that didn't cover the key. Query-response protocols (Jensen,
+        Limoss) answer reads through a notification, so wait briefly for it.
+        """
+        if self._controller is None:
+            return
+        event.clear()
+        if self._controller.notifying_position_keys:
+            try:
+                with self._latency.measure(LATENCY_PHASE_POSITION_READ):
+                    async with asyncio.timeout(3.0):
+                        await self._controller.read_non_notifying_positions()
+            except TimeoutError:
+                _LOGGER.debug("Position read timed out")
+            except Exception as err:
+                _LOGGER.debug("Failed to read positions: %s", err)
+        if not event.is_set():
+            await self._async_read_positions()
+        if not event.is_set():
+            await self._async_wait_position_update(event, POSITION_QUERY_TIMEOUT)
+        event.clear()
+
     def register_position_callback(
         self, callback_fn: Callable[[dict[str, float]], None]
     ) -> Callable[[], None]:
@@ -1727,6 +2395,28 @@ class AdjustableBedCoordinator:
 
         return unregister
 
+    def subscribe_position(
+        self, position_key: str | None, callback_fn: Callable[[], None]
+    ) -> Callable[[], None]:
+        """Subscribe an entity to updates of one position key.
+
+        The callback runs only when that key's value changes, at most once per
+        position update interval; updates in between are coalesced and the
+        final value is flushed when a command finishes. Read the value from
+        position_data in the callback. Pass None to receive every update
+        (without change detection), e.g. for state parsed from the same
+        notifications.
+
+        Returns:
+            Function that removes the subscription.
+        """
+        return self._position_subscriptions.subscribe(position_key, callback_fn)
+
+    @property
+    def position_update_stats(self) -> dict[str, Any]:
+        """Return entity position fan-out statistics."""
+        return self._position_subscriptions.stats()
+
     def register_connection_state_callback(
         self, callback_fn: Callable[[bool], None]
     ) -> Callable[[], None]:
@@ -1746,6 +2436,68 @@ class AdjustableBedCoordinator:
             except Exception as err:
                 _LOGGER.warning("Connection state callback error: %s", err)
 
+    async def _async_seek_burst(
+        self,
+        move_fn: Callable[[BedController], Coroutine[Any, Any, None]],
+        position_key: str,
+        moving_up: bool,
+        distance: float,
+        entry_cancel_count: int,
+    ) -> tuple[float, bool]:
+        """Drive a motor for one seek burst, cutting it short when the model allows.
+
+        If the motion model for this motor and direction is trained, the burst is
+        cut after the predicted run time by setting the cancel event, which stops
+        the pulse train at its next frame. The cut is not a user cancellation,
+        so the event is cleared again unless a real stop arrived meanwhile.
+
+        Args:
+            move_fn: Movement function for the direction.
+            position_key: Motor being moved.
+            moving_up: Direction of travel.
+            distance: Remaining distance to the target.
+            entry_cancel_count: Cancel counter captured when the seek started.
+
+        Returns:
+            Tuple of (seconds the motor was driven, whether the burst was cut).
+        """
+        if self._controller is None:
+            return 0.0, False
+        estimate = self._motion_models.estimate(position_key, moving_up)
+        cut_handle: asyncio.TimerHandle | None = None
+        cut_fired = False
+        run_time: float | None = None
+
+        def _cut() -> None:
+            nonlocal cut_fired
+            cut_fired = True
+            self._cancel_command.set()
+
+        if estimate is not None:
+            run_time = estimate.run_time_for(distance)
+            _LOGGER.debug(
+                "Predictive stop for %s: %.1f to go at %.1f/s (coast %.1f), driving %.2fs",
+                position_key,
+                distance,
+                estimate.velocity,
+                estimate.coast,
+                run_time,
+            )
+            cut_handle = self.hass.loop.call_later(run_time, _cut)
+
+        start = time.monotonic()
+        try:
+            await move_fn(self._controller)
+        finally:
+            if cut_handle is not None:
+                cut_handle.cancel()
+            if cut_fired and self._cancel_counter == entry_cancel_count:
+                self._cancel_command.clear()
+
+        if cut_fired and run_time is not None:
+            return run_time, True
+        return time.monotonic() - start, False
+
     async def async_seek_position(
         self,
         position_key: str,
@@ -1753,11 +2505,14 @@ class AdjustableBedCoordinator:
         move_up_fn: Callable[[BedController], Coroutine[Any, Any, None]],
         move_down_fn: Callable[[BedController], Coroutine[Any, Any, None]],
         move_stop_fn: Callable[[BedController], Coroutine[Any, Any, None]],
+        pulse_anchor: float | None = None,
     ) -> None:
         """Seek to a target position using feedback loop control.
 
-        This method moves the motor toward the target position by polling the
-        current position and adjusting direction as needed. It handles:
+        This method moves the motor toward the target position by following the
+        current position and adjusting direction as needed. Motors that push
+        positions via notifications are followed by waiting on their updates;
+        others are polled every POSITION_CHECK_INTERVAL. It handles:
         - Immediate return if already at target position
         - Timeout protection (60s max)
         - Stall detection (motor not moving)
@@ -1769,6 +2524,7 @@ class AdjustableBedCoordinator:
             move_up_fn: Async function to move motor up
             move_down_fn: Async function to move motor down
             move_stop_fn: Async function to stop motor
+            pulse_anchor: Start deadline shared with a bed group (see BedGroup).
         """
         # Cancel any running command FIRST (before tolerance check)
         # This ensures any in-flight seek is cancelled even if new target is already satisfied
@@ -1776,7 +2532,16 @@ class AdjustableBedCoordinator:
         self._cancel_command.set()
         entry_cancel_count = self._cancel_counter
 
-        async with self._command_lock:
+        async with self._command_slot(
+            CommandPriority.MOTOR,
+            key=f"seek:{position_key}",
+            supersede=True,
+            pulse_anchor=pulse_anchor,
+        ) as ticket:
+            if ticket.superseded:
+                _LOGGER.debug("Position seek for %s superseded by a newer target", position_key)
+                return
+
             # Cancel disconnect timer during seeking
             self._cancel_disconnect_timer()
 
@@ -1849,18 +2614,44 @@ class AdjustableBedCoordinator:
 
                 # Determine initial direction
                 moving_up = target_angle > current_angle
+                await self._motion_models.async_load()
+
+                # Tracking variables
+                start_time = time.monotonic()
+                stall_count = 0
+                last_angle = current_angle
+                reads = 0
+                notified_updates = 0
+                bursts = 0
+                predicted_bursts = 0
+                # Motors that push positions while moving are followed by waiting
+                # on their updates instead of polling on a fixed interval
+                notifying = position_key in self._controller.notifying_position_keys
+                update_event = self._position_event(position_key)
+                burst_end = stall_ref_time = time.monotonic()
+                # Burst awaiting its first position read for learning: (start, run_time, up)
+                pending_burst: tuple[float, float, bool] | None = None
+                burst_cut = False
+
+                async def _burst(up: bool, from_angle: float) -> bool:
+                    """Drive the motor one burst, returning True if it was cut early."""
+                    nonlocal bursts, predicted_bursts, pending_burst, burst_end, stall_ref_time
+                    bursts += 1
+                    run_time, cut = await self._async_seek_burst(
+                        move_up_fn if up else move_down_fn,
+                        position_key,
+                        up,
+                        abs(target_angle - from_angle),
+                        entry_cancel_count,
+                    )
+                    predicted_bursts += int(cut)
+                    pending_burst = (from_angle, run_time, up)
+                    burst_end = stall_ref_time = time.monotonic()
+                    return cut
 
                 # Start movement in try-finally to guarantee stop is sent
                 try:
-                    if moving_up:
-                        await move_up_fn(self._controller)
-                    else:
-                        await move_down_fn(self._controller)
-
-                    # Tracking variables
-                    start_time = time.monotonic()
-                    stall_count = 0
-                    last_angle = current_angle
+                    burst_cut = await _burst(moving_up, current_angle)
 
                     # Position seeking loop
                     while True:
@@ -1878,11 +2669,23 @@ class AdjustableBedCoordinator:
                             _LOGGER.debug("Position seek cancelled for %s", position_key)
                             break
 
-                        # Wait and poll position
-                        await asyncio.sleep(POSITION_CHECK_INTERVAL)
+                        if notifying:
+                            # Wake on the next pushed update; no update within a
+                            # check interval means the motor hasn't moved
+                            if await self._async_wait_position_update(
+                                update_event, POSITION_CHECK_INTERVAL
+                            ):
+                                notified_updates += 1
+                        else:
+                            # Wait and poll position
+                            await asyncio.sleep(POSITION_CHECK_INTERVAL)
+                            await self._async_poll_seek_position(position_key, update_event)
+                            reads += 1
 
-                        # Read current position
-                        await self._async_read_positions()
+                        # Updates can arrive while the motor is still coasting from
+                        # the last burst; only learn from or act on settled positions
+                        now = time.monotonic()
+                        settled = now - burst_end >= POSITION_CHECK_INTERVAL
 
                         # Get updated position
                         current_angle = self._position_data.get(position_key)
@@ -1893,6 +2696,18 @@ class AdjustableBedCoordinator:
                             )
                             break
 
+                        # Learn from the burst that just finished
+                        if pending_burst is not None and settled:
+                            burst_start, burst_run_time, burst_up = pending_burst
+                            travel = current_angle - burst_start
+                            self._motion_models.observe(
+                                position_key,
+                                burst_up,
+                                burst_run_time,
+                                travel if burst_up else -travel,
+                            )
+                            pending_burst = None
+
                         _LOGGER.debug(
                             "Position seek %s: current=%.1f, target=%.1f",
                             position_key,
@@ -1935,8 +2750,10 @@ class AdjustableBedCoordinator:
                                 _LOGGER.debug("New stop request during overshoot - aborting reversal")
                                 break
                             self._cancel_command.clear()  # Ensure reversal isn't cancelled
-                            await move_down_fn(self._controller)
+                            burst_cut = await _burst(False, current_angle)
                             moving_up = False
+                            last_angle = current_angle
+                            continue
                         elif (
                             not moving_up
                             and current_angle < target_angle - POSITION_OVERSHOOT_TOLERANCE
@@ -1954,11 +2771,31 @@ class AdjustableBedCoordinator:
                                 _LOGGER.debug("New stop request during overshoot - aborting reversal")
                                 break
                             self._cancel_command.clear()  # Ensure reversal isn't cancelled
-                            await move_up_fn(self._controller)
+                            burst_cut = await _burst(True, current_angle)
                             moving_up = True
+                            last_angle = current_angle
+                            continue
 
-                        # Stall detection - re-issue movement if motor stopped prematurely
+                        # A burst we cut short has already stopped - continue toward
+                        # the target right away instead of waiting for stall detection
+                        if burst_cut and settled:
+                            _LOGGER.debug(
+                                "Position %s short of target after predicted stop, continuing",
+                                position_key,
+                            )
+                            burst_cut = await _burst(moving_up, current_angle)
+                            stall_count = 0
+                            last_angle = current_angle
+                            continue
+
+                        # Stall detection - re-issue movement if motor stopped prematurely.
+                        # Measured per check interval so frequent notifications
+                        # don't make small per-update steps look like a stall.
+                        if now - stall_ref_time < POSITION_CHECK_INTERVAL:
+                            continue
                         movement = abs(current_angle - last_angle)
+                        last_angle = current_angle
+                        stall_ref_time = now
                         if movement < POSITION_STALL_THRESHOLD:
                             stall_count += 1
                             if stall_count >= POSITION_STALL_COUNT:
@@ -1969,16 +2806,27 @@ class AdjustableBedCoordinator:
                                     position_key,
                                     current_angle,
                                 )
-                                if moving_up:
-                                    await move_up_fn(self._controller)
-                                else:
-                                    await move_down_fn(self._controller)
+                                burst_cut = await _burst(moving_up, current_angle)
                                 stall_count = 0  # Reset stall count after re-issue
                         else:
                             stall_count = 0
-
-                        last_angle = current_angle
                 finally:
+                    final_angle = self._position_data.get(position_key)
+                    self._last_seek_stats = {
+                        "position_key": position_key,
+                        "target": target_angle,
+                        "final": final_angle,
+                        "duration_s": round(time.monotonic() - start_time, 2),
+                        "bursts": bursts,
+                        "predicted_bursts": predicted_bursts,
+                        "position_reads": reads,
+                        "event_driven": notifying,
+                        "notified_updates": notified_updates,
+                        "reached": (
+                            final_angle is not None
+                            and abs(final_angle - target_angle) <= POSITION_TOLERANCE
+                        ),
+                    }
                     # Stop the motor unless it auto-stops on idle
                     # Some controllers (e.g., Linak) auto-stop and sending explicit
                     # STOP can cause brief reverse movement
@@ -1993,6 +2841,364 @@ class AdjustableBedCoordinator:
                             raise
 
             finally:
+                # Motion is over: write the final positions without waiting
+                # out the entity update rate limit
+                self._position_subscriptions.flush()
+                if self._client is not None and self._client.is_connected:
+                    if self._disconnect_after_command:
+                        _LOGGER.debug(
+                            "Disconnecting after seek (disconnect_after_command=True) for %s",
+                            self._address,
+                        )
+                        await self.async_disconnect()
+                    else:
+                        self._reset_disconnect_timer()
+
+    def _combined_move_group(
+        self, directions: dict[str, bool], distances: dict[str, float]
+    ) -> dict[str, bool]:
+        """Return the largest set of motors the controller can drive in one burst.
+
+        The motor furthest from its target is always part of the group, so
+        motors that can't be combined are driven in turn, furthest first.
+        """
+        furthest = max(distances, key=distances.__getitem__)
+        if self._controller is None:
+            return {furthest: directions[furthest]}
+        others = [key for key in directions if key != furthest]
+        for size in range(len(others), 0, -1):
+            for combo in itertools.combinations(others, size):
+                group = {key: directions[key] for key in (furthest, *combo)}
+                if self._controller.supports_combined_move(group):
+                    return group
+        return {furthest: directions[furthest]}
+
+    async def _async_watch_seek_targets(
+        self, group: dict[str, bool], targets: dict[str, float], arrived: asyncio.Event
+    ) -> None:
+        """Cut a combined burst as soon as one of its motors reaches its target."""
+        if self._controller is None:
+            return
+        notifying = self._controller.notifying_position_keys
+        polled = any(key not in notifying for key in group)
+        while True:
+            for key, up in group.items():
+                current = self._position_data.get(key)
+                if current is None:
+                    continue
+                target = targets[key]
+                if (current >= target - POSITION_TOLERANCE) if up else (
+                    current <= target + POSITION_TOLERANCE
+                ):
+                    _LOGGER.debug("Position %s reached %.1f during combined burst", key, current)
+                    arrived.set()
+                    self._cancel_command.set()
+                    return
+            await asyncio.sleep(POSITION_CHECK_INTERVAL)
+            # A burst pulse train schedules its own reads into the frame gaps
+            if polled and not self._controller.burst_active:
+                try:
+                    async with asyncio.timeout(POSITION_CHECK_INTERVAL):
+                        if notifying:
+                            await self._controller.read_non_notifying_positions()
+                        else:
+                            await self._controller.read_positions(self._motor_count)
+                except TimeoutError:
+                    pass
+                except Exception as err:
+                    _LOGGER.debug("Failed to read positions during combined burst: %s", err)
+
+    async def _async_multi_seek_burst(
+        self, group: dict[str, bool], targets: dict[str, float], entry_cancel_count: int
+    ) -> tuple[float, bool, bool]:
+        """Drive a group of motors for one burst, cutting it when a motor arrives.
+
+        The burst is cut through the cancel event as soon as any motor in the
+        group reaches its target, or, once the motion models of the group are
+        trained, after the shortest predicted run time of its motors (see
+        _async_seek_burst), so that motor coasts to its target while the others
+        continue in the next burst. Neither cut is a user cancellation, so the
+        event is cleared again unless a real stop arrived.
+
+        Returns:
+            Tuple of (seconds the motors were driven, whether the burst was cut
+            by the prediction, whether it was cut because a motor arrived).
+        """
+        if self._controller is None:
+            return 0.0, False, False
+        run_times = [
+            estimate.run_time_for(abs(targets[key] - self._position_data[key]))
+            for key, up in group.items()
+            if (estimate := self._motion_models.estimate(key, up)) is not None
+        ]
+        run_time = min(run_times, default=None)
+        cut_handle: asyncio.TimerHandle | None = None
+        cut_fired = False
+
+        def _cut() -> None:
+            nonlocal cut_fired
+            cut_fired = True
+            self._cancel_command.set()
+
+        if run_time is not None:
+            _LOGGER.debug("Predictive stop for %s after %.2fs", ", ".join(group), run_time)
+            cut_handle = self.hass.loop.call_later(run_time, _cut)
+
+        arrived = asyncio.Event()
+        watcher = asyncio.create_task(self._async_watch_seek_targets(group, targets, arrived))
+        start = time.monotonic()
+        try:
+            await self._controller.move_motors(group)
+        finally:
+            if cut_handle is not None:
+                cut_handle.cancel()
+            watcher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await watcher
+            if (arrived.is_set() or cut_fired) and self._cancel_counter == entry_cancel_count:
+                self._cancel_command.clear()
+        if arrived.is_set():
+            return time.monotonic() - start, False, True
+        if cut_fired and run_time is not None:
+            return run_time, True, False
+        return time.monotonic() - start, False, False
+
+    async def async_seek_positions(
+        self, targets: dict[str, float], pulse_anchor: float | None = None
+    ) -> None:
+        """Seek several motors to target positions in one seek loop.
+
+        Motors are driven together only where the protocol has a combined frame
+        for them (see BedController.supports_combined_move): Keeson/Ergomotion
+        head and feet in any direction, and Linak with every motor moving up.
+        For those scenes the total time approaches that of the slowest motor.
+        All other motors are driven one burst at a time, furthest from its
+        target first, so their travel times still add up.
+
+        Bursts are cut short from the learned motion models like single-motor
+        seeks. Once a group's models are trained, a full-length burst that left
+        every motor short of its target is followed by the next one right away
+        instead of waiting for the motors to coast to rest.
+
+        Args:
+            targets: Position key (e.g., "back", "legs") -> target position in
+                degrees (or percentage for Keeson/Ergomotion)
+            pulse_anchor: Start deadline shared with a bed group (see BedGroup).
+        """
+        if len(targets) == 1:
+            ((position_key, target_angle),) = targets.items()
+            await self.async_seek_position(
+                position_key,
+                target_angle,
+                lambda ctrl: getattr(ctrl, f"move_{position_key}_up")(),
+                lambda ctrl: getattr(ctrl, f"move_{position_key}_down")(),
+                lambda ctrl: getattr(ctrl, f"move_{position_key}_stop")(),
+                pulse_anchor=pulse_anchor,
+            )
+            return
+
+        # Cancel any running command first, same as a single-motor seek
+        self._cancel_counter += 1
+        self._cancel_command.set()
+        entry_cancel_count = self._cancel_counter
+        seek_key = "seek:" + "+".join(sorted(targets))
+
+        async with self._command_slot(
+            CommandPriority.MOTOR, key=seek_key, supersede=True, pulse_anchor=pulse_anchor
+        ) as ticket:
+            if ticket.superseded:
+                _LOGGER.debug("Position seek for %s superseded by a newer target", seek_key)
+                return
+
+            self._cancel_disconnect_timer()
+
+            if self._cancel_counter > entry_cancel_count:
+                _LOGGER.debug("Position seek cancelled while waiting for lock")
+                if self._client is not None and self._client.is_connected:
+                    self._reset_disconnect_timer()
+                return
+
+            try:
+                self._cancel_command.clear()
+
+                if not await self.async_ensure_connected(reset_timer=False):
+                    _LOGGER.error("Cannot seek positions: not connected to bed")
+                    raise NotConnectedError("Not connected to bed")
+
+                if self._controller is None:
+                    _LOGGER.error("Cannot seek positions: no controller available")
+                    raise NoControllerError("No controller available")
+
+                await self._async_refresh_controller_auth()
+
+                if any(self._position_data.get(key) is None for key in targets):
+                    await self._async_read_positions()
+                missing = [key for key in targets if self._position_data.get(key) is None]
+                if missing:
+                    raise NotConnectedError(
+                        f"Cannot seek {', '.join(missing)}: no position data available"
+                    )
+
+                _LOGGER.info(
+                    "Seeking positions %s",
+                    ", ".join(
+                        f"{key} {self._position_data[key]:.1f} -> {target:.1f}"
+                        for key, target in targets.items()
+                    ),
+                )
+
+                if self._controller.supports_direct_position_control:
+                    # Absolute position commands already run motors concurrently
+                    for key, target in targets.items():
+                        await self._controller.set_motor_position(
+                            key, self._controller.angle_to_native_position(key, target)
+                        )
+                    return
+
+                start_time = time.monotonic()
+                active = dict(targets)
+                last_direction: dict[str, bool] = {}
+                progress_ref = {key: self._position_data[key] for key in targets}
+                stalls = dict.fromkeys(targets, 0)
+                bursts = 0
+                combined_bursts = 0
+                predicted_bursts = 0
+                reads = 0
+                notifying = self._controller.notifying_position_keys
+                await self._motion_models.async_load()
+
+                try:
+                    while True:
+                        # Drop motors that arrived, including a small overshoot in
+                        # their direction of travel (reversing would oscillate)
+                        for key in list(active):
+                            current = self._position_data.get(key)
+                            if current is None:
+                                _LOGGER.warning("Lost position data for %s during seek", key)
+                                del active[key]
+                                continue
+                            error = current - active[key]
+                            overshoot = error if last_direction.get(key, error < 0) else -error
+                            if abs(error) <= POSITION_TOLERANCE or (
+                                key in last_direction
+                                and 0 < overshoot <= POSITION_OVERSHOOT_TOLERANCE
+                            ):
+                                _LOGGER.info(
+                                    "Position %s reached target: %.1f (target: %.1f)",
+                                    key,
+                                    current,
+                                    active.pop(key),
+                                )
+                        if not active:
+                            break
+
+                        if time.monotonic() - start_time > POSITION_SEEK_TIMEOUT:
+                            _LOGGER.warning(
+                                "Position seek timeout for %s after %.0fs",
+                                ", ".join(active),
+                                POSITION_SEEK_TIMEOUT,
+                            )
+                            break
+
+                        if self._cancel_command.is_set():
+                            _LOGGER.debug("Position seek cancelled for %s", ", ".join(active))
+                            break
+
+                        directions = {
+                            key: target > self._position_data[key]
+                            for key, target in active.items()
+                        }
+                        distances = {
+                            key: abs(target - self._position_data[key])
+                            for key, target in active.items()
+                        }
+                        group = self._combined_move_group(directions, distances)
+                        last_direction.update(group)
+                        bursts += 1
+                        combined_bursts += int(len(group) > 1)
+                        burst_start = {key: self._position_data[key] for key in group}
+                        run_time, predicted, arrived = await self._async_multi_seek_burst(
+                            group, active, entry_cancel_count
+                        )
+                        predicted_bursts += int(predicted)
+
+                        trained = all(
+                            self._motion_models.estimate(key, up) is not None
+                            for key, up in group.items()
+                        )
+                        if predicted or arrived or not trained:
+                            # A motor is expected at its target, or the models still
+                            # need settled positions to learn from: let the motors
+                            # coast to rest before measuring
+                            await asyncio.sleep(POSITION_CHECK_INTERVAL)
+                            await self._async_read_positions()
+                            reads += 1
+                            for key, up in group.items():
+                                current = self._position_data.get(key)
+                                if current is None:
+                                    continue
+                                travel = current - burst_start[key]
+                                self._motion_models.observe(
+                                    key, up, run_time, travel if up else -travel
+                                )
+                        elif any(key not in notifying for key in group):
+                            # Full burst with every motor still short of its target:
+                            # continue right away from a fresh reading
+                            await self._async_read_positions()
+                            reads += 1
+
+                        # A motor that keeps not moving is at an end stop or blocked
+                        for key in group:
+                            current = self._position_data.get(key)
+                            if current is None:
+                                continue
+                            if abs(current - progress_ref[key]) < POSITION_STALL_THRESHOLD:
+                                stalls[key] += 1
+                                if stalls[key] >= POSITION_STALL_COUNT and key in active:
+                                    _LOGGER.warning(
+                                        "Position %s stalled at %.1f, giving up on target %.1f",
+                                        key,
+                                        current,
+                                        active.pop(key),
+                                    )
+                            else:
+                                stalls[key] = 0
+                            progress_ref[key] = current
+                finally:
+                    finals = {key: self._position_data.get(key) for key in targets}
+                    self._last_seek_stats = {
+                        "position_key": "+".join(targets),
+                        "target": dict(targets),
+                        "final": finals,
+                        "duration_s": round(time.monotonic() - start_time, 2),
+                        "bursts": bursts,
+                        "combined_bursts": combined_bursts,
+                        "predicted_bursts": predicted_bursts,
+                        "position_reads": reads,
+                        "reached": all(
+                            finals[key] is not None
+                            and abs(cast(float, finals[key]) - target) <= POSITION_TOLERANCE
+                            for key, target in targets.items()
+                        ),
+                    }
+                    if (
+                        bursts
+                        and self._controller is not None
+                        and not self._controller.auto_stops_on_idle
+                    ):
+                        try:
+                            await self._controller.stop_all()
+                        except Exception:
+                            _LOGGER.exception(
+                                "CRITICAL: Failed to stop motors %s - manual intervention may be required",
+                                ", ".join(targets),
+                            )
+                            raise
+
+            finally:
+                # Motion is over: write the final positions without waiting
+                # out the entity update rate limit
+                self._position_subscriptions.flush()
                 if self._client is not None and self._client.is_connected:
                     if self._disconnect_after_command:
                         _LOGGER.debug(
@@ -17,6 +17,8 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .beds.capabilities import Capability
+from .command_queue import CommandPriority
 from .const import (
     BED_TYPE_ERGOMOTION,
     BED_TYPE_KEESON,
@@ -156,9 +158,10 @@ async def async_setup_entry(
     coordinator: AdjustableBedCoordinator = hass.data[DOMAIN][entry.entry_id]
     motor_count = entry.data.get(CONF_MOTOR_COUNT, DEFAULT_MOTOR_COUNT)
     controller = coordinator.controller
+    capabilities = controller.capabilities if controller is not None else None
 
     # Skip motor cover entities if bed doesn't support motor control
-    if controller is not None and not controller.supports_motor_control:
+    if capabilities is not None and not capabilities.has(Capability.MOTOR_CONTROL):
         _LOGGER.debug(
             "Skipping motor covers for %s - bed only supports presets",
             coordinator.name,
@@ -166,7 +169,7 @@ async def async_setup_entry(
         return
 
     # Skip motor cover entities if bed uses discrete motor control (buttons instead)
-    if controller is not None and controller.has_discrete_motor_control:
+    if capabilities is not None and capabilities.has(Capability.DISCRETE_MOTOR_CONTROL):
         _LOGGER.debug(
             "Skipping motor covers for %s - bed uses discrete motor control (buttons instead)",
             coordinator.name,
@@ -189,7 +192,7 @@ async def async_setup_entry(
 
         # Get translation key overrides from controller
         translation_overrides = (
-            controller.motor_translation_keys if controller is not None else None
+            capabilities.motor_translation_keys if capabilities is not None else None
         ) or {}
 
         # Create Keeson-specific head description that maps to "back" position data
@@ -230,8 +233,8 @@ async def async_setup_entry(
         if (
             motor_count >= 3
             and "tilt" in descriptions_by_key
-            and controller is not None
-            and controller.has_tilt_support
+            and capabilities is not None
+            and capabilities.has(Capability.TILT)
         ):
             tilt_desc = descriptions_by_key["tilt"]
             keeson_tilt_desc = AdjustableBedCoverEntityDescription(
@@ -252,8 +255,8 @@ async def async_setup_entry(
         if (
             motor_count >= 4
             and "lumbar" in descriptions_by_key
-            and controller is not None
-            and controller.has_lumbar_support
+            and capabilities is not None
+            and capabilities.has(Capability.LUMBAR)
         ):
             entities.append(AdjustableBedCover(coordinator, descriptions_by_key["lumbar"]))
     else:
@@ -267,15 +270,15 @@ async def async_setup_entry(
                 continue
             # Special handling for lumbar - only add if controller supports it
             if description.key == "lumbar":
-                if controller is not None and controller.has_lumbar_support:
+                if capabilities is not None and capabilities.has(Capability.LUMBAR):
                     entities.append(AdjustableBedCover(coordinator, description))
             # Special handling for pillow - only add if controller supports it
             elif description.key == "pillow":
-                if controller is not None and controller.has_pillow_support:
+                if capabilities is not None and capabilities.has(Capability.PILLOW):
                     entities.append(AdjustableBedCover(coordinator, description))
             # Special handling for hip - only add if controller supports it
             elif description.key == "hip":
-                if controller is not None and controller.has_hip_support:
+                if capabilities is not None and capabilities.has(Capability.HIP):
                     entities.append(AdjustableBedCover(coordinator, description))
             elif motor_count >= description.min_motors:
                 # For Reverie beds, adjust max_angle for back/head motors
@@ -443,7 +446,7 @@ class AdjustableBedCover(AdjustableBedEntity, CoverEntity):
         try:
             _LOGGER.debug("Sending stop command for %s", self.entity_description.key)
             await self._coordinator.async_execute_controller_command(
-                self.entity_description.stop_fn
+                self.entity_description.stop_fn, priority=CommandPriority.STOP
             )
             _LOGGER.debug("Stop command sent for %s", self.entity_description.key)
         except Exception:
@@ -4,7 +4,10 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import TYPE_CHECKING
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import replace
+from typing import TYPE_CHECKING, Final
 
 from homeassistant.components.bluetooth import BluetoothServiceInfoBleak
 from homeassistant.helpers.selector import SelectOptionDict
@@ -122,6 +125,7 @@ from .const import (
     # Detection result type
     DetectionResult,
 )
+from .detection_engine import Advertisement, DetectionRule, RuleIndex
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -176,36 +180,6 @@ def is_mac_like_name(name: str | None) -> bool:
     return bool(MAC_ADDRESS_PATTERN.match(name))
 
 
-def _check_manufacturer_data(
-    manufacturer_data: dict[int, bytes] | None,
-) -> tuple[str | None, float, int | None]:
-    """Check manufacturer data for bed identification.
-
-    Args:
-        manufacturer_data: Dictionary mapping Company ID to data bytes
-
-    Returns:
-        Tuple of (bed_type, confidence, manufacturer_id) or (None, 0.0, None)
-    """
-    if not manufacturer_data:
-        return None, 0.0, None
-
-    # DewertOkin: Company ID 1643 (0x066B)
-    # Source: com.dewertokin.okinsmartcomfort app disassembly
-    if MANUFACTURER_ID_DEWERTOKIN in manufacturer_data:
-        return BED_TYPE_DEWERTOKIN, 0.95, MANUFACTURER_ID_DEWERTOKIN
-
-    # Vibradorm: Company ID 944 (0x03B0)
-    # Source: de.vibradorm.vra app disassembly
-    if MANUFACTURER_ID_VIBRADORM in manufacturer_data:
-        return BED_TYPE_VIBRADORM, 0.95, MANUFACTURER_ID_VIBRADORM
-
-    # Note: OKIN Automotive (ID 89) is NOT checked here because it should be
-    # a fallback after UUID-based detection. See detect_bed_type_detailed().
-
-    return None, 0.0, None
-
-
 # Solace naming convention pattern (e.g., S4-Y-192-461000AD)
 SOLACE_NAME_PATTERN = re.compile(r"^s\d+-[a-z]-\d+-[a-z0-9]+$", re.IGNORECASE)
 
@@ -288,7 +262,7 @@ EXCLUDED_DEVICE_PATTERNS: tuple[str, ...] = (
 )
 
 
-def _has_only_generic_uuids(service_uuids: list[str]) -> bool:
+def _has_only_generic_uuids(service_uuids: Sequence[str]) -> bool:
     """Check if device has only generic/shared UUIDs (or no UUIDs).
 
     Returns True if the device should be subject to name-based exclusion checks.
@@ -300,6 +274,635 @@ def _has_only_generic_uuids(service_uuids: list[str]) -> bool:
     return all(uuid in GENERIC_SHARED_SERVICE_UUIDS for uuid in service_uuids)
 
 
+def _is_linak_name(advertisement: Advertisement) -> bool:
+    """Return True for Linak default names like "Bed 1696"."""
+    name = advertisement.name
+    return any(
+        name.startswith(pattern) and name[len(pattern) :].isdigit()
+        for pattern in LINAK_NAME_PATTERNS
+    )
+
+
+def _is_suta_name(advertisement: Advertisement) -> bool:
+    """Return True for SUTA Smart Home names."""
+    return advertisement.name.startswith(SUTA_NAME_PATTERNS)
+
+
+def _has_no_uuids(advertisement: Advertisement) -> bool:
+    """Return True when the device advertises no service UUIDs."""
+    return not advertisement.service_uuids
+
+
+def _is_solace_name(advertisement: Advertisement) -> bool:
+    """Return True for names containing "solace" or in the legacy Solace format."""
+    name = advertisement.name
+    return "solace" in name or bool(SOLACE_NAME_PATTERN.match(name))
+
+
+def _is_leggett_mlrm_name(advertisement: Advertisement) -> bool:
+    """Return True for Leggett & Platt MlRM names."""
+    return advertisement.name.startswith(LEGGETT_RICHMAT_NAME_PATTERNS)
+
+
+def _is_richmat_name(advertisement: Advertisement) -> bool:
+    """Return True for Richmat names (remote code or known pattern), except MlRM."""
+    if _is_leggett_mlrm_name(advertisement):
+        return False
+    return advertisement.name.startswith(RICHMAT_NAME_PATTERNS) or bool(
+        advertisement.detected_remote
+    )
+
+
+def _fee9_is_first_wilinke_uuid(advertisement: Advertisement) -> bool:
+    """Return True if FEE9 (shared with BedTech) is the first WiLinke UUID found."""
+    return advertisement.first_uuid_of(_WILINKE_SERVICE_UUIDS) == BEDTECH_SERVICE_UUID.lower()
+
+
+def _is_richmat_fee9(advertisement: Advertisement) -> bool:
+    """Return True for a Richmat name on the FEE9 WiLinke service."""
+    return _fee9_is_first_wilinke_uuid(advertisement) and _is_richmat_name(advertisement)
+
+
+# WiLinke service UUIDs in the order the Richmat app checks them
+_WILINKE_SERVICE_UUIDS: Final = tuple(uuid.lower() for uuid in RICHMAT_WILINKE_SERVICE_UUIDS)
+
+# Name fragments of Jiecang beds (Glide beds, Dream Motion app)
+_JIECANG_NAME_PATTERNS: Final = (
+    "jiecang",
+    "jc-",
+    "dream motion",
+    "glide",
+    "comfort motion",
+    "lierda",
+)
+
+# Name fragments of Serta Motion Perfect beds without a service UUID
+_SERTA_BRAND_NAME_PATTERNS: Final = ("serta", "motion perfect")
+
+# Detection rules in priority order (lowest first). The first matching rule
+# decides the result, so a rule only has to rule out what higher-priority
+# rules haven't already claimed. Keep priorities spaced to leave room for new
+# rules between existing ones.
+DETECTION_RULES: Final[tuple[DetectionRule, ...]] = (
+    # Manufacturer data is the most reliable signal
+    # DewertOkin: Company ID 1643 (0x066B), com.dewertokin.okinsmartcomfort
+    DetectionRule(
+        priority=100,
+        label="DewertOkin bed by manufacturer ID",
+        bed_type=BED_TYPE_DEWERTOKIN,
+        confidence=0.95,
+        signals=(f"manufacturer_id:{MANUFACTURER_ID_DEWERTOKIN}",),
+        manufacturer_ids=frozenset({MANUFACTURER_ID_DEWERTOKIN}),
+        manufacturer_id=MANUFACTURER_ID_DEWERTOKIN,
+    ),
+    # Vibradorm: Company ID 944 (0x03B0), de.vibradorm.vra
+    DetectionRule(
+        priority=110,
+        label="Vibradorm bed by manufacturer ID",
+        bed_type=BED_TYPE_VIBRADORM,
+        confidence=0.95,
+        signals=(f"manufacturer_id:{MANUFACTURER_ID_VIBRADORM}",),
+        manufacturer_ids=frozenset({MANUFACTURER_ID_VIBRADORM}),
+        manufacturer_id=MANUFACTURER_ID_VIBRADORM,
+    ),
+    # Unique service UUIDs and their name-only fallbacks
+    DetectionRule(
+        priority=200,
+        label="DewertOkin bed by service UUID",
+        bed_type=BED_TYPE_DEWERTOKIN,
+        confidence=0.9,
+        signals=("uuid:dewertokin",),
+        service_uuids=frozenset({DEWERTOKIN_SERVICE_UUID}),
+    ),
+    DetectionRule(
+        priority=210,
+        label="OKIN ORE bed by service UUID",
+        bed_type=BED_TYPE_OKIN_ORE,
+        confidence=1.0,
+        signals=("uuid:okin_ore",),
+        service_uuids=frozenset({OKIN_ORE_SERVICE_UUID}),
+    ),
+    DetectionRule(
+        priority=220,
+        label="Jensen bed by service UUID",
+        bed_type=BED_TYPE_JENSEN,
+        confidence=1.0,
+        signals=("uuid:jensen",),
+        service_uuids=frozenset({JENSEN_SERVICE_UUID}),
+    ),
+    DetectionRule(
+        priority=230,
+        label="Jensen bed by name pattern",
+        bed_type=BED_TYPE_JENSEN,
+        confidence=0.9,
+        signals=("name:jensen",),
+        name_prefixes=frozenset(JENSEN_NAME_PATTERNS),
+    ),
+    DetectionRule(
+        priority=240,
+        label="Vibradorm bed by service UUID",
+        bed_type=BED_TYPE_VIBRADORM,
+        confidence=1.0,
+        signals=("uuid:vibradorm",),
+        service_uuids=frozenset({VIBRADORM_SERVICE_UUID, VIBRADORM_SECONDARY_SERVICE_UUID}),
+    ),
+    DetectionRule(
+        priority=250,
+        label="Vibradorm bed by name pattern",
+        bed_type=BED_TYPE_VIBRADORM,
+        confidence=0.9,
+        signals=("name:vibradorm",),
+        name_prefixes=frozenset(VIBRADORM_NAME_PATTERNS),
+    ),
+    DetectionRule(
+        priority=260,
+        label="Svane bed by service UUID",
+        bed_type=BED_TYPE_SVANE,
+        confidence=1.0,
+        signals=("uuid:svane",),
+        service_uuids=frozenset({SVANE_HEAD_SERVICE_UUID}),
+    ),
+    DetectionRule(
+        priority=270,
+        label="Svane bed by name pattern",
+        bed_type=BED_TYPE_SVANE,
+        confidence=0.9,
+        signals=("name:svane",),
+        name_contains=frozenset(SVANE_NAME_PATTERNS),
+    ),
+    # Remacro (Jeromes / Slumberland / The Brick): 6e403587 looks like Nordic
+    # UART (6e400001) but is unique
+    DetectionRule(
+        priority=280,
+        label="Remacro bed by service UUID",
+        bed_type=BED_TYPE_REMACRO,
+        confidence=1.0,
+        signals=("uuid:remacro",),
+        service_uuids=frozenset({REMACRO_SERVICE_UUID}),
+    ),
+    # SUTA Smart Home (AT command protocol over FFF0). Accessory subtypes use
+    # a separate binary protocol and are not supported.
+    DetectionRule(
+        priority=300,
+        label="SUTA accessory subtype",
+        bed_type=None,
+        confidence=0.0,
+        signals=("name:suta_accessory",),
+        name_prefixes=frozenset(SUTA_UNSUPPORTED_NAME_PREFIXES),
+        when=_is_suta_name,
+    ),
+    # Other SUTA names are noted; a SUTA name with some other UUID falls
+    # through to the remaining rules
+    DetectionRule(
+        priority=310,
+        label="SUTA name",
+        bed_type=None,
+        confidence=0.0,
+        signals=("name:suta",),
+        name_prefixes=frozenset(SUTA_NAME_PATTERNS),
+        terminal=False,
+    ),
+    DetectionRule(
+        priority=320,
+        label="SUTA bed by FFF0 UUID + name pattern",
+        bed_type=BED_TYPE_SUTA,
+        confidence=0.9,
+        signals=("uuid:suta_fff0",),
+        service_uuids=frozenset({SUTA_SERVICE_UUID}),
+        name_prefixes=frozenset(SUTA_NAME_PATTERNS),
+    ),
+    DetectionRule(
+        priority=330,
+        label="SUTA bed by name pattern",
+        bed_type=BED_TYPE_SUTA,
+        confidence=0.3,
+        name_prefixes=frozenset(SUTA_NAME_PATTERNS),
+        when=_has_no_uuids,
+    ),
+    # TiMOTION AHF uses Nordic UART UUIDs, which are shared by many devices
+    DetectionRule(
+        priority=340,
+        label="TiMOTION AHF bed with Nordic UART service",
+        bed_type=BED_TYPE_TIMOTION_AHF,
+        confidence=0.9,
+        signals=("name:timotion_ahf", "uuid:nordic_uart"),
+        service_uuids=frozenset({TIMOTION_AHF_SERVICE_UUID}),
+        name_prefixes=frozenset(TIMOTION_AHF_NAME_PATTERNS),
+    ),
+    DetectionRule(
+        priority=350,
+        label="TiMOTION AHF bed by name pattern",
+        bed_type=BED_TYPE_TIMOTION_AHF,
+        confidence=0.3,
+        signals=("name:timotion_ahf",),
+        name_prefixes=frozenset(TIMOTION_AHF_NAME_PATTERNS),
+    ),
+    DetectionRule(
+        priority=400,
+        label="Malouf NEW_OKIN bed by service UUID",
+        bed_type=BED_TYPE_MALOUF_NEW_OKIN,
+        confidence=1.0,
+        signals=("uuid:malouf_new_okin",),
+        service_uuids=frozenset({MALOUF_NEW_OKIN_ADVERTISED_SERVICE_UUID}),
+    ),
+    # Some Linak beds advertise the position service but not the control service
+    DetectionRule(
+        priority=410,
+        label="Linak bed by service UUID",
+        bed_type=BED_TYPE_LINAK,
+        confidence=1.0,
+        signals=("uuid:linak",),
+        service_uuids=frozenset({LINAK_CONTROL_SERVICE_UUID, LINAK_POSITION_SERVICE_UUID}),
+    ),
+    # Some Linak beds don't advertise service UUIDs at all (e.g. "Bed 1696")
+    DetectionRule(
+        priority=420,
+        label="Linak bed by name pattern",
+        bed_type=BED_TYPE_LINAK,
+        confidence=0.9,
+        signals=("name:linak",),
+        name_prefixes=frozenset(LINAK_NAME_PATTERNS),
+        when=_is_linak_name,
+    ),
+    DetectionRule(
+        priority=430,
+        label="Leggett & Platt Gen2 bed by service UUID",
+        bed_type=BED_TYPE_LEGGETT_GEN2,
+        confidence=1.0,
+        signals=("uuid:leggett_gen2",),
+        service_uuids=frozenset({LEGGETT_GEN2_SERVICE_UUID}),
+    ),
+    # Reverie Nightstand (Protocol 110) before Reverie (Protocol 108)
+    DetectionRule(
+        priority=440,
+        label="Reverie Nightstand bed by service UUID",
+        bed_type=BED_TYPE_REVERIE_NIGHTSTAND,
+        confidence=1.0,
+        signals=("uuid:reverie_nightstand",),
+        service_uuids=frozenset({REVERIE_NIGHTSTAND_SERVICE_UUID}),
+    ),
+    DetectionRule(
+        priority=450,
+        label="Reverie bed by service UUID",
+        bed_type=BED_TYPE_REVERIE,
+        confidence=1.0,
+        signals=("uuid:reverie",),
+        service_uuids=frozenset({REVERIE_SERVICE_UUID}),
+    ),
+    # OKIN service UUID (62741523): Sleepy's BOX24, Nectar, Leggett Okin,
+    # Okimat and OKIN 64-bit, told apart by name where possible
+    DetectionRule(
+        priority=500,
+        label="Sleepy's Elite BOX24 bed",
+        bed_type=BED_TYPE_SLEEPYS_BOX24,
+        confidence=0.9,
+        signals=("uuid:okin", "name:sleepys"),
+        service_uuids=frozenset({OKIMAT_SERVICE_UUID}),
+        name_contains=frozenset(SLEEPYS_NAME_PATTERNS),
+    ),
+    DetectionRule(
+        priority=510,
+        label="Nectar bed",
+        bed_type=BED_TYPE_NECTAR,
+        confidence=0.9,
+        signals=("uuid:okin", "name:nectar"),
+        service_uuids=frozenset({OKIMAT_SERVICE_UUID}),
+        name_contains=frozenset({"nectar"}),
+    ),
+    DetectionRule(
+        priority=520,
+        label="Leggett & Platt Okin bed",
+        bed_type=BED_TYPE_LEGGETT_OKIN,
+        confidence=0.9,
+        signals=("uuid:okin", "name:leggett"),
+        service_uuids=frozenset({OKIMAT_SERVICE_UUID}),
+        name_contains=frozenset(LEGGETT_OKIN_NAME_PATTERNS),
+    ),
+    DetectionRule(
+        priority=530,
+        label="Okimat bed",
+        bed_type=BED_TYPE_OKIMAT,
+        confidence=0.9,
+        signals=("uuid:okin", "name:okimat"),
+        service_uuids=frozenset({OKIMAT_SERVICE_UUID}),
+        name_contains=frozenset(OKIMAT_NAME_PATTERNS),
+    ),
+    # OKIN 64-bit can't be told apart without connecting
+    DetectionRule(
+        priority=540,
+        label="Okimat bed (ambiguous OKIN UUID)",
+        bed_type=BED_TYPE_OKIMAT,
+        confidence=0.5,
+        signals=("uuid:okin",),
+        service_uuids=frozenset({OKIMAT_SERVICE_UUID}),
+        ambiguous_types=(BED_TYPE_LEGGETT_OKIN, BED_TYPE_OKIN_64BIT),
+        requires_characteristic_check=True,
+        warning=(
+            "Okin UUID detected but device name '%s' at %s doesn't match known patterns. "
+            "Defaulting to Okimat. Change to Leggett & Platt or OKIN 64-bit in settings if needed."
+        ),
+    ),
+    # BedTech shares the FEE9 service UUID with Richmat WiLinke
+    DetectionRule(
+        priority=600,
+        label="BedTech bed",
+        bed_type=BED_TYPE_BEDTECH,
+        confidence=0.9,
+        signals=(f"uuid:{BEDTECH_SERVICE_UUID.lower()}", "name:bedtech"),
+        service_uuids=frozenset({BEDTECH_SERVICE_UUID}),
+        name_contains=frozenset(BEDTECH_NAME_PATTERNS),
+    ),
+    # Octo names (RC2, DA1458x, ...) before the shared FFE0 UUID rules
+    DetectionRule(
+        priority=610,
+        label="Octo bed by name pattern",
+        bed_type=BED_TYPE_OCTO,
+        confidence=0.9,
+        signals=("name:octo",),
+        name_prefixes=frozenset(OCTO_NAME_PATTERNS),
+    ),
+    # FFE0: Limoss, Solace, MotoSleep and Octo. Must come before Richmat
+    # WiLinke, which lists FFE0 as its W3 variant.
+    DetectionRule(
+        priority=620,
+        label="Limoss bed by FFE0 UUID + name pattern",
+        bed_type=BED_TYPE_LIMOSS,
+        confidence=0.9,
+        signals=("uuid:ffe0", "name:limoss"),
+        service_uuids=frozenset({SOLACE_SERVICE_UUID}),
+        name_contains=frozenset(LIMOSS_NAME_PATTERNS),
+    ),
+    # Solace names from the Motion Bed app: QMS-*, QMS2-4, S3-* to S6-*, SealyMF
+    DetectionRule(
+        priority=630,
+        label="Solace bed by name pattern",
+        bed_type=BED_TYPE_SOLACE,
+        confidence=0.9,
+        signals=("uuid:ffe0", "name:solace"),
+        service_uuids=frozenset({SOLACE_SERVICE_UUID}),
+        name_prefixes=frozenset(SOLACE_NAME_PATTERNS),
+    ),
+    DetectionRule(
+        priority=640,
+        label="Solace bed",
+        bed_type=BED_TYPE_SOLACE,
+        confidence=0.9,
+        signals=("uuid:ffe0", "name:solace"),
+        service_uuids=frozenset({SOLACE_SERVICE_UUID}),
+        when=_is_solace_name,
+    ),
+    DetectionRule(
+        priority=650,
+        label="MotoSleep bed by FFE0 UUID + name pattern",
+        bed_type=BED_TYPE_MOTOSLEEP,
+        confidence=0.9,
+        signals=("uuid:ffe0", "name:motosleep"),
+        service_uuids=frozenset({SOLACE_SERVICE_UUID}),
+        name_prefixes=frozenset({"hhc"}),
+    ),
+    DetectionRule(
+        priority=660,
+        label="Octo bed (default for shared FFE0 UUID)",
+        bed_type=BED_TYPE_OCTO,
+        confidence=0.5,
+        signals=("uuid:ffe0",),
+        service_uuids=frozenset({SOLACE_SERVICE_UUID}),
+        ambiguous_types=(BED_TYPE_SOLACE, BED_TYPE_MOTOSLEEP),
+    ),
+    # WiLinke: Leggett & Platt MlRM first, then Richmat. The first WiLinke
+    # UUID found decides; FEE9 is also used by BedTech.
+    DetectionRule(
+        priority=700,
+        label="Leggett & Platt MlRM bed",
+        bed_type=BED_TYPE_LEGGETT_WILINKE,
+        confidence=0.9,
+        signals=("uuid:wilinke", "name:mlrm"),
+        service_uuids=frozenset(RICHMAT_WILINKE_SERVICE_UUIDS),
+        when=_is_leggett_mlrm_name,
+    ),
+    DetectionRule(
+        priority=710,
+        label="Richmat WiLinke bed by Richmat name + FEE9 UUID",
+        bed_type=BED_TYPE_RICHMAT,
+        confidence=0.9,
+        signals=("uuid:wilinke", "name:richmat"),
+        service_uuids=frozenset(RICHMAT_WILINKE_SERVICE_UUIDS),
+        when=_is_richmat_fee9,
+        report_remote=True,
+    ),
+    DetectionRule(
+        priority=720,
+        label="Richmat WiLinke bed (FEE9 UUID, also used by BedTech)",
+        bed_type=BED_TYPE_RICHMAT,
+        confidence=0.5,
+        signals=("uuid:wilinke",),
+        service_uuids=frozenset(RICHMAT_WILINKE_SERVICE_UUIDS),
+        when=_fee9_is_first_wilinke_uuid,
+        ambiguous_types=(BED_TYPE_BEDTECH,),
+        requires_characteristic_check=True,
+    ),
+    DetectionRule(
+        priority=730,
+        label="Richmat WiLinke bed",
+        bed_type=BED_TYPE_RICHMAT,
+        confidence=0.8,
+        signals=("uuid:wilinke",),
+        service_uuids=frozenset(RICHMAT_WILINKE_SERVICE_UUIDS),
+    ),
+    # Name-only rules for beds on shared or unadvertised UUIDs
+    DetectionRule(
+        priority=800,
+        label="MotoSleep bed by name pattern",
+        bed_type=BED_TYPE_MOTOSLEEP,
+        confidence=0.9,
+        signals=("name:motosleep",),
+        name_prefixes=frozenset({"hhc"}),
+    ),
+    # Limoss / Stawett use the shared FFE0/FFE1 UUIDs, so the name is the signal
+    DetectionRule(
+        priority=810,
+        label="Limoss bed by name pattern",
+        bed_type=BED_TYPE_LIMOSS,
+        confidence=0.3,
+        signals=("name:limoss",),
+        name_contains=frozenset(LIMOSS_NAME_PATTERNS),
+    ),
+    # Before Keeson (same UUID); includes Serta-branded ErgoMotion ("serta-i")
+    DetectionRule(
+        priority=820,
+        label="Ergomotion bed",
+        bed_type=BED_TYPE_ERGOMOTION,
+        confidence=0.9,
+        signals=("name:ergomotion",),
+        name_contains=frozenset(ERGOMOTION_NAME_PATTERNS),
+    ),
+    # Sleepy's BOX15 uses the FFE5 service with a 9-byte checksum protocol
+    DetectionRule(
+        priority=830,
+        label="Sleepy's Elite BOX15 bed",
+        bed_type=BED_TYPE_SLEEPYS_BOX15,
+        confidence=0.9,
+        signals=("uuid:ffe5", "name:sleepys"),
+        service_uuids=frozenset({KEESON_BASE_SERVICE_UUID}),
+        name_contains=frozenset(SLEEPYS_NAME_PATTERNS),
+    ),
+    # Cool Base is a Keeson BaseI5 variant with a fan ("base-i5" names)
+    DetectionRule(
+        priority=840,
+        label="Cool Base bed by name pattern",
+        bed_type=BED_TYPE_COOLBASE,
+        confidence=0.9,
+        signals=("name:coolbase",),
+        name_prefixes=frozenset(COOLBASE_NAME_PATTERNS),
+    ),
+    # Malouf LEGACY_OKIN uses FFE5 with a different 9-byte command format
+    DetectionRule(
+        priority=850,
+        label="Malouf LEGACY_OKIN bed",
+        bed_type=BED_TYPE_MALOUF_LEGACY_OKIN,
+        confidence=0.9,
+        signals=("uuid:ffe5", "name:malouf"),
+        service_uuids=frozenset({MALOUF_LEGACY_OKIN_SERVICE_UUID}),
+        name_contains=frozenset(MALOUF_NAME_PATTERNS),
+    ),
+    DetectionRule(
+        priority=860,
+        label="Keeson bed by name pattern",
+        bed_type=BED_TYPE_KEESON,
+        confidence=0.9,
+        signals=("name:keeson",),
+        name_prefixes=frozenset(KEESON_NAME_PATTERNS),
+    ),
+    # Remote code names (QRRM157052, ZR10, ...) or known Richmat patterns;
+    # MlRM names are Leggett & Platt and need the WiLinke UUID
+    DetectionRule(
+        priority=870,
+        label="Richmat bed by name pattern",
+        bed_type=BED_TYPE_RICHMAT,
+        confidence=0.9,
+        signals=("name:richmat",),
+        when=_is_richmat_name,
+        report_remote=True,
+    ),
+    # Comfort Motion / Lierda: Lierda3 FE60 service first, then legacy FF12
+    DetectionRule(
+        priority=880,
+        label="Comfort Motion bed",
+        bed_type=BED_TYPE_COMFORT_MOTION,
+        confidence=1.0,
+        signals=("uuid:comfort_motion_lierda3",),
+        service_uuids=frozenset({COMFORT_MOTION_LIERDA3_SERVICE_UUID}),
+    ),
+    DetectionRule(
+        priority=890,
+        label="Comfort Motion bed",
+        bed_type=BED_TYPE_COMFORT_MOTION,
+        confidence=1.0,
+        signals=("uuid:comfort_motion",),
+        service_uuids=frozenset({COMFORT_MOTION_SERVICE_UUID}),
+    ),
+    DetectionRule(
+        priority=900,
+        label="Jiecang bed",
+        bed_type=BED_TYPE_JIECANG,
+        confidence=0.9,
+        signals=("name:jiecang",),
+        name_contains=frozenset(_JIECANG_NAME_PATTERNS),
+    ),
+    # A H Beard, HankookGallery; manufacturer data and UUID rules run first
+    DetectionRule(
+        priority=910,
+        label="DewertOkin bed by name pattern",
+        bed_type=BED_TYPE_DEWERTOKIN,
+        confidence=0.3,
+        signals=("name:dewertokin",),
+        name_contains=frozenset(DEWERTOKIN_NAME_PATTERNS),
+    ),
+    DetectionRule(
+        priority=920,
+        label="Serta bed (Keeson protocol, serta variant)",
+        bed_type=BED_TYPE_SERTA,
+        confidence=0.9,
+        signals=("name:serta",),
+        name_contains=frozenset(_SERTA_BRAND_NAME_PATTERNS),
+    ),
+    DetectionRule(
+        priority=930,
+        label="Octo Star2 bed by service UUID",
+        bed_type=BED_TYPE_OCTO,
+        confidence=1.0,
+        signals=("uuid:octo_star2",),
+        service_uuids=frozenset({OCTO_STAR2_SERVICE_UUID}),
+    ),
+    # FFE5: Serta and OKIN FFE by name, otherwise Keeson
+    DetectionRule(
+        priority=1000,
+        label="Serta bed by FFE5 UUID (Keeson protocol, serta variant)",
+        bed_type=BED_TYPE_SERTA,
+        confidence=0.9,
+        signals=("uuid:ffe5", "name:serta"),
+        service_uuids=frozenset({KEESON_BASE_SERVICE_UUID}),
+        name_contains=frozenset(SERTA_NAME_PATTERNS),
+    ),
+    DetectionRule(
+        priority=1010,
+        label="OKIN FFE bed",
+        bed_type=BED_TYPE_OKIN_FFE,
+        confidence=0.9,
+        signals=("uuid:ffe5", "name:okin_ffe"),
+        service_uuids=frozenset({KEESON_BASE_SERVICE_UUID}),
+        name_contains=frozenset(OKIN_FFE_NAME_PATTERNS),
+    ),
+    DetectionRule(
+        priority=1020,
+        label="Keeson Base bed (FFE5 UUID is ambiguous)",
+        bed_type=BED_TYPE_KEESON,
+        confidence=0.5,
+        signals=("uuid:ffe5",),
+        service_uuids=frozenset({KEESON_BASE_SERVICE_UUID}),
+        ambiguous_types=(BED_TYPE_MALOUF_LEGACY_OKIN, BED_TYPE_OKIN_FFE, BED_TYPE_SERTA),
+    ),
+    # Mattress Firm 900 shares the Nordic UART UUID with Richmat
+    DetectionRule(
+        priority=1100,
+        label="Mattress Firm 900 bed",
+        bed_type=BED_TYPE_MATTRESSFIRM,
+        confidence=0.9,
+        signals=("name:iflex",),
+        name_contains=frozenset({"iflex"}),
+    ),
+    # Nordic UART: Richmat, Keeson KSBT, Mattress Firm and OKIN 64-bit
+    DetectionRule(
+        priority=1110,
+        label="Richmat/Keeson bed (Nordic UART UUID is ambiguous)",
+        bed_type=BED_TYPE_RICHMAT,
+        confidence=0.5,
+        signals=("uuid:nordic_uart",),
+        service_uuids=frozenset({RICHMAT_NORDIC_SERVICE_UUID}),
+        ambiguous_types=(BED_TYPE_KEESON, BED_TYPE_MATTRESSFIRM, BED_TYPE_OKIN_64BIT),
+        requires_characteristic_check=True,
+    ),
+    # OKIN Automotive (ID 89, CB24 protocol) comes last so UUIDs win; SmartBed
+    # by Okin advertises the manufacturer ID but no service UUIDs
+    DetectionRule(
+        priority=1200,
+        label=f"Okin CB24 bed by manufacturer ID {MANUFACTURER_ID_OKIN} (fallback)",
+        bed_type=BED_TYPE_OKIN_CB24,
+        confidence=0.7,
+        signals=(f"manufacturer_id:{MANUFACTURER_ID_OKIN}",),
+        manufacturer_ids=frozenset({MANUFACTURER_ID_OKIN}),
+        manufacturer_id=MANUFACTURER_ID_OKIN,
+    ),
+)
+
+_RULE_INDEX: Final = RuleIndex(
+    DETECTION_RULES,
+    extra_name_patterns=EXCLUDED_DEVICE_PATTERNS,
+    remote_from_name=detect_richmat_remote_from_name,
+)
+_EXCLUSION_ORDER: Final = {pattern: i for i, pattern in enumerate(EXCLUDED_DEVICE_PATTERNS)}
+
+
 # Display names for bed types shown in the UI selector
 # Note: Legacy types (dewertokin, okimat, nectar, mattressfirm, leggett_platt)
 # are NOT included here - they're only kept for backward compatibility with
@@ -362,6 +965,85 @@ def get_bed_type_options() -> list[SelectOptionDict]:
     ]
 
 
+# Number of distinct advertisements whose detection result is kept. Discovery
+# sees the same few devices over and over; this covers a busy RF environment.
+DETECTION_CACHE_SIZE: Final = 256
+
+DetectionCacheKey = tuple[str | None, frozenset[str], frozenset[int]]
+
+
+def _copy_result(result: DetectionResult) -> DetectionResult:
+    """Copy the mutable lists of a result so callers can't change a cached one."""
+    return replace(
+        result,
+        signals=list(result.signals),
+        ambiguous_types=list(result.ambiguous_types) if result.ambiguous_types else None,
+    )
+
+
+class DetectionCache:
+    """Bounded LRU cache of detection results for repeated advertisements.
+
+    Devices advertise several times per second and the Bluetooth discovery
+    callbacks and config flow classify every one of them. The key covers
+    exactly the advertisement fields the detection rules read: the name, the
+    service UUIDs (as a lowercase set, detection doesn't depend on their order
+    or case) and the manufacturer IDs. Manufacturer payloads and service data
+    are not part of the key - they change between advertisements of the same
+    device (counters, state bytes) and no rule looks at them. A rule that
+    starts reading them must extend the key.
+    """
+
+    def __init__(self, maxsize: int = DETECTION_CACHE_SIZE) -> None:
+        """Initialize an empty cache holding up to ``maxsize`` results."""
+        self._maxsize = maxsize
+        self._entries: OrderedDict[DetectionCacheKey, DetectionResult] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(service_info: BluetoothServiceInfoBleak) -> DetectionCacheKey:
+        """Return the cache key of an advertisement."""
+        uuids = service_info.service_uuids
+        manufacturer_data = service_info.manufacturer_data
+        return (
+            service_info.name,
+            frozenset(str(uuid).lower() for uuid in uuids) if uuids else frozenset(),
+            frozenset(manufacturer_data) if manufacturer_data else frozenset(),
+        )
+
+    def get(self, key: DetectionCacheKey) -> DetectionResult | None:
+        """Return a copy of the cached result for ``key``, or None."""
+        result = self._entries.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return _copy_result(result)
+
+    def put(self, key: DetectionCacheKey, result: DetectionResult) -> None:
+        """Store ``result``, evicting the least recently used entry if full."""
+        self._entries[key] = _copy_result(result)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached results and reset the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters and the number of cached results."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+DETECTION_CACHE: Final = DetectionCache()
+
+
 def detect_bed_type(service_info: BluetoothServiceInfoBleak) -> str | None:
     """Detect bed type from service info.
 
@@ -376,782 +1058,77 @@ def detect_bed_type(service_info: BluetoothServiceInfoBleak) -> str | None:
 def detect_bed_type_detailed(service_info: BluetoothServiceInfoBleak) -> DetectionResult:
     """Detect bed type from service info with detailed confidence scoring.
 
+    Evaluates DETECTION_RULES through the compiled rule index; see
+    detection_engine for how candidate rules are selected. Repeated
+    advertisements are answered from DETECTION_CACHE.
+
     Returns:
         DetectionResult with bed_type, confidence score, and detection signals.
         Use requires_characteristic_check to determine if post-connection
         detection can improve confidence (for ambiguous UUID cases).
     """
-    # Handle devices that report None for service_uuids
-    raw_uuids = service_info.service_uuids
-    service_uuids = [str(uuid).lower() for uuid in raw_uuids] if raw_uuids else []
-    device_name = (service_info.name or "").lower()
-    signals: list[str] = []
-    detected_remote = detect_richmat_remote_from_name(service_info.name)
-    is_leggett_mlrm_name = any(
-        device_name.startswith(pattern) for pattern in LEGGETT_RICHMAT_NAME_PATTERNS
+    key = DetectionCache.key(service_info)
+    cached = DETECTION_CACHE.get(key)
+    if cached is not None:
+        return cached
+    result = _classify(service_info)
+    DETECTION_CACHE.put(key, result)
+    return result
+
+
+def _classify(service_info: BluetoothServiceInfoBleak) -> DetectionResult:
+    """Run the detection rules for one advertisement."""
+    advertisement = _RULE_INDEX.advertisement(
+        service_info.address,
+        service_info.name,
+        service_info.service_uuids,
+        service_info.manufacturer_data,
     )
-    is_richmat_named = (
-        bool(detected_remote)
-        or any(device_name.startswith(pattern) for pattern in RICHMAT_NAME_PATTERNS)
-    ) and not is_leggett_mlrm_name
 
     _LOGGER.debug(
         "Detecting bed type for device %s (name: %s)",
         service_info.address,
         service_info.name,
     )
-    _LOGGER.debug("  Service UUIDs: %s", service_uuids)
+    _LOGGER.debug("  Service UUIDs: %s", advertisement.service_uuids)
     _LOGGER.debug("  Manufacturer data: %s", service_info.manufacturer_data)
 
     # Exclude devices that are clearly not beds based on name, but only when
     # they have generic/shared UUIDs. This preserves UUID-based detection for
     # beds with unique service UUIDs (e.g., a hypothetical "Linak Band" bed
     # with Linak's unique UUID would not be excluded by the "band" pattern).
-    if _has_only_generic_uuids(service_uuids):
-        for pattern in EXCLUDED_DEVICE_PATTERNS:
-            if pattern in device_name:
-                _LOGGER.debug(
-                    "Device %s excluded: name '%s' matches excluded pattern '%s' "
-                    "(device has only generic UUIDs)",
-                    service_info.address,
-                    service_info.name,
-                    pattern,
-                )
-                return DetectionResult(bed_type=None, confidence=0.0, signals=["excluded:" + pattern])
-
-    # Priority 1: Check manufacturer data (highest confidence, unique signal)
-    mfr_bed_type, mfr_confidence, mfr_id = _check_manufacturer_data(service_info.manufacturer_data)
-    if mfr_bed_type:
-        signals.append(f"manufacturer_id:{mfr_id}")
-        _LOGGER.info(
-            "Detected %s bed at %s (name: %s) by manufacturer ID %s",
-            mfr_bed_type,
-            service_info.address,
-            service_info.name,
-            mfr_id,
-        )
-        return DetectionResult(
-            bed_type=mfr_bed_type,
-            confidence=mfr_confidence,
-            signals=signals,
-            manufacturer_id=mfr_id,
-        )
-
-    # Priority 2: Check for DewertOkin unique service UUID
-    if DEWERTOKIN_SERVICE_UUID.lower() in service_uuids:
-        signals.append("uuid:dewertokin")
-        _LOGGER.info(
-            "Detected DewertOkin bed at %s (name: %s) by service UUID",
-            service_info.address,
-            service_info.name,
-        )
-        return DetectionResult(
-            bed_type=BED_TYPE_DEWERTOKIN,
-            confidence=0.9,
-            signals=signals,
-        )
-
-    # Check for OKIN ORE - unique service UUID (00001000)
-    if OKIN_ORE_SERVICE_UUID.lower() in service_uuids:
-        signals.append("uuid:okin_ore")
-        _LOGGER.info(
-            "Detected OKIN ORE bed at %s (name: %s) by service UUID",
-            service_info.address,
-            service_info.name,
-        )
-        return DetectionResult(
-            bed_type=BED_TYPE_OKIN_ORE,
-            confidence=1.0,
-            signals=signals,
-        )
-
-    # Check for Jensen - unique service UUID (00001234)
-    if JENSEN_SERVICE_UUID.lower() in service_uuids:
-        signals.append("uuid:jensen")
-        _LOGGER.info(
-            "Detected Jensen bed at %s (name: %s) by service UUID",
-            service_info.address,
-            service_info.name,
-        )
-        return DetectionResult(
-            bed_type=BED_TYPE_JENSEN,
-            confidence=1.0,
-            signals=signals,
-        )
-
-    # Check for Jensen by name pattern (JMC400)
-    if any(device_name.startswith(pattern) for pattern in JENSEN_NAME_PATTERNS):
-        signals.append("name:jensen")
-        _LOGGER.info(
-            "Detected Jensen bed at %s (name: %s) by name pattern",
-            service_info.address,
-            service_info.name,
-        )
-        return DetectionResult(
-            bed_type=BED_TYPE_JENSEN,
-            confidence=0.9,
-            signals=signals,
-        )
-
-    # Check for Vibradorm - VMAT service UUIDs (1525/1527)
-    if (
-        VIBRADORM_SERVICE_UUID.lower() in service_uuids
-        or VIBRADORM_SECONDARY_SERVICE_UUID.lower() in service_uuids
-    ):
-        signals.append("uuid:vibradorm")
-        _LOGGER.info(
-            "Detected Vibradorm bed at %s (name: %s) by service UUID",
-            service_info.address,
-            service_info.name,
-        )
-        return DetectionResult(
-            bed_type=BED_TYPE_VIBRADORM,
-            confidence=1.0,
-            signals=signals,
-        )
-
-    # Check for Vibradorm by name pattern (VMAT*)
-    if any(device_name.startswith(pattern) for pattern in VIBRADORM_NAME_PATTERNS):
-        signals.append("name:vibradorm")
-        _LOGGER.info(
-            "Detected Vibradorm bed at %s (name: %s) by name pattern",
-            service_info.address,
-            service_info.name,
-        )
-        return DetectionResult(
-            bed_type=BED_TYPE_VIBRADORM,
-            confidence=0.9,
-            signals=signals,
-        )
-
-    # Check for Svane - unique service UUID (abcb)
-    if SVANE_HEAD_SERVICE_UUID.lower() in service_uuids:
-        signals.append("uuid:svane")
-        _LOGGER.info(
-            "Detected Svane bed at %s (name: %s) by service UUID",
-            service_info.address,
-            service_info.name,
-        )
-        return DetectionResult(
-            bed_type=BED_TYPE_SVANE,
-            confidence=1.0,
-            signals=signals,
-        )
-
-    # Check for Svane by name pattern
-    if any(pattern in device_name for pattern in SVANE_NAME_PATTERNS):
-        signals.append("name:svane")
-        _LOGGER.info(
-            "Detected Svane bed at %s (name: %s) by name pattern",
-            service_info.address,
-            service_info.name,
-        )
-        return DetectionResult(
-            bed_type=BED_TYPE_SVANE,
-            confidence=0.9,
-            signals=signals,
-        )
-
-    # Check for Remacro (Jeromes / Slumberland / The Brick) - unique service UUID (6e403587)
-    # Note: Similar to Nordic UART (6e400001) but with different prefix, so unique
-    if REMACRO_SERVICE_UUID.lower() in service_uuids:
-        signals.append("uuid:remacro")
-        _LOGGER.info(
-            "Detected Remacro bed at %s (name: %s) by service UUID",
-            service_info.address,
-            service_info.name,
-        )
-        return DetectionResult(
-            bed_type=BED_TYPE_REMACRO,
-            confidence=1.0,
-            signals=signals,
-        )
-
-    # Check for SUTA Smart Home (AT command protocol over FFF0).
-    # Excludes known accessory-only subtypes that use a separate binary protocol.
-    if any(device_name.startswith(pattern) for pattern in SUTA_NAME_PATTERNS):
-        if any(device_name.startswith(prefix) for prefix in SUTA_UNSUPPORTED_NAME_PREFIXES):
-            signals.append("name:suta_accessory")
-            _LOGGER.debug(
-                "Skipping SUTA accessory subtype at %s (name: %s)",
-                service_info.address,
-                service_info.name,
-            )
-            return DetectionResult(bed_type=None, confidence=0.0, signals=signals)
-        else:
-            signals.append("name:suta")
-            if SUTA_SERVICE_UUID.lower() in service_uuids:
-                signals.append("uuid:suta_fff0")
-                _LOGGER.info(
-                    "Detected SUTA bed at %s (name: %s) by FFF0 UUID + name pattern",
-                    service_info.address,
-                    service_info.name,
-                )
-                return DetectionResult(
-                    bed_type=BED_TYPE_SUTA,
-                    confidence=0.9,
-                    signals=signals,
-                )
-            if not service_uuids:
-                _LOGGER.info(
-                    "Detected SUTA bed at %s (name: %s) by name pattern",
-                    service_info.address,
-                    service_info.name,
-                )
-                return DetectionResult(
-                    bed_type=BED_TYPE_SUTA,
-                    confidence=0.3,
-                    signals=signals,
-                )
-
-    # Check for TiMOTION AHF protocol by device name.
-    # The protocol uses Nordic UART UUIDs, which are shared by many devices.
-    if any(device_name.startswith(pattern) for pattern in TIMOTION_AHF_NAME_PATTERNS):
-        signals.append("name:timotion_ahf")
-        confidence = 0.3
-        if TIMOTION_AHF_SERVICE_UUID.lower() in service_uuids:
-            signals.append("uuid:nordic_uart")
-            confidence = 0.9
-
-        _LOGGER.info(
-            "Detected TiMOTION AHF bed at %s (name: %s)%s",
-            service_info.address,
-            service_info.name,
-            " with Nordic UART service" if confidence >= 0.9 else " by name pattern",
-        )
-        return DetectionResult(
-            bed_type=BED_TYPE_TIMOTION_AHF,
-            confidence=confidence,
-            signals=signals,
-        )
-
-    # Check for Malouf NEW_OKIN - unique advertised service UUID (most specific first)
-    if MALOUF_NEW_OKIN_ADVERTISED_SERVICE_UUID.lower() in service_uuids:
-        signals.append("uuid:malouf_new_okin")
-        _LOGGER.info(
-            "Detected Malouf NEW_OKIN bed at %s (name: %s)",
-            service_info.address,
-            service_info.name,
-        )
-        return DetectionResult(bed_type=BED_TYPE_MALOUF_NEW_OKIN, confidence=1.0, signals=signals)
-
-    # Check for Linak - most specific first
-    # Some Linak beds may advertise position service but not control service
-    if (
-        LINAK_CONTROL_SERVICE_UUID.lower() in service_uuids
-        or LINAK_POSITION_SERVICE_UUID.lower() in service_uuids
-    ):
-        signals.append("uuid:linak")
-        _LOGGER.info(
-            "Detected Linak bed at %s (name: %s)",
-            service_info.address,
-            service_info.name,
-        )
-        return DetectionResult(bed_type=BED_TYPE_LINAK, confidence=1.0, signals=signals)
-
-    # Check for Linak by name pattern (e.g., "Bed 1696")
-    # Some Linak beds don't advertise service UUIDs in their BLE beacon
-    for pattern in LINAK_NAME_PATTERNS:
-        if device_name.startswith(pattern) and device_name[len(pattern) :].isdigit():
-            signals.append("name:linak")
-            _LOGGER.info(
-                "Detected Linak bed at %s (name: %s) by name pattern",
-                service_info.address,
-                service_info.name,
-            )
-            return DetectionResult(bed_type=BED_TYPE_LINAK, confidence=0.9, signals=signals)
-
-    # Check for Leggett & Platt Gen2 (must check before generic UUIDs)
-    if LEGGETT_GEN2_SERVICE_UUID.lower() in service_uuids:
-        signals.append("uuid:leggett_gen2")
-        _LOGGER.info(
-            "Detected Leggett & Platt Gen2 bed at %s (name: %s)",
-            service_info.address,
-            service_info.name,
-        )
-        return DetectionResult(bed_type=BED_TYPE_LEGGETT_GEN2, confidence=1.0, signals=signals)
-
-    # Check for Reverie Nightstand (Protocol 110) - more specific UUID
-    if REVERIE_NIGHTSTAND_SERVICE_UUID.lower() in service_uuids:
-        signals.append("uuid:reverie_nightstand")
-        _LOGGER.info(
-            "Detected Reverie Nightstand bed at %s (name: %s)",
-            service_info.address,
-            service_info.name,
-        )
-        return DetectionResult(bed_type=BED_TYPE_REVERIE_NIGHTSTAND, confidence=1.0, signals=signals)
-
-    # Check for Reverie (Protocol 108)
-    if REVERIE_SERVICE_UUID.lower() in service_uuids:
-        signals.append("uuid:reverie")
-        _LOGGER.info(
-            "Detected Reverie bed at %s (name: %s)",
-            service_info.address,
-            service_info.name,
-        )
-        return DetectionResult(bed_type=BED_TYPE_REVERIE, confidence=1.0, signals=signals)
-
-    # Check for Sleepy's Elite BOX24 - name-based detection (before Okimat since same UUID)
-    # Sleepy's BOX24 beds use OKIN 64-bit service UUID
-    if (
-        any(pattern in device_name for pattern in SLEEPYS_NAME_PATTERNS)
-        and OKIMAT_SERVICE_UUID.lower() in service_uuids
-    ):
-        signals.append("uuid:okin")
-        signals.append("name:sleepys")
-        _LOGGER.info(
-            "Detected Sleepy's Elite BOX24 bed at %s (name: %s)",
-            service_info.address,
-            service_info.name,
-        )
-        return DetectionResult(
-            bed_type=BED_TYPE_SLEEPYS_BOX24, confidence=0.9, signals=signals
-        )
-
-    # Check for Nectar - name-based detection (before Okimat since same UUID)
-    # Nectar beds use OKIN service UUID but different command protocol
-    if "nectar" in device_name and OKIMAT_SERVICE_UUID.lower() in service_uuids:
-        signals.append("uuid:okin")
-        signals.append("name:nectar")
-        _LOGGER.info(
-            "Detected Nectar bed at %s (name: %s)",
-            service_info.address,
-            service_info.name,
-        )
-        return DetectionResult(bed_type=BED_TYPE_NECTAR, confidence=0.9, signals=signals)
-
-    # Check for beds using OKIN service UUID (Okimat, Leggett Okin, Nectar, OKIN 64-bit)
-    # Nectar is already handled above by name check
-    # Use name patterns to disambiguate between Okimat and Leggett Okin
-    # Note: OKIN 64-bit cannot be reliably detected without connecting
-    if OKIMAT_SERVICE_UUID.lower() in service_uuids:
-        signals.append("uuid:okin")
-        # Check for Leggett & Platt Okin by name patterns
-        if any(pattern in device_name for pattern in LEGGETT_OKIN_NAME_PATTERNS):
-            signals.append("name:leggett")
-            _LOGGER.info(
-                "Detected Leggett & Platt Okin bed at %s (name: %s)",
-                service_info.address,
-                service_info.name,
-            )
-            return DetectionResult(bed_type=BED_TYPE_LEGGETT_OKIN, confidence=0.9, signals=signals)
-
-        # Check for Okimat-specific name patterns
-        if any(pattern in device_name for pattern in OKIMAT_NAME_PATTERNS):
-            signals.append("name:okimat")
-            _LOGGER.info(
-                "Detected Okimat bed at %s (name: %s)",
-                service_info.address,
-                service_info.name,
-            )
-            return DetectionResult(bed_type=BED_TYPE_OKIMAT, confidence=0.9, signals=signals)
-
-        # Fallback: default to Okimat with warning about ambiguity
-        # This UUID is shared by Okimat, Leggett Okin, and OKIN 64-bit
-        _LOGGER.warning(
-            "Okin UUID detected but device name '%s' at %s doesn't match known patterns. "
-            "Defaulting to Okimat. Change to Leggett & Platt or OKIN 64-bit in settings if needed.",
-            service_info.name,
-            service_info.address,
-        )
-        return DetectionResult(
-            bed_type=BED_TYPE_OKIMAT,
-            confidence=0.5,
-            signals=signals,
-            ambiguous_types=[BED_TYPE_LEGGETT_OKIN, BED_TYPE_OKIN_64BIT],
-            requires_characteristic_check=True,
-        )
-
-    # Check for BedTech - name-based detection (before Richmat WiLinke since same UUID)
-    # BedTech shares FEE9 service UUID with Richmat WiLinke
-    if any(pattern in device_name for pattern in BEDTECH_NAME_PATTERNS):
-        if BEDTECH_SERVICE_UUID.lower() in service_uuids:
-            signals.append(f"uuid:{BEDTECH_SERVICE_UUID.lower()}")
-            signals.append("name:bedtech")
-            _LOGGER.info(
-                "Detected BedTech bed at %s (name: %s)",
-                service_info.address,
-                service_info.name,
-            )
-            return DetectionResult(bed_type=BED_TYPE_BEDTECH, confidence=0.9, signals=signals)
-
-    # Check for Octo by name pattern (e.g., RC2, DA1458x, etc.)
-    # MUST be before Richmat WiLinke since FFE0 (W3 variant) is in both lists
-    if any(device_name.startswith(pattern) for pattern in OCTO_NAME_PATTERNS):
-        signals.append("name:octo")
-        _LOGGER.info(
-            "Detected Octo bed at %s (name: %s) by name pattern",
-            service_info.address,
-            service_info.name,
-        )
-        return DetectionResult(bed_type=BED_TYPE_OCTO, confidence=0.9, signals=signals)
-
-    # Check for Solace/Octo/MotoSleep disambiguation (FFE0 UUID)
-    # MUST be before Richmat WiLinke since FFE0 is in RICHMAT_WILINKE_SERVICE_UUIDS as W3
-    if SOLACE_SERVICE_UUID.lower() in service_uuids:
-        signals.append("uuid:ffe0")
-        # Limoss / Stawett use the same FFE0 UUID but are identified by name.
-        if any(pattern in device_name for pattern in LIMOSS_NAME_PATTERNS):
-            signals.append("name:limoss")
-            _LOGGER.info(
-                "Detected Limoss bed at %s (name: %s) by FFE0 UUID + name pattern",
-                service_info.address,
-                service_info.name,
-            )
-            return DetectionResult(bed_type=BED_TYPE_LIMOSS, confidence=0.9, signals=signals)
-
-        # Check for Solace name patterns from Motion Bed app reverse engineering:
-        # - QMS-*, QMS2, QMS3, QMS4 (QMS series)
-        # - S3-*, S4-*, S5-*, S6-* (S-series)
-        # - SealyMF (Sealy Motion Flex)
-        # - Contains "solace"
-        # - Matches legacy Solace naming convention like "S2-Y-192-461000AD"
-        if any(device_name.startswith(p) for p in SOLACE_NAME_PATTERNS):
-            signals.append("name:solace")
-            _LOGGER.info(
-                "Detected Solace bed at %s (name: %s) by name pattern",
-                service_info.address,
-                service_info.name,
-            )
-            return DetectionResult(bed_type=BED_TYPE_SOLACE, confidence=0.9, signals=signals)
-        if "solace" in device_name or SOLACE_NAME_PATTERN.match(device_name):
-            signals.append("name:solace")
-            _LOGGER.info(
-                "Detected Solace bed at %s (name: %s)",
-                service_info.address,
-                service_info.name,
-            )
-            return DetectionResult(bed_type=BED_TYPE_SOLACE, confidence=0.9, signals=signals)
-        # Check for MotoSleep name pattern (HHC prefix)
-        if device_name.startswith("hhc"):
-            signals.append("name:motosleep")
-            _LOGGER.info(
-                "Detected MotoSleep bed at %s (name: %s)",
-                service_info.address,
-                service_info.name,
-            )
-            return DetectionResult(bed_type=BED_TYPE_MOTOSLEEP, confidence=0.9, signals=signals)
-        # Default to Octo for unknown FFE0 names
-        _LOGGER.info(
-            "Detected Octo bed at %s (name: %s) - defaulting to Octo for shared FFE0 UUID",
-            service_info.address,
-            service_info.name,
-        )
-        return DetectionResult(
-            bed_type=BED_TYPE_OCTO,
-            confidence=0.5,
-            signals=signals,
-            ambiguous_types=[BED_TYPE_SOLACE, BED_TYPE_MOTOSLEEP],
-        )
-
-    # Check for Leggett & Platt MlRM variant (MlRM prefix with WiLinke UUID)
-    # Must be before generic Richmat WiLinke check
-    # Variant detection (mlrm) happens at controller instantiation
-    if is_leggett_mlrm_name:
-        for wilinke_uuid in RICHMAT_WILINKE_SERVICE_UUIDS:
-            if wilinke_uuid.lower() in service_uuids:
-                signals.append("uuid:wilinke")
-                signals.append("name:mlrm")
-                _LOGGER.info(
-                    "Detected Leggett & Platt MlRM bed at %s (name: %s)",
-                    service_info.address,
-                    service_info.name,
-                )
-                return DetectionResult(
-                    bed_type=BED_TYPE_LEGGETT_WILINKE, confidence=0.9, signals=signals
-                )
-
-    # Check for Richmat WiLinke variants (includes FEE9 which is also used by BedTech)
-    for wilinke_uuid in RICHMAT_WILINKE_SERVICE_UUIDS:
-        if wilinke_uuid.lower() in service_uuids:
-            signals.append("uuid:wilinke")
-            # FEE9 is ambiguous - could be Richmat or BedTech
-            if wilinke_uuid.lower() == BEDTECH_SERVICE_UUID.lower():
-                if is_richmat_named:
-                    signals.append("name:richmat")
-                    _LOGGER.info(
-                        "Detected Richmat WiLinke bed at %s (name: %s) by Richmat name + FEE9 UUID",
-                        service_info.address,
-                        service_info.name,
-                    )
-                    return DetectionResult(
-                        bed_type=BED_TYPE_RICHMAT,
-                        confidence=0.9,
-                        signals=signals,
-                        detected_remote=detected_remote,
-                    )
-                _LOGGER.info(
-                    "Detected Richmat WiLinke bed at %s (name: %s) - FEE9 UUID (also used by BedTech)",
-                    service_info.address,
-                    service_info.name,
-                )
-                return DetectionResult(
-                    bed_type=BED_TYPE_RICHMAT,
-                    confidence=0.5,
-                    signals=signals,
-                    ambiguous_types=[BED_TYPE_BEDTECH],
-                    requires_characteristic_check=True,
-                )
-            _LOGGER.info(
-                "Detected Richmat WiLinke bed at %s (name: %s)",
-                service_info.address,
-                service_info.name,
-            )
-            return DetectionResult(bed_type=BED_TYPE_RICHMAT, confidence=0.8, signals=signals)
-
-    # Check for MotoSleep - name-based detection (HHC prefix)
-    if device_name.startswith("hhc"):
-        signals.append("name:motosleep")
-        _LOGGER.info(
-            "Detected MotoSleep bed at %s (name: %s)",
+    excluded = advertisement.name_substrings.intersection(EXCLUDED_DEVICE_PATTERNS)
+    if excluded and _has_only_generic_uuids(advertisement.service_uuids):
+        pattern = min(excluded, key=_EXCLUSION_ORDER.__getitem__)
+        _LOGGER.debug(
+            "Device %s excluded: name '%s' matches excluded pattern '%s' "
+            "(device has only generic UUIDs)",
             service_info.address,
             service_info.name,
+            pattern,
         )
-        return DetectionResult(bed_type=BED_TYPE_MOTOSLEEP, confidence=0.9, signals=signals)
-
-    # Check for Limoss / Stawett (TEA-encrypted protocol over shared FFE0/FFE1 UUIDs)
-    # Detection relies primarily on device name because FFE0 is shared by many protocols.
-    if any(pattern in device_name for pattern in LIMOSS_NAME_PATTERNS):
-        signals.append("name:limoss")
-        confidence = 0.3
-        _LOGGER.info(
-            "Detected Limoss bed at %s (name: %s) by name pattern",
-            service_info.address,
-            service_info.name,
-        )
-        return DetectionResult(bed_type=BED_TYPE_LIMOSS, confidence=confidence, signals=signals)
-
-    # Check for Ergomotion - name-based detection (before Keeson since same UUID)
-    # Includes "serta-i" prefix for Serta-branded ErgoMotion beds (e.g., Serta-i490350)
-    if any(pattern in device_name for pattern in ERGOMOTION_NAME_PATTERNS):
-        signals.append("name:ergomotion")
-        _LOGGER.info(
-            "Detected Ergomotion bed at %s (name: %s)",
+        return DetectionResult(bed_type=None, confidence=0.0, signals=["excluded:" + pattern])
+
+    rule, result = _RULE_INDEX.evaluate(advertisement)
+    if rule is None:
+        _LOGGER.debug("Device %s does not match any known bed types", service_info.address)
+    elif rule.warning is not None:
+        _LOGGER.warning(rule.warning, service_info.name, service_info.address)
+    elif rule.bed_type is None:
+        _LOGGER.debug(
+            "Skipping %s at %s (name: %s)",
+            rule.label,
             service_info.address,
             service_info.name,
         )
-        return DetectionResult(bed_type=BED_TYPE_ERGOMOTION, confidence=0.9, signals=signals)
-
-    # Check for Sleepy's Elite BOX15 - name pattern + FFE5 service (before Keeson)
-    # Sleepy's BOX15 uses FFE5 service UUID with 9-byte checksum protocol
-    if (
-        any(pattern in device_name for pattern in SLEEPYS_NAME_PATTERNS)
-        and KEESON_BASE_SERVICE_UUID.lower() in service_uuids
-    ):
-        signals.append("uuid:ffe5")
-        signals.append("name:sleepys")
+    else:
         _LOGGER.info(
-            "Detected Sleepy's Elite BOX15 bed at %s (name: %s)",
+            "Detected %s at %s (name: %s)",
+            rule.label,
             service_info.address,
             service_info.name,
         )
-        return DetectionResult(
-            bed_type=BED_TYPE_SLEEPYS_BOX15, confidence=0.9, signals=signals
-        )
-
-    # Check for Cool Base - name pattern detection (before Keeson since same UUID)
-    # Cool Base is a Keeson BaseI5 variant with additional fan control
-    # Device names start with "base-i5" (from BleConnect.java: limitedDevice = "base-i5")
-    if any(device_name.startswith(pattern) for pattern in COOLBASE_NAME_PATTERNS):
-        signals.append("name:coolbase")
-        _LOGGER.info(
-            "Detected Cool Base bed at %s (name: %s) by name pattern",
-            service_info.address,
-            service_info.name,
-        )
-        return DetectionResult(bed_type=BED_TYPE_COOLBASE, confidence=0.9, signals=signals)
-
-    # Check for Malouf LEGACY_OKIN - name pattern + FFE5 service (before Keeson)
-    # Malouf LEGACY_OKIN uses FFE5 service UUID but different 9-byte command format
-    if (
-        any(pattern in device_name for pattern in MALOUF_NAME_PATTERNS)
-        and MALOUF_LEGACY_OKIN_SERVICE_UUID.lower() in service_uuids
-    ):
-        signals.append("uuid:ffe5")
-        signals.append("name:malouf")
-        _LOGGER.info(
-            "Detected Malouf LEGACY_OKIN bed at %s (name: %s)",
-            service_info.address,
-            service_info.name,
-        )
-        return DetectionResult(
-            bed_type=BED_TYPE_MALOUF_LEGACY_OKIN, confidence=0.9, signals=signals
-        )
-
-    # Check for Keeson by name patterns (e.g., base-i4.XXXX, base-i5.XXXX, KSBTXXXX)
-    # This catches devices that may not advertise the specific service UUID
-    if any(device_name.startswith(pattern) for pattern in KEESON_NAME_PATTERNS):
-        signals.append("name:keeson")
-        _LOGGER.info(
-            "Detected Keeson bed at %s (name: %s) by name pattern",
-            service_info.address,
-            service_info.name,
-        )
-        return DetectionResult(bed_type=BED_TYPE_KEESON, confidence=0.9, signals=signals)
-
-    # Check for Richmat by name pattern (e.g., QRRM157052, B6RM123456, ZR10...)
-    # Uses RICHMAT_CODE_PATTERN regex to match all valid remote codes (492 codes supported)
-    # Also extract remote code for feature detection
-    # Exclude MlRM patterns which are Leggett & Platt (need WiLinke UUID to detect)
-    if is_richmat_named:
-        signals.append("name:richmat")
-        _LOGGER.info(
-            "Detected Richmat bed at %s (name: %s) by name pattern",
-            service_info.address,
-            service_info.name,
-        )
-        return DetectionResult(
-            bed_type=BED_TYPE_RICHMAT,
-            confidence=0.9,
-            signals=signals,
-            detected_remote=detected_remote,
-        )
-
-    # Check for Comfort Motion / Lierda - service UUID detection
-    # Supports both legacy FF12 service and Lierda3 FE60 service.
-    if (
-        COMFORT_MOTION_SERVICE_UUID.lower() in service_uuids
-        or COMFORT_MOTION_LIERDA3_SERVICE_UUID.lower() in service_uuids
-    ):
-        if COMFORT_MOTION_LIERDA3_SERVICE_UUID.lower() in service_uuids:
-            signals.append("uuid:comfort_motion_lierda3")
-        else:
-            signals.append("uuid:comfort_motion")
-        _LOGGER.info(
-            "Detected Comfort Motion bed at %s (name: %s)",
-            service_info.address,
-            service_info.name,
-        )
-        return DetectionResult(bed_type=BED_TYPE_COMFORT_MOTION, confidence=1.0, signals=signals)
-
-    # Check for Jiecang - name-based detection (Glide beds, Dream Motion app)
-    if any(
-        x in device_name for x in ["jiecang", "jc-", "dream motion", "glide", "comfort motion", "lierda"]
-    ):
-        signals.append("name:jiecang")
-        _LOGGER.info(
-            "Detected Jiecang bed at %s (name: %s)",
-            service_info.address,
-            service_info.name,
-        )
-        return DetectionResult(bed_type=BED_TYPE_JIECANG, confidence=0.9, signals=signals)
-
-    # Check for DewertOkin - name-based detection (A H Beard, HankookGallery)
-    # Note: Also detected by manufacturer data and service UUID above (higher priority)
-    if any(x in device_name for x in DEWERTOKIN_NAME_PATTERNS):
-        signals.append("name:dewertokin")
-        _LOGGER.info(
-            "Detected DewertOkin bed at %s (name: %s)",
-            service_info.address,
-            service_info.name,
-        )
-        return DetectionResult(bed_type=BED_TYPE_DEWERTOKIN, confidence=0.3, signals=signals)
-
-    # Check for Serta Motion Perfect - name-based detection (uses Keeson protocol)
-    if any(x in device_name for x in ["serta", "motion perfect"]):
-        signals.append("name:serta")
-        _LOGGER.info(
-            "Detected Serta bed at %s (name: %s) - uses Keeson protocol with serta variant",
-            service_info.address,
-            service_info.name,
-        )
-        return DetectionResult(bed_type=BED_TYPE_SERTA, confidence=0.9, signals=signals)
-
-    # Check for Octo Star2 variant - service UUID detection
-    if OCTO_STAR2_SERVICE_UUID.lower() in service_uuids:
-        signals.append("uuid:octo_star2")
-        _LOGGER.info(
-            "Detected Octo Star2 bed at %s (name: %s)",
-            service_info.address,
-            service_info.name,
-        )
-        return DetectionResult(bed_type=BED_TYPE_OCTO, confidence=1.0, signals=signals)
-
-    # Check for beds using FFE5 service UUID (Keeson, OKIN FFE, Malouf LEGACY, Serta)
-    # Priority: Serta/Keeson name patterns > OKIN FFE > Keeson (default)
-    if KEESON_BASE_SERVICE_UUID.lower() in service_uuids:
-        signals.append("uuid:ffe5")
-        # Check for Serta name patterns (uses Keeson protocol with serta variant)
-        if any(pattern in device_name for pattern in SERTA_NAME_PATTERNS):
-            signals.append("name:serta")
-            _LOGGER.info(
-                "Detected Serta bed at %s (name: %s) - uses Keeson protocol with serta variant",
-                service_info.address,
-                service_info.name,
-            )
-            return DetectionResult(bed_type=BED_TYPE_SERTA, confidence=0.9, signals=signals)
-        # Check for OKIN FFE name patterns (0xE6 prefix variant)
-        if any(pattern in device_name for pattern in OKIN_FFE_NAME_PATTERNS):
-            signals.append("name:okin_ffe")
-            _LOGGER.info(
-                "Detected OKIN FFE bed at %s (name: %s)",
-                service_info.address,
-                service_info.name,
-            )
-            return DetectionResult(bed_type=BED_TYPE_OKIN_FFE, confidence=0.9, signals=signals)
-        # Default to Keeson Base for other FFE5 devices
-        # This UUID is shared by Keeson, Malouf LEGACY, OKIN FFE, Serta
-        _LOGGER.info(
-            "Detected Keeson Base bed at %s (name: %s) - FFE5 UUID is ambiguous",
-            service_info.address,
-            service_info.name,
-        )
-        return DetectionResult(
-            bed_type=BED_TYPE_KEESON,
-            confidence=0.5,
-            signals=signals,
-            ambiguous_types=[BED_TYPE_MALOUF_LEGACY_OKIN, BED_TYPE_OKIN_FFE, BED_TYPE_SERTA],
-        )
-
-    # Check for Mattress Firm 900 (iFlex) - name-based detection
-    # Must check before Richmat Nordic since they share the same UUID
-    if "iflex" in device_name:
-        signals.append("name:iflex")
-        _LOGGER.info(
-            "Detected Mattress Firm 900 bed at %s (name: %s)",
-            service_info.address,
-            service_info.name,
-        )
-        return DetectionResult(bed_type=BED_TYPE_MATTRESSFIRM, confidence=0.9, signals=signals)
-
-    # Check for Richmat Nordic / Keeson KSBT / OKIN 64-bit (same UUID)
-    # These share the Nordic UART service UUID
-    if RICHMAT_NORDIC_SERVICE_UUID.lower() in service_uuids:
-        signals.append("uuid:nordic_uart")
-        # This UUID is shared by Richmat, Keeson KSBT, Mattress Firm, and OKIN 64-bit
-        _LOGGER.info(
-            "Detected Richmat/Keeson bed at %s (name: %s) - Nordic UART UUID is ambiguous",
-            service_info.address,
-            service_info.name,
-        )
-        return DetectionResult(
-            bed_type=BED_TYPE_RICHMAT,
-            confidence=0.5,
-            signals=signals,
-            ambiguous_types=[BED_TYPE_KEESON, BED_TYPE_MATTRESSFIRM, BED_TYPE_OKIN_64BIT],
-            requires_characteristic_check=True,
-        )
-
-    # Fallback: Check for OKIN Automotive manufacturer ID 89 (CB24 protocol)
-    # This is checked LAST to allow UUID-based detection to take priority.
-    # SmartBed by Okin devices advertise manufacturer ID but no service UUIDs.
-    if service_info.manufacturer_data and MANUFACTURER_ID_OKIN in service_info.manufacturer_data:
-        signals.append(f"manufacturer_id:{MANUFACTURER_ID_OKIN}")
-        _LOGGER.info(
-            "Detected Okin CB24 bed at %s (name: %s) by manufacturer ID %s (fallback)",
-            service_info.address,
-            service_info.name,
-            MANUFACTURER_ID_OKIN,
-        )
-        return DetectionResult(
-            bed_type=BED_TYPE_OKIN_CB24,
-            confidence=0.7,  # Lower confidence as fallback
-            signals=signals,
-            manufacturer_id=MANUFACTURER_ID_OKIN,
-        )
-
-    _LOGGER.debug("Device %s does not match any known bed types", service_info.address)
-    return DetectionResult(bed_type=None, confidence=0.0, signals=signals)
+    return result
 
 
 async def detect_bed_type_by_characteristics(
@@ -0,0 +1,285 @@
+"""Indexed rule evaluation for bed type detection.
+
+Detection used to be one ordered chain of checks that lowercased every UUID
+and ran dozens of ``in`` and ``startswith`` loops for every advertisement,
+even though almost all of those checks could never match it.
+
+Detection is now a table of DetectionRule entries, each with a priority, the
+result it produces and the conditions it needs. RuleIndex compiles the table
+once into:
+
+- a service UUID index and a manufacturer ID index,
+- a trie of every name pattern, walked once per advertisement to find all
+  patterns the name starts with or contains.
+
+Each rule is filed under one condition it cannot match without, so an
+advertisement only evaluates the rules reachable from its own UUIDs,
+manufacturer IDs and name patterns (plus the few rules that can't be indexed),
+in priority order. The first matching rule decides the result, exactly like
+the first matching branch of the old chain.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any, Final
+
+from .const import DetectionResult
+
+# Trie node key holding the pattern that ends at that node. Name characters
+# are always one character long, so the empty string can't collide.
+_PATTERN_END: Final = ""
+
+
+class NameTrie:
+    """Trie of name patterns matched against device names in one pass."""
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        """Build the trie.
+
+        Args:
+            patterns: Lowercase name patterns. Empty patterns are rejected.
+        """
+        self._root: dict[str, Any] = {}
+        for pattern in patterns:
+            if not pattern:
+                raise ValueError("Name patterns must not be empty")
+            node = self._root
+            for char in pattern:
+                node = node.setdefault(char, {})
+            node[_PATTERN_END] = pattern
+
+    def scan(self, name: str) -> tuple[frozenset[str], frozenset[str]]:
+        """Find the patterns ``name`` starts with and the patterns it contains.
+
+        Returns:
+            Tuple of (prefix matches, substring matches). Every prefix match is
+            also a substring match.
+        """
+        root = self._root
+        prefixes: set[str] = set()
+        substrings: set[str] = set()
+        length = len(name)
+        for start in range(length):
+            node = root.get(name[start])
+            pos = start + 1
+            while node is not None:
+                pattern = node.get(_PATTERN_END)
+                if pattern is not None:
+                    substrings.add(pattern)
+                    if start == 0:
+                        prefixes.add(pattern)
+                if pos == length:
+                    break
+                node = node.get(name[pos])
+                pos += 1
+        return frozenset(prefixes), frozenset(substrings)
+
+
+class Advertisement:
+    """Normalized view of one advertisement, shared by all rule checks."""
+
+    def __init__(
+        self,
+        address: str,
+        raw_name: str | None,
+        service_uuids: Sequence[str],
+        manufacturer_data: Mapping[int, bytes] | None,
+        trie: NameTrie,
+        remote_from_name: Callable[[str | None], str | None] | None = None,
+    ) -> None:
+        """Normalize the advertisement and scan its name."""
+        self._remote_from_name = remote_from_name
+        self.address = address
+        self.raw_name = raw_name
+        self.name = (raw_name or "").lower()
+        self.service_uuids = service_uuids
+        self.uuid_set = frozenset(service_uuids)
+        self.manufacturer_data = manufacturer_data
+        self.manufacturer_ids: frozenset[int] = (
+            frozenset(manufacturer_data) if manufacturer_data else frozenset()
+        )
+        self.name_prefixes, self.name_substrings = trie.scan(self.name)
+
+    @cached_property
+    def detected_remote(self) -> str | None:
+        """Return the remote code encoded in the name, if any."""
+        if self._remote_from_name is None:
+            return None
+        return self._remote_from_name(self.raw_name)
+
+    def first_uuid_of(self, uuids: Sequence[str]) -> str | None:
+        """Return the first of ``uuids`` (in their order) that is advertised."""
+        for uuid in uuids:
+            if uuid in self.uuid_set:
+                return uuid
+        return None
+
+
+@dataclass(frozen=True)
+class DetectionRule:
+    """One detection outcome and the conditions that select it.
+
+    All declared conditions must hold: at least one of ``service_uuids`` is
+    advertised, at least one of ``manufacturer_ids`` is present, the name
+    starts with one of ``name_prefixes``, the name contains one of
+    ``name_contains``, and ``when`` returns True.
+    """
+
+    priority: int
+    label: str
+    bed_type: str | None
+    confidence: float
+    signals: tuple[str, ...] = ()
+    service_uuids: frozenset[str] = field(default_factory=frozenset)
+    manufacturer_ids: frozenset[int] = field(default_factory=frozenset)
+    name_prefixes: frozenset[str] = field(default_factory=frozenset)
+    name_contains: frozenset[str] = field(default_factory=frozenset)
+    when: Callable[[Advertisement], bool] | None = None
+    ambiguous_types: tuple[str, ...] = ()
+    requires_characteristic_check: bool = False
+    report_remote: bool = False
+    manufacturer_id: int | None = None
+    # Logged instead of the info message when the rule matches
+    warning: str | None = None
+    # Non-terminal rules only contribute their signals and evaluation goes on
+    terminal: bool = True
+
+    def __post_init__(self) -> None:
+        """Lowercase the service UUIDs (advertised UUIDs are lowercased too)."""
+        object.__setattr__(
+            self, "service_uuids", frozenset(uuid.lower() for uuid in self.service_uuids)
+        )
+
+    def matches(self, advertisement: Advertisement) -> bool:
+        """Return whether every condition of the rule holds."""
+        if self.service_uuids and self.service_uuids.isdisjoint(advertisement.uuid_set):
+            return False
+        if self.manufacturer_ids and self.manufacturer_ids.isdisjoint(
+            advertisement.manufacturer_ids
+        ):
+            return False
+        if self.name_prefixes and self.name_prefixes.isdisjoint(advertisement.name_prefixes):
+            return False
+        if self.name_contains and self.name_contains.isdisjoint(advertisement.name_substrings):
+            return False
+        return self.when is None or self.when(advertisement)
+
+    def result(self, advertisement: Advertisement, notes: Sequence[str]) -> DetectionResult:
+        """Build the detection result of this rule."""
+        return DetectionResult(
+            bed_type=self.bed_type,
+            confidence=self.confidence,
+            signals=[*notes, *self.signals],
+            ambiguous_types=list(self.ambiguous_types) if self.ambiguous_types else None,
+            detected_remote=advertisement.detected_remote if self.report_remote else None,
+            manufacturer_id=self.manufacturer_id,
+            requires_characteristic_check=self.requires_characteristic_check,
+        )
+
+
+class RuleIndex:
+    """Detection rules compiled into lookup indexes."""
+
+    def __init__(
+        self,
+        rules: Iterable[DetectionRule],
+        extra_name_patterns: Iterable[str] = (),
+        remote_from_name: Callable[[str | None], str | None] | None = None,
+    ) -> None:
+        """Compile the rules.
+
+        Args:
+            rules: Rule table. Priorities must be unique; lower runs first.
+            extra_name_patterns: Patterns to report in Advertisement name
+                matches without being tied to a rule (e.g. exclusions).
+            remote_from_name: Decodes a remote code from the device name,
+                evaluated lazily for rules that need it.
+        """
+        self._remote_from_name = remote_from_name
+        ordered = sorted(rules, key=lambda rule: rule.priority)
+        priorities = [rule.priority for rule in ordered]
+        if len(set(priorities)) != len(priorities):
+            raise ValueError("Detection rule priorities must be unique")
+        self._rules = ordered
+
+        self._by_uuid: dict[str, list[int]] = {}
+        self._by_manufacturer: dict[int, list[int]] = {}
+        self._by_prefix: dict[str, list[int]] = {}
+        self._by_substring: dict[str, list[int]] = {}
+        self._always: list[int] = []
+        patterns: set[str] = set(extra_name_patterns)
+
+        for position, rule in enumerate(ordered):
+            patterns.update(rule.name_prefixes)
+            patterns.update(rule.name_contains)
+            # File the rule under one condition it can't match without
+            if rule.service_uuids:
+                for uuid in rule.service_uuids:
+                    self._by_uuid.setdefault(uuid, []).append(position)
+            elif rule.manufacturer_ids:
+                for manufacturer_id in rule.manufacturer_ids:
+                    self._by_manufacturer.setdefault(manufacturer_id, []).append(position)
+            elif rule.name_prefixes:
+                for pattern in rule.name_prefixes:
+                    self._by_prefix.setdefault(pattern, []).append(position)
+            elif rule.name_contains:
+                for pattern in rule.name_contains:
+                    self._by_substring.setdefault(pattern, []).append(position)
+            else:
+                self._always.append(position)
+
+        self._trie = NameTrie(sorted(patterns))
+
+    @property
+    def rules(self) -> list[DetectionRule]:
+        """Return the rules in priority order."""
+        return list(self._rules)
+
+    def advertisement(
+        self,
+        address: str,
+        name: str | None,
+        service_uuids: Iterable[Any] | None,
+        manufacturer_data: Mapping[int, bytes] | None,
+    ) -> Advertisement:
+        """Normalize an advertisement for evaluation."""
+        uuids = [str(uuid).lower() for uuid in service_uuids] if service_uuids else []
+        return Advertisement(
+            address, name, uuids, manufacturer_data, self._trie, self._remote_from_name
+        )
+
+    def candidates(self, advertisement: Advertisement) -> list[DetectionRule]:
+        """Return the rules that can match, in priority order."""
+        found = set(self._always)
+        for uuid in advertisement.service_uuids:
+            found.update(self._by_uuid.get(uuid, ()))
+        for manufacturer_id in advertisement.manufacturer_ids:
+            found.update(self._by_manufacturer.get(manufacturer_id, ()))
+        for pattern in advertisement.name_prefixes:
+            found.update(self._by_prefix.get(pattern, ()))
+        for pattern in advertisement.name_substrings:
+            found.update(self._by_substring.get(pattern, ()))
+        return [self._rules[position] for position in sorted(found)]
+
+    def evaluate(
+        self, advertisement: Advertisement
+    ) -> tuple[DetectionRule | None, DetectionResult]:
+        """Run the candidate rules and return the deciding rule and its result.
+
+        Returns:
+            Tuple of (matched terminal rule or None, detection result). When no
+            rule matches, the result has no bed type and carries the signals
+            of any non-terminal rules that matched.
+        """
+        notes: list[str] = []
+        for rule in self.candidates(advertisement):
+            if not rule.matches(advertisement):
+                continue
+            if not rule.terminal:
+                notes.extend(rule.signals)
+                continue
+            return rule, rule.result(advertisement, notes)
+        return None, DetectionResult(bed_type=None, confidence=0.0, signals=notes)
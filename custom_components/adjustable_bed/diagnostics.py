@@ -126,6 +126,10 @@ async def async_get_config_entry_diagnostics(
             "connection_history": coordinator.connection_history,
             "adapter_details": coordinator.adapter_details,
             "command_timing": coordinator.command_timing,
+            "latency": coordinator.latency_stats,
+            "command_queue": coordinator.command_queue_stats,
+            "position_updates": coordinator.position_update_stats,
+            "gatt_cache": coordinator.gatt_cache_stats,
         },
         "ble": ble_info,
         "gatt_summary": get_gatt_summary(coordinator),
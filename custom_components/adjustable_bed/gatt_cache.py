@@ -0,0 +1,172 @@
+"""Persistent GATT layout cache per bed.
+
+After every connection the coordinator walks the discovered services, reads
+the Device Information Service and, for beds that need pairing, forces a
+fresh GATT discovery because services cached from an unpaired connection
+break characteristic lookups. Through a Bluetooth proxy that discovery and
+the extra reads make up most of the reconnect time, and they repeat after
+every idle disconnect and every Home Assistant restart.
+
+GattServiceCache keeps the resolved service/characteristic/handle map of one
+bed in Home Assistant storage together with the device information read from
+it. On reconnect the services bleak returns are reduced to a fingerprint and
+compared with the stored one, which needs no BLE traffic. When they match the
+stored device information is reused. When they don't, the coordinator falls
+back to full discovery and stores the new layout.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, Final
+
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from bleak.backends.service import BleakGATTService
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+GATT_CACHE_STORAGE_VERSION: Final = 1
+
+
+def gatt_layout(services: Iterable[BleakGATTService]) -> list[dict[str, Any]]:
+    """Return the service/characteristic/handle map of discovered services."""
+    return sorted(
+        (
+            {
+                "uuid": service.uuid.lower(),
+                "handle": getattr(service, "handle", None),
+                "characteristics": sorted(
+                    (
+                        {
+                            "uuid": char.uuid.lower(),
+                            "handle": getattr(char, "handle", None),
+                            "properties": sorted(char.properties),
+                        }
+                        for char in service.characteristics
+                    ),
+                    key=lambda char: (char["uuid"], char["handle"] or 0),
+                ),
+            }
+            for service in services
+        ),
+        key=lambda service: (service["uuid"], service["handle"] or 0),
+    )
+
+
+def gatt_fingerprint(layout: list[dict[str, Any]]) -> str:
+    """Return a short digest identifying a GATT layout."""
+    digest = hashlib.sha1(usedforsecurity=False)
+    for service in layout:
+        digest.update(f"S{service['uuid']}:{service['handle']}".encode())
+        for char in service["characteristics"]:
+            props = ",".join(char["properties"])
+            digest.update(f"C{char['uuid']}:{char['handle']}:{props}".encode())
+    return digest.hexdigest()[:16]
+
+
+class GattServiceCache:
+    """Stored GATT layout and device information for one bed address."""
+
+    def __init__(self, hass: HomeAssistant, address: str) -> None:
+        """Initialize the cache."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, GATT_CACHE_STORAGE_VERSION, _storage_key(address)
+        )
+        self._data: dict[str, Any] | None = None
+        self._loaded = False
+        self._hits = 0
+        self._misses = 0
+        self._last_result: str | None = None
+        self._last_fingerprint: str | None = None
+
+    async def async_load(self) -> None:
+        """Load the stored layout once."""
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            self._data = await self._store.async_load()
+        except Exception:
+            _LOGGER.debug("Failed to load GATT cache, starting fresh", exc_info=True)
+
+    @property
+    def has_layout(self) -> bool:
+        """Return True if a layout is stored."""
+        return bool(self._data and self._data.get("fingerprint"))
+
+    @property
+    def device_info(self) -> tuple[str | None, str | None]:
+        """Return the stored (manufacturer, model)."""
+        if not self._data:
+            return None, None
+        return self._data.get("manufacturer"), self._data.get("model")
+
+    @property
+    def last_fingerprint(self) -> str | None:
+        """Return the fingerprint of the services last validated, None if there were none."""
+        return self._last_fingerprint
+
+    def validate(self, services: Iterable[BleakGATTService] | None) -> bool:
+        """Return True if discovered services match the stored layout."""
+        layout = gatt_layout(services or ())
+        self._last_fingerprint = gatt_fingerprint(layout) if layout else None
+        if not self.has_layout or not layout:
+            self._last_result = "empty"
+            return False
+        assert self._data is not None
+        if self._last_fingerprint == self._data["fingerprint"]:
+            self._hits += 1
+            self._last_result = "hit"
+            return True
+        self._misses += 1
+        self._last_result = "mismatch"
+        return False
+
+    def store(
+        self,
+        services: Iterable[BleakGATTService],
+        manufacturer: str | None,
+        model: str | None,
+    ) -> None:
+        """Store a freshly discovered layout and the device information read from it."""
+        layout = gatt_layout(services)
+        if not layout:
+            return
+        self._data = {
+            "fingerprint": gatt_fingerprint(layout),
+            "services": layout,
+            "manufacturer": manufacturer,
+            "model": model,
+        }
+        self._store.async_delay_save(lambda: self._data or {}, 0)
+
+    def invalidate(self) -> None:
+        """Forget the stored layout so the next connection does full discovery."""
+        self._data = None
+        self._store.async_delay_save(dict, 0)
+
+    def stats(self) -> dict[str, Any]:
+        """Return cache statistics for diagnostics."""
+        return {
+            "stored": self.has_layout,
+            "fingerprint": self._data.get("fingerprint") if self._data else None,
+            "hits": self._hits,
+            "misses": self._misses,
+            "last_result": self._last_result,
+        }
+
+
+def _storage_key(address: str) -> str:
+    return f"{DOMAIN}.gatt_cache.{address.replace(':', '').lower()}"
+
+
+async def async_remove_gatt_cache(hass: HomeAssistant, address: str) -> None:
+    """Delete the stored GATT layout for a removed bed."""
+    await Store(hass, GATT_CACHE_STORAGE_VERSION, _storage_key(address)).async_remove()
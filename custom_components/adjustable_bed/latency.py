@@ -0,0 +1,177 @@
+"""Command latency histograms for Adjustable Bed diagnostics.
+
+Each coordinator keeps one LatencyHistogram per command phase (command lock
+wait, connection check, connection slot lease wait, auth refresh, GATT write round-trip, final position
+read, and the connection wait of the first command after a pause, split into
+warm and cold). Samples land in fixed log-spaced bucket arrays, so recording is a
+bisect plus an integer increment and memory use never grows with uptime.
+
+Histograms are rolling: samples are counted in a current window and, once it
+fills, the window is rotated into a single previous window. Percentiles are
+computed over both windows, so the reported figures always cover the most
+recent LATENCY_WINDOW_SIZE to 2 * LATENCY_WINDOW_SIZE samples.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from bisect import bisect_left
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, Final
+
+# Command phases tracked per coordinator
+LATENCY_PHASE_LOCK_WAIT: Final = "command_lock_wait"
+LATENCY_PHASE_ENSURE_CONNECTED: Final = "ensure_connected"
+LATENCY_PHASE_SLOT_WAIT: Final = "connection_slot_wait"
+LATENCY_PHASE_AUTH_REFRESH: Final = "auth_refresh"
+LATENCY_PHASE_GATT_WRITE: Final = "gatt_write"
+LATENCY_PHASE_POSITION_READ: Final = "position_read"
+# Connection wait of the first user command after a pause, split by whether
+# the link was still (or already) up
+LATENCY_PHASE_FIRST_COMMAND_WARM: Final = "first_command_warm"
+LATENCY_PHASE_FIRST_COMMAND_COLD: Final = "first_command_cold"
+
+LATENCY_PHASES: Final = (
+    LATENCY_PHASE_LOCK_WAIT,
+    LATENCY_PHASE_ENSURE_CONNECTED,
+    LATENCY_PHASE_SLOT_WAIT,
+    LATENCY_PHASE_AUTH_REFRESH,
+    LATENCY_PHASE_GATT_WRITE,
+    LATENCY_PHASE_POSITION_READ,
+    LATENCY_PHASE_FIRST_COMMAND_WARM,
+    LATENCY_PHASE_FIRST_COMMAND_COLD,
+)
+
+# Upper bucket bounds in milliseconds (1-2-3-5-7 steps per decade).
+# Samples above the last bound fall into a final overflow bucket.
+LATENCY_BUCKET_BOUNDS_MS: Final = (
+    1, 2, 3, 5, 7,
+    10, 20, 30, 50, 70,
+    100, 200, 300, 500, 700,
+    1000, 2000, 3000, 5000, 7000,
+    10000, 20000, 30000, 60000,
+)  # fmt: skip
+
+# Samples per rolling window
+LATENCY_WINDOW_SIZE: Final = 500
+
+
+class LatencyHistogram:
+    """Rolling fixed-bucket latency histogram for one command phase."""
+
+    __slots__ = ("_current", "_previous", "_current_count", "_total_count", "_max_ms", "_sum_ms")
+
+    def __init__(self) -> None:
+        """Initialize empty bucket arrays."""
+        bucket_count = len(LATENCY_BUCKET_BOUNDS_MS) + 1
+        self._current = [0] * bucket_count
+        self._previous = [0] * bucket_count
+        self._current_count = 0
+        self._total_count = 0
+        self._max_ms = 0.0
+        self._sum_ms = 0.0
+
+    @property
+    def count(self) -> int:
+        """Return the total number of samples recorded since startup."""
+        return self._total_count
+
+    def record(self, elapsed_ms: float) -> None:
+        """Record one latency sample in milliseconds."""
+        if self._current_count >= LATENCY_WINDOW_SIZE:
+            # Rotate windows by swapping arrays and clearing the old one in place
+            self._previous, self._current = self._current, self._previous
+            for i in range(len(self._current)):
+                self._current[i] = 0
+            self._current_count = 0
+        self._current[bisect_left(LATENCY_BUCKET_BOUNDS_MS, elapsed_ms)] += 1
+        self._current_count += 1
+        self._total_count += 1
+        self._sum_ms += elapsed_ms
+        if elapsed_ms > self._max_ms:
+            self._max_ms = elapsed_ms
+
+    def _window(self) -> list[int]:
+        """Return bucket counts covering the current and previous windows."""
+        return [c + p for c, p in zip(self._current, self._previous, strict=True)]
+
+    def percentile(self, pct: float) -> float | None:
+        """Return the bucket upper bound containing the given percentile.
+
+        Args:
+            pct: Percentile between 0 and 100.
+
+        Returns:
+            Latency in milliseconds, or None if no samples are recorded.
+            Samples in the overflow bucket report the largest observed value.
+        """
+        window = self._window()
+        total = sum(window)
+        if total == 0:
+            return None
+        rank = max(1, math.ceil(total * pct / 100))
+        seen = 0
+        for index, bucket_count in enumerate(window):
+            seen += bucket_count
+            if seen >= rank:
+                if index < len(LATENCY_BUCKET_BOUNDS_MS):
+                    return float(min(LATENCY_BUCKET_BOUNDS_MS[index], self._max_ms))
+                break
+        return round(self._max_ms, 1)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-friendly summary for diagnostics."""
+        window = self._window()
+        return {
+            "count": self._total_count,
+            "window_count": sum(window),
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "max_ms": round(self._max_ms, 1),
+            "mean_ms": round(self._sum_ms / self._total_count, 1) if self._total_count else None,
+            # Raw bucket counts so reports from several beds can be merged
+            "buckets": window,
+        }
+
+
+class CommandLatencyTracker:
+    """Per-coordinator collection of phase latency histograms."""
+
+    def __init__(self) -> None:
+        """Create one histogram per tracked phase."""
+        self._histograms: dict[str, LatencyHistogram] = {
+            phase: LatencyHistogram() for phase in LATENCY_PHASES
+        }
+
+    def record(self, phase: str, elapsed_seconds: float) -> None:
+        """Record a phase duration measured in seconds."""
+        histogram = self._histograms.get(phase)
+        if histogram is not None:
+            histogram.record(elapsed_seconds * 1000)
+
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        """Time the wrapped block and record it under the given phase.
+
+        The sample is recorded even if the block raises, so failed writes and
+        timed-out reads still show up in the distribution.
+        """
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.record(phase, time.monotonic() - start)
+
+    def histogram(self, phase: str) -> LatencyHistogram:
+        """Return the histogram for a phase."""
+        return self._histograms[phase]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return percentile summaries for all phases."""
+        return {
+            "bucket_bounds_ms": list(LATENCY_BUCKET_BOUNDS_MS),
+            "phases": {phase: hist.as_dict() for phase, hist in self._histograms.items()},
+        }
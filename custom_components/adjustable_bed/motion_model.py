@@ -0,0 +1,207 @@
+"""Learned motor motion model for predictive position seeking.
+
+Position seeking moves a motor in bursts and checks the position between them.
+Without knowing how fast a motor moves or how far it coasts after the last
+pulse, every burst runs its full length and the seek has to correct overshoot
+by reversing.
+
+MotorMotionModel fits ``travel = velocity * run_time + coast`` for one motor
+and direction from completed bursts, using recursive least squares with
+exponential forgetting so the model tracks load changes (someone lying on the
+bed) without keeping a sample history. The seek uses the fit to cut the next
+burst short so the motor coasts to a stop inside the position tolerance.
+
+Models are stored per config entry in Home Assistant storage so learning
+survives restarts.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Final
+
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+MOTION_MODEL_STORAGE_VERSION: Final = 1
+MOTION_MODEL_SAVE_DELAY: Final = 30  # Seconds to batch writes after a seek
+
+# Weight kept by older samples on each new observation
+MOTION_FORGETTING_FACTOR: Final = 0.8
+# Samples needed before predictions are trusted
+MOTION_MIN_SAMPLES: Final = 2
+# Run-time variance (s^2) below which the intercept can't be fitted
+MOTION_MIN_RUN_VARIANCE: Final = 0.01
+# Bursts shorter than this are too dominated by latency to learn from
+MOTION_MIN_RUN_TIME: Final = 0.1
+# Shortest burst the seek will ask for
+MOTION_MIN_PREDICTED_RUN: Final = 0.05
+
+
+@dataclass(frozen=True)
+class MotionEstimate:
+    """Current velocity and coast estimate for one motor direction."""
+
+    velocity: float  # Degrees (or percent) per second while pulses are sent
+    coast: float  # Additional travel after the last pulse
+    samples: int
+
+    def run_time_for(self, distance: float) -> float:
+        """Return how long to drive the motor to cover a distance including coast."""
+        return max((distance - self.coast) / self.velocity, MOTION_MIN_PREDICTED_RUN)
+
+
+class MotorMotionModel:
+    """Online least-squares fit of travel against run time."""
+
+    __slots__ = ("_s0", "_st", "_sd", "_stt", "_std", "_samples")
+
+    def __init__(self) -> None:
+        """Initialize an empty model."""
+        self._s0 = 0.0
+        self._st = 0.0
+        self._sd = 0.0
+        self._stt = 0.0
+        self._std = 0.0
+        self._samples = 0
+
+    def observe(self, run_time: float, travel: float) -> None:
+        """Add one completed burst.
+
+        Args:
+            run_time: Seconds the motor was driven.
+            travel: Distance moved in the commanded direction, including coast.
+        """
+        if run_time < MOTION_MIN_RUN_TIME or travel <= 0:
+            return
+        decay = MOTION_FORGETTING_FACTOR
+        self._s0 = self._s0 * decay + 1
+        self._st = self._st * decay + run_time
+        self._sd = self._sd * decay + travel
+        self._stt = self._stt * decay + run_time * run_time
+        self._std = self._std * decay + run_time * travel
+        self._samples += 1
+
+    def estimate(self) -> MotionEstimate | None:
+        """Return the current estimate, or None until enough bursts are seen."""
+        if self._samples < MOTION_MIN_SAMPLES or self._st <= 0:
+            return None
+        variance = self._stt / self._s0 - (self._st / self._s0) ** 2
+        velocity = 0.0
+        coast = 0.0
+        if variance >= MOTION_MIN_RUN_VARIANCE:
+            velocity = (self._s0 * self._std - self._st * self._sd) / (
+                self._s0 * self._stt - self._st * self._st
+            )
+            coast = (self._sd - velocity * self._st) / self._s0
+        if velocity <= 0 or coast < 0:
+            # All bursts had the same length (or the fit is degenerate):
+            # fall back to a pure velocity estimate with no coast
+            velocity = self._sd / self._st
+            coast = 0.0
+        if velocity <= 0:
+            return None
+        return MotionEstimate(velocity=velocity, coast=coast, samples=self._samples)
+
+    def as_dict(self) -> dict[str, float]:
+        """Return the model state for storage."""
+        return {
+            "s0": self._s0,
+            "st": self._st,
+            "sd": self._sd,
+            "stt": self._stt,
+            "std": self._std,
+            "samples": self._samples,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> MotorMotionModel:
+        """Restore a model from storage."""
+        model = cls()
+        model._s0 = float(data.get("s0", 0.0))
+        model._st = float(data.get("st", 0.0))
+        model._sd = float(data.get("sd", 0.0))
+        model._stt = float(data.get("stt", 0.0))
+        model._std = float(data.get("std", 0.0))
+        model._samples = int(data.get("samples", 0))
+        return model
+
+
+class MotionModelStore:
+    """Per-coordinator collection of motion models backed by HA storage."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, MOTION_MODEL_STORAGE_VERSION, _storage_key(entry_id)
+        )
+        self._models: dict[str, MotorMotionModel] = {}
+        self._loaded = False
+
+    @staticmethod
+    def _key(motor: str, moving_up: bool) -> str:
+        return f"{motor}:{'up' if moving_up else 'down'}"
+
+    async def async_load(self) -> None:
+        """Load stored models once."""
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            data = await self._store.async_load()
+        except Exception:
+            _LOGGER.debug("Failed to load motion models, starting fresh", exc_info=True)
+            return
+        if not data:
+            return
+        for key, model_data in data.get("models", {}).items():
+            self._models[key] = MotorMotionModel.from_dict(model_data)
+
+    def estimate(self, motor: str, moving_up: bool) -> MotionEstimate | None:
+        """Return the estimate for a motor direction, if trained."""
+        model = self._models.get(self._key(motor, moving_up))
+        return model.estimate() if model is not None else None
+
+    def observe(self, motor: str, moving_up: bool, run_time: float, travel: float) -> None:
+        """Record a completed burst and schedule a save."""
+        key = self._key(motor, moving_up)
+        model = self._models.get(key)
+        if model is None:
+            model = self._models[key] = MotorMotionModel()
+        model.observe(run_time, travel)
+        self._store.async_delay_save(self._data_to_save, MOTION_MODEL_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {"models": {key: model.as_dict() for key, model in self._models.items()}}
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return current estimates for diagnostics."""
+        result: dict[str, Any] = {}
+        for key, model in self._models.items():
+            estimate = model.estimate()
+            result[key] = (
+                {
+                    "velocity": round(estimate.velocity, 2),
+                    "coast": round(estimate.coast, 2),
+                    "samples": estimate.samples,
+                }
+                if estimate
+                else None
+            )
+        return result
+
+
+def _storage_key(entry_id: str) -> str:
+    return f"{DOMAIN}.motion_model.{entry_id}"
+
+
+async def async_remove_motion_models(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete stored motion models for a removed config entry."""
+    await Store(hass, MOTION_MODEL_STORAGE_VERSION, _storage_key(entry_id)).async_remove()
@@ -13,9 +13,11 @@ from homeassistant.components.number import (
     NumberMode,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .beds.capabilities import Capability
+from .command_queue import CommandPriority
 from .const import (
     BED_TYPE_ERGOMOTION,
     BED_TYPE_KEESON,
@@ -188,6 +190,7 @@ async def async_setup_entry(
     bed_type = entry.data.get(CONF_BED_TYPE)
     has_massage = entry.data.get(CONF_HAS_MASSAGE, False)
     controller = coordinator.controller
+    capabilities = controller.capabilities if controller is not None else None
 
     entities: list[NumberEntity] = []
 
@@ -287,10 +290,10 @@ async def async_setup_entry(
             )
 
     # Set up massage intensity number entities (only for beds with massage and direct intensity control)
-    if has_massage and controller is not None:
-        if getattr(controller, "supports_massage_intensity_control", False):
-            supported_zones = getattr(controller, "massage_intensity_zones", [])
-            max_intensity = getattr(controller, "massage_intensity_max", 10)
+    if has_massage and capabilities is not None:
+        if capabilities.has(Capability.MASSAGE_INTENSITY_CONTROL):
+            supported_zones = capabilities.massage_intensity_zones
+            max_intensity = capabilities.massage_intensity_max
             _LOGGER.debug(
                 "Setting up massage intensity numbers for %s (zones: %s, max: %d)",
                 coordinator.name,
@@ -314,8 +317,8 @@ async def async_setup_entry(
                     entities.append(AdjustableBedMassageNumber(coordinator, massage_adjusted))
 
     # Set up light level number entity (only for beds that support it)
-    if controller is not None and getattr(controller, "supports_light_level_control", False):
-        max_level = getattr(controller, "light_level_max", 10)
+    if capabilities is not None and capabilities.has(Capability.LIGHT_LEVEL_CONTROL):
+        max_level = capabilities.light_level_max
         _LOGGER.debug(
             "Setting up light level number for %s (max: %d)",
             coordinator.name,
@@ -356,8 +359,8 @@ class AdjustableBedPositionNumber(AdjustableBedEntity, NumberEntity):
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to hass."""
         await super().async_added_to_hass()
-        self._unregister_callback = self._coordinator.register_position_callback(
-            self._handle_position_update
+        self._unregister_callback = self._coordinator.subscribe_position(
+            self.entity_description.position_key, self.async_write_ha_state
         )
 
     async def async_will_remove_from_hass(self) -> None:
@@ -366,11 +369,6 @@ class AdjustableBedPositionNumber(AdjustableBedEntity, NumberEntity):
             self._unregister_callback()
         await super().async_will_remove_from_hass()
 
-    @callback
-    def _handle_position_update(self, _position_data: dict[str, float]) -> None:
-        """Handle position data update."""
-        self.async_write_ha_state()
-
     @property
     def native_value(self) -> float | None:
         """Return the current position (angle in degrees, or percentage for Keeson/Ergomotion)."""
@@ -456,7 +454,9 @@ class AdjustableBedMassageNumber(AdjustableBedEntity, NumberEntity):
         async def _set_intensity(ctrl: BedController) -> None:
             await ctrl.set_massage_intensity(zone, level)
 
-        await self._coordinator.async_execute_controller_command(_set_intensity)
+        await self._coordinator.async_execute_controller_command(
+            _set_intensity, priority=CommandPriority.ACCESSORY
+        )
 
 
 class AdjustableBedLightLevelNumber(AdjustableBedEntity, NumberEntity):
@@ -496,4 +496,6 @@ class AdjustableBedLightLevelNumber(AdjustableBedEntity, NumberEntity):
         async def _set_level(ctrl: BedController) -> None:
             await ctrl.set_light_level(level)
 
-        await self._coordinator.async_execute_controller_command(_set_level)
+        await self._coordinator.async_execute_controller_command(
+            _set_level, priority=CommandPriority.ACCESSORY
+        )
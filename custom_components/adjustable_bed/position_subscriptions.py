@@ -0,0 +1,148 @@
+"""Per-key, rate-limited position subscriptions for entities.
+
+During a move a bed can send several position notifications per second for
+every motor. Calling each entity on every notification writes state for
+entities whose value did not change and floods the recorder and websocket
+clients with intermediate positions.
+
+PositionSubscriptions dispatches an update only to entities subscribed to
+the position key that changed, and only if its value actually changed. Each
+subscriber is called at most once per minimum interval: updates inside the
+interval are coalesced into one trailing call, which reads the latest value.
+flush() runs pending calls immediately so the final position is written as
+soon as motion stops.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _Subscriber:
+    """One subscribed callback and its rate-limit state."""
+
+    __slots__ = ("callback", "last_call", "timer")
+
+    def __init__(self, callback_fn: Callable[[], None]) -> None:
+        """Initialize the subscriber."""
+        self.callback = callback_fn
+        self.last_call = float("-inf")
+        self.timer: asyncio.TimerHandle | None = None
+
+    def cancel(self) -> None:
+        """Cancel a pending trailing call."""
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+
+
+class PositionSubscriptions:
+    """Fan position updates out to per-key subscribers with change detection.
+
+    Subscribing with key None receives every update (still rate limited and
+    without change detection), for entities whose state arrives alongside
+    position notifications, like Keeson/Ergomotion massage levels.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, min_interval: float) -> None:
+        """Initialize the subscriptions.
+
+        Args:
+            loop: Event loop used to schedule trailing calls.
+            min_interval: Minimum seconds between calls to one subscriber.
+                0 calls subscribers on every change.
+        """
+        self._loop = loop
+        self._min_interval = min_interval
+        self._subscribers: dict[str | None, list[_Subscriber]] = {}
+        self._last_values: dict[str, float] = {}
+        self._updates = 0
+        self._unchanged = 0
+        self._calls = 0
+        self._coalesced = 0
+
+    @property
+    def min_interval(self) -> float:
+        """Return the minimum seconds between calls to one subscriber."""
+        return self._min_interval
+
+    def subscribe(self, key: str | None, callback_fn: Callable[[], None]) -> Callable[[], None]:
+        """Subscribe to updates for one position key (or all, with None).
+
+        Returns:
+            Function that removes the subscription.
+        """
+        subscriber = _Subscriber(callback_fn)
+        self._subscribers.setdefault(key, []).append(subscriber)
+
+        def unsubscribe() -> None:
+            subscriber.cancel()
+            subscribers = self._subscribers.get(key)
+            if subscribers is not None and subscriber in subscribers:
+                subscribers.remove(subscriber)
+
+        return unsubscribe
+
+    def update(self, key: str, value: float) -> None:
+        """Dispatch a position update."""
+        self._updates += 1
+        changed = self._last_values.get(key) != value
+        self._last_values[key] = value
+        if changed:
+            for subscriber in self._subscribers.get(key, ()):
+                self._schedule(subscriber)
+        else:
+            self._unchanged += 1
+        for subscriber in self._subscribers.get(None, ()):
+            self._schedule(subscriber)
+
+    def flush(self) -> None:
+        """Run every pending trailing call now."""
+        for subscribers in list(self._subscribers.values()):
+            for subscriber in list(subscribers):
+                if subscriber.timer is not None:
+                    subscriber.cancel()
+                    self._call(subscriber)
+
+    def _schedule(self, subscriber: _Subscriber) -> None:
+        """Call a subscriber now, or once its interval has passed."""
+        if subscriber.timer is not None:
+            # A trailing call is already pending and will see the latest value
+            self._coalesced += 1
+            return
+        wait = subscriber.last_call + self._min_interval - time.monotonic()
+        if wait <= 0:
+            self._call(subscriber)
+            return
+        subscriber.timer = self._loop.call_later(wait, self._call_pending, subscriber)
+
+    def _call_pending(self, subscriber: _Subscriber) -> None:
+        """Run a trailing call scheduled by _schedule."""
+        subscriber.timer = None
+        self._call(subscriber)
+
+    def _call(self, subscriber: _Subscriber) -> None:
+        """Invoke a subscriber and record the call time."""
+        subscriber.last_call = time.monotonic()
+        self._calls += 1
+        try:
+            subscriber.callback()
+        except Exception as err:
+            _LOGGER.warning("Position callback error: %s", err)
+
+    def stats(self) -> dict[str, Any]:
+        """Return fan-out statistics for diagnostics."""
+        return {
+            "min_interval_ms": round(self._min_interval * 1000),
+            "subscribers": sum(len(subs) for subs in self._subscribers.values()),
+            "updates": self._updates,
+            "unchanged_updates": self._unchanged,
+            "callbacks": self._calls,
+            "coalesced": self._coalesced,
+        }
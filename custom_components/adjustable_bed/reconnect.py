@@ -0,0 +1,212 @@
+"""Reconnect state machine for unexpected disconnects.
+
+An unexpected disconnect used to schedule a reconnect 5 seconds later, and a
+failed reconnect waited for the next command. A bed that is powered off (or
+out of range) then costs a full connect cycle - several attempts, each up to
+the connection timeout - on every command and every disconnect, and each of
+those holds a connection slot on the adapter or proxy that beds which are
+alive need.
+
+ReconnectPolicy tracks one bed through these states:
+
+- CONNECTED: link is up.
+- BACKOFF: waiting to retry; the delay doubles per failure up to a cap.
+- CONNECTING: a background reconnect is running.
+- OPEN: the circuit breaker opened after repeated failures. No more timed
+  retries; the coordinator waits until the bed is seen advertising.
+- PROBING: a single reconnect triggered by an advertisement while OPEN.
+  Success closes the circuit, failure opens it again.
+- IDLE: disconnected on purpose (idle timeout, unload); nothing scheduled.
+
+AdapterReconnectAccounting is shared by all beds in one Home Assistant
+instance. It counts background reconnect attempts and failures per adapter
+and lets only one background reconnect run on an adapter at a time.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from collections import Counter
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any, Final
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+# First retry after an unexpected disconnect, doubled per failure
+RECONNECT_BASE_DELAY: Final = 5.0
+RECONNECT_MAX_DELAY: Final = 300.0
+# Failed background reconnects before the circuit opens
+RECONNECT_CIRCUIT_THRESHOLD: Final = 5
+# Minimum time between advertisement-triggered probes while the circuit is open
+RECONNECT_PROBE_INTERVAL: Final = 60.0
+
+DATA_ADAPTER_RECONNECTS: Final = f"{DOMAIN}_adapter_reconnects"
+
+
+class ReconnectState(StrEnum):
+    """Reconnect states of one bed."""
+
+    IDLE = "idle"
+    CONNECTED = "connected"
+    BACKOFF = "backoff"
+    CONNECTING = "connecting"
+    OPEN = "open"
+    PROBING = "probing"
+
+
+class ReconnectPolicy:
+    """Backoff and circuit breaker state for one bed."""
+
+    def __init__(
+        self,
+        jitter: float = 0.2,
+        base_delay: float = RECONNECT_BASE_DELAY,
+        max_delay: float = RECONNECT_MAX_DELAY,
+        failure_threshold: int = RECONNECT_CIRCUIT_THRESHOLD,
+        probe_interval: float = RECONNECT_PROBE_INTERVAL,
+    ) -> None:
+        """Initialize the policy."""
+        self._jitter = jitter
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._failure_threshold = failure_threshold
+        self._probe_interval = probe_interval
+        self._state = ReconnectState.IDLE
+        self._failures = 0
+        self._next_delay: float | None = None
+        self._last_probe = float("-inf")
+        self._transitions: Counter[str] = Counter()
+
+    @property
+    def state(self) -> ReconnectState:
+        """Return the current state."""
+        return self._state
+
+    @property
+    def circuit_open(self) -> bool:
+        """Return True while timed retries are suspended."""
+        return self._state in (ReconnectState.OPEN, ReconnectState.PROBING)
+
+    def _transition(self, state: ReconnectState) -> None:
+        if state != self._state:
+            self._transitions[f"{self._state}->{state}"] += 1
+            self._state = state
+
+    def _backoff_delay(self) -> float:
+        delay = min(self._base_delay * 2 ** max(self._failures - 1, 0), self._max_delay)
+        return float(delay * random.uniform(1 - self._jitter, 1 + self._jitter))
+
+    def connected(self) -> None:
+        """Record a successful connection (background or not)."""
+        self._failures = 0
+        self._next_delay = None
+        self._transition(ReconnectState.CONNECTED)
+
+    def disconnected_intentionally(self) -> None:
+        """Record a deliberate disconnect; nothing should be retried."""
+        self._failures = 0
+        self._next_delay = None
+        self._transition(ReconnectState.IDLE)
+
+    def connection_lost(self) -> float | None:
+        """Record an unexpected disconnect.
+
+        Returns:
+            Seconds to wait before reconnecting, or None while the circuit is open.
+        """
+        if self.circuit_open:
+            return None
+        self._transition(ReconnectState.BACKOFF)
+        self._next_delay = self._backoff_delay()
+        return self._next_delay
+
+    def attempt_started(self) -> None:
+        """Record the start of a background reconnect."""
+        if self.circuit_open:
+            self._last_probe = time.monotonic()
+            self._transition(ReconnectState.PROBING)
+        else:
+            self._transition(ReconnectState.CONNECTING)
+
+    def attempt_failed(self) -> float | None:
+        """Record a failed background reconnect.
+
+        Returns:
+            Seconds until the next attempt, or None if the circuit is (now) open.
+        """
+        self._failures += 1
+        if self.circuit_open or self._failures >= self._failure_threshold:
+            self._next_delay = None
+            self._transition(ReconnectState.OPEN)
+            return None
+        self._transition(ReconnectState.BACKOFF)
+        self._next_delay = self._backoff_delay()
+        return self._next_delay
+
+    def deferred(self) -> float:
+        """Return the delay for a reconnect postponed because its adapter is busy."""
+        self._next_delay = self._backoff_delay()
+        return self._next_delay
+
+    def should_probe(self) -> bool:
+        """Return True if an advertisement should trigger a probe now."""
+        return (
+            self._state == ReconnectState.OPEN
+            and time.monotonic() - self._last_probe >= self._probe_interval
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return state and transition counts for diagnostics."""
+        return {
+            "state": str(self._state),
+            "consecutive_failures": self._failures,
+            "next_delay": round(self._next_delay, 1) if self._next_delay is not None else None,
+            "transitions": dict(self._transitions),
+        }
+
+
+class AdapterReconnectAccounting:
+    """Background reconnect counts and in-flight reconnects per adapter."""
+
+    def __init__(self) -> None:
+        """Initialize empty accounting."""
+        self._in_flight: set[str] = set()
+        self._attempts: Counter[str] = Counter()
+        self._failures: Counter[str] = Counter()
+
+    def try_acquire(self, adapter: str) -> bool:
+        """Claim the adapter for a background reconnect, if no other bed is using it."""
+        if adapter in self._in_flight:
+            return False
+        self._in_flight.add(adapter)
+        self._attempts[adapter] += 1
+        return True
+
+    def release(self, adapter: str, success: bool) -> None:
+        """Release the adapter after a background reconnect."""
+        self._in_flight.discard(adapter)
+        if not success:
+            self._failures[adapter] += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return per-adapter counts for diagnostics."""
+        return {
+            adapter: {
+                "attempts": self._attempts[adapter],
+                "failures": self._failures[adapter],
+                "in_flight": adapter in self._in_flight,
+            }
+            for adapter in sorted(self._attempts)
+        }
+
+
+def adapter_reconnect_accounting(hass: HomeAssistant) -> AdapterReconnectAccounting:
+    """Return the accounting shared by all beds of this Home Assistant instance."""
+    accounting: AdapterReconnectAccounting | None = hass.data.get(DATA_ADAPTER_RECONNECTS)
+    if accounting is None:
+        accounting = hass.data[DATA_ADAPTER_RECONNECTS] = AdapterReconnectAccounting()
+    return accounting
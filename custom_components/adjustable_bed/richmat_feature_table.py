@@ -0,0 +1,156 @@
+"""Compact lookup table for the generated Richmat remote code features.
+
+richmat_features.py maps 492 remote codes to RichmatFeatures flag expressions.
+Importing it evaluates hundreds of OR-chained IntFlag expressions and keeps a
+dict of them alive, which is noticeable at startup on low-end hardware, while
+a running installation looks up one or two codes.
+
+The same mapping is kept here as a single bytes constant in the generated
+richmat_feature_table_data.py: fixed-size records of a 4-character lowercase
+code followed by its flags as a little-endian uint64, sorted by code. Loading
+it is one constant from the module's bytecode (no file I/O in the event loop),
+and lookups binary-search the records.
+
+After regenerating richmat_features.py, rebuild the table from the repository
+root with:
+
+    python -m custom_components.adjustable_bed.richmat_feature_table
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+from collections.abc import Iterator, Mapping
+from functools import cache
+from typing import Final
+
+from .const import RichmatFeatures
+
+CODE_LENGTH: Final = 4
+RECORD: Final = struct.Struct(f"<{CODE_LENGTH}sQ")
+
+# os.path rather than pathlib: looking up a code shouldn't import pathlib
+DATA_MODULE_FILE: Final = os.path.join(os.path.dirname(__file__), "richmat_feature_table_data.py")
+
+_DATA_MODULE_HEADER: Final = '''"""Auto-generated Richmat remote code feature table.
+
+Do not edit manually - regenerate with
+python -m custom_components.adjustable_bed.richmat_feature_table
+
+Sorted {count} records of (4-byte code, uint64 little-endian flags); see
+richmat_feature_table.py for the format.
+"""
+
+from __future__ import annotations
+
+from typing import Final
+
+RICHMAT_FEATURE_TABLE: Final = (
+'''
+
+
+def build_table(features: Mapping[str, int]) -> bytes:
+    """Encode a code -> flags mapping as sorted fixed-size records.
+
+    Raises:
+        ValueError: If a code isn't 4 ASCII letters or digits, or codes
+            collide after lowercasing.
+    """
+    records: dict[bytes, int] = {}
+    for code, flags in features.items():
+        if len(code) != CODE_LENGTH or not (code.isascii() and code.isalnum()):
+            raise ValueError(
+                f"Richmat remote code must be {CODE_LENGTH} ASCII letters or digits: {code!r}"
+            )
+        key = code.lower().encode("ascii")
+        if key in records:
+            raise ValueError(f"Duplicate Richmat remote code: {code!r}")
+        records[key] = int(flags)
+    return b"".join(RECORD.pack(key, records[key]) for key in sorted(records))
+
+
+def render_data_module(features: Mapping[str, int]) -> str:
+    """Return the source of richmat_feature_table_data.py for ``features``."""
+    table = build_table(features)
+    lines = [
+        f"    {_bytes_literal(table[offset : offset + RECORD.size])}\n"
+        for offset in range(0, len(table), RECORD.size)
+    ]
+    return _DATA_MODULE_HEADER.format(count=len(lines)) + "".join(lines) + ")\n"
+
+
+def _bytes_literal(record: bytes) -> str:
+    """Return a double-quoted bytes literal: the code as text, flags as escapes."""
+    code, flags = record[:CODE_LENGTH], record[CODE_LENGTH:]
+    return f'b"{code.decode("ascii")}' + "".join(f"\\x{byte:02x}" for byte in flags) + '"'
+
+
+class RichmatFeatureTable:
+    """Binary search over sorted (code, flags) records."""
+
+    def __init__(self, data: bytes) -> None:
+        """Wrap encoded records.
+
+        Raises:
+            ValueError: If ``data`` isn't a whole number of records.
+        """
+        if len(data) % RECORD.size:
+            raise ValueError("Richmat feature table is truncated")
+        self._data = data
+        self._count = len(data) // RECORD.size
+
+    def __len__(self) -> int:
+        """Return the number of remote codes."""
+        return self._count
+
+    def __iter__(self) -> Iterator[tuple[str, RichmatFeatures]]:
+        """Yield (code, features) in code order."""
+        for code, flags in RECORD.iter_unpack(self._data):
+            yield code.decode("ascii"), RichmatFeatures(flags)
+
+    def lookup(self, remote_code: str) -> RichmatFeatures | None:
+        """Return the features of a remote code (case-insensitive), or None."""
+        if len(remote_code) != CODE_LENGTH or not remote_code.isascii():
+            return None
+        key = remote_code.lower().encode("ascii")
+        data = self._data
+        size = RECORD.size
+        low, high = 0, self._count
+        while low < high:
+            mid = (low + high) // 2
+            offset = mid * size
+            probe = data[offset : offset + CODE_LENGTH]
+            if probe < key:
+                low = mid + 1
+            elif probe > key:
+                high = mid
+            else:
+                return RichmatFeatures(RECORD.unpack_from(data, offset)[1])
+        return None
+
+
+@cache
+def _generated_table() -> RichmatFeatureTable:
+    """Load the generated table on first use."""
+    from .richmat_feature_table_data import RICHMAT_FEATURE_TABLE
+
+    return RichmatFeatureTable(RICHMAT_FEATURE_TABLE)
+
+
+def lookup_richmat_features(remote_code: str) -> RichmatFeatures | None:
+    """Return the generated features of a remote code, or None if unknown."""
+    return _generated_table().lookup(remote_code)
+
+
+def main() -> None:
+    """Rebuild richmat_feature_table_data.py from richmat_features.py."""
+    from .richmat_features import RICHMAT_REMOTE_FEATURES_GENERATED
+
+    with open(DATA_MODULE_FILE, "w", encoding="utf-8") as data_module:
+        data_module.write(render_data_module(RICHMAT_REMOTE_FEATURES_GENERATED))
+    print(f"Wrote {len(RICHMAT_REMOTE_FEATURES_GENERATED)} codes to {DATA_MODULE_FILE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,507 @@
+"""Auto-generated Richmat remote code feature table.
+
+Do not edit manually - regenerate with
+python -m custom_components.adjustable_bed.richmat_feature_table
+
+Sorted 492 records of (4-byte code, uint64 little-endian flags); see
+richmat_feature_table.py for the format.
+"""
+
+from __future__ import annotations
+
+from typing import Final
+
+RICHMAT_FEATURE_TABLE: Final = (
+    b"a0rm\xfb\xde\x1f\x00\x00\x00\x00\x00"
+    b"a0rn\x7d\xff\x2f\x00\x00\x00\x00\x00"
+    b"a1rm\x59\xf6\x3f\x00\x00\x00\x00\x00"
+    b"a2rm\x19\xc6\x0c\x00\x00\x00\x00\x00"
+    b"a2rn\xeb\xfa\x1f\x00\x00\x00\x00\x00"
+    b"a3rm\x7d\x3f\x0f\x00\x00\x00\x00\x00"
+    b"a8rm\x41\x30\x0c\x00\x00\x00\x00\x00"
+    b"a9rn\xef\xfb\x0f\x00\x00\x00\x00\x00"
+    b"aarm\x01\xe0\x3f\x00\x00\x00\x00\x00"
+    b"aarn\x19\x06\x04\x00\x00\x00\x00\x00"
+    b"ahrm\xe3\xf8\x3f\x00\x00\x00\x00\x00"
+    b"ajrn\xe7\x19\x0c\x00\x00\x00\x00\x00"
+    b"anrn\xfb\xfe\x3f\x00\x00\x00\x00\x00"
+    b"aprm\xfb\xfe\x0e\x00\x00\x00\x00\x00"
+    b"aqrm\x19\x26\x0c\x00\x00\x00\x00\x00"
+    b"asrn\xe3\x38\x0c\x00\x00\x00\x00\x00"
+    b"atrm\x6d\x3b\x0c\x00\x00\x00\x00\x00"
+    b"aurm\xfb\xde\x0f\x00\x00\x00\x00\x00"
+    b"avrm\x09\x22\x0c\x00\x00\x00\x00\x00"
+    b"awrm\xfb\xfe\x0f\x00\x00\x00\x00\x00"
+    b"axrm\xfb\xfe\x1f\x00\x00\x00\x00\x00"
+    b"ayrm\xfb\xfe\x0f\x00\x00\x00\x00\x00"
+    b"ayrn\x39\x2e\x2c\x00\x00\x00\x00\x00"
+    b"azrm\x09\x22\x0c\x00\x00\x00\x00\x00"
+    b"azrn\xef\x1b\x0c\x00\x00\x00\x00\x00"
+    b"b0rm\x01\x20\x0c\x00\x00\x00\x00\x00"
+    b"b1rm\x01\x20\x0c\x00\x00\x00\x00\x00"
+    b"b2rn\x7d\xff\x0f\x00\x00\x00\x00\x00"
+    b"b4rm\xef\xfb\x0f\x00\x00\x00\x00\x00"
+    b"b5rn\xeb\xfa\x0f\x00\x00\x00\x00\x00"
+    b"b6rm\x00\x00\x0c\x00\x00\x00\x00\x00"
+    b"b7rn\xeb\x1a\x0c\x00\x00\x00\x00\x00"
+    b"b8rm\x41\x10\x0d\x00\x00\x00\x00\x00"
+    b"b8rn\xfb\xfe\x0f\x00\x00\x00\x00\x00"
+    b"b8tt\x41\x90\x0c\x00\x00\x00\x00\x00"
+    b"b9tt\x49\xb2\x0c\x00\x00\x00\x00\x00"
+    b"barm\x01\x00\x0c\x00\x00\x00\x00\x00"
+    b"bbrm\x01\x20\x0c\x00\x00\x00\x00\x00"
+    b"bbrn\xdb\x36\x3c\x00\x00\x00\x00\x00"
+    b"bcrm\x41\x10\x0c\x00\x00\x00\x00\x00"
+    b"bdrm\xe7\xf9\x3f\x00\x00\x00\x00\x00"
+    b"berm\x65\xf9\x3f\x00\x00\x00\x00\x00"
+    b"bfrm\xe7\x19\x0c\x00\x00\x00\x00\x00"
+    b"bgrm\xe7\x39\x2f\x00\x00\x00\x00\x00"
+    b"bhrm\xe7\xf9\x0f\x00\x00\x00\x00\x00"
+    b"birm\xe7\xf9\x3f\x00\x00\x00\x00\x00"
+    b"bjrm\x7d\x3f\x0c\x00\x00\x00\x00\x00"
+    b"bkrm\x7d\x3f\x0c\x00\x00\x00\x00\x00"
+    b"blrm\x7d\xff\x2f\x00\x00\x00\x00\x00"
+    b"bmrm\x19\x26\x2c\x00\x00\x00\x00\x00"
+    b"bnrm\xfb\xfe\x0f\x00\x00\x00\x00\x00"
+    b"borm\xc3\xf0\x0f\x00\x00\x00\x00\x00"
+    b"bprm\x19\x26\x0c\x00\x00\x00\x00\x00"
+    b"bqrm\x01\x20\x0c\x00\x00\x00\x00\x00"
+    b"brrm\xfb\x3e\x0c\x00\x00\x00\x00\x00"
+    b"bsrm\x19\x06\x04\x00\x00\x00\x00\x00"
+    b"bvrm\xfb\x3e\x0c\x00\x00\x00\x00\x00"
+    b"bxrm\x19\x26\x0c\x00\x00\x00\x00\x00"
+    b"bzrm\x7d\x3f\x0f\x00\x00\x00\x00\x00"
+    b"c0rm\x19\x26\x0c\x00\x00\x00\x00\x00"
+    b"c2rm\xfb\xfe\x3f\x00\x00\x00\x00\x00"
+    b"c2rn\xef\xfb\x0f\x00\x00\x00\x00\x00"
+    b"c5rm\xeb\xfa\x0f\x00\x00\x00\x00\x00"
+    b"c9rm\xfb\xfe\x0c\x00\x00\x00\x00\x00"
+    b"carm\x09\xe2\x3f\x00\x00\x00\x00\x00"
+    b"cbrm\xe3\xf8\x2f\x00\x00\x00\x00\x00"
+    b"cbrn\xff\xff\x0f\x00\x00\x00\x00\x00"
+    b"cdrm\x6d\x3b\x2c\x00\x00\x00\x00\x00"
+    b"cdrn\xdb\xf6\x2f\x00\x00\x00\x00\x00"
+    b"cerm\xfb\x1e\x0c\x00\x00\x00\x00\x00"
+    b"cfrn\xeb\xfa\x0f\x00\x00\x00\x00\x00"
+    b"chrn\x41\x30\x0c\x00\x00\x00\x00\x00"
+    b"cjrm\x83\xe0\x3f\x00\x00\x00\x00\x00"
+    b"ckrm\x65\x39\x3c\x00\x00\x00\x00\x00"
+    b"clrn\xcb\xf2\x2f\x00\x00\x00\x00\x00"
+    b"cmrm\x79\xfe\x0f\x00\x00\x00\x00\x00"
+    b"cnrm\x09\x22\x0c\x00\x00\x00\x00\x00"
+    b"corm\xfb\xde\x0f\x00\x00\x00\x00\x00"
+    b"cprm\x59\xf6\x3f\x00\x00\x00\x00\x00"
+    b"cqrm\x7d\xff\x2f\x00\x00\x00\x00\x00"
+    b"cxrn\xfb\xde\x0f\x00\x00\x00\x00\x00"
+    b"cyrm\xfb\xfe\x0f\x00\x00\x00\x00\x00"
+    b"czrm\xe3\xf8\x3f\x00\x00\x00\x00\x00"
+    b"d0rm\xdb\xf6\x0f\x00\x00\x00\x00\x00"
+    b"d2rm\x79\xfe\x0f\x00\x00\x00\x00\x00"
+    b"d3rm\xdb\xf6\x0e\x00\x00\x00\x00\x00"
+    b"d4rm\xfb\xfe\x3f\x00\x00\x00\x00\x00"
+    b"d6rm\x01\x00\x20\x00\x00\x00\x00\x00"
+    b"d7rm\xcb\xf2\x0d\x00\x00\x00\x00\x00"
+    b"d8rm\x01\x20\x0c\x00\x00\x00\x00\x00"
+    b"d9rm\xdb\xf6\x0e\x00\x00\x00\x00\x00"
+    b"darm\xfb\xfe\x2f\x00\x00\x00\x00\x00"
+    b"dbrm\x23\x00\x0c\x00\x00\x00\x00\x00"
+    b"dcrm\x7d\xff\x2f\x00\x00\x00\x00\x00"
+    b"dcrn\x09\x22\x2c\x00\x00\x00\x00\x00"
+    b"ddrm\xff\x1f\x0c\x00\x00\x00\x00\x00"
+    b"dfrm\xfb\xfe\x0f\x00\x00\x00\x00\x00"
+    b"dgrm\xd3\x34\x0c\x00\x00\x00\x00\x00"
+    b"dhrm\xfb\xfe\x0f\x00\x00\x00\x00\x00"
+    b"dirm\xfb\x7e\x0f\x00\x00\x00\x00\x00"
+    b"dmrm\xcb\x32\x0c\x00\x00\x00\x00\x00"
+    b"dmrn\xfb\xfe\x0f\x00\x00\x00\x00\x00"
+    b"dprm\xdb\xf6\x2f\x00\x00\x00\x00\x00"
+    b"dqrm\x23\x00\x0c\x00\x00\x00\x00\x00"
+    b"dsrn\xc3\xf0\x3f\x00\x00\x00\x00\x00"
+    b"durm\xeb\x1a\x0c\x00\x00\x00\x00\x00"
+    b"dvrm\xff\x3f\x0c\x00\x00\x00\x00\x00"
+    b"dwrm\xff\xff\x0f\x00\x00\x00\x00\x00"
+    b"dwrn\x01\xe0\x3f\x00\x00\x00\x00\x00"
+    b"dxrm\x01\x00\x0c\x00\x00\x00\x00\x00"
+    b"e2rm\x01\x00\x04\x00\x00\x00\x00\x00"
+    b"e3rm\x19\x26\x0c\x00\x00\x00\x00\x00"
+    b"e5rm\x23\x00\x0c\x00\x00\x00\x00\x00"
+    b"e9rm\xfb\xfe\x0f\x00\x00\x00\x00\x00"
+    b"ecrm\x07\x20\x0c\x00\x00\x00\x00\x00"
+    b"efrm\xfb\xfe\x2f\x00\x00\x00\x00\x00"
+    b"ejrm\x19\x26\x0c\x00\x00\x00\x00\x00"
+    b"ekrm\x01\x00\x0c\x00\x00\x00\x00\x00"
+    b"eprm\x1b\x20\x0c\x00\x00\x00\x00\x00"
+    b"errm\x19\x26\x0c\x00\x00\x00\x00\x00"
+    b"esrm\x7d\xff\x0f\x00\x00\x00\x00\x00"
+    b"eurm\xcb\xf2\x0c\x00\x00\x00\x00\x00"
+    b"evrn\x01\xe0\x2f\x00\x00\x00\x00\x00"
+    b"exrm\xc3\xf0\x3f\x00\x00\x00\x00\x00"
+    b"eyrm\xc3\x10\x0c\x00\x00\x00\x00\x00"
+    b"ezrm\x41\x30\x0c\x00\x00\x00\x00\x00"
+    b"f2rm\x01\x00\x04\x00\x00\x00\x00\x00"
+    b"f5rm\x03\x20\x0c\x00\x00\x00\x00\x00"
+    b"f8rm\xf7\x1d\x0c\x00\x00\x00\x00\x00"
+    b"fcrm\xeb\x3a\x0e\x00\x00\x00\x00\x00"
+    b"fdrm\x27\x20\x0c\x00\x00\x00\x00\x00"
+    b"firm\x59\xf6\x0f\x00\x00\x00\x00\x00"
+    b"flrm\x01\x00\x0c\x00\x00\x00\x00\x00"
+    b"fnrm\x03\x00\x0c\x00\x00\x00\x00\x00"
+    b"fprn\x7d\xff\x0f\x00\x00\x00\x00\x00"
+    b"frrm\x49\xf2\x0f\x00\x00\x00\x00\x00"
+    b"g4rm\x1b\x20\x0c\x00\x00\x00\x00\x00"
+    b"g5rn\xfb\xfe\x0f\x00\x00\x00\x00\x00"
+    b"g6rn\xeb\xfa\x1f\x00\x00\x00\x00\x00"
+    b"g7rn\xc3\xf0\x3f\x00\x00\x00\x00\x00"
+    b"garn\xeb\x3a\x2c\x00\x00\x00\x00\x00"
+    b"gcrm\xfb\xfe\x0f\x00\x00\x00\x00\x00"
+    b"gcrn\x00\x20\x00\x00\x00\x00\x00\x00"
+    b"germ\xfb\xfe\x0f\x00\x00\x00\x00\x00"
+    b"gfrm\xfb\xfe\x2f\x00\x00\x00\x00\x00"
+    b"gfrn\xe3\x38\x0c\x00\x00\x00\x00\x00"
+    b"ggrm\xcb\xf2\x3f\x00\x00\x00\x00\x00"
+    b"ghrm\x00\x00\x0c\x00\x00\x00\x00\x00"
+    b"gjrm\x00\x00\x0c\x00\x00\x00\x00\x00"
+    b"gnrm\x09\xe2\x0f\x00\x00\x00\x00\x00"
+    b"gnrn\xcb\x32\x0c\x00\x00\x00\x00\x00"
+    b"gorm\x09\xe2\x0f\x00\x00\x00\x00\x00"
+    b"gsrm\x00\x00\x0c\x00\x00\x00\x00\x00"
+    b"gurm\xff\x1f\x0c\x00\x00\x00\x00\x00"
+    b"gwrm\x41\x30\x0c\x00\x00\x00\x00\x00"
+    b"gxrm\x00\x00\x0c\x00\x00\x00\x00\x00"
+    b"gyrm\xeb\xfa\x0f\x00\x00\x00\x00\x00"
+    b"gzrn\x01\x20\x04\x00\x00\x00\x00\x00"
+    b"h2rm\xa3\xe8\x3f\x00\x00\x00\x00\x00"
+    b"h3rm\x65\x19\x3c\x00\x00\x00\x00\x00"
+    b"h7rm\xef\xfb\x2f\x00\x00\x00\x00\x00"
+    b"h8rm\xff\xff\x0f\x00\x00\x00\x00\x00"
+    b"hcrm\x09\x22\x0c\x00\x00\x00\x00\x00"
+    b"herm\xdb\x36\x0c\x00\x00\x00\x00\x00"
+    b"hkrm\x00\x00\x0c\x00\x00\x00\x00\x00"
+    b"hmrm\xfb\xfe\x0f\x00\x00\x00\x00\x00"
+    b"htrm\xff\xff\x0f\x00\x00\x00\x00\x00"
+    b"i0rm\xcb\xf2\x2c\x00\x00\x00\x00\x00"
+    b"i1rm\xfb\xfe\x0f\x00\x00\x00\x00\x00"
+    b"i2rm\xfb\xfe\x0f\x00\x00\x00\x00\x00"
+    b"i3rm\xff\x3f\x0c\x00\x00\x00\x00\x00"
+    b"i4rm\xcb\xf2\x2c\x00\x00\x00\x00\x00"
+    b"i5rm\xdb\xf6\x3c\x00\x00\x00\x00\x00"
+    b"i6rm\x19\x26\x20\x00\x00\x00\x00\x00"
+    b"i7rm\xcb\xf2\x0f\x00\x00\x00\x00\x00"
+    b"i8rm\x8b\xe2\x2f\x00\x00\x00\x00\x00"
+    b"i9rm\x8b\x22\x0c\x00\x00\x00\x00\x00"
+    b"iarm\x79\xfe\x0f\x00\x00\x00\x00\x00"
+    b"ibrm\xeb\xfa\x0f\x00\x00\x00\x00\x00"
+    b"icrm\xcb\xf2\x2f\x00\x00\x00\x00\x00"
+    b"ierm\xcb\xf2\x0f\x00\x00\x00\x00\x00"
+    b"ifrm\x8b\x22\x0c\x00\x00\x00\x00\x00"
+    b"igrm\xe7\xf9\x2f\x00\x00\x00\x00\x00"
+    b"ihrm\xcb\xf2\x0f\x00\x00\x00\x00\x00"
+    b"iirm\x09\xe2\x0e\x00\x00\x00\x00\x00"
+    b"ijrm\x01\x20\x04\x00\x00\x00\x00\x00"
+    b"ikrm\x09\x22\x04\x00\x00\x00\x00\x00"
+    b"ilrm\x19\x06\x06\x00\x00\x00\x00\x00"
+    b"imrm\x01\x20\x04\x00\x00\x00\x00\x00"
+    b"inrm\x09\x22\x0c\x00\x00\x00\x00\x00"
+    b"iorm\x69\xfa\x0e\x00\x00\x00\x00\x00"
+    b"iprm\x01\x00\x0c\x00\x00\x00\x00\x00"
+    b"irrm\xff\xff\x0f\x00\x00\x00\x00\x00"
+    b"isrm\x01\x20\x04\x00\x00\x00\x00\x00"
+    b"j2rn\x64\x19\x00\x00\x00\x00\x00\x00"
+    b"j4rm\xc3\x30\x0c\x00\x00\x00\x00\x00"
+    b"j5rn\xff\xff\x0f\x00\x00\x00\x00\x00"
+    b"j6rm\x00\x00\x0c\x00\x00\x00\x00\x00"
+    b"j7rm\x00\x00\x0c\x00\x00\x00\x00\x00"
+    b"j9rm\xe3\xf8\x3f\x00\x00\x00\x00\x00"
+    b"jcrn\xeb\x3a\x2c\x00\x00\x00\x00\x00"
+    b"jdrm\x00\x00\x0c\x00\x00\x00\x00\x00"
+    b"jdrn\xfb\xfe\x2f\x00\x00\x00\x00\x00"
+    b"jfrm\x00\x00\x0c\x00\x00\x00\x00\x00"
+    b"jgrm\x00\x00\x0c\x00\x00\x00\x00\x00"
+    b"jmrm\x00\x00\x0c\x00\x00\x00\x00\x00"
+    b"jprm\xfb\xfe\x2f\x00\x00\x00\x00\x00"
+    b"jqrm\x00\x00\x0c\x00\x00\x00\x00\x00"
+    b"jrrm\x00\x00\x0c\x00\x00\x00\x00\x00"
+    b"jwrm\x00\x00\x0c\x00\x00\x00\x00\x00"
+    b"karm\x00\x00\x0c\x00\x00\x00\x00\x00"
+    b"kbrn\xfb\xfe\x0f\x00\x00\x00\x00\x00"
+    b"kcrn\xff\xff\x0f\x00\x00\x00\x00\x00"
+    b"kerm\x69\xfa\x3f\x00\x00\x00\x00\x00"
+    b"kfrm\x7d\xff\x2f\x00\x00\x00\x00\x00"
+    b"kgrn\x7d\xff\x2f\x00\x00\x00\x00\x00"
+    b"klrn\x01\x00\x04\x00\x00\x00\x00\x00"
+    b"kmrm\xfb\xfe\x0f\x00\x00\x00\x00\x00"
+    b"knrm\xe7\x19\x0c\x00\x00\x00\x00\x00"
+    b"kqrm\x39\x2e\x2c\x00\x00\x00\x00\x00"
+    b"krrm\xc3\xf0\x3f\x00\x00\x00\x00\x00"
+    b"kurm\x00\x00\x0c\x00\x00\x00\x00\x00"
+    b"kwrn\x5d\x17\x0c\x00\x00\x00\x00\x00"
+    b"l2rn\xcb\xf2\x3f\x00\x00\x00\x00\x00"
+    b"l3rm\x00\x00\x0c\x00\x00\x00\x00\x00"
+    b"l9rn\xfb\xfe\x0f\x00\x00\x00\x00\x00"
+    b"lcrm\x00\x00\x0c\x00\x00\x00\x00\x00"
+    b"ldrm\x8b\xe2\x3f\x00\x00\x00\x00\x00"
+    b"lgrm\x8b\xe2\x3f\x00\x00\x00\x00\x00"
+    b"lqrm\x00\x00\x0c\x00\x00\x00\x00\x00"
+    b"lrrm\x00\x00\x0c\x00\x00\x00\x00\x00"
+    b"lsrm\x00\x00\x0c\x00\x00\x00\x00\x00"
+    b"lxrm\x41\x30\x0c\x00\x00\x00\x00\x00"
+    b"lyrm\x41\xf0\x3f\x00\x00\x00\x00\x00"
+    b"lzrm\x65\xf9\x3f\x00\x00\x00\x00\x00"
+    b"m3rm\x7d\xff\x2f\x00\x00\x00\x00\x00"
+    b"m4rm\x01\x20\x0c\x00\x00\x00\x00\x00"
+    b"m5rm\x7d\x3f\x2c\x00\x00\x00\x00\x00"
+    b"m6rm\xdb\xf6\x0f\x00\x00\x00\x00\x00"
+    b"m7rm\x09\xe2\x0f\x00\x00\x00\x00\x00"
+    b"marm\x01\xe0\x0f\x00\x00\x00\x00\x00"
+    b"mcrm\x00\x00\x0c\x00\x00\x00\x00\x00"
+    b"mdrm\x00\x00\x0c\x00\x00\x00\x00\x00"
+    b"merm\x00\x00\x0c\x00\x00\x00\x00\x00"
+    b"mfrm\x00\x00\x0c\x00\x00\x00\x00\x00"
+    b"mgrm\x00\x00\x0c\x00\x00\x00\x00\x00"
+    b"mlrm\xcb\xf2\x0e\x00\x00\x00\x00\x00"
+    b"mmrm\x7d\x3f\x0f\x00\x00\x00\x00\x00"
+    b"mrrm\x7d\xff\x2f\x00\x00\x00\x00\x00"
+    b"o0rm\xcb\xf2\x0e\x00\x00\x00\x00\x00"
+    b"o1rm\xfb\xfe\x2f\x00\x00\x00\x00\x00"
+    b"o2rm\x7d\x3f\x0f\x00\x00\x00\x00\x00"
+    b"o3rm\x7d\xff\x0f\x00\x00\x00\x00\x00"
+    b"o4rm\xfb\xfe\x0f\x00\x00\x00\x00\x00"
+    b"o5rm\x6d\x3b\x3f\x00\x00\x00\x00\x00"
+    b"o6rm\x6d\x3b\x0c\x00\x00\x00\x00\x00"
+    b"o7rm\xfb\xfe\x2f\x00\x00\x00\x00\x00"
+    b"o8rm\xdb\xf6\x2f\x00\x00\x00\x00\x00"
+    b"o9rm\x7d\xff\x0f\x00\x00\x00\x00\x00"
+    b"oarm\xfb\xfe\x0f\x00\x00\x00\x00\x00"
+    b"omrm\x6d\x3b\x0c\x00\x00\x00\x00\x00"
+    b"onrm\x2d\xeb\x0e\x00\x00\x00\x00\x00"
+    b"oorm\x09\x22\x0c\x00\x00\x00\x00\x00"
+    b"oprm\xfb\xfe\x0f\x00\x00\x00\x00\x00"
+    b"oqrm\xfb\xfe\x0f\x00\x00\x00\x00\x00"
+    b"orrm\x21\xe8\x3f\x00\x00\x00\x00\x00"
+    b"osrm\x7d\xff\x0f\x00\x00\x00\x00\x00"
+    b"otrm\xcb\xf2\x0e\x00\x00\x00\x00\x00"
+    b"ourm\x00\x20\x00\x00\x00\x00\x00\x00"
+    b"ovrm\x01\x00\x04\x00\x00\x00\x00\x00"
+    b"owrm\x01\x00\x0c\x00\x00\x00\x00\x00"
+    b"oxrm\x7d\xff\x0f\x00\x00\x00\x00\x00"
+    b"oyrm\xcb\xf2\x0e\x00\x00\x00\x00\x00"
+    b"ozrm\xff\xff\x0f\x00\x00\x00\x00\x00"
+    b"p0rm\x79\xfe\x0f\x00\x00\x00\x00\x00"
+    b"p1rm\xff\xff\x0f\x00\x00\x00\x00\x00"
+    b"p2rm\xdb\x36\x0c\x00\x00\x00\x00\x00"
+    b"p3rm\xe3\x38\x0c\x00\x00\x00\x00\x00"
+    b"p4rm\xfb\xfe\x0f\x00\x00\x00\x00\x00"
+    b"p5rm\xfb\xfe\x0f\x00\x00\x00\x00\x00"
+    b"p6rm\x8b\xc2\x3f\x00\x00\x00\x00\x00"
+    b"perm\x00\x00\x0c\x00\x00\x00\x00\x00"
+    b"qrrm\x00\x00\x0c\x00\x00\x00\x00\x00"
+    b"r2rm\x7d\xff\x0e\x00\x00\x00\x00\x00"
+    b"r5rm\x7d\xff\x0f\x00\x00\x00\x00\x00"
+    b"r6rm\x19\x26\x0c\x00\x00\x00\x00\x00"
+    b"s9rm\x03\x20\x0c\x00\x00\x00\x00\x00"
+    b"t3rm\xfb\x3e\x0c\x00\x00\x00\x00\x00"
+    b"t5rm\xfb\xfe\x0f\x00\x00\x00\x00\x00"
+    b"t7rm\xff\xff\x0f\x00\x00\x00\x00\x00"
+    b"t9rm\xcb\x72\x2f\x00\x00\x00\x00\x00"
+    b"tarm\x7d\xff\x0f\x00\x00\x00\x00\x00"
+    b"tbrm\xff\xff\x0d\x00\x00\x00\x00\x00"
+    b"tdrm\xcf\xf3\x0f\x00\x00\x00\x00\x00"
+    b"term\xfb\xfe\x3f\x00\x00\x00\x00\x00"
+    b"thrm\x2d\xeb\x0c\x00\x00\x00\x00\x00"
+    b"twrm\x05\x20\x0c\x00\x00\x00\x00\x00"
+    b"u0rm\x5d\x17\x0c\x00\x00\x00\x00\x00"
+    b"u1rm\x7d\x3f\x0f\x00\x00\x00\x00\x00"
+    b"u2rm\x7d\x3f\x2f\x00\x00\x00\x00\x00"
+    b"u3rm\xef\xfb\x0f\x00\x00\x00\x00\x00"
+    b"u4rm\xef\xfb\x0f\x00\x00\x00\x00\x00"
+    b"u5rm\xfb\xfe\x3f\x00\x00\x00\x00\x00"
+    b"u6rm\xcb\x32\x0c\x00\x00\x00\x00\x00"
+    b"u7rm\xcb\x32\x0c\x00\x00\x00\x00\x00"
+    b"u9rm\x41\xf0\x3c\x00\x00\x00\x00\x00"
+    b"uarm\xc3\xf0\x2e\x00\x00\x00\x00\x00"
+    b"ubrm\xc3\xf0\x2e\x00\x00\x00\x00\x00"
+    b"ucrm\xe7\x39\x0c\x00\x00\x00\x00\x00"
+    b"udrm\xc3\x10\x0c\x00\x00\x00\x00\x00"
+    b"uerm\x7d\xff\x2f\x00\x00\x00\x00\x00"
+    b"ufrm\x7d\xff\x0f\x00\x00\x00\x00\x00"
+    b"ugrm\xfb\xfe\x2f\x00\x00\x00\x00\x00"
+    b"uhrm\x19\xe6\x3f\x00\x00\x00\x00\x00"
+    b"uirm\xff\x1f\x0c\x00\x00\x00\x00\x00"
+    b"ujrm\xc3\xf0\x0e\x00\x00\x00\x00\x00"
+    b"ukrm\xdb\x36\x0f\x00\x00\x00\x00\x00"
+    b"ulrm\xdb\xf6\x0f\x00\x00\x00\x00\x00"
+    b"umrm\x7d\x3f\x0c\x00\x00\x00\x00\x00"
+    b"unrm\xfb\xfe\x2f\x00\x00\x00\x00\x00"
+    b"uorm\xfb\x3e\x0c\x00\x00\x00\x00\x00"
+    b"uprm\x65\x39\x0c\x00\x00\x00\x00\x00"
+    b"urrm\x8b\xe2\x3f\x00\x00\x00\x00\x00"
+    b"utrm\xdb\xf6\x0f\x00\x00\x00\x00\x00"
+    b"uurm\xcb\x32\x0c\x00\x00\x00\x00\x00"
+    b"uvrm\xfb\xfe\x0f\x00\x00\x00\x00\x00"
+    b"uwrm\xe3\x38\x0c\x00\x00\x00\x00\x00"
+    b"uxrm\xdf\x17\x0c\x00\x00\x00\x00\x00"
+    b"uyrm\xcb\xf2\x0f\x00\x00\x00\x00\x00"
+    b"uzrm\x7d\x1f\x0f\x00\x00\x00\x00\x00"
+    b"v0rm\x65\xf9\x3f\x00\x00\x00\x00\x00"
+    b"v1rm\xcb\x32\x0c\x00\x00\x00\x00\x00"
+    b"v2rm\x65\xf9\x3f\x00\x00\x00\x00\x00"
+    b"v4rm\xfb\xfe\x0f\x00\x00\x00\x00\x00"
+    b"v5rm\x01\x20\x0c\x00\x00\x00\x00\x00"
+    b"v6rm\xc3\xf0\x0c\x00\x00\x00\x00\x00"
+    b"v7rm\xdb\xf6\x2c\x00\x00\x00\x00\x00"
+    b"v8rm\x7d\xff\x2f\x00\x00\x00\x00\x00"
+    b"varm\xc3\x30\x0c\x00\x00\x00\x00\x00"
+    b"vbrm\xff\xff\x0f\x00\x00\x00\x00\x00"
+    b"vcrm\x7d\xff\x2f\x00\x00\x00\x00\x00"
+    b"vdrm\x79\xfe\x2f\x00\x00\x00\x00\x00"
+    b"verm\xfb\xfe\x3f\x00\x00\x00\x00\x00"
+    b"vfrm\x69\xfa\x3f\x00\x00\x00\x00\x00"
+    b"vgrm\xc3\x30\x0c\x00\x00\x00\x00\x00"
+    b"vhrm\xeb\x1a\x0c\x00\x00\x00\x00\x00"
+    b"virm\xcb\xf2\x3f\x00\x00\x00\x00\x00"
+    b"vjrm\x09\x22\x0c\x00\x00\x00\x00\x00"
+    b"vkrm\xfb\xfe\x0f\x00\x00\x00\x00\x00"
+    b"vlrm\xdb\xf6\x2f\x00\x00\x00\x00\x00"
+    b"vmrm\xfb\x3e\x2c\x00\x00\x00\x00\x00"
+    b"vnrm\xdb\xf6\x2f\x00\x00\x00\x00\x00"
+    b"vorm\xfb\xfe\x3f\x00\x00\x00\x00\x00"
+    b"vprm\x19\xe6\x3f\x00\x00\x00\x00\x00"
+    b"vqrm\x49\xd2\x0c\x00\x00\x00\x00\x00"
+    b"vrrm\x09\xe2\x3f\x00\x00\x00\x00\x00"
+    b"vsrm\xeb\xfa\x2f\x00\x00\x00\x00\x00"
+    b"vtrm\x61\xf8\x3f\x00\x00\x00\x00\x00"
+    b"vurm\x61\xf8\x3f\x00\x00\x00\x00\x00"
+    b"vvrm\xef\xfb\x2f\x00\x00\x00\x00\x00"
+    b"vwrm\xff\xff\x0f\x00\x00\x00\x00\x00"
+    b"vxrm\x19\xe6\x0f\x00\x00\x00\x00\x00"
+    b"vyrm\x6d\xfb\x0f\x00\x00\x00\x00\x00"
+    b"vzrm\x21\xe8\x3f\x00\x00\x00\x00\x00"
+    b"w0rm\x6d\xfb\x0f\x00\x00\x00\x00\x00"
+    b"w1rm\x09\x22\x0c\x00\x00\x00\x00\x00"
+    b"w2rm\x7d\xff\x0f\x00\x00\x00\x00\x00"
+    b"w3rm\x7d\xff\x2f\x00\x00\x00\x00\x00"
+    b"w4rm\x09\x22\x0c\x00\x00\x00\x00\x00"
+    b"w5rm\x59\xf6\x0d\x00\x00\x00\x00\x00"
+    b"w6rm\x7d\xff\x0f\x00\x00\x00\x00\x00"
+    b"w7rm\x19\xe6\x0f\x00\x00\x00\x00\x00"
+    b"w9rm\x09\xe2\x2f\x00\x00\x00\x00\x00"
+    b"warm\x6d\xfb\x2f\x00\x00\x00\x00\x00"
+    b"wbrm\x65\xf9\x3f\x00\x00\x00\x00\x00"
+    b"wcrm\x65\xf9\x3f\x00\x00\x00\x00\x00"
+    b"wdrm\xdf\x37\x2f\x00\x00\x00\x00\x00"
+    b"werm\xdf\x37\x0f\x00\x00\x00\x00\x00"
+    b"wgrm\x01\x00\x0c\x00\x00\x00\x00\x00"
+    b"whrm\x09\xe2\x3f\x00\x00\x00\x00\x00"
+    b"wirm\xfb\xfe\x2f\x00\x00\x00\x00\x00"
+    b"wjrm\xeb\xfa\x2f\x00\x00\x00\x00\x00"
+    b"wkrm\xdb\xf6\x0f\x00\x00\x00\x00\x00"
+    b"wlrm\xf7\x1d\x0c\x00\x00\x00\x00\x00"
+    b"wmrm\x01\x00\x04\x00\x00\x00\x00\x00"
+    b"wnrm\xfb\xfe\x2f\x00\x00\x00\x00\x00"
+    b"worm\x41\x30\x0c\x00\x00\x00\x00\x00"
+    b"wprm\x39\x0e\x0c\x00\x00\x00\x00\x00"
+    b"wqrm\x4d\x13\x04\x00\x00\x00\x00\x00"
+    b"wrrm\x09\x22\x0c\x00\x00\x00\x00\x00"
+    b"wsrm\x65\xf9\x2f\x00\x00\x00\x00\x00"
+    b"wtrm\x6d\x1b\x3c\x00\x00\x00\x00\x00"
+    b"wurm\xfb\xfe\x0f\x00\x00\x00\x00\x00"
+    b"wvrm\xeb\x3a\x0c\x00\x00\x00\x00\x00"
+    b"wwrm\xeb\x3a\x0c\x00\x00\x00\x00\x00"
+    b"wxrm\xfb\xfe\x2f\x00\x00\x00\x00\x00"
+    b"wyrm\xeb\x3a\x0c\x00\x00\x00\x00\x00"
+    b"wzrm\x01\x20\x0c\x00\x00\x00\x00\x00"
+    b"x0rm\x7d\xff\x2f\x00\x00\x00\x00\x00"
+    b"x1rm\xc3\x10\x0c\x00\x00\x00\x00\x00"
+    b"x2rm\x41\x10\x0c\x00\x00\x00\x00\x00"
+    b"x4rm\xc3\x10\x2c\x00\x00\x00\x00\x00"
+    b"x5rm\xe7\x19\x0c\x00\x00\x00\x00\x00"
+    b"x6rm\x61\x18\x0c\x00\x00\x00\x00\x00"
+    b"x7rm\xff\xdf\x0f\x00\x00\x00\x00\x00"
+    b"x8rm\x59\x36\x0c\x00\x00\x00\x00\x00"
+    b"x9rm\xff\xff\x3f\x00\x00\x00\x00\x00"
+    b"xarm\x19\x26\x0c\x00\x00\x00\x00\x00"
+    b"xdrm\x19\x26\x04\x00\x00\x00\x00\x00"
+    b"xerm\xef\xfb\x0f\x00\x00\x00\x00\x00"
+    b"xhrm\xff\xdf\x0f\x00\x00\x00\x00\x00"
+    b"xirm\xef\xfb\x0f\x00\x00\x00\x00\x00"
+    b"xjrm\x7d\xff\x0f\x00\x00\x00\x00\x00"
+    b"xkrm\xfb\xfe\x0f\x00\x00\x00\x00\x00"
+    b"xmrm\xfb\xfe\x3f\x00\x00\x00\x00\x00"
+    b"xnrm\x09\x22\x00\x00\x00\x00\x00\x00"
+    b"xorm\x01\x00\x2c\x00\x00\x00\x00\x00"
+    b"xprm\x9b\xe6\x3f\x00\x00\x00\x00\x00"
+    b"xurm\xff\x3f\x0c\x00\x00\x00\x00\x00"
+    b"xvrm\xff\xdf\x2f\x00\x00\x00\x00\x00"
+    b"xwrm\x01\xe0\x3f\x00\x00\x00\x00\x00"
+    b"xyrm\xfb\xfe\x2f\x00\x00\x00\x00\x00"
+    b"xzrm\x7d\xff\x2f\x00\x00\x00\x00\x00"
+    b"y0rm\x09\x22\x0c\x00\x00\x00\x00\x00"
+    b"y3rm\x61\xf8\x2e\x00\x00\x00\x00\x00"
+    b"y4rm\xe7\x19\x0c\x00\x00\x00\x00\x00"
+    b"y5rm\x19\x06\x0c\x00\x00\x00\x00\x00"
+    b"y6rm\x03\x20\x1c\x00\x00\x00\x00\x00"
+    b"y8rm\xff\xff\x0f\x00\x00\x00\x00\x00"
+    b"ybrm\x19\x06\x0c\x00\x00\x00\x00\x00"
+    b"ycrm\x41\x10\x0c\x00\x00\x00\x00\x00"
+    b"ydrm\xc3\x30\x0c\x00\x00\x00\x00\x00"
+    b"yerm\xff\xff\x0f\x00\x00\x00\x00\x00"
+    b"yfrm\x19\x26\x0c\x00\x00\x00\x00\x00"
+    b"ygrm\xfb\xfe\x0f\x00\x00\x00\x00\x00"
+    b"yhrm\xfb\xfe\x0f\x00\x00\x00\x00\x00"
+    b"yirm\xef\xfb\x3f\x00\x00\x00\x00\x00"
+    b"yjrm\xeb\xfa\x0f\x00\x00\x00\x00\x00"
+    b"ykrm\x49\x12\x0c\x00\x00\x00\x00\x00"
+    b"ymrm\x7d\xff\x2f\x00\x00\x00\x00\x00"
+    b"ynrm\x49\x32\x0c\x00\x00\x00\x00\x00"
+    b"yorm\xef\xfb\x3f\x00\x00\x00\x00\x00"
+    b"yprm\xff\xff\x3f\x00\x00\x00\x00\x00"
+    b"ysrm\x19\x06\x3c\x00\x00\x00\x00\x00"
+    b"ytrm\x19\x26\x3c\x00\x00\x00\x00\x00"
+    b"yurm\x19\x26\x2c\x00\x00\x00\x00\x00"
+    b"yvrm\x19\x06\x2c\x00\x00\x00\x00\x00"
+    b"ywrm\x7d\x3f\x0f\x00\x00\x00\x00\x00"
+    b"yyrm\xfb\xfe\x0f\x00\x00\x00\x00\x00"
+    b"yzrm\xcf\xf3\x0f\x00\x00\x00\x00\x00"
+    b"z0rm\x01\x20\x0c\x00\x00\x00\x00\x00"
+    b"z1rm\x01\x20\x0c\x00\x00\x00\x00\x00"
+    b"z2rm\xff\xdf\x0f\x00\x00\x00\x00\x00"
+    b"z4rm\xfb\xfe\x0f\x00\x00\x00\x00\x00"
+    b"z5rm\x7d\xff\x0f\x00\x00\x00\x00\x00"
+    b"z6rm\xfb\xfe\x2f\x00\x00\x00\x00\x00"
+    b"z7rm\x01\x20\x0c\x00\x00\x00\x00\x00"
+    b"z8rm\xff\xff\x0f\x00\x00\x00\x00\x00"
+    b"z9rm\xeb\x3a\x2c\x00\x00\x00\x00\x00"
+    b"zarm\xef\xfb\x2f\x00\x00\x00\x00\x00"
+    b"zbrm\x79\x3e\x0c\x00\x00\x00\x00\x00"
+    b"zcrm\x01\x20\x0c\x00\x00\x00\x00\x00"
+    b"zdrm\xfb\x1e\x0c\x00\x00\x00\x00\x00"
+    b"zerm\x7d\xff\x0f\x00\x00\x00\x00\x00"
+    b"zfrm\xfb\xfe\x2f\x00\x00\x00\x00\x00"
+    b"zgrm\xfb\xfe\x2f\x00\x00\x00\x00\x00"
+    b"zhrm\x83\xe0\x0d\x00\x00\x00\x00\x00"
+    b"zirm\x83\xe0\x2d\x00\x00\x00\x00\x00"
+    b"zjrm\xcb\x32\x0c\x00\x00\x00\x00\x00"
+    b"zkrm\xcb\xf2\x2d\x00\x00\x00\x00\x00"
+    b"zlrm\x41\xf0\x3d\x00\x00\x00\x00\x00"
+    b"zprm\x09\x22\x0c\x00\x00\x00\x00\x00"
+    b"zr00\x01\x20\x0c\x00\x00\x00\x00\x00"
+    b"zr01\x01\x20\x04\x00\x00\x00\x00\x00"
+    b"zr10\x69\x3a\x0c\x00\x00\x00\x00\x00"
+    b"zr11\x65\x39\x2c\x00\x00\x00\x00\x00"
+    b"zr12\x7d\x3f\x0c\x00\x00\x00\x00\x00"
+    b"zr21\x41\x30\x0c\x00\x00\x00\x00\x00"
+    b"zr40\xc3\x10\x0c\x00\x00\x00\x00\x00"
+    b"zr50\xff\xff\x3f\x00\x00\x00\x00\x00"
+    b"zr51\xff\xff\x2f\x00\x00\x00\x00\x00"
+    b"zr60\x49\x32\x0c\x00\x00\x00\x00\x00"
+    b"zr70\x01\x00\x0c\x00\x00\x00\x00\x00"
+    b"zr80\x19\x06\x0c\x00\x00\x00\x00\x00"
+    b"zra0\xe7\x39\x3c\x00\x00\x00\x00\x00"
+    b"zra1\x01\x00\x0c\x00\x00\x00\x00\x00"
+    b"zra2\xdb\x16\x0c\x00\x00\x00\x00\x00"
+    b"zri0\xcb\xf2\x2d\x00\x00\x00\x00\x00"
+    b"zsrm\xef\xfb\x2f\x00\x00\x00\x00\x00"
+    b"ztrm\xe3\xf8\x3f\x00\x00\x00\x00\x00"
+    b"zurm\xef\xfb\x0f\x00\x00\x00\x00\x00"
+    b"zzrm\x01\x00\x0c\x00\x00\x00\x00\x00"
+)
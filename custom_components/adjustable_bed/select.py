@@ -10,6 +10,8 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .beds.capabilities import Capability
+from .command_queue import CommandPriority
 from .const import (
     CONF_HAS_MASSAGE,
     DOMAIN,
@@ -45,13 +47,14 @@ async def async_setup_entry(
     coordinator: AdjustableBedCoordinator = hass.data[DOMAIN][entry.entry_id]
     has_massage = entry.data.get(CONF_HAS_MASSAGE, False)
     controller = coordinator.controller
+    capabilities = controller.capabilities if controller is not None else None
 
     entities: list[SelectEntity] = []
 
     # Set up massage timer select (only for beds with massage and timer support)
-    if has_massage and controller is not None:
-        if getattr(controller, "supports_massage_timer", False):
-            timer_options = getattr(controller, "massage_timer_options", [])
+    if has_massage and capabilities is not None:
+        if capabilities.has(Capability.MASSAGE_TIMER):
+            timer_options = list(capabilities.massage_timer_options)
             if timer_options:
                 _LOGGER.debug(
                     "Setting up massage timer select for %s (options: %s)",
@@ -65,8 +68,8 @@ async def async_setup_entry(
                 )
 
     # Set up light timer select (only for beds that support it)
-    if controller is not None and getattr(controller, "supports_light_timer", False):
-        light_timer_options = getattr(controller, "light_timer_options", [])
+    if capabilities is not None and capabilities.has(Capability.LIGHT_TIMER):
+        light_timer_options = list(capabilities.light_timer_options)
         if light_timer_options:
             _LOGGER.debug(
                 "Setting up light timer select for %s (options: %s)",
@@ -151,7 +154,9 @@ class AdjustableBedMassageTimerSelect(AdjustableBedEntity, SelectEntity):
         async def _set_timer(ctrl: BedController) -> None:
             await ctrl.set_massage_timer(minutes)
 
-        await self._coordinator.async_execute_controller_command(_set_timer)
+        await self._coordinator.async_execute_controller_command(
+            _set_timer, priority=CommandPriority.ACCESSORY
+        )
 
 
 class AdjustableBedLightTimerSelect(AdjustableBedEntity, SelectEntity):
@@ -203,4 +208,6 @@ class AdjustableBedLightTimerSelect(AdjustableBedEntity, SelectEntity):
         async def _set_timer(ctrl: BedController) -> None:
             await ctrl.set_light_timer(option)
 
-        await self._coordinator.async_execute_controller_command(_set_timer)
+        await self._coordinator.async_execute_controller_command(
+            _set_timer, priority=CommandPriority.ACCESSORY
+        )
@@ -7,15 +7,24 @@ from collections.abc import Callable
 from dataclasses import dataclass
 
 from homeassistant.components.sensor import (
+    SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import EntityCategory
+from homeassistant.const import EntityCategory, UnitOfTime
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .connection_timing import (
+    CONNECT_PHASE_DISCOVERY,
+    CONNECT_PHASE_ESTABLISH,
+    CONNECT_PHASE_LOOKUP,
+    CONNECT_PHASE_NOTIFY,
+    CONNECT_PHASE_POSITION_READ,
+    CONNECT_PHASE_SETUP,
+)
 from .const import (
     BED_TYPE_ERGOMOTION,
     BED_TYPE_KEESON,
@@ -123,6 +132,45 @@ MASSAGE_SENSOR_DESCRIPTIONS: tuple[AdjustableBedMassageSensorEntityDescription,
 )
 
 
+@dataclass(frozen=True, kw_only=True)
+class AdjustableBedConnectionPhaseSensorEntityDescription(SensorEntityDescription):
+    """Describes a connection phase timing sensor entity."""
+
+    phase: str  # Phase name in the coordinator's connection timings
+
+
+def _connection_phase_description(
+    phase: str,
+) -> AdjustableBedConnectionPhaseSensorEntityDescription:
+    return AdjustableBedConnectionPhaseSensorEntityDescription(
+        key=f"connect_{phase}_time",
+        translation_key=f"connect_{phase}_time",
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        phase=phase,
+    )
+
+
+# Phases of the last successful connection, for tracking regressions over time
+CONNECTION_PHASE_SENSOR_DESCRIPTIONS: tuple[
+    AdjustableBedConnectionPhaseSensorEntityDescription, ...
+] = tuple(
+    _connection_phase_description(phase)
+    for phase in (
+        CONNECT_PHASE_LOOKUP,
+        CONNECT_PHASE_ESTABLISH,
+        CONNECT_PHASE_DISCOVERY,
+        CONNECT_PHASE_SETUP,
+        CONNECT_PHASE_NOTIFY,
+        CONNECT_PHASE_POSITION_READ,
+    )
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -168,6 +216,12 @@ async def async_setup_entry(
             for massage_desc in MASSAGE_SENSOR_DESCRIPTIONS:
                 entities.append(AdjustableBedMassageSensor(coordinator, massage_desc))
 
+    # Connection phase timings (disabled by default)
+    entities.extend(
+        AdjustableBedConnectionPhaseSensor(coordinator, phase_desc)
+        for phase_desc in CONNECTION_PHASE_SENSOR_DESCRIPTIONS
+    )
+
     if entities:
         async_add_entities(entities)
 
@@ -191,8 +245,8 @@ class AdjustableBedAngleSensor(AdjustableBedEntity, SensorEntity):
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to hass."""
         await super().async_added_to_hass()
-        self._unregister_callback = self._coordinator.register_position_callback(
-            self._handle_position_update
+        self._unregister_callback = self._coordinator.subscribe_position(
+            self.entity_description.position_key, self.async_write_ha_state
         )
 
     async def async_will_remove_from_hass(self) -> None:
@@ -201,17 +255,6 @@ class AdjustableBedAngleSensor(AdjustableBedEntity, SensorEntity):
             self._unregister_callback()
         await super().async_will_remove_from_hass()
 
-    @callback
-    def _handle_position_update(self, position_data: dict[str, float]) -> None:
-        """Handle position data update.
-
-        The position_data parameter is provided by the callback interface but not
-        used here since we read from the coordinator's position_data in native_value.
-        """
-        # position_data is intentionally unused - we read from coordinator in native_value
-        del position_data  # Mark as intentionally unused
-        self.async_write_ha_state()
-
     @property
     def native_value(self) -> float | None:
         """Return the sensor value."""
@@ -241,10 +284,11 @@ class AdjustableBedMassageSensor(AdjustableBedEntity, SensorEntity):
         # (parsed by _parse_position_message in Keeson/Ergomotion controllers) also
         # contain massage state data. When the controller receives a notification,
         # it parses both position and massage state, then triggers all registered
-        # position callbacks. Our _handle_state_update receives these updates and
-        # refreshes the entity state, which reads massage data via get_massage_state().
-        self._unregister_callback = self._coordinator.register_position_callback(
-            self._handle_state_update
+        # position callbacks. Subscribing to all keys (massage state can change
+        # without a position change) refreshes the entity state, which reads
+        # massage data via get_massage_state().
+        self._unregister_callback = self._coordinator.subscribe_position(
+            None, self.async_write_ha_state
         )
 
     async def async_will_remove_from_hass(self) -> None:
@@ -253,11 +297,6 @@ class AdjustableBedMassageSensor(AdjustableBedEntity, SensorEntity):
             self._unregister_callback()
         await super().async_will_remove_from_hass()
 
-    @callback
-    def _handle_state_update(self, _position_data: dict[str, float]) -> None:
-        """Handle state update from BLE notifications."""
-        self.async_write_ha_state()
-
     @property
     def native_value(self) -> str | int | None:
         """Return the massage state value from controller."""
@@ -284,3 +323,49 @@ class AdjustableBedMassageSensor(AdjustableBedEntity, SensorEntity):
         except (ValueError, TypeError):
             _LOGGER.debug("Non-numeric massage state value: %s", value)
             return None
+
+
+class AdjustableBedConnectionPhaseSensor(AdjustableBedEntity, SensorEntity):
+    """Sensor entity for one phase of the last successful connection."""
+
+    entity_description: AdjustableBedConnectionPhaseSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: AdjustableBedCoordinator,
+        description: AdjustableBedConnectionPhaseSensorEntityDescription,
+    ) -> None:
+        """Initialize the connection phase sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = f"{coordinator.address}_{description.key}"
+        self._unregister_callbacks: list[Callable[[], None]] = []
+
+    async def async_added_to_hass(self) -> None:
+        """Run when entity is added to hass."""
+        await super().async_added_to_hass()
+        # Connection phases are final once connected; the initial position read
+        # finishes later and is followed by position callbacks
+        self._unregister_callbacks = [
+            self._coordinator.register_connection_state_callback(
+                self._handle_connection_state_change
+            ),
+            self._coordinator.subscribe_position(None, self.async_write_ha_state),
+        ]
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Run when entity is removed from hass."""
+        for unregister in self._unregister_callbacks:
+            unregister()
+        self._unregister_callbacks = []
+        await super().async_will_remove_from_hass()
+
+    @callback
+    def _handle_connection_state_change(self, _connected: bool) -> None:
+        """Handle connection state change."""
+        self.async_write_ha_state()
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the phase duration in milliseconds."""
+        return self._coordinator.connection_phase_ms(self.entity_description.phase)
@@ -0,0 +1,104 @@
+"""Post-connect setup pipeline for Adjustable Bed.
+
+After the GATT connection is up, a bed needs a few setup operations before
+the first command: notification subscriptions, protocol handshakes (Octo
+feature discovery and PIN, Jensen config query) and the Device Information
+reads. These used to run one after another even where nothing orders them,
+so every connect paid for the sum of their round-trips.
+
+Setup is now declared as SetupSteps. The coordinator contributes its own
+steps (notification setup, device information) and the controller adds its
+protocol steps through BedController.post_connect_steps(), naming the steps
+it must wait for. async_run_setup_steps() starts each step as soon as its
+dependencies are done, with at most SETUP_MAX_CONCURRENCY GATT operations
+in flight, since adapters and proxies queue (or reject) more than a few.
+
+A failing step cancels the rest and its exception is raised unchanged, so
+connection error handling sees the same errors as with sequential setup.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from typing import Any, Final
+
+# Setup operations in flight at once
+SETUP_MAX_CONCURRENCY: Final = 3
+
+# Step names provided by the coordinator that controllers can depend on
+SETUP_STEP_NOTIFY: Final = "notify"
+SETUP_STEP_DEVICE_INFO: Final = "device_info"
+
+
+@dataclass(frozen=True, slots=True)
+class SetupStep:
+    """One post-connect setup operation."""
+
+    name: str
+    run: Callable[[], Awaitable[Any]]
+    # Steps that must finish before this one starts
+    after: tuple[str, ...] = ()
+
+
+def _check_steps(steps: Sequence[SetupStep]) -> None:
+    """Raise ValueError for duplicate names, unknown dependencies or cycles."""
+    names = [step.name for step in steps]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Duplicate setup step names: {names}")
+    remaining = {step.name: set(step.after) for step in steps}
+    for step in steps:
+        unknown = remaining[step.name] - remaining.keys()
+        if unknown:
+            raise ValueError(f"Setup step {step.name} depends on unknown steps {sorted(unknown)}")
+    while remaining:
+        ready = [name for name, deps in remaining.items() if not deps]
+        if not ready:
+            raise ValueError(f"Setup steps have a dependency cycle: {sorted(remaining)}")
+        for name in ready:
+            del remaining[name]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+
+
+async def async_run_setup_steps(
+    steps: Sequence[SetupStep],
+    concurrency: int = SETUP_MAX_CONCURRENCY,
+    on_step_done: Callable[[SetupStep, float], None] | None = None,
+) -> None:
+    """Run setup steps as their dependencies allow.
+
+    Args:
+        steps: The steps to run.
+        concurrency: Maximum number of steps running at once.
+        on_step_done: Called with each finished step and its duration in seconds.
+
+    Raises:
+        ValueError: If the steps don't form a valid dependency graph.
+        Exception: The first exception raised by a step; the others are cancelled.
+    """
+    _check_steps(steps)
+    finished = {step.name: asyncio.Event() for step in steps}
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def _run(step: SetupStep) -> None:
+        for dependency in step.after:
+            await finished[dependency].wait()
+        async with semaphore:
+            start = time.monotonic()
+            await step.run()
+            elapsed = time.monotonic() - start
+        if on_step_done is not None:
+            on_step_done(step, elapsed)
+        finished[step.name].set()
+
+    tasks = [asyncio.create_task(_run(step), name=f"setup_{step.name}") for step in steps]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
@@ -53,7 +53,7 @@ async def generate_support_report(
     integration_version = str(integration.version) if integration.version is not None else "unknown"
 
     report: dict[str, Any] = {
-        "report_version": "1.1",
+        "report_version": "1.2",
         "generated_at": timestamp.isoformat(),
         "system": _get_system_info(hass, integration_version),
         "integration": _get_integration_info(entry),
@@ -61,6 +61,10 @@ async def generate_support_report(
         "connection_history": coordinator.connection_history,
         "adapter": coordinator.adapter_details,
         "command_timing": coordinator.command_timing,
+        "latency": coordinator.latency_stats,
+        "command_queue": coordinator.command_queue_stats,
+        "position_updates": coordinator.position_update_stats,
+        "gatt_cache": coordinator.gatt_cache_stats,
         "bluetooth": await _get_bluetooth_info(hass, coordinator),
         "gatt_summary": get_gatt_summary(coordinator),
         "controller": _get_controller_info(coordinator),
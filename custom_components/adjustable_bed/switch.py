@@ -13,6 +13,8 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .beds.capabilities import Capability
+from .command_queue import CommandPriority
 from .const import DOMAIN
 from .coordinator import AdjustableBedCoordinator
 from .entity import AdjustableBedEntity
@@ -53,15 +55,15 @@ async def async_setup_entry(
     """Set up Adjustable Bed switch entities."""
     coordinator: AdjustableBedCoordinator = hass.data[DOMAIN][entry.entry_id]
     controller = coordinator.controller
+    capabilities = controller.capabilities if controller is not None else None
 
     entities = []
     for description in SWITCH_DESCRIPTIONS:
         # Skip switches that require capabilities the controller doesn't have
         if description.required_capability is not None:
-            if controller is None:
+            if capabilities is None:
                 continue
-            # Default to False: only create entity if controller explicitly supports it
-            if not getattr(controller, description.required_capability, False):
+            if not capabilities.supports(description.required_capability):
                 continue
         entities.append(AdjustableBedSwitch(coordinator, description))
 
@@ -87,7 +89,7 @@ class AdjustableBedSwitch(AdjustableBedEntity, SwitchEntity):
         # Default to False for toggle-only beds when controller disconnects
         controller = coordinator.controller
         self._supports_discrete_light_control = (
-            getattr(controller, "supports_discrete_light_control", False)
+            controller.capabilities.has(Capability.DISCRETE_LIGHT_CONTROL)
             if controller is not None
             else False
         )
@@ -116,7 +118,7 @@ class AdjustableBedSwitch(AdjustableBedEntity, SwitchEntity):
         if controller is None:
             return
 
-        auto_off_seconds = getattr(controller, "light_auto_off_seconds", None)
+        auto_off_seconds = controller.capabilities.light_auto_off_seconds
         if auto_off_seconds is None:
             return
 
@@ -162,6 +164,7 @@ class AdjustableBedSwitch(AdjustableBedEntity, SwitchEntity):
             await self._coordinator.async_execute_controller_command(
                 self.entity_description.turn_on_fn,
                 cancel_running=False,
+                priority=CommandPriority.ACCESSORY,
             )
             # Only update assumed state if controller supports discrete on/off
             # Toggle-only controllers can't reliably track state
@@ -204,6 +207,7 @@ class AdjustableBedSwitch(AdjustableBedEntity, SwitchEntity):
             await self._coordinator.async_execute_controller_command(
                 self.entity_description.turn_off_fn,
                 cancel_running=False,
+                priority=CommandPriority.ACCESSORY,
             )
             # Only update assumed state if controller supports discrete on/off
             # Toggle-only controllers can't reliably track state
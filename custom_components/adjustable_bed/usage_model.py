@@ -0,0 +1,223 @@
+"""Learned bed usage pattern for adaptive connection management.
+
+A fixed idle disconnect timeout is a compromise: too short and the next
+command after a pause pays a full reconnect (5-20 s through a proxy), too
+long and the bed holds one of the proxy's few connection slots while nobody
+is using it.
+
+UsageModel learns two things from command arrivals:
+- how commands are spaced within a session (recent gaps shorter than
+  USAGE_SESSION_GAP), which sets how long the link is worth keeping up;
+- when in the day the bed is used, as half-hour bins with a daily decay,
+  which marks likely-use windows.
+
+Inside a likely-use window the idle timeout is stretched to cover the usual
+gap between commands and the coordinator reconnects shortly before the next
+window starts. Outside of one the timeout is shortened to free the slot.
+
+The model is stored per config entry in Home Assistant storage.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import deque
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Final
+
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+USAGE_MODEL_STORAGE_VERSION: Final = 1
+USAGE_MODEL_SAVE_DELAY: Final = 60  # Seconds to batch writes
+
+USAGE_BIN_MINUTES: Final = 30
+USAGE_BINS: Final = 24 * 60 // USAGE_BIN_MINUTES
+# Weight a day's usage keeps after each following day
+USAGE_DAILY_DECAY: Final = 0.9
+# Commands seen before the model adapts anything
+USAGE_MIN_COMMANDS: Final = 20
+# A bin is a likely-use window when its weight is this many times the mean
+USAGE_HOT_FACTOR: Final = 2.0
+# Gaps longer than this start a new session and aren't used for the timeout
+USAGE_SESSION_GAP: Final = 300.0
+# Recent in-session gaps kept for the timeout percentile
+USAGE_GAP_WINDOW: Final = 50
+# Share of in-session gaps the idle timeout should cover
+USAGE_GAP_PERCENTILE: Final = 0.8
+# Margin added on top of the covered gap
+USAGE_GAP_MARGIN: Final = 1.25
+
+ADAPTIVE_IDLE_MIN_SECONDS: Final = 10
+ADAPTIVE_IDLE_MAX_SECONDS: Final = 300
+# Reconnect this long before a predicted likely-use window
+USAGE_PREWARM_LEAD: Final = timedelta(seconds=60)
+
+
+def _bin_index(when: datetime) -> int:
+    return (when.hour * 60 + when.minute) // USAGE_BIN_MINUTES
+
+
+class UsageModel:
+    """Time-of-day usage bins and in-session command gaps for one bed."""
+
+    __slots__ = ("_bins", "_day", "_gaps", "_last_command", "_commands")
+
+    def __init__(self) -> None:
+        """Initialize an empty model."""
+        self._bins = [0.0] * USAGE_BINS
+        self._day: int | None = None
+        self._gaps: deque[float] = deque(maxlen=USAGE_GAP_WINDOW)
+        self._last_command: float | None = None
+        self._commands = 0
+
+    @property
+    def trained(self) -> bool:
+        """Return True once enough commands were seen to adapt."""
+        return self._commands >= USAGE_MIN_COMMANDS
+
+    def observe(self, when: datetime) -> None:
+        """Record a user command at a local time."""
+        day = when.toordinal()
+        if self._day is not None and day > self._day:
+            decay = USAGE_DAILY_DECAY ** (day - self._day)
+            self._bins = [weight * decay for weight in self._bins]
+        if self._day is None or day > self._day:
+            self._day = day
+        self._bins[_bin_index(when)] += 1.0
+
+        timestamp = when.timestamp()
+        if self._last_command is not None:
+            gap = timestamp - self._last_command
+            if 0 < gap <= USAGE_SESSION_GAP:
+                self._gaps.append(gap)
+        self._last_command = timestamp
+        self._commands += 1
+
+    def _is_hot(self, index: int) -> bool:
+        mean = sum(self._bins) / USAGE_BINS
+        return mean > 0 and self._bins[index % USAGE_BINS] >= mean * USAGE_HOT_FACTOR
+
+    def is_likely_use(self, when: datetime) -> bool:
+        """Return True if the time falls in (or next to) a likely-use window."""
+        if not self.trained:
+            return False
+        index = _bin_index(when)
+        return any(self._is_hot(index + offset) for offset in (-1, 0, 1))
+
+    def session_gap(self) -> float | None:
+        """Return the in-session gap the idle timeout should cover."""
+        if not self._gaps:
+            return None
+        gaps = sorted(self._gaps)
+        return gaps[min(int(len(gaps) * USAGE_GAP_PERCENTILE), len(gaps) - 1)]
+
+    def idle_timeout(self, when: datetime, base: int) -> int:
+        """Return the idle disconnect timeout to use at a local time.
+
+        Args:
+            when: Current local time.
+            base: Configured idle disconnect timeout in seconds.
+        """
+        if not self.trained:
+            return base
+        gap = self.session_gap()
+        wanted = base if gap is None else gap * USAGE_GAP_MARGIN
+        if self.is_likely_use(when):
+            return int(min(max(base, wanted), ADAPTIVE_IDLE_MAX_SECONDS))
+        return int(max(min(base, wanted), ADAPTIVE_IDLE_MIN_SECONDS))
+
+    def next_likely_use(self, when: datetime) -> datetime | None:
+        """Return the start of the next likely-use window within a day, if any."""
+        if not self.trained:
+            return None
+        bin_start = when.replace(
+            minute=when.minute - when.minute % USAGE_BIN_MINUTES, second=0, microsecond=0
+        )
+        index = _bin_index(when)
+        for step in range(1, USAGE_BINS + 1):
+            if self._is_hot(index + step) and not self._is_hot(index + step - 1):
+                return bin_start + timedelta(minutes=USAGE_BIN_MINUTES * step)
+        return None
+
+    def stats(self) -> dict[str, Any]:
+        """Return a summary for diagnostics."""
+        gap = self.session_gap()
+        return {
+            "commands": self._commands,
+            "trained": self.trained,
+            "session_gap": round(gap, 1) if gap is not None else None,
+            "likely_use_windows": [
+                f"{index * USAGE_BIN_MINUTES // 60:02d}:{index * USAGE_BIN_MINUTES % 60:02d}"
+                for index in range(USAGE_BINS)
+                if self.trained and self._is_hot(index)
+            ],
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the model state for storage."""
+        return {
+            "bins": [round(weight, 4) for weight in self._bins],
+            "day": self._day,
+            "gaps": list(self._gaps),
+            "last_command": self._last_command,
+            "commands": self._commands,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> UsageModel:
+        """Restore a model from storage."""
+        model = cls()
+        bins = data.get("bins")
+        if isinstance(bins, list) and len(bins) == USAGE_BINS:
+            model._bins = [float(weight) for weight in bins]
+        model._day = data.get("day")
+        model._gaps.extend(float(gap) for gap in data.get("gaps", []))
+        model._last_command = data.get("last_command")
+        model._commands = int(data.get("commands", 0))
+        return model
+
+
+class UsageModelStore:
+    """Per-coordinator usage model backed by HA storage."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, USAGE_MODEL_STORAGE_VERSION, _storage_key(entry_id)
+        )
+        self.model = UsageModel()
+        self._loaded = False
+
+    async def async_load(self) -> None:
+        """Load the stored model once."""
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            data = await self._store.async_load()
+        except Exception:
+            _LOGGER.debug("Failed to load usage model, starting fresh", exc_info=True)
+            return
+        if data:
+            self.model = UsageModel.from_dict(data)
+
+    def observe(self, when: datetime) -> None:
+        """Record a user command and schedule a save."""
+        self.model.observe(when)
+        self._store.async_delay_save(self.model.as_dict, USAGE_MODEL_SAVE_DELAY)
+
+
+def _storage_key(entry_id: str) -> str:
+    return f"{DOMAIN}.usage_model.{entry_id}"
+
+
+async def async_remove_usage_model(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete the stored usage model for a removed config entry."""
+    await Store(hass, USAGE_MODEL_STORAGE_VERSION, _storage_key(entry_id)).async_remove()
@@ -0,0 +1,899 @@
+"""Simulated beds behind a fake BleakClient for timing-sensitive tests.
+
+The MagicMock client in conftest.py accepts any write instantly and never
+answers. That is enough for byte-level controller tests, but not for anything
+that depends on timing: position seeks, pulse trains, burst mode or the BLE
+lock.
+
+SimulatedBleakClient sits where the real client would (patch it in as the
+return value of establish_connection) and talks to a SimulatedBed:
+
+- every write is decoded by the bed exactly as the firmware would see it;
+  frames with a bad checksum, header or PIN state are counted and ignored,
+- motors move at a fixed speed while hold-to-run commands keep arriving and
+  coast to a stop ``hold_time`` after the last one,
+- position notifications are pushed at the bed's own rate while subscribed,
+- LinkProfile injects write latency, jitter and dropped writes, and the
+  client records write timestamps and overlapping GATT operations.
+
+Protocols: Linak, Keeson/Ergomotion, Octo, Limoss, Jensen and Reverie.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import random
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from bleak.exc import BleakError
+
+from custom_components.adjustable_bed.const import (
+    JENSEN_CHAR_UUID,
+    JENSEN_SERVICE_UUID,
+    KEESON_BASE_NOTIFY_CHAR_UUID,
+    KEESON_BASE_NOTIFY_SERVICE_UUID,
+    KEESON_BASE_SERVICE_UUID,
+    KEESON_BASE_WRITE_CHAR_UUID,
+    LIMOSS_CHAR_UUID,
+    LIMOSS_SERVICE_UUID,
+    LINAK_BACK_MAX_POSITION,
+    LINAK_CONTROL_CHAR_UUID,
+    LINAK_CONTROL_SERVICE_UUID,
+    LINAK_FEET_MAX_POSITION,
+    LINAK_HEAD_MAX_POSITION,
+    LINAK_LEG_MAX_POSITION,
+    LINAK_POSITION_BACK_UUID,
+    LINAK_POSITION_FEET_UUID,
+    LINAK_POSITION_HEAD_UUID,
+    LINAK_POSITION_LEG_UUID,
+    LINAK_POSITION_SERVICE_UUID,
+    OCTO_CHAR_UUID,
+    OCTO_SERVICE_UUID,
+    REVERIE_CHAR_UUID,
+    REVERIE_SERVICE_UUID,
+)
+
+from .conftest import TEST_ADDRESS
+
+Notification = tuple[str, bytes]
+
+_WRITE_PROPS = ["write", "write-without-response"]
+
+
+@dataclass
+class LinkProfile:
+    """Radio link behaviour injected by SimulatedBleakClient.
+
+    Attributes:
+        write_latency: Seconds each GATT write or read takes.
+        jitter: Maximum extra random latency in seconds.
+        drop_rate: Probability (0-1) that a write is lost. Writes with
+            response fail with BleakError, writes without response vanish.
+        reject_concurrent: Fail GATT operations that overlap another one
+            with "operation in progress", as BlueZ does.
+        seed: Seed for latency jitter and drops, so runs are repeatable.
+    """
+
+    write_latency: float = 0.0
+    jitter: float = 0.0
+    drop_rate: float = 0.0
+    reject_concurrent: bool = False
+    seed: int = 0
+
+
+@dataclass
+class SimulatedMotor:
+    """One actuator moving at constant speed in native position units."""
+
+    max_position: int
+    travel_time: float
+    position: float = 0.0
+    direction: int = 0
+    target: float | None = None
+    hold_until: float = 0.0
+    _updated: float = field(default_factory=time.monotonic)
+
+    @property
+    def speed(self) -> float:
+        """Return the speed in native units per second."""
+        return self.max_position / self.travel_time
+
+    def advance(self, now: float) -> None:
+        """Move the motor up to ``now``."""
+        end = min(now, self.hold_until)
+        elapsed = end - self._updated
+        self._updated = now
+        if self.direction == 0 or elapsed <= 0:
+            if now >= self.hold_until:
+                self.direction = 0
+            return
+        position = self.position + self.direction * self.speed * elapsed
+        if self.target is not None and (position - self.target) * self.direction >= 0:
+            position = self.target
+            self.direction = 0
+            self.target = None
+        self.position = min(max(position, 0.0), float(self.max_position))
+        if now >= self.hold_until or self.position in (0.0, float(self.max_position)):
+            self.direction = 0
+
+    def drive(self, direction: int, now: float, hold: float) -> None:
+        """Keep moving in ``direction`` for ``hold`` seconds from now."""
+        self.advance(now)
+        self.direction = direction
+        self.target = None
+        self.hold_until = now + hold
+
+    def seek(self, target: float, now: float, hold: float) -> None:
+        """Move towards ``target``, stopping there or ``hold`` seconds from now."""
+        self.advance(now)
+        target = min(max(target, 0.0), float(self.max_position))
+        if abs(target - self.position) < 1e-9:
+            self.direction = 0
+            return
+        self.direction = 1 if target > self.position else -1
+        self.target = target
+        self.hold_until = now + hold
+
+    def stop(self, now: float) -> None:
+        """Stop immediately."""
+        self.advance(now)
+        self.direction = 0
+        self.target = None
+
+    @property
+    def moving(self) -> bool:
+        """Return True while the motor is driven."""
+        return self.direction != 0
+
+
+class SimulatedBed:
+    """Base class for a simulated bed firmware.
+
+    Subclasses declare their GATT layout in ``services`` and decode writes in
+    ``handle_write``. Responses and pushed positions are returned as
+    ``(characteristic_uuid, payload)`` notifications.
+    """
+
+    # service uuid -> characteristic uuid -> properties
+    services: dict[str, dict[str, list[str]]] = {}
+    # Seconds a motor keeps running after the last hold-to-run command
+    hold_time: float = 0.4
+    # Interval between pushed position notifications while motors move
+    notify_interval: float | None = None
+
+    def __init__(self, motors: dict[str, SimulatedMotor]) -> None:
+        """Initialize the bed with its motors."""
+        self.motors = motors
+        self.frames: list[bytes] = []
+        self.rejected_frames: list[bytes] = []
+        self.subscribed: set[str] = set()
+        self._reported: dict[str, int] = {}
+
+    def positions(self, now: float | None = None) -> dict[str, float]:
+        """Return current native motor positions."""
+        now = time.monotonic() if now is None else now
+        for motor in self.motors.values():
+            motor.advance(now)
+        return {name: motor.position for name, motor in self.motors.items()}
+
+    def set_position(self, name: str, position: float) -> None:
+        """Place a motor at a native position (test setup)."""
+        self.motors[name].position = position
+
+    def drive_all(self, direction: int, now: float) -> None:
+        """Drive every motor for one hold period."""
+        for motor in self.motors.values():
+            motor.drive(direction, now, self.hold_time)
+
+    def stop_all(self, now: float) -> None:
+        """Stop every motor."""
+        for motor in self.motors.values():
+            motor.stop(now)
+
+    def subscribe(self, char_uuid: str, enabled: bool) -> None:
+        """Track notification subscriptions."""
+        if enabled:
+            self.subscribed.add(char_uuid)
+        else:
+            self.subscribed.discard(char_uuid)
+
+    def accept(self, data: bytes) -> None:
+        """Record a decoded frame."""
+        self.frames.append(data)
+
+    def reject(self, data: bytes) -> list[Notification]:
+        """Record a frame the firmware would ignore."""
+        self.rejected_frames.append(data)
+        return []
+
+    def handle_write(self, char_uuid: str, data: bytes, now: float) -> list[Notification]:
+        """Decode a write and return any response notifications."""
+        raise NotImplementedError
+
+    def handle_read(self, char_uuid: str, now: float) -> bytes:
+        """Return the value of a readable characteristic."""
+        raise BleakError(f"Characteristic {char_uuid} is not readable")
+
+    def position_notifications(self, now: float) -> list[Notification]:
+        """Return pushed position notifications for motors that moved."""
+        return []
+
+    def _changed(self, name: str) -> bool:
+        """Return True if a motor moved since it was last reported."""
+        value = int(self.motors[name].position)
+        if self._reported.get(name) == value:
+            return False
+        self._reported[name] = value
+        return True
+
+
+class LinakBed(SimulatedBed):
+    """Linak: 2-byte hold-to-run commands, 16-bit positions on read/notify.
+
+    The back position characteristic accepts a subscription but never
+    notifies, like the real beds.
+    """
+
+    services = {
+        LINAK_CONTROL_SERVICE_UUID: {LINAK_CONTROL_CHAR_UUID: _WRITE_PROPS},
+        LINAK_POSITION_SERVICE_UUID: {
+            LINAK_POSITION_BACK_UUID: ["read", "notify"],
+            LINAK_POSITION_LEG_UUID: ["read", "notify"],
+            LINAK_POSITION_HEAD_UUID: ["read", "notify"],
+            LINAK_POSITION_FEET_UUID: ["read", "notify"],
+        },
+    }
+    # Motors auto-stop 200-500ms after commands stop arriving
+    hold_time = 0.35
+    notify_interval = 0.1
+
+    _MOVES = {
+        0x0B: ("back", 1),
+        0x0A: ("back", -1),
+        0x09: ("legs", 1),
+        0x08: ("legs", -1),
+        0x03: ("head", 1),
+        0x02: ("head", -1),
+        0x05: ("feet", 1),
+        0x04: ("feet", -1),
+    }
+    _POSITION_CHARS = {
+        LINAK_POSITION_BACK_UUID: "back",
+        LINAK_POSITION_LEG_UUID: "legs",
+        LINAK_POSITION_HEAD_UUID: "head",
+        LINAK_POSITION_FEET_UUID: "feet",
+    }
+
+    def __init__(self, travel_time: float = 20.0) -> None:
+        """Initialize a four-motor Linak frame."""
+        super().__init__(
+            {
+                "back": SimulatedMotor(LINAK_BACK_MAX_POSITION, travel_time),
+                "legs": SimulatedMotor(LINAK_LEG_MAX_POSITION, travel_time),
+                "head": SimulatedMotor(LINAK_HEAD_MAX_POSITION, travel_time),
+                "feet": SimulatedMotor(LINAK_FEET_MAX_POSITION, travel_time),
+            }
+        )
+
+    def handle_write(self, char_uuid: str, data: bytes, now: float) -> list[Notification]:
+        """Decode a control command."""
+        if char_uuid != LINAK_CONTROL_CHAR_UUID or len(data) != 2 or data[1] != 0x00:
+            return self.reject(data)
+        self.accept(data)
+        command = data[0]
+        if command in self._MOVES:
+            name, direction = self._MOVES[command]
+            self.motors[name].drive(direction, now, self.hold_time)
+        elif command == 0x01:
+            self.drive_all(1, now)
+        elif command == 0x00:
+            # INITIALIZE_DOWN, the reason 0x00 must never be sent as stop
+            self.drive_all(-1, now)
+        elif command == 0xFF:
+            self.stop_all(now)
+        return []
+
+    def handle_read(self, char_uuid: str, now: float) -> bytes:
+        """Return a motor position as a little-endian 16-bit value."""
+        name = self._POSITION_CHARS.get(char_uuid)
+        if name is None:
+            return super().handle_read(char_uuid, now)
+        return int(self.positions(now)[name]).to_bytes(2, "little")
+
+    def position_notifications(self, now: float) -> list[Notification]:
+        """Push positions of moving motors, except back."""
+        self.positions(now)
+        return [
+            (uuid, int(self.motors[name].position).to_bytes(2, "little"))
+            for uuid, name in self._POSITION_CHARS.items()
+            if name != "back" and self._changed(name)
+        ]
+
+
+class KeesonBed(SimulatedBed):
+    """Keeson BaseI4/I5 and Ergomotion: E5 FE 16 frames, ED status notifications.
+
+    Positions are 0-100. ``notifies`` selects the Ergomotion variant, which
+    pushes 16-byte ED status messages while the motors move.
+    """
+
+    services = {
+        KEESON_BASE_SERVICE_UUID: {KEESON_BASE_WRITE_CHAR_UUID: _WRITE_PROPS},
+        KEESON_BASE_NOTIFY_SERVICE_UUID: {KEESON_BASE_NOTIFY_CHAR_UUID: ["notify"]},
+    }
+    hold_time = 0.4
+    notify_interval = 0.1
+
+    _PRESET_FLAT = 0x8000000
+
+    def __init__(self, travel_time: float = 20.0, notifies: bool = True) -> None:
+        """Initialize a two-motor Keeson base."""
+        super().__init__(
+            {
+                "head": SimulatedMotor(100, travel_time),
+                "feet": SimulatedMotor(100, travel_time),
+            }
+        )
+        self.notifies = notifies
+
+    def handle_write(self, char_uuid: str, data: bytes, now: float) -> list[Notification]:
+        """Decode a motor/preset value frame."""
+        if (
+            char_uuid != KEESON_BASE_WRITE_CHAR_UUID
+            or len(data) != 8
+            or data[0] not in (0xE5, 0xE6)
+            or data[1:3] != b"\xfe\x16"
+            or (sum(data[:7]) ^ 0xFF) & 0xFF != data[7]
+        ):
+            return self.reject(data)
+        self.accept(data)
+        value = int.from_bytes(data[3:7], "little")
+        if value == 0:
+            self.stop_all(now)
+        elif value == self._PRESET_FLAT:
+            for motor in self.motors.values():
+                motor.seek(0, now, self.motors["head"].travel_time)
+        for name, up_bit, down_bit in (("head", 0x1, 0x2), ("feet", 0x4, 0x8)):
+            if value & up_bit:
+                self.motors[name].drive(1, now, self.hold_time)
+            elif value & down_bit:
+                self.motors[name].drive(-1, now, self.hold_time)
+        return []
+
+    def status_message(self) -> bytes:
+        """Build a 16-byte ED status message."""
+        head = self.motors["head"]
+        feet = self.motors["feet"]
+        move = (1 if head.moving else 0) | (2 if feet.moving else 0)
+        message = bytearray(16)
+        message[0] = 0xED
+        message[1:3] = int(head.position).to_bytes(2, "little")
+        message[3:5] = int(feet.position).to_bytes(2, "little")
+        message[13] = move
+        return bytes(message)
+
+    def position_notifications(self, now: float) -> list[Notification]:
+        """Push a status message whenever a motor moved."""
+        if not self.notifies:
+            return []
+        self.positions(now)
+        changed = [self._changed(name) for name in self.motors]
+        if not any(changed):
+            return []
+        return [(KEESON_BASE_NOTIFY_CHAR_UUID, self.status_message())]
+
+
+class OctoBed(SimulatedBed):
+    """Octo: 0x40-framed, byte-stuffed packets with feature discovery and PIN.
+
+    A bed with a PIN ignores motor commands until the PIN is sent and locks
+    again ``pin_timeout`` seconds after the last PIN (the keep-alive).
+    """
+
+    services = {OCTO_SERVICE_UUID: {OCTO_CHAR_UUID: [*_WRITE_PROPS, "notify"]}}
+    # Octo sends a pulse every 350ms
+    hold_time = 0.5
+
+    _ESCAPE = {0x40: 0x01, 0x3C: 0x02, 0x4F: 0x03, 0x41: 0x04}
+    _UNESCAPE = {v: k for k, v in _ESCAPE.items()}
+    _MOTORS = {0x02: "head", 0x04: "legs"}
+
+    def __init__(
+        self,
+        travel_time: float = 20.0,
+        pin: str = "",
+        has_lights: bool = True,
+        memory_slots: int = 0,
+        pin_timeout: float = 30.0,
+    ) -> None:
+        """Initialize a two-motor Octo bed."""
+        super().__init__(
+            {
+                "head": SimulatedMotor(100, travel_time),
+                "legs": SimulatedMotor(100, travel_time),
+            }
+        )
+        self.pin = pin
+        self.has_lights = has_lights
+        self.memory_slots = memory_slots
+        self.pin_timeout = pin_timeout
+        self._unlocked_until = 0.0
+
+    @staticmethod
+    def checksum(values: list[int]) -> int:
+        """Return the two's complement of the byte sum."""
+        return (((sum(values) & 0xFF) ^ 0xFF) + 1) & 0xFF
+
+    def unlocked(self, now: float) -> bool:
+        """Return True if motor commands are accepted."""
+        return not self.pin or now < self._unlocked_until
+
+    def _unescape(self, data: bytes) -> list[int] | None:
+        result: list[int] = []
+        i = 0
+        while i < len(data):
+            if data[i] == 0x3C:
+                if i + 1 >= len(data) or data[i + 1] not in self._UNESCAPE:
+                    return None
+                result.append(self._UNESCAPE[data[i + 1]])
+                i += 2
+                continue
+            result.append(data[i])
+            i += 1
+        return result
+
+    def _response(self, command: list[int], data: list[int]) -> bytes:
+        length = [(len(data) >> 8) & 0xFF, len(data) & 0xFF]
+        checksum = self.checksum([0x80, *command, *length, *data])
+        payload: list[int] = []
+        for value in [*command, *length, checksum, *data]:
+            if value in self._ESCAPE:
+                payload.extend((0x3C, self._ESCAPE[value]))
+            else:
+                payload.append(value)
+        return bytes([0x40, *payload, 0x40])
+
+    def _feature(self, feature_id: int, value: list[int]) -> Notification:
+        data = [(feature_id >> 16) & 0xFF, (feature_id >> 8) & 0xFF, feature_id & 0xFF, 0, 0, 0]
+        return (OCTO_CHAR_UUID, self._response([0x21, 0x71], [*data, *value]))
+
+    def handle_write(self, char_uuid: str, data: bytes, now: float) -> list[Notification]:
+        """Decode a packet."""
+        if char_uuid != OCTO_CHAR_UUID or len(data) < 7 or data[0] != 0x40 or data[-1] != 0x40:
+            return self.reject(data)
+        payload = self._unescape(data[1:-1])
+        if payload is None or len(payload) < 5:
+            return self.reject(data)
+        # The checksum makes the sum of the unescaped packet zero
+        if (0x40 + sum(payload) + 0x40) & 0xFF != 0:
+            return self.reject(data)
+        command = payload[0:2]
+        length = (payload[2] << 8) + payload[3]
+        body = payload[5:]
+        if len(body) != length:
+            return self.reject(data)
+        self.accept(data)
+
+        if command == [0x20, 0x71]:
+            features = [self._feature(0x000003, [1 if self.pin else 0, 0 if self.pin else 1])]
+            if self.memory_slots:
+                features.append(self._feature(0x000002, [self.memory_slots]))
+            if self.has_lights:
+                features.append(self._feature(0x000102, [0]))
+            features.append(self._feature(0xFFFFFF, []))
+            return features
+        if command == [0x20, 0x43]:
+            if "".join(str(d) for d in body) == self.pin:
+                self._unlocked_until = now + self.pin_timeout
+            return []
+        if command == [0x02, 0x73]:
+            self.stop_all(now)
+            return []
+        if command in ([0x02, 0x70], [0x02, 0x71]) and body:
+            if not self.unlocked(now):
+                return self.reject(data)
+            direction = 1 if command[1] == 0x70 else -1
+            for bit, name in self._MOTORS.items():
+                if body[0] & bit:
+                    self.motors[name].drive(direction, now, self.hold_time)
+        return []
+
+
+def _tea_encrypt(block: bytes) -> bytes:
+    key = (1431639188, 1949848917, 1431639188, 1949848917)
+    v0 = int.from_bytes(block[:4], "big")
+    v1 = int.from_bytes(block[4:], "big")
+    total = 0
+    for _ in range(16):
+        total = (total + 0x9E3779B9) & 0xFFFFFFFF
+        v0 = (v0 + (((v1 << 4) + key[0]) ^ (v1 + total) ^ ((v1 >> 5) + key[1]))) & 0xFFFFFFFF
+        v1 = (v1 + (((v0 << 4) + key[2]) ^ (v0 + total) ^ ((v0 >> 5) + key[3]))) & 0xFFFFFFFF
+    return v0.to_bytes(4, "big") + v1.to_bytes(4, "big")
+
+
+def _tea_decrypt(block: bytes) -> bytes:
+    key = (1431639188, 1949848917, 1431639188, 1949848917)
+    v0 = int.from_bytes(block[:4], "big")
+    v1 = int.from_bytes(block[4:], "big")
+    total = (0x9E3779B9 * 16) & 0xFFFFFFFF
+    for _ in range(16):
+        v1 = (v1 - (((v0 << 4) + key[2]) ^ (v0 + total) ^ ((v0 >> 5) + key[3]))) & 0xFFFFFFFF
+        v0 = (v0 - (((v1 << 4) + key[0]) ^ (v1 + total) ^ ((v1 >> 5) + key[1]))) & 0xFFFFFFFF
+        total = (total - 0x9E3779B9) & 0xFFFFFFFF
+    return v0.to_bytes(4, "big") + v1.to_bytes(4, "big")
+
+
+class LimossBed(SimulatedBed):
+    """Limoss/Stawett: TEA-encrypted 10-byte packets, positions on request."""
+
+    services = {LIMOSS_SERVICE_UUID: {LIMOSS_CHAR_UUID: ["write", "notify"]}}
+    hold_time = 0.4
+
+    _MOVES = {
+        0x12: ("back", 1),
+        0x13: ("back", -1),
+        0x22: ("legs", 1),
+        0x23: ("legs", -1),
+    }
+    _ASK = {0x10: "back", 0x20: "legs"}
+
+    def __init__(self, travel_time: float = 20.0, memory_slots: int = 2) -> None:
+        """Initialize a two-motor Limoss bed."""
+        super().__init__(
+            {
+                "back": SimulatedMotor(16000, travel_time),
+                "legs": SimulatedMotor(12000, travel_time),
+            }
+        )
+        self.memory_slots = memory_slots
+        self._counter = 0
+
+    def _packet(self, cmd: int, params: bytes) -> bytes:
+        inner = bytearray([0xAA, cmd, *params, self._counter, 0])
+        inner[7] = sum(inner[0:7]) & 0xFF
+        self._counter = (self._counter + 1) & 0xFF
+        outer = bytearray([0xDD, *_tea_encrypt(bytes(inner)), 0])
+        outer[9] = sum(outer[0:9]) & 0xFF
+        return bytes(outer)
+
+    def handle_write(self, char_uuid: str, data: bytes, now: float) -> list[Notification]:
+        """Decrypt and execute a packet."""
+        if (
+            char_uuid != LIMOSS_CHAR_UUID
+            or len(data) != 10
+            or data[0] != 0xDD
+            or sum(data[0:9]) & 0xFF != data[9]
+        ):
+            return self.reject(data)
+        inner = _tea_decrypt(data[1:9])
+        if inner[0] != 0xAA or sum(inner[0:7]) & 0xFF != inner[7]:
+            return self.reject(data)
+        self.accept(data)
+        cmd = inner[1]
+
+        if cmd == 0x02:
+            params = bytes([8, len(self.motors), 0, self.memory_slots])
+            return [(LIMOSS_CHAR_UUID, self._packet(0x02, params))]
+        if cmd in self._ASK:
+            raw = int(self.positions(now)[self._ASK[cmd]])
+            return [(LIMOSS_CHAR_UUID, self._packet(cmd, raw.to_bytes(4, "big")))]
+        if cmd in self._MOVES:
+            name, direction = self._MOVES[cmd]
+            self.motors[name].drive(direction, now, self.hold_time)
+        elif cmd == 0x51:
+            for motor in self.motors.values():
+                motor.seek(0, now, motor.travel_time)
+        elif cmd == 0xFF:
+            self.stop_all(now)
+        return []
+
+
+class JensenBed(SimulatedBed):
+    """Jensen JMC400: 6-byte commands, PIN unlock, positions on request.
+
+    Commands other than the PIN are ignored until notifications are enabled
+    and the PIN has been sent, matching the order the app uses.
+    """
+
+    services = {JENSEN_SERVICE_UUID: {JENSEN_CHAR_UUID: [*_WRITE_PROPS, "notify"]}}
+    hold_time = 0.4
+
+    _MOVES = {0x01: ("head", 1), 0x02: ("head", -1), 0x10: ("foot", 1), 0x20: ("foot", -1)}
+
+    def __init__(self, travel_time: float = 20.0, pin: str = "3060", features: int = 0x45) -> None:
+        """Initialize a Jensen bed (default features: head massage, light, under-bed)."""
+        super().__init__(
+            {
+                "head": SimulatedMotor(30500, travel_time, position=1),
+                "foot": SimulatedMotor(30500, travel_time, position=1),
+            }
+        )
+        self.pin = pin
+        self.features = features
+        self.unlocked = False
+
+    def handle_write(self, char_uuid: str, data: bytes, now: float) -> list[Notification]:
+        """Execute a 6-byte command."""
+        if char_uuid != JENSEN_CHAR_UUID or len(data) != 6:
+            return self.reject(data)
+        if data[0] == 0x1E:
+            self.accept(data)
+            self.unlocked = "".join(str(d) for d in data[1:5]) == self.pin
+            return []
+        if not self.unlocked or JENSEN_CHAR_UUID not in self.subscribed:
+            return self.reject(data)
+        self.accept(data)
+
+        if data[0] == 0x0A:
+            return [(JENSEN_CHAR_UUID, bytes([0x0A, 0x00, self.features, 0, 0, 0]))]
+        if data[0] != 0x10:
+            return []
+        command = data[1]
+        if command == 0xFF:
+            positions = self.positions(now)
+            head = int(positions["head"])
+            foot = int(positions["foot"])
+            return [(JENSEN_CHAR_UUID, bytes([0x10, 0x00, head >> 8, head & 0xFF, foot >> 8, foot & 0xFF]))]
+        if command in self._MOVES:
+            name, direction = self._MOVES[command]
+            self.motors[name].drive(direction, now, self.hold_time)
+        elif command == 0x81:
+            for motor in self.motors.values():
+                motor.seek(1, now, motor.travel_time)
+        elif command == 0x00:
+            self.stop_all(now)
+        return []
+
+
+class ReverieBed(SimulatedBed):
+    """Reverie: XOR-checksummed frames with absolute 0-100 motor targets."""
+
+    services = {REVERIE_SERVICE_UUID: {REVERIE_CHAR_UUID: ["write", "notify"]}}
+    # Position commands repeat every 300ms while the app holds the target
+    hold_time = 1.0
+    notify_interval = 0.2
+
+    _TARGETS = {0x51: "head", 0x52: "feet"}
+
+    def __init__(self, travel_time: float = 20.0) -> None:
+        """Initialize a two-motor Reverie bed."""
+        super().__init__(
+            {
+                "head": SimulatedMotor(100, travel_time),
+                "feet": SimulatedMotor(100, travel_time),
+            }
+        )
+
+    def handle_write(self, char_uuid: str, data: bytes, now: float) -> list[Notification]:
+        """Execute a 0x55 frame."""
+        if char_uuid != REVERIE_CHAR_UUID or len(data) < 3 or data[0] != 0x55:
+            return self.reject(data)
+        checksum = 0
+        for value in data[:-1]:
+            checksum ^= value
+        if checksum != data[-1]:
+            return self.reject(data)
+        self.accept(data)
+        body = data[1:-1]
+        if body[0] in self._TARGETS and len(body) == 2 and body[1] <= 100:
+            self.motors[self._TARGETS[body[0]]].seek(body[1], now, self.hold_time)
+        elif body[0] == 0x05:
+            for motor in self.motors.values():
+                motor.seek(0, now, motor.travel_time)
+        elif body[0] == 0xFF:
+            self.stop_all(now)
+        return []
+
+    def position_notifications(self, now: float) -> list[Notification]:
+        """Push [0x55, motor, position, xor] for motors that moved."""
+        self.positions(now)
+        notifications = []
+        for command, name in self._TARGETS.items():
+            if self._changed(name):
+                position = int(self.motors[name].position)
+                notifications.append(
+                    (REVERIE_CHAR_UUID, bytes([0x55, command, position, 0x55 ^ command ^ position]))
+                )
+        return notifications
+
+
+class _Characteristic:
+    """Minimal BleakGATTCharacteristic."""
+
+    def __init__(self, uuid: str, properties: list[str], handle: int, service_uuid: str) -> None:
+        self.uuid = uuid
+        self.properties = properties
+        self.handle = handle
+        self.service_uuid = service_uuid
+        self.descriptors: list[Any] = []
+
+
+class _Service:
+    """Minimal BleakGATTService."""
+
+    def __init__(self, uuid: str, handle: int, characteristics: list[_Characteristic]) -> None:
+        self.uuid = uuid
+        self.handle = handle
+        self.characteristics = characteristics
+
+    def get_characteristic(self, uuid: str) -> _Characteristic | None:
+        for char in self.characteristics:
+            if char.uuid == uuid.lower():
+                return char
+        return None
+
+
+class _ServiceCollection:
+    """Minimal BleakGATTServiceCollection."""
+
+    def __init__(self, layout: dict[str, dict[str, list[str]]]) -> None:
+        self._services: list[_Service] = []
+        handle = 1
+        for service_uuid, chars in layout.items():
+            service_handle = handle
+            characteristics = []
+            for char_uuid, props in chars.items():
+                handle += 2
+                characteristics.append(
+                    _Characteristic(char_uuid.lower(), list(props), handle, service_uuid.lower())
+                )
+            self._services.append(_Service(service_uuid.lower(), service_handle, characteristics))
+            handle += 1
+
+    def __iter__(self) -> Iterator[_Service]:
+        return iter(self._services)
+
+    def __len__(self) -> int:
+        return len(self._services)
+
+    def get_service(self, uuid: str) -> _Service | None:
+        for service in self._services:
+            if service.uuid == uuid.lower():
+                return service
+        return None
+
+    def get_characteristic(self, uuid: str) -> _Characteristic | None:
+        for service in self._services:
+            char = service.get_characteristic(uuid)
+            if char is not None:
+                return char
+        return None
+
+
+class SimulatedBleakClient:
+    """BleakClient stand-in that forwards GATT traffic to a SimulatedBed."""
+
+    def __init__(
+        self,
+        bed: SimulatedBed,
+        profile: LinkProfile | None = None,
+        address: str = TEST_ADDRESS,
+    ) -> None:
+        """Initialize the client in the connected state."""
+        self.bed = bed
+        self.profile = profile or LinkProfile()
+        self.address = address
+        self.mtu_size = 23
+        self.services = _ServiceCollection(bed.services)
+        self.is_connected = True
+        self._random = random.Random(self.profile.seed)
+        self._callbacks: dict[str, Callable[[Any, bytearray], None]] = {}
+        self._notify_task: asyncio.Task[None] | None = None
+        self._in_flight = 0
+        # Link statistics: (monotonic time, characteristic, payload) per write
+        self.write_log: list[tuple[float, str, bytes]] = []
+        self.writes = 0
+        self.reads = 0
+        self.dropped = 0
+        self.overlapping_ops = 0
+        self.notifications_sent = 0
+
+    @staticmethod
+    def _uuid(char: Any) -> str:
+        return str(getattr(char, "uuid", char)).lower()
+
+    def _characteristic(self, uuid: str) -> _Characteristic:
+        char = self.services.get_characteristic(uuid)
+        if char is None:
+            raise BleakError(f"Characteristic {uuid} was not found!")
+        return char
+
+    def pulse_intervals(self, data: bytes | None = None) -> list[float]:
+        """Return seconds between consecutive writes (optionally of one payload)."""
+        times = [t for t, _, frame in self.write_log if data is None or frame == data]
+        return [later - earlier for earlier, later in zip(times, times[1:], strict=False)]
+
+    @contextlib.asynccontextmanager
+    async def _gatt_operation(self) -> Any:
+        if not self.is_connected:
+            raise BleakError("Not connected")
+        if self._in_flight:
+            self.overlapping_ops += 1
+            if self.profile.reject_concurrent:
+                raise BleakError("Operation already in progress")
+        self._in_flight += 1
+        try:
+            delay = self.profile.write_latency + self._random.uniform(0, self.profile.jitter)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                await asyncio.sleep(0)
+            yield
+        finally:
+            self._in_flight -= 1
+
+    def _deliver(self, notifications: list[Notification]) -> None:
+        for uuid, payload in notifications:
+            callback = self._callbacks.get(uuid)
+            if callback is None:
+                continue
+            self.notifications_sent += 1
+            callback(self._characteristic(uuid), bytearray(payload))
+
+    async def connect(self, **kwargs: Any) -> bool:  # noqa: ARG002
+        """Reconnect the link."""
+        self.is_connected = True
+        return True
+
+    async def disconnect(self) -> bool:
+        """Drop the link and stop pushing notifications."""
+        self.is_connected = False
+        self._callbacks.clear()
+        self.bed.subscribed.clear()
+        if self._notify_task is not None:
+            self._notify_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._notify_task
+            self._notify_task = None
+        return True
+
+    async def write_gatt_char(self, char: Any, data: bytes, response: bool = False) -> None:
+        """Write to the bed after the link latency."""
+        uuid = self._uuid(char)
+        self._characteristic(uuid)
+        self.write_log.append((time.monotonic(), uuid, bytes(data)))
+        self.writes += 1
+        async with self._gatt_operation():
+            if self.profile.drop_rate and self._random.random() < self.profile.drop_rate:
+                self.dropped += 1
+                if response:
+                    raise BleakError("Simulated write failure")
+                return
+            notifications = self.bed.handle_write(uuid, bytes(data), time.monotonic())
+        self._deliver(notifications)
+
+    async def read_gatt_char(self, char: Any) -> bytearray:
+        """Read a characteristic after the link latency."""
+        uuid = self._uuid(char)
+        self._characteristic(uuid)
+        self.reads += 1
+        async with self._gatt_operation():
+            return bytearray(self.bed.handle_read(uuid, time.monotonic()))
+
+    async def start_notify(self, char: Any, callback: Callable[[Any, bytearray], None]) -> None:
+        """Subscribe to a characteristic."""
+        uuid = self._uuid(char)
+        if "notify" not in self._characteristic(uuid).properties:
+            raise BleakError(f"Characteristic {uuid} does not support notifications")
+        async with self._gatt_operation():
+            self._callbacks[uuid] = callback
+            self.bed.subscribe(uuid, True)
+        if self.bed.notify_interval is not None and self._notify_task is None:
+            self._notify_task = asyncio.get_running_loop().create_task(self._notify_loop())
+
+    async def stop_notify(self, char: Any) -> None:
+        """Unsubscribe from a characteristic."""
+        uuid = self._uuid(char)
+        self._callbacks.pop(uuid, None)
+        self.bed.subscribe(uuid, False)
+
+    async def _notify_loop(self) -> None:
+        interval = self.bed.notify_interval
+        assert interval is not None
+        while self.is_connected:
+            await asyncio.sleep(interval)
+            self._deliver(self.bed.position_notifications(time.monotonic()))
@@ -0,0 +1,290 @@
+"""Throughput and allocation benchmarks for per-frame protocol code.
+
+Every command frame and every notification goes through a handful of small
+codecs: Limoss TEA, Octo byte stuffing and checksums, the Keeson/Ergomotion
+status parser, the Linak position handler and the Sleepy's BOX15 checksum.
+Each case below feeds a fixed set of representative frames to one of them and
+measures:
+
+- frames per second (best of several timed rounds), and the cost relative to a
+  fixed reference workload, which keeps the stored numbers comparable across
+  machines;
+- allocated bytes per frame (tracemalloc peak while handling one frame).
+
+Results are compared against codec_baselines.json. Allocation sizes differ
+between Python releases, so record the baselines with the Python version the
+project requires (pyproject.toml). To refresh them after an intentional change,
+run from the repository root:
+
+    python -m tests.codec_benchmarks --update
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import time
+import tracemalloc
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Final
+from unittest.mock import MagicMock
+
+from custom_components.adjustable_bed.beds.keeson import KeesonController
+from custom_components.adjustable_bed.beds.limoss import LimossController
+from custom_components.adjustable_bed.beds.linak import LinakController
+from custom_components.adjustable_bed.beds.octo import OctoController
+from custom_components.adjustable_bed.beds.sleepys import _calculate_box15_checksum
+from custom_components.adjustable_bed.const import (
+    KEESON_BASE_WRITE_CHAR_UUID,
+    LINAK_BACK_MAX_POSITION,
+)
+
+BASELINE_FILE: Final = Path(__file__).with_name("codec_baselines.json")
+
+# A case fails when it gets this much slower (relative to the reference
+# workload) or allocates this much more per frame than its baseline
+THROUGHPUT_REGRESSION: Final = 1.5
+ALLOCATION_REGRESSION: Final = 1.25
+# Absolute slack for allocation comparisons, so a few bytes of interpreter
+# noise on a tiny baseline don't fail the check
+ALLOCATION_SLACK_BYTES: Final = 64
+
+TIMED_ROUNDS: Final = 5
+ROUND_TIME: Final = 0.05
+
+
+@dataclass(frozen=True)
+class CodecCase:
+    """One codec fed with a fixed set of frames."""
+
+    name: str
+    handler: Callable[[Any], Any]
+    frames: Sequence[Any]
+
+
+@dataclass(frozen=True)
+class CodecResult:
+    """Measurements of one codec case."""
+
+    name: str
+    frames_per_second: float
+    relative_cost: float
+    alloc_bytes: int
+
+    def as_baseline(self) -> dict[str, float | int]:
+        """Return the values stored in the baseline file."""
+        return {
+            "relative_cost": round(self.relative_cost, 3),
+            "alloc_bytes": self.alloc_bytes,
+        }
+
+
+def _octo_frame(controller: OctoController, command: list[int], data: list[int]) -> bytes:
+    """Build an Octo response frame (checksum starts with 0x80 instead of 0x40)."""
+    length = [(len(data) >> 8) & 0xFF, len(data) & 0xFF]
+    checksum = controller._calculate_checksum([0x80, *command, *length, *data])
+    payload = controller._escape_bytes([*command, *length, checksum, *data])
+    return bytes([0x40, *payload, 0x40])
+
+
+def _keeson_status(head: int, foot: int, moving: int) -> bytes:
+    """Build a 16-byte Ergomotion 0xED status message."""
+    return bytes(
+        [0xED, *head.to_bytes(2, "little"), *foot.to_bytes(2, "little"), 0, 0, 0, 0]
+        + [0, 0, 0, 0, moving, 0, 0]
+    )
+
+
+def build_cases() -> list[CodecCase]:
+    """Return the benchmarked codecs with their frames."""
+    octo = OctoController(MagicMock())
+    keeson = KeesonController(
+        MagicMock(), variant="ergomotion", char_uuid=KEESON_BASE_WRITE_CHAR_UUID
+    )
+    keeson._notify_callback = lambda _key, _value: None
+    linak = LinakController(MagicMock())
+    linak._notify_callback = lambda _key, _value: None
+
+    tea_blocks = [bytes([n, 0x12, 0x00, 0x00, 0x1F, 0x40, n ^ 0x5A, 0x00]) for n in range(16)]
+    octo_payloads = [
+        [0x02, 0x70, 0x00, 0x01, 0x00, 0x02],
+        [0x20, 0x43, 0x00, 0x04, 0x00, 0x01, 0x02, 0x03, 0x04],
+        # Every escaped byte at once
+        [0x21, 0x71, 0x00, 0x04, 0x00, 0x40, 0x3C, 0x4F, 0x41],
+    ]
+    octo_responses = [
+        _octo_frame(octo, [0x21, 0x71], [0x00, 0x00, 0x03, 0x00, 0x06, 0, 0, 0, 0, 0, 0, 1, 1]),
+        _octo_frame(octo, [0x21, 0x71], [0x00, 0x00, 0x21, 0x00, 0x06, 0, 0, 0, 0, 0, 0, 1, 0x40]),
+        _octo_frame(octo, [0x21, 0x71], [0xFF, 0xFF, 0xFF]),
+    ]
+    escaped = [octo._escape_bytes(payload) for payload in octo_payloads]
+
+    return [
+        CodecCase("limoss_tea_encrypt", LimossController._tea_encrypt, tea_blocks),
+        CodecCase(
+            "limoss_tea_decrypt",
+            LimossController._tea_decrypt,
+            [LimossController._tea_encrypt(block) for block in tea_blocks],
+        ),
+        CodecCase("octo_escape_bytes", octo._escape_bytes, octo_payloads),
+        CodecCase("octo_unescape_bytes", octo._unescape_bytes, escaped),
+        CodecCase("octo_calculate_checksum", octo._calculate_checksum, octo_payloads),
+        CodecCase("octo_parse_response_packet", octo._parse_response_packet, octo_responses),
+        CodecCase(
+            "keeson_parse_notification",
+            keeson._parse_notification,
+            [
+                _keeson_status(0, 0, 0x0F),
+                _keeson_status(37, 12, 0x01),
+                _keeson_status(100, 100, 0x43),
+            ],
+        ),
+        CodecCase(
+            "linak_handle_position_data",
+            lambda data: linak._handle_position_data(
+                "back", data, LINAK_BACK_MAX_POSITION, 68.0
+            ),
+            [
+                bytearray(raw.to_bytes(2, "little"))
+                for raw in (0, 120, LINAK_BACK_MAX_POSITION // 2, LINAK_BACK_MAX_POSITION)
+            ],
+        ),
+        CodecCase(
+            "sleepys_box15_checksum",
+            _calculate_box15_checksum,
+            [bytes([0xE6, 0xFE, 0x16, n, 0, 0, 0, 0]) for n in range(8)],
+        ),
+    ]
+
+
+def _reference_workload(frames: Sequence[bytes]) -> None:
+    """Fixed pure-Python work that calibrates the speed of the machine."""
+    for frame in frames:
+        total = 0
+        for byte in frame:
+            total = (total + (byte ^ 0x5A)) & 0xFF
+
+
+_REFERENCE_FRAMES: Final = [bytes(range(n, n + 8)) for n in range(16)]
+
+
+def seconds_per_call(run: Callable[[], None]) -> float:
+    """Return the best seconds per call of ``run`` over the timed rounds."""
+    calls = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(calls):
+            run()
+        elapsed = time.perf_counter() - start
+        if elapsed >= ROUND_TIME:
+            break
+        calls *= 2
+
+    best = elapsed / calls
+    for _ in range(TIMED_ROUNDS - 1):
+        start = time.perf_counter()
+        for _ in range(calls):
+            run()
+        best = min(best, (time.perf_counter() - start) / calls)
+    return best
+
+
+def reference_seconds() -> float:
+    """Return the time per frame of the reference workload."""
+    return seconds_per_call(lambda: _reference_workload(_REFERENCE_FRAMES)) / len(
+        _REFERENCE_FRAMES
+    )
+
+
+def measure_alloc_bytes(case: CodecCase) -> int:
+    """Return the most bytes allocated while handling any one frame."""
+    handler = case.handler
+    # Warm up caches and lazily created attributes first
+    for frame in case.frames:
+        handler(frame)
+
+    peak = 0
+    tracemalloc.start()
+    try:
+        for frame in case.frames:
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            handler(frame)
+            _, frame_peak = tracemalloc.get_traced_memory()
+            peak = max(peak, frame_peak - before)
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def measure(case: CodecCase, reference: float) -> CodecResult:
+    """Benchmark one codec case."""
+    handler = case.handler
+    frames = case.frames
+
+    def _run() -> None:
+        for frame in frames:
+            handler(frame)
+
+    per_frame = seconds_per_call(_run) / len(frames)
+    return CodecResult(
+        name=case.name,
+        frames_per_second=1 / per_frame,
+        relative_cost=per_frame / reference,
+        alloc_bytes=measure_alloc_bytes(case),
+    )
+
+
+def load_baselines() -> dict[str, dict[str, float | int]]:
+    """Return the stored baselines keyed by case name."""
+    if not BASELINE_FILE.exists():
+        return {}
+    return json.loads(BASELINE_FILE.read_text())["codecs"]
+
+
+def baseline_python() -> str | None:
+    """Return the major.minor Python version the baselines were recorded with."""
+    if not BASELINE_FILE.exists():
+        return None
+    version: str = json.loads(BASELINE_FILE.read_text())["python"]
+    return ".".join(version.split(".")[:2])
+
+
+def save_baselines(results: Sequence[CodecResult]) -> None:
+    """Store ``results`` as the new baselines."""
+    content = {
+        "python": platform.python_version(),
+        "codecs": {result.name: result.as_baseline() for result in results},
+    }
+    BASELINE_FILE.write_text(json.dumps(content, indent=2, sort_keys=True) + "\n")
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Print a benchmark table and optionally store it as the baselines."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--update", action="store_true", help="rewrite codec_baselines.json")
+    args = parser.parse_args(argv)
+
+    baselines = load_baselines()
+    reference = reference_seconds()
+    results = [measure(case, reference) for case in build_cases()]
+
+    print(f"{'codec':32} {'frames/s':>12} {'rel. cost':>10} {'baseline':>9} {'bytes':>7}")
+    for result in results:
+        baseline = baselines.get(result.name, {}).get("relative_cost")
+        print(
+            f"{result.name:32} {result.frames_per_second:12,.0f} "
+            f"{result.relative_cost:10.2f} "
+            f"{baseline if baseline is not None else '-':>9} {result.alloc_bytes:7d}"
+        )
+
+    if args.update:
+        save_baselines(results)
+        print(f"Baselines written to {BASELINE_FILE}")
+
+
+if __name__ == "__main__":
+    main()
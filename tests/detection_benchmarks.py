@@ -0,0 +1,197 @@
+"""Throughput benchmark and rule hit distribution for bed type detection.
+
+The discovery callbacks and the config flow classify every advertisement they
+see. Each case below runs one classification entry point over the synthetic
+traffic corpus (see detection_corpus) and measures classifications per second
+and the cost relative to the reference workload of codec_benchmarks:
+
+- detect_uncached: the rule engine alone, bypassing the result cache;
+- detect_cached: detect_bed_type_detailed, cache starting empty, so the hit
+  rate is the one the traffic stream produces;
+- unsupported_reason: determine_unsupported_reason for every advertisement
+  that isn't detected as a bed.
+
+It also counts which rule decides each advertisement. That distribution is
+stored with the baselines and compared exactly, so the corpus doubles as a
+regression fixture for the rule table. To refresh the baselines after an
+intentional change, run from the repository root:
+
+    python -m tests.detection_benchmarks --update
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import platform
+from collections import Counter
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final
+
+from custom_components.adjustable_bed import detection
+from custom_components.adjustable_bed.detection import (
+    DETECTION_CACHE,
+    detect_bed_type_detailed,
+    determine_unsupported_reason,
+)
+
+from .codec_benchmarks import reference_seconds, seconds_per_call
+from .detection_corpus import ServiceInfo, traffic_corpus
+
+BASELINE_FILE: Final = Path(__file__).with_name("detection_baselines.json")
+
+# Distribution keys for advertisements no rule decides
+EXCLUDED: Final = "excluded"
+UNMATCHED: Final = "unmatched"
+
+
+@dataclass(frozen=True)
+class DetectionCase:
+    """One classification entry point fed with a list of advertisements."""
+
+    name: str
+    handler: Callable[[ServiceInfo], object]
+    advertisements: Sequence[ServiceInfo]
+    # Runs before every pass over the advertisements
+    setup: Callable[[], None] | None = None
+
+
+@dataclass(frozen=True)
+class DetectionBenchmarkResult:
+    """Measurements of one detection case."""
+
+    name: str
+    per_second: float
+    relative_cost: float
+
+
+def rule_key(service_info: ServiceInfo) -> str:
+    """Return the distribution key of the rule that decides an advertisement."""
+    result = detect_bed_type_detailed(service_info)
+    if result.signals and result.signals[0].startswith("excluded:"):
+        return EXCLUDED
+    index = detection._RULE_INDEX
+    rule, _ = index.evaluate(
+        index.advertisement(
+            service_info.address,
+            service_info.name,
+            service_info.service_uuids,
+            service_info.manufacturer_data,
+        )
+    )
+    if rule is None:
+        return UNMATCHED
+    return f"{rule.priority:04d} {rule.label}"
+
+
+def rule_hits(corpus: Sequence[ServiceInfo]) -> dict[str, int]:
+    """Return how many advertisements each rule decides."""
+    return dict(sorted(Counter(rule_key(service_info) for service_info in corpus).items()))
+
+
+def build_cases(corpus: Sequence[ServiceInfo]) -> list[DetectionCase]:
+    """Return the benchmarked entry points with their advertisements."""
+    unsupported = [
+        service_info
+        for service_info in corpus
+        if detect_bed_type_detailed(service_info).bed_type is None
+    ]
+    return [
+        DetectionCase("detect_uncached", detection._classify, corpus),
+        DetectionCase(
+            "detect_cached", detect_bed_type_detailed, corpus, setup=DETECTION_CACHE.clear
+        ),
+        DetectionCase("unsupported_reason", determine_unsupported_reason, unsupported),
+    ]
+
+
+def cache_hit_rate(corpus: Sequence[ServiceInfo]) -> float:
+    """Return the share of the stream answered by an initially empty cache."""
+    DETECTION_CACHE.clear()
+    for service_info in corpus:
+        detect_bed_type_detailed(service_info)
+    stats = DETECTION_CACHE.stats
+    DETECTION_CACHE.clear()
+    return stats["hits"] / (stats["hits"] + stats["misses"])
+
+
+def measure(case: DetectionCase, reference: float) -> DetectionBenchmarkResult:
+    """Benchmark one detection case."""
+    handler = case.handler
+    advertisements = case.advertisements
+    setup = case.setup
+
+    def _run() -> None:
+        if setup is not None:
+            setup()
+        for service_info in advertisements:
+            handler(service_info)
+
+    per_call = seconds_per_call(_run) / len(advertisements)
+    return DetectionBenchmarkResult(
+        name=case.name,
+        per_second=1 / per_call,
+        relative_cost=per_call / reference,
+    )
+
+
+def load_baselines() -> dict[str, dict]:
+    """Return the stored baselines: per-case costs and the rule hit counts."""
+    if not BASELINE_FILE.exists():
+        return {"cases": {}, "rule_hits": {}}
+    return json.loads(BASELINE_FILE.read_text())
+
+
+def save_baselines(
+    results: Sequence[DetectionBenchmarkResult], hits: dict[str, int]
+) -> None:
+    """Store ``results`` and ``hits`` as the new baselines."""
+    content = {
+        "python": platform.python_version(),
+        "cases": {
+            result.name: {"relative_cost": round(result.relative_cost, 3)} for result in results
+        },
+        "rule_hits": hits,
+    }
+    BASELINE_FILE.write_text(json.dumps(content, indent=2, sort_keys=True) + "\n")
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Print the benchmark and distribution and optionally store them."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--update", action="store_true", help="rewrite detection_baselines.json"
+    )
+    args = parser.parse_args(argv)
+    # Detection logs every bed it finds; keep handlers out of the timing
+    logging.disable(logging.CRITICAL)
+
+    baselines = load_baselines()["cases"]
+    corpus = traffic_corpus()
+    reference = reference_seconds()
+    results = [measure(case, reference) for case in build_cases(corpus)]
+    hits = rule_hits(corpus)
+
+    print(f"{len(corpus)} advertisements, cache hit rate {cache_hit_rate(corpus):.1%}")
+    print(f"{'case':24} {'per second':>12} {'rel. cost':>10} {'baseline':>9}")
+    for result in results:
+        baseline = baselines.get(result.name, {}).get("relative_cost")
+        print(
+            f"{result.name:24} {result.per_second:12,.0f} {result.relative_cost:10.2f} "
+            f"{baseline if baseline is not None else '-':>9}"
+        )
+
+    print(f"\n{'rule':72} {'hits':>7}")
+    for key, count in sorted(hits.items(), key=lambda item: -item[1]):
+        print(f"{key:72} {count:7d}")
+
+    if args.update:
+        save_baselines(results, hits)
+        print(f"Baselines written to {BASELINE_FILE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+"""Synthetic advertisement corpora for detection tests and benchmarks.
+
+Two corpora are built here, both deterministic:
+
+- coverage_corpus() walks every name pattern, UUID and manufacturer ID the
+  detection rules know, alone and combined. It is meant for exhaustive
+  comparisons, not for timing.
+- traffic_corpus() imitates what the Bluetooth discovery callbacks actually
+  see: a population of bed controllers (one or more for every bed signature
+  in the rule table) among phones, tags, audio devices, wearables, scales
+  and unnamed beacons. Devices advertise repeatedly in scan windows, with
+  manufacturer payloads that change between advertisements, so the stream
+  has the same locality real traffic has.
+"""
+
+from __future__ import annotations
+
+import itertools
+import random
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Final
+
+from custom_components.adjustable_bed.const import (
+    COOLBASE_NAME_PATTERNS,
+    DEWERTOKIN_NAME_PATTERNS,
+    ERGOMOTION_NAME_PATTERNS,
+    KEESON_NAME_PATTERNS,
+    LEGGETT_RICHMAT_NAME_PATTERNS,
+    MANUFACTURER_ID_DEWERTOKIN,
+    MANUFACTURER_ID_OKIN,
+    MANUFACTURER_ID_VIBRADORM,
+    OCTO_NAME_PATTERNS,
+    RICHMAT_NAME_PATTERNS,
+    SOLACE_NAME_PATTERNS,
+    SUTA_UNSUPPORTED_NAME_PREFIXES,
+)
+from custom_components.adjustable_bed.detection import (
+    DETECTION_RULES,
+    EXCLUDED_DEVICE_PATTERNS,
+    GENERIC_SHARED_SERVICE_UUIDS,
+)
+
+
+@dataclass
+class ServiceInfo:
+    """The advertisement fields detection reads."""
+
+    name: str | None
+    service_uuids: list[str] | None
+    manufacturer_data: dict[int, bytes] | None
+    address: str = "AA:BB:CC:DD:EE:FF"
+
+
+def _uuid16(short: int) -> str:
+    """Return the full UUID of a 16-bit Bluetooth SIG UUID."""
+    return f"0000{short:04x}-0000-1000-8000-00805f9b34fb"
+
+
+UNRELATED_UUID: Final = _uuid16(0x180F)
+
+CORPUS_UUIDS: Final = sorted(
+    {uuid for rule in DETECTION_RULES for uuid in rule.service_uuids}
+    | GENERIC_SHARED_SERVICE_UUIDS
+    | {UNRELATED_UUID}
+)
+
+MANUFACTURER_DATA: Final[list[dict[int, bytes] | None]] = [
+    None,
+    {},
+    {MANUFACTURER_ID_DEWERTOKIN: b"\x01"},
+    {MANUFACTURER_ID_VIBRADORM: b"\x01"},
+    {MANUFACTURER_ID_OKIN: b"\x01"},
+    {MANUFACTURER_ID_OKIN: b"\x01", MANUFACTURER_ID_VIBRADORM: b"\x02"},
+    {0x004C: b"\x02\x15"},
+]
+
+# Bed names that rules match through predicates rather than name patterns
+BED_NAMES: Final[tuple[str | None, ...]] = (
+    None,
+    "Bed 1696",
+    "QRRM157052",
+    "V1RM123456",
+    "MlRM100231",
+    "Sleep Function 2.0",
+    "S4-Y-192-461000AD",
+    "Solace HHC",
+    "Serta-i490350",
+    "Base-i5.1234",
+    "Smartbed 4E21",
+)
+
+# Manufacturer IDs of common non-bed devices
+_APPLE: Final = 0x004C
+_MICROSOFT: Final = 0x0006
+_SAMSUNG: Final = 0x0075
+_GOOGLE: Final = 0x00E0
+_HUAMI: Final = 0x0157
+_TILE: Final = 0x067C
+
+# (names, service UUIDs, manufacturer IDs, relative advertising rate)
+_NOISE_PROFILES: Final[
+    tuple[tuple[tuple[str | None, ...], tuple[str, ...], tuple[int, ...], int], ...]
+] = (
+    # Phones, tablets and laptops: mostly unnamed, chatty
+    ((None, None, "iPhone", "iPad"), (), (_APPLE,), 6),
+    ((None, "Galaxy S23", "Galaxy Tab S8"), (_uuid16(0xFD5A),), (_SAMSUNG,), 4),
+    ((None, "Pixel 8", "Pixel 7a"), (_uuid16(0xFE2C),), (_GOOGLE,), 4),
+    ((None, "Surface Laptop"), (), (_MICROSOFT,), 2),
+    # Trackers and tags
+    (("Tile", None), (_uuid16(0xFEED), _uuid16(0xFEEC)), (_TILE,), 2),
+    ((None,), (), (_APPLE,), 2),
+    (("Chipolo ONE", "SmartTag2"), (_uuid16(0xFE33),), (), 1),
+    # Audio
+    (("WH-1000XM5", "JBL Flip 6", "Bose QC45", "Sonos Roam"), (_uuid16(0xFE03),), (), 2),
+    # Health, fitness and mobility devices using generic UUIDs
+    (("Mi Smart Band 8", "Amazfit GTR 4"), (_uuid16(0xFEE0),), (_HUAMI,), 2),
+    (("Polar H10", "Heart Rate Sensor"), (_uuid16(0x180D), UNRELATED_UUID), (), 1),
+    ((None, "Thermometer"), (_uuid16(0x1809),), (), 1),
+    # Unnamed beacons with arbitrary services
+    ((None,), (_uuid16(0xFEAA),), (), 2),
+)
+
+
+def _corpus_names() -> list[str | None]:
+    """Return device names around every name pattern the rules know."""
+    patterns: set[str] = set(EXCLUDED_DEVICE_PATTERNS)
+    for rule in DETECTION_RULES:
+        patterns.update(rule.name_prefixes)
+        patterns.update(rule.name_contains)
+    patterns.update(
+        (
+            *COOLBASE_NAME_PATTERNS,
+            *DEWERTOKIN_NAME_PATTERNS,
+            *ERGOMOTION_NAME_PATTERNS,
+            *KEESON_NAME_PATTERNS,
+            *LEGGETT_RICHMAT_NAME_PATTERNS,
+            *OCTO_NAME_PATTERNS,
+            *RICHMAT_NAME_PATTERNS,
+            *SOLACE_NAME_PATTERNS,
+            *SUTA_UNSUPPORTED_NAME_PREFIXES,
+        )
+    )
+
+    names: set[str] = set()
+    for pattern in patterns:
+        names.update(
+            {
+                pattern,
+                pattern.upper(),
+                f"{pattern}1234",
+                f"My {pattern.title()} 2",
+                f"x{pattern}",
+                pattern[:-1],
+            }
+        )
+    names.update(name for name in BED_NAMES if name is not None)
+    names.update(
+        {
+            "bed 12a",
+            "Bed abc",
+            "A0RN0001",
+            "ZR10",
+            "MlRM1234",
+            "S2-Y-192-461000AD",
+            "suta-bed-01",
+            "SUTA-MOON",
+            "AA:BB:CC:DD:EE:FF",
+            "Smart Scale Bed",
+            "Linak Band",
+            "Nectar Okimat",
+            "Leggett Sleepy",
+            "hhc solace",
+            "iFlex Malouf",
+            "Unknown Device",
+            "",
+        }
+    )
+    return [None, *sorted(names)]
+
+
+def coverage_corpus() -> list[ServiceInfo]:
+    """Return a large set of advertisements around every rule condition."""
+    names = _corpus_names()
+    uuid_sets: list[list[str] | None] = [None, [], *([uuid] for uuid in CORPUS_UUIDS)]
+    corpus: list[ServiceInfo] = []
+
+    # Every name with no UUIDs, each single UUID and each manufacturer ID
+    for name, uuids in itertools.product(names, uuid_sets):
+        corpus.append(ServiceInfo(name, uuids, None))
+    for name, data in itertools.product(names, MANUFACTURER_DATA):
+        corpus.append(ServiceInfo(name, [], data))
+
+    # Every UUID pair in both orders under a handful of names
+    for first, second in itertools.permutations(CORPUS_UUIDS, 2):
+        for name in (None, "QRRM157052", "MlRM1234", "Sleepy Okin"):
+            corpus.append(ServiceInfo(name, [first, second], None))
+
+    # Random mixes, including upper-case UUIDs
+    rng = random.Random(20240613)
+    for _ in range(20000):
+        uuids = rng.sample(CORPUS_UUIDS, rng.randint(0, 4))
+        if rng.random() < 0.2:
+            uuids = [uuid.upper() for uuid in uuids]
+        corpus.append(ServiceInfo(rng.choice(names), uuids, rng.choice(MANUFACTURER_DATA)))
+    return corpus
+
+
+@dataclass(frozen=True)
+class _Device:
+    """A device in range and how often it advertises."""
+
+    address: str
+    name: str | None
+    service_uuids: tuple[str, ...]
+    manufacturer_ids: tuple[int, ...]
+    rate: int
+
+
+def _address(rng: random.Random) -> str:
+    """Return a random device address."""
+    return ":".join(f"{rng.randrange(256):02X}" for _ in range(6))
+
+
+def _bed_signatures() -> Iterator[tuple[str | None, tuple[str, ...], tuple[int, ...]]]:
+    """Yield (name, UUIDs, manufacturer IDs) for every bed-producing rule."""
+    for rule in DETECTION_RULES:
+        if not rule.terminal or rule.bed_type is None:
+            continue
+        patterns = sorted(rule.name_prefixes | rule.name_contains)
+        names: list[str | None] = (
+            [f"{pattern.title()}{index:03d}" for index, pattern in enumerate(patterns)]
+            if patterns
+            else list(BED_NAMES)
+        )
+        uuids = [(uuid,) for uuid in sorted(rule.service_uuids)] or [()]
+        manufacturer_ids = [(mid,) for mid in sorted(rule.manufacturer_ids)] or [()]
+        yield from itertools.product(names, uuids, manufacturer_ids)
+
+
+def _noise_device(rng: random.Random) -> _Device:
+    """Return a random non-bed device."""
+    if rng.random() < 0.2:
+        # Wearables, scales and scooters named after an excluded pattern,
+        # often on the same generic UUIDs beds use
+        pattern = rng.choice(EXCLUDED_DEVICE_PATTERNS)
+        uuids = rng.choice(((), (rng.choice(sorted(GENERIC_SHARED_SERVICE_UUIDS)),)))
+        return _Device(_address(rng), f"{pattern.title()} {rng.randrange(100)}", uuids, (), 1)
+    names, uuids, manufacturer_ids, rate = rng.choice(_NOISE_PROFILES)
+    return _Device(_address(rng), rng.choice(names), uuids, manufacturer_ids, rate)
+
+
+def traffic_corpus(
+    size: int = 50000,
+    noise_devices: int = 2000,
+    window: int = 1000,
+    devices_per_window: int = 80,
+    seed: int = 20240701,
+) -> list[ServiceInfo]:
+    """Return a stream of advertisements resembling Bluetooth discovery traffic.
+
+    Args:
+        size: Number of advertisements.
+        noise_devices: Number of non-bed devices in the population.
+        window: Advertisements per scan window.
+        devices_per_window: Non-bed devices in range during one scan window.
+            A few beds are in range too, and every bed signature is in range
+            in at least one window.
+        seed: Random seed; the same arguments always give the same stream.
+    """
+    rng = random.Random(seed)
+    beds = [
+        _Device(_address(rng), name, uuids, manufacturer_ids, 1)
+        for name, uuids, manufacturer_ids in _bed_signatures()
+    ]
+    noise = [_noise_device(rng) for _ in range(noise_devices)]
+    pending_beds = beds[:]
+    rng.shuffle(pending_beds)
+    # A few beds per window, enough to bring every signature in range once
+    windows = -(-size // window)
+    beds_per_window = max(8, -(-len(beds) // windows))
+
+    corpus: list[ServiceInfo] = []
+    while len(corpus) < size:
+        in_range_beds = [
+            pending_beds.pop() if pending_beds else rng.choice(beds)
+            for _ in range(beds_per_window)
+        ]
+        in_range = rng.sample(noise, devices_per_window) + in_range_beds
+        # Every bed in range advertises at least once
+        for device in in_range_beds:
+            corpus.append(_advertisement(rng, device))
+        count = min(window, size - len(corpus) + len(in_range_beds)) - len(in_range_beds)
+        weights = [device.rate for device in in_range]
+        for device in rng.choices(in_range, weights, k=max(count, 0)):
+            corpus.append(_advertisement(rng, device))
+    return corpus[:size]
+
+
+def _advertisement(rng: random.Random, device: _Device) -> ServiceInfo:
+    """Return one advertisement of ``device`` with a fresh payload."""
+    return ServiceInfo(
+        device.name,
+        list(device.service_uuids),
+        {mid: rng.randbytes(rng.randint(2, 12)) for mid in device.manufacturer_ids},
+        device.address,
+    )
@@ -0,0 +1,117 @@
+"""Import cost of the Richmat feature dict versus the compact table.
+
+Each case imports one way of looking up generated Richmat features in a fresh
+interpreter, after the modules every caller already has loaded, and reports:
+
+- import time (best of several fresh interpreters);
+- bytes still allocated afterwards (tracemalloc), i.e. what the lookup data
+  keeps alive;
+- growth of the process peak RSS across the import (ru_maxrss; coarse, KiB
+  on Linux).
+
+Run from the repository root:
+
+    python -m tests.richmat_table_benchmarks
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final
+
+REPO_ROOT: Final = Path(__file__).parent.parent
+RUNS: Final = 5
+
+# Imported before measuring; every lookup path needs them anyway
+_PRELUDE: Final = "import custom_components.adjustable_bed.const"
+
+CASES: Final = {
+    "generated_dict": (
+        "from custom_components.adjustable_bed.richmat_features import "
+        "RICHMAT_REMOTE_FEATURES_GENERATED as table\n"
+        "table['a0rm']"
+    ),
+    "compact_table": (
+        "from custom_components.adjustable_bed.richmat_feature_table import "
+        "lookup_richmat_features\n"
+        "lookup_richmat_features('a0rm')"
+    ),
+}
+
+_PROBE: Final = """
+import json, resource, sys, time, tracemalloc
+{prelude}
+trace = sys.argv[1] == "memory"
+rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+if trace:
+    tracemalloc.start()
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+allocated = tracemalloc.get_traced_memory()[0] if trace else 0
+rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{
+    "seconds": elapsed,
+    "allocated_bytes": allocated,
+    "rss_kib": rss_after - rss_before,
+    "modules": sorted(name for name in sys.modules if "richmat" in name),
+}}))
+"""
+
+
+@dataclass(frozen=True)
+class ImportCost:
+    """Measured cost of one lookup path."""
+
+    name: str
+    seconds: float
+    allocated_bytes: int
+    rss_kib: int
+    modules: tuple[str, ...]
+
+
+def _probe(statement: str, mode: str) -> dict:
+    """Run ``statement`` in a fresh interpreter and return its measurements."""
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(prelude=_PRELUDE, statement=statement), mode],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def measure(name: str, runs: int = RUNS) -> ImportCost:
+    """Measure one case; timing and allocations come from separate runs."""
+    statement = CASES[name]
+    # The first run may compile bytecode; don't time it
+    _probe(statement, "time")
+    timings = [_probe(statement, "time") for _ in range(runs)]
+    memory = _probe(statement, "memory")
+    return ImportCost(
+        name=name,
+        seconds=min(timing["seconds"] for timing in timings),
+        allocated_bytes=memory["allocated_bytes"],
+        rss_kib=max(timing["rss_kib"] for timing in timings),
+        modules=tuple(memory["modules"]),
+    )
+
+
+def main() -> None:
+    """Print the import cost of every case."""
+    results = [measure(name) for name in CASES]
+    print(f"{'case':16} {'import ms':>10} {'allocated':>10} {'peak RSS':>9}")
+    for result in results:
+        print(
+            f"{result.name:16} {result.seconds * 1000:10.2f} "
+            f"{result.allocated_bytes:10,d} {result.rss_kib:7d}Ki"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Tests for history-weighted adapter selection."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.adjustable_bed.adapter import AdapterScorer, select_adapter
+
+from .conftest import TEST_ADDRESS
+
+
+def _scanner_device(source: str, rssi: int) -> MagicMock:
+    scanner_device = MagicMock()
+    scanner_device.scanner.source = source
+    scanner_device.advertisement.rssi = rssi
+    scanner_device.ble_device = MagicMock(name=f"device_{source}")
+    return scanner_device
+
+
+class TestAdapterScorer:
+    """Test expected time-to-connect scoring."""
+
+    def test_prior_prefers_stronger_signal(self):
+        """Without history, a stronger RSSI should score better."""
+        scorer = AdapterScorer()
+
+        assert scorer.expected_connect_time("proxy_1", -60) < scorer.expected_connect_time(
+            "proxy_2", -85
+        )
+
+    def test_history_outweighs_rssi(self):
+        """An adapter that keeps failing should lose to a weaker one that connects."""
+        scorer = AdapterScorer()
+        for _ in range(5):
+            scorer.record("proxy_1", False, 20.0)
+            scorer.record("proxy_2", True, 2.0)
+
+        assert scorer.expected_connect_time("proxy_2", -85) < scorer.expected_connect_time(
+            "proxy_1", -60
+        )
+
+    def test_rssi_is_smoothed(self):
+        """A single outlier sample should only move the smoothed RSSI partially."""
+        scorer = AdapterScorer()
+        scorer.observe(TEST_ADDRESS, "proxy_1", -80)
+
+        assert -80 < scorer.observe(TEST_ADDRESS, "proxy_1", -50) < -60
+
+
+class TestSelectAdapter:
+    """Test select_adapter with the per-address scanner index."""
+
+    async def test_auto_mode_uses_connection_history(self, hass: HomeAssistant):
+        """Auto mode should pick the adapter with the best expected connect time."""
+        strong = _scanner_device("proxy_1", -55)
+        weak = _scanner_device("proxy_2", -80)
+        scorer = AdapterScorer()
+        for _ in range(5):
+            scorer.record("proxy_1", False, 25.0)
+            scorer.record("proxy_2", True, 3.0)
+
+        with patch(
+            "custom_components.adjustable_bed.adapter.bluetooth.async_scanner_devices_by_address",
+            return_value=[strong, weak],
+        ):
+            result = await select_adapter(hass, TEST_ADDRESS, None, scorer)
+
+        assert result.source == "proxy_2"
+        assert result.device is weak.ble_device
+        assert result.rssi == -80
+        assert len(result.available_sources) == 2
+
+    async def test_auto_mode_without_scorer_uses_rssi(self, hass: HomeAssistant):
+        """Without a scorer the strongest signal should win."""
+        strong = _scanner_device("proxy_1", -55)
+        weak = _scanner_device("proxy_2", -80)
+
+        with patch(
+            "custom_components.adjustable_bed.adapter.bluetooth.async_scanner_devices_by_address",
+            return_value=[weak, strong],
+        ):
+            result = await select_adapter(hass, TEST_ADDRESS, None)
+
+        assert result.source == "proxy_1"
+
+    async def test_preferred_adapter_wins(self, hass: HomeAssistant):
+        """A configured adapter that sees the bed should be used regardless of score."""
+        strong = _scanner_device("proxy_1", -55)
+        weak = _scanner_device("proxy_2", -80)
+
+        with patch(
+            "custom_components.adjustable_bed.adapter.bluetooth.async_scanner_devices_by_address",
+            return_value=[strong, weak],
+        ):
+            result = await select_adapter(hass, TEST_ADDRESS, "proxy_2", AdapterScorer())
+
+        assert result.source == "proxy_2"
@@ -0,0 +1,146 @@
+"""Tests for driving several beds together."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+import pytest
+
+from custom_components.adjustable_bed.bed_group import BedGroup
+
+
+class FakeCoordinator:
+    """A bed coordinator with a controllable connect time."""
+
+    def __init__(self, name: str, connect_delay: float = 0.0) -> None:
+        self.name = name
+        self.connect_delay = connect_delay
+        self.position_data: dict[str, float] = {}
+        self.group_runs: list[dict[str, Any]] = []
+        self.first_pulses: dict[float, float] = {}
+        self.connects = 0
+
+    def first_pulse_at(self, anchor: float) -> float | None:
+        return self.first_pulses.get(anchor)
+
+    def note_group_run(self, stats: dict[str, Any]) -> None:
+        self.group_runs.append(stats)
+
+    async def async_prepare_command(self) -> bool:
+        await asyncio.sleep(self.connect_delay)
+        self.connects += 1
+        return True
+
+
+class TestBedGroup:
+    """Test concurrent, aligned execution across members."""
+
+    async def test_members_start_together_after_slow_connect(self):
+        """A slow connect on one half should not delay the other half's start."""
+        left = FakeCoordinator("left")
+        right = FakeCoordinator("right", connect_delay=0.05)
+        starts: dict[str, float] = {}
+        anchors: dict[str, float | None] = {}
+
+        async def command(coord: FakeCoordinator, anchor: float | None) -> None:
+            starts[coord.name] = time.monotonic()
+            anchors[coord.name] = anchor
+            assert anchor is not None
+            coord.first_pulses[anchor] = time.monotonic()
+            await asyncio.sleep(0.05)
+
+        group = BedGroup([left, right], start_lead=0.01)
+        begin = time.monotonic()
+        await group.async_run(command)  # type: ignore[arg-type]
+        elapsed = time.monotonic() - begin
+
+        assert left.connects == right.connects == 1
+        assert abs(starts["left"] - starts["right"]) < 0.01
+        # Concurrent: connect + one command, not two commands back to back
+        assert elapsed < 0.15
+        # Both commands were given the same start deadline as pulse anchor
+        assert anchors["left"] is not None
+        assert anchors["left"] == anchors["right"]
+
+    async def test_single_member_runs_directly(self):
+        """A one-bed group runs the command without connecting or anchoring."""
+        bed = FakeCoordinator("bed")
+        seen: list[float | None] = []
+
+        async def command(coord: FakeCoordinator, anchor: float | None) -> None:
+            seen.append(anchor)
+
+        await BedGroup([bed, bed]).async_run(command)  # type: ignore[arg-type,list-item]
+
+        assert seen == [None]
+        assert bed.connects == 0
+        assert bed.group_runs == []
+
+    async def test_failure_is_raised_after_all_members_finish(self):
+        """One failing half must not abandon the other mid-move."""
+        left = FakeCoordinator("left")
+        right = FakeCoordinator("right")
+        finished: list[str] = []
+
+        async def command(coord: FakeCoordinator, anchor: float | None) -> None:
+            if coord is left:
+                raise ConnectionError("Not connected to bed")
+            await asyncio.sleep(0.01)
+            finished.append(coord.name)
+
+        with pytest.raises(ConnectionError):
+            await BedGroup([left, right], start_lead=0).async_run(command)  # type: ignore[arg-type]
+
+        assert finished == ["right"]
+        assert len(left.group_runs) == len(right.group_runs) == 1
+
+    async def test_run_summary_is_kept_by_every_member(self):
+        """Members keep the start skew and the aggregated positions of the run."""
+        left = FakeCoordinator("left")
+        right = FakeCoordinator("right")
+        left.position_data = {"back": 30.0, "legs": 10.0, "head": 5.0}
+        right.position_data = {"back": 40.0, "legs": 10.0}
+
+        async def command(coord: FakeCoordinator, anchor: float | None) -> None:
+            assert anchor is not None
+            coord.first_pulses[anchor] = anchor + 0.002
+
+        await BedGroup([left, right], start_lead=0).async_run(command)  # type: ignore[arg-type]
+
+        assert left.group_runs == right.group_runs
+        stats = left.group_runs[0]
+        assert stats["members"] == ["left", "right"]
+        assert stats["start_skew_ms"] == 0.0
+        assert stats["positions"] == {"back": 35.0, "legs": 10.0}
+        assert stats["position_spread"] == {"back": 10.0, "legs": 0.0}
+
+    async def test_skew_is_measured_from_first_pulses(self):
+        """Start skew covers queue wait and write latency up to the first pulse."""
+        left = FakeCoordinator("left")
+        right = FakeCoordinator("right")
+
+        async def command(coord: FakeCoordinator, anchor: float | None) -> None:
+            assert anchor is not None
+            # The right half waited 30ms for its command slot before writing
+            coord.first_pulses[anchor] = anchor + (0.03 if coord is right else 0.0)
+
+        group = BedGroup([left, right], start_lead=0)
+        await group.async_run(command)  # type: ignore[arg-type]
+
+        assert group.last_start_skew_ms == pytest.approx(30.0)
+
+    async def test_no_skew_without_pulses(self):
+        """Commands that sent no pulse train (e.g. stop) report no skew."""
+        left = FakeCoordinator("left")
+        right = FakeCoordinator("right")
+
+        async def command(coord: FakeCoordinator, anchor: float | None) -> None:
+            pass
+
+        group = BedGroup([left, right], start_lead=0)
+        await group.async_run(command)  # type: ignore[arg-type]
+
+        assert group.last_start_skew_ms is None
+        assert left.group_runs[0]["start_skew_ms"] is None
@@ -0,0 +1,296 @@
+"""End-to-end timing tests against simulated beds."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Generator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from bleak.exc import BleakError
+from homeassistant.const import CONF_ADDRESS, CONF_NAME
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.adjustable_bed.beds.linak import LinakCommands
+from custom_components.adjustable_bed.beds.reverie import ReverieCommands
+from custom_components.adjustable_bed.const import (
+    BED_TYPE_ERGOMOTION,
+    BED_TYPE_JENSEN,
+    BED_TYPE_LIMOSS,
+    BED_TYPE_LINAK,
+    BED_TYPE_OCTO,
+    BED_TYPE_REVERIE,
+    CONF_BED_TYPE,
+    CONF_DISABLE_ANGLE_SENSING,
+    CONF_HAS_MASSAGE,
+    CONF_MOTOR_COUNT,
+    CONF_OCTO_PIN,
+    CONF_PREFERRED_ADAPTER,
+    DOMAIN,
+    LINAK_LEG_MAX_POSITION,
+    POSITION_OVERSHOOT_TOLERANCE,
+)
+from custom_components.adjustable_bed.coordinator import AdjustableBedCoordinator
+
+from .ble_simulator import (
+    JensenBed,
+    KeesonBed,
+    LimossBed,
+    LinakBed,
+    LinkProfile,
+    OctoBed,
+    ReverieBed,
+    SimulatedBed,
+    SimulatedBleakClient,
+)
+from .conftest import TEST_ADDRESS, TEST_NAME
+
+ConnectSimulated = Callable[..., SimulatedBleakClient]
+
+
+def _entry(hass: HomeAssistant, bed_type: str, angle_sensing: bool = False, **data) -> MockConfigEntry:
+    """Add a config entry for a simulated bed."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title=TEST_NAME,
+        data={
+            CONF_ADDRESS: TEST_ADDRESS,
+            CONF_NAME: TEST_NAME,
+            CONF_BED_TYPE: bed_type,
+            CONF_MOTOR_COUNT: 2,
+            CONF_HAS_MASSAGE: False,
+            CONF_DISABLE_ANGLE_SENSING: not angle_sensing,
+            CONF_PREFERRED_ADAPTER: "auto",
+            **data,
+        },
+        unique_id=TEST_ADDRESS,
+        entry_id=f"simulated_{bed_type}",
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+@pytest.fixture
+def connect_simulated(
+    mock_async_ble_device_from_address: MagicMock,
+    mock_bluetooth_adapters: None,
+) -> Generator[ConnectSimulated]:
+    """Return a helper that makes coordinators connect to a simulated bed."""
+    del mock_async_ble_device_from_address, mock_bluetooth_adapters
+    with patch(
+        "custom_components.adjustable_bed.coordinator.establish_connection",
+        new_callable=AsyncMock,
+    ) as establish:
+
+        def _use(bed: SimulatedBed, profile: LinkProfile | None = None) -> SimulatedBleakClient:
+            client = SimulatedBleakClient(bed, profile)
+            establish.return_value = client
+            return client
+
+        yield _use
+
+
+class TestSimulatedLinak:
+    """Linak timing against the simulated frame."""
+
+    async def test_pulse_period_absorbs_write_latency(
+        self, hass: HomeAssistant, connect_simulated: ConnectSimulated
+    ):
+        """Pulses stay on the 100ms timeline despite a slow, jittery link."""
+        bed = LinakBed(travel_time=2.0)
+        client = connect_simulated(bed, LinkProfile(write_latency=0.03, jitter=0.01, seed=1))
+        coordinator = AdjustableBedCoordinator(hass, _entry(hass, BED_TYPE_LINAK))
+        await coordinator.async_connect()
+
+        await coordinator.controller.move_back_up()
+
+        intervals = client.pulse_intervals(LinakCommands.MOVE_BACK_UP)
+        assert len(intervals) == 14
+        assert sum(intervals) / len(intervals) == pytest.approx(0.1, abs=0.015)
+        assert bed.positions()["back"] > 0
+        assert not bed.rejected_frames
+
+        await coordinator.async_disconnect()
+
+    async def test_reads_and_writes_never_overlap(
+        self, hass: HomeAssistant, connect_simulated: ConnectSimulated
+    ):
+        """The BLE lock keeps position reads out of a running pulse train."""
+        bed = LinakBed(travel_time=2.0)
+        client = connect_simulated(bed, LinkProfile(write_latency=0.02, reject_concurrent=True))
+        coordinator = AdjustableBedCoordinator(hass, _entry(hass, BED_TYPE_LINAK))
+        await coordinator.async_connect()
+        controller = coordinator.controller
+
+        await asyncio.gather(controller.move_legs_up(), controller.read_positions(2))
+
+        assert client.overlapping_ops == 0
+        assert client.reads >= 1
+
+        await coordinator.async_disconnect()
+
+    async def test_seek_stops_near_target(
+        self, hass: HomeAssistant, connect_simulated: ConnectSimulated
+    ):
+        """A notification-driven seek ends within the overshoot tolerance."""
+        bed = LinakBed(travel_time=6.0)
+        connect_simulated(bed, LinkProfile(write_latency=0.01))
+        coordinator = AdjustableBedCoordinator(
+            hass, _entry(hass, BED_TYPE_LINAK, angle_sensing=True)
+        )
+        await coordinator.async_connect()
+        assert "legs" in coordinator.controller.notifying_position_keys
+
+        await coordinator.async_seek_position(
+            "legs",
+            20.0,
+            lambda ctrl: ctrl.move_legs_up(),
+            lambda ctrl: ctrl.move_legs_down(),
+            lambda ctrl: ctrl.move_legs_stop(),
+        )
+        await asyncio.sleep(bed.hold_time)
+
+        angle = bed.positions()["legs"] / LINAK_LEG_MAX_POSITION * coordinator.legs_max_angle
+        assert abs(angle - 20.0) <= POSITION_OVERSHOOT_TOLERANCE
+
+        await coordinator.async_disconnect()
+
+
+class TestSimulatedProtocols:
+    """Each simulated protocol round-trips through its real controller."""
+
+    async def test_ergomotion_status_notifications(
+        self, hass: HomeAssistant, connect_simulated: ConnectSimulated
+    ):
+        """Pushed ED status messages track the head motor while it moves."""
+        bed = KeesonBed(travel_time=2.0)
+        connect_simulated(bed)
+        coordinator = AdjustableBedCoordinator(
+            hass, _entry(hass, BED_TYPE_ERGOMOTION, angle_sensing=True)
+        )
+        await coordinator.async_connect()
+
+        await coordinator.controller.move_head_up()
+        await asyncio.sleep(2 * bed.notify_interval)
+
+        assert bed.positions()["head"] > 0
+        assert coordinator.position_data["back"] == pytest.approx(bed.positions()["head"], abs=1)
+        assert not bed.rejected_frames
+
+        await coordinator.async_disconnect()
+
+    async def test_octo_pin_unlocks_motion(
+        self, hass: HomeAssistant, connect_simulated: ConnectSimulated
+    ):
+        """Feature discovery finds the PIN and the bed moves once it is sent."""
+        bed = OctoBed(travel_time=2.0, pin="1234", memory_slots=2)
+        connect_simulated(bed)
+        coordinator = AdjustableBedCoordinator(
+            hass, _entry(hass, BED_TYPE_OCTO, **{CONF_OCTO_PIN: "1234"})
+        )
+        await coordinator.async_connect()
+
+        assert coordinator.controller.supports_lights
+        assert coordinator.controller.memory_slot_count == 2
+
+        await coordinator.controller.move_head_up()
+
+        assert bed.positions()["head"] > 0
+        assert not bed.rejected_frames
+
+        await coordinator.async_disconnect()
+
+    async def test_octo_wrong_pin_is_ignored(
+        self, hass: HomeAssistant, connect_simulated: ConnectSimulated
+    ):
+        """A locked bed drops motor packets."""
+        bed = OctoBed(travel_time=2.0, pin="1234")
+        connect_simulated(bed)
+        coordinator = AdjustableBedCoordinator(
+            hass, _entry(hass, BED_TYPE_OCTO, **{CONF_OCTO_PIN: "9999"})
+        )
+        await coordinator.async_connect()
+
+        await coordinator.controller.move_head_up()
+
+        assert bed.positions()["head"] == 0
+        assert bed.rejected_frames
+
+        await coordinator.async_disconnect()
+
+    async def test_limoss_capabilities_and_positions(
+        self, hass: HomeAssistant, connect_simulated: ConnectSimulated
+    ):
+        """Encrypted capability and position responses are decoded."""
+        bed = LimossBed(memory_slots=2)
+        bed.set_position("back", 8000)
+        connect_simulated(bed)
+        coordinator = AdjustableBedCoordinator(
+            hass, _entry(hass, BED_TYPE_LIMOSS, angle_sensing=True)
+        )
+        await coordinator.async_connect()
+
+        assert coordinator.controller.memory_slot_count == 2
+        assert coordinator.position_data["back"] == pytest.approx(
+            coordinator.back_max_angle / 2, abs=0.5
+        )
+        assert not bed.rejected_frames
+
+        await coordinator.async_disconnect()
+
+    async def test_jensen_unlock_config_and_positions(
+        self, hass: HomeAssistant, connect_simulated: ConnectSimulated
+    ):
+        """The PIN is sent before config and position queries are accepted."""
+        bed = JensenBed(features=0x45)
+        bed.set_position("head", 15250)
+        connect_simulated(bed)
+        coordinator = AdjustableBedCoordinator(
+            hass, _entry(hass, BED_TYPE_JENSEN, angle_sensing=True)
+        )
+        await coordinator.async_connect()
+
+        assert bed.unlocked
+        assert coordinator.controller.supports_lights
+        assert coordinator.position_data["back"] == pytest.approx(50, abs=0.5)
+        assert not bed.rejected_frames
+
+        await coordinator.async_disconnect()
+
+    async def test_reverie_absolute_position(
+        self, hass: HomeAssistant, connect_simulated: ConnectSimulated
+    ):
+        """A head target frame moves the motor and its notifications follow."""
+        bed = ReverieBed(travel_time=1.0)
+        connect_simulated(bed)
+        coordinator = AdjustableBedCoordinator(
+            hass, _entry(hass, BED_TYPE_REVERIE, angle_sensing=True)
+        )
+        await coordinator.async_connect()
+        controller = coordinator.controller
+
+        await controller.write_command(controller._build_command(ReverieCommands.motor_head(40)))
+        await asyncio.sleep(0.5 + 2 * bed.notify_interval)
+
+        assert bed.positions()["head"] == 40
+        assert coordinator.position_data["back"] == pytest.approx(40 * 0.6)
+
+        await coordinator.async_disconnect()
+
+    async def test_dropped_writes_surface_as_errors(
+        self, hass: HomeAssistant, connect_simulated: ConnectSimulated
+    ):
+        """Lost writes with response raise instead of silently moving nothing."""
+        bed = LinakBed()
+        client = connect_simulated(bed, LinkProfile(drop_rate=1.0))
+        coordinator = AdjustableBedCoordinator(hass, _entry(hass, BED_TYPE_LINAK))
+        await coordinator.async_connect()
+
+        with pytest.raises(BleakError, match="Simulated write failure"):
+            await coordinator.controller.write_command(LinakCommands.MOVE_BACK_UP)
+
+        assert client.dropped >= 1
+        assert not bed.frames
+
+        await coordinator.async_disconnect()
@@ -0,0 +1,79 @@
+"""Regression checks for protocol codec throughput and allocations."""
+
+from __future__ import annotations
+
+import os
+import platform
+
+import pytest
+
+from .codec_benchmarks import (
+    ALLOCATION_REGRESSION,
+    ALLOCATION_SLACK_BYTES,
+    THROUGHPUT_REGRESSION,
+    CodecCase,
+    baseline_python,
+    build_cases,
+    load_baselines,
+    measure,
+    measure_alloc_bytes,
+    reference_seconds,
+)
+
+CASES = {case.name: case for case in build_cases()}
+BASELINES = load_baselines()
+
+# Timing is only meaningful on a quiet machine, so throughput checks are opt-in
+run_throughput = pytest.mark.skipif(
+    not os.environ.get("ADJUSTABLE_BED_BENCHMARK"),
+    reason="set ADJUSTABLE_BED_BENCHMARK=1 to run throughput benchmarks",
+)
+
+# Allocation sizes change between Python releases; only compare them on the
+# release the baselines were recorded with
+same_python = pytest.mark.skipif(
+    baseline_python() != ".".join(platform.python_version_tuple()[:2]),
+    reason=f"allocation baselines were recorded on Python {baseline_python()}",
+)
+
+
+@pytest.fixture(scope="module")
+def reference() -> float:
+    """Return the reference workload time per frame on this machine."""
+    return reference_seconds()
+
+
+def test_every_case_has_a_baseline() -> None:
+    """Baselines cover exactly the benchmarked codecs."""
+    assert set(BASELINES) == set(CASES)
+
+
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_codec_handles_its_frames(name: str) -> None:
+    """Benchmark frames are valid input, not an error path."""
+    case: CodecCase = CASES[name]
+    results = [case.handler(frame) for frame in case.frames]
+    if name == "octo_parse_response_packet":
+        assert all(result is not None for result in results)
+
+
+@same_python
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_allocations_within_baseline(name: str) -> None:
+    """Allocated bytes per frame don't grow past the regression threshold."""
+    allowed = BASELINES[name]["alloc_bytes"] * ALLOCATION_REGRESSION + ALLOCATION_SLACK_BYTES
+    assert measure_alloc_bytes(CASES[name]) <= allowed
+
+
+@pytest.mark.benchmark
+@run_throughput
+@pytest.mark.xdist_group("benchmark")
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_throughput_within_baseline(name: str, reference: float) -> None:
+    """Per-frame cost relative to the reference doesn't regress."""
+    result = measure(CASES[name], reference)
+    allowed = BASELINES[name]["relative_cost"] * THROUGHPUT_REGRESSION
+    assert result.relative_cost <= allowed, (
+        f"{name}: {result.frames_per_second:,.0f} frames/s, "
+        f"relative cost {result.relative_cost:.2f} > {allowed:.2f}"
+    )
@@ -0,0 +1,174 @@
+"""Tests for the priority command queue."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.adjustable_bed.command_queue import CommandPriority, CommandQueue
+from custom_components.adjustable_bed.coordinator import AdjustableBedCoordinator
+
+
+async def _hold(queue: CommandQueue, release: asyncio.Event) -> None:
+    """Hold the queue slot until release is set."""
+    async with queue.slot(CommandPriority.MOTOR):
+        await release.wait()
+
+
+class TestCommandQueue:
+    """Test CommandQueue ordering, coalescing and superseding."""
+
+    async def test_grants_by_priority_then_arrival(self):
+        """Waiting commands should run highest priority first, FIFO within a priority."""
+        queue = CommandQueue()
+        release = asyncio.Event()
+        holder = asyncio.create_task(_hold(queue, release))
+        await asyncio.sleep(0)
+        order: list[str] = []
+
+        async def job(name: str, priority: CommandPriority) -> None:
+            async with queue.slot(priority):
+                order.append(name)
+
+        tasks = [
+            asyncio.create_task(job("keepalive", CommandPriority.BACKGROUND)),
+            asyncio.create_task(job("light", CommandPriority.ACCESSORY)),
+            asyncio.create_task(job("preset", CommandPriority.PRESET)),
+            asyncio.create_task(job("motor_1", CommandPriority.MOTOR)),
+            asyncio.create_task(job("motor_2", CommandPriority.MOTOR)),
+            asyncio.create_task(job("stop", CommandPriority.STOP)),
+        ]
+        await asyncio.sleep(0)
+        assert queue.depth == 6
+
+        release.set()
+        await asyncio.gather(holder, *tasks)
+
+        assert order == ["stop", "motor_1", "motor_2", "preset", "light", "keepalive"]
+        assert queue.depth == 0
+        assert not queue.locked()
+
+    async def test_identical_queued_commands_coalesce(self):
+        """A second identical command should join the queued one instead of running."""
+        queue = CommandQueue()
+        release = asyncio.Event()
+        holder = asyncio.create_task(_hold(queue, release))
+        await asyncio.sleep(0)
+        runs = 0
+        skipped = 0
+
+        async def press() -> None:
+            nonlocal runs, skipped
+            async with queue.slot(CommandPriority.ACCESSORY, key="button:toggle_light") as ticket:
+                if ticket.skipped:
+                    skipped += 1
+                    return
+                runs += 1
+
+        presses = [asyncio.create_task(press()) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(holder, *presses)
+
+        assert runs == 1
+        assert skipped == 2
+        assert queue.stats()["coalesced"] == 2
+
+    async def test_superseded_command_never_runs(self):
+        """A newer command with supersede=True should reject the queued one."""
+        queue = CommandQueue()
+        release = asyncio.Event()
+        holder = asyncio.create_task(_hold(queue, release))
+        await asyncio.sleep(0)
+        targets: list[int] = []
+
+        async def seek(target: int) -> bool:
+            async with queue.slot(CommandPriority.MOTOR, key="seek:back", supersede=True) as ticket:
+                if ticket.superseded:
+                    return False
+                targets.append(target)
+                return True
+
+        old = asyncio.create_task(seek(30))
+        await asyncio.sleep(0)
+        new = asyncio.create_task(seek(60))
+        await asyncio.sleep(0)
+
+        # The old seek is rejected right away, without waiting for the slot
+        assert await old is False
+        release.set()
+        await asyncio.gather(holder, new)
+
+        assert targets == [60]
+        assert queue.stats()["superseded"] == 1
+
+    async def test_cancelled_waiter_leaves_queue(self):
+        """A waiter cancelled before its turn should not block later commands."""
+        queue = CommandQueue()
+        release = asyncio.Event()
+        holder = asyncio.create_task(_hold(queue, release))
+        await asyncio.sleep(0)
+
+        async def job() -> None:
+            async with queue.slot(CommandPriority.PRESET):
+                pass
+
+        waiter = asyncio.create_task(job())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+
+        assert queue.depth == 0
+        release.set()
+        await holder
+        assert not queue.locked()
+
+
+class TestCoordinatorCommandQueue:
+    """Test command queue integration in the coordinator."""
+
+    async def test_stop_jumps_ahead_of_queued_commands(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry,
+        mock_coordinator_connected,
+        mock_bleak_client: MagicMock,
+    ):
+        """Stop should run first and drop commands that queued before it as stale."""
+        coordinator = AdjustableBedCoordinator(hass, mock_config_entry)
+        await coordinator.async_connect()
+        order: list[str] = []
+
+        async def light(controller) -> None:
+            order.append("light")
+
+        original_stop = coordinator.controller.stop_all
+
+        async def tracked_stop() -> None:
+            order.append("stop")
+            await original_stop()
+
+        coordinator.controller.stop_all = tracked_stop
+
+        async with coordinator._command_lock:
+            lights = [
+                asyncio.create_task(
+                    coordinator.async_execute_controller_command(
+                        light, cancel_running=False, priority=CommandPriority.ACCESSORY
+                    )
+                )
+                for _ in range(2)
+            ]
+            await asyncio.sleep(0)
+            stop = asyncio.create_task(coordinator.async_stop_command())
+            await asyncio.sleep(0)
+            assert coordinator.command_queue_stats["depth"] == 3
+
+        await asyncio.gather(stop, *lights)
+
+        assert order == ["stop"]
+        assert coordinator.command_queue_stats["depth"] == 0
+
+        await coordinator.async_disconnect()
@@ -0,0 +1,174 @@
+"""Tests for per-adapter connection slot leases."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+from habluetooth import HaBluetoothSlotAllocations
+from homeassistant.core import HomeAssistant
+
+from custom_components.adjustable_bed.connection_slots import (
+    SLOT_DEFAULT_CAPACITY,
+    ConnectionSlotScheduler,
+    SlotPriority,
+)
+
+
+class FakeBed:
+    """A slot holder with a controllable idle time."""
+
+    def __init__(self, name: str, idle: float | None = None, address: str = "") -> None:
+        self.name = name
+        self.address = address
+        self.idle = idle
+        self.scheduler: ConnectionSlotScheduler | None = None
+        self.released = False
+
+    def slot_idle_seconds(self) -> float | None:
+        return self.idle
+
+    async def async_release_slot(self) -> None:
+        self.released = True
+        assert self.scheduler is not None
+        self.scheduler.release(self)
+
+
+def _scheduler(hass: HomeAssistant) -> ConnectionSlotScheduler:
+    return ConnectionSlotScheduler(hass)
+
+
+def _manager(*allocations: HaBluetoothSlotAllocations) -> MagicMock:
+    manager = MagicMock()
+    manager.async_current_allocations.return_value = list(allocations)
+    return manager
+
+
+class TestConnectionSlotScheduler:
+    """Test lease queueing and preemption."""
+
+    async def test_waiters_are_served_by_priority(self, hass: HomeAssistant):
+        """A freed slot should go to the waiting user command before background work."""
+        scheduler = _scheduler(hass)
+        holder = FakeBed("holder")
+        background = FakeBed("background")
+        user = FakeBed("user")
+        granted: list[str] = []
+
+        async def acquire(bed: FakeBed, priority: SlotPriority) -> None:
+            await scheduler.async_acquire("proxy", bed, priority)
+            granted.append(bed.name)
+
+        with patch.object(scheduler, "capacity", return_value=1):
+            assert await scheduler.async_acquire("proxy", holder, SlotPriority.USER) == 0.0
+            background_task = asyncio.create_task(acquire(background, SlotPriority.BACKGROUND))
+            user_task = asyncio.create_task(acquire(user, SlotPriority.USER))
+            await asyncio.sleep(0)
+            assert scheduler.as_dict()["proxy"]["waiting"] == 2
+
+            scheduler.release(holder)
+            await user_task
+            assert granted == ["user"]
+
+            scheduler.release(user)
+            await background_task
+
+        assert granted == ["user", "background"]
+        stats = scheduler.as_dict()["proxy"]
+        assert stats["grants"] == 3
+        assert stats["waits"] == 2
+        assert stats["mean_wait_ms"] is not None
+
+    async def test_user_request_preempts_idle_connection(self, hass: HomeAssistant):
+        """A user command should free the slot of the longest idle keep-alive."""
+        scheduler = _scheduler(hass)
+        busy = FakeBed("busy", idle=None)
+        idle = FakeBed("idle", idle=120.0)
+        idle.scheduler = scheduler
+        user = FakeBed("user")
+
+        with patch.object(scheduler, "capacity", return_value=2):
+            await scheduler.async_acquire("proxy", busy, SlotPriority.BACKGROUND)
+            await scheduler.async_acquire("proxy", idle, SlotPriority.KEEPALIVE)
+            await scheduler.async_acquire("proxy", user, SlotPriority.USER)
+
+        assert idle.released
+        assert not busy.released
+        stats = scheduler.as_dict()["proxy"]
+        assert stats["leases"] == ["busy", "user"]
+        assert stats["preemptions"] == 1
+
+    async def test_background_request_does_not_preempt(self, hass: HomeAssistant):
+        """Background work should wait rather than disconnect another bed."""
+        scheduler = _scheduler(hass)
+        idle = FakeBed("idle", idle=120.0)
+        idle.scheduler = scheduler
+        background = FakeBed("background")
+
+        with patch.object(scheduler, "capacity", return_value=1):
+            await scheduler.async_acquire("proxy", idle, SlotPriority.KEEPALIVE)
+            task = asyncio.create_task(
+                scheduler.async_acquire("proxy", background, SlotPriority.BACKGROUND)
+            )
+            await asyncio.sleep(0)
+            assert not idle.released
+
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        assert scheduler.as_dict()["proxy"]["waiting"] == 0
+
+
+class TestSlotCapacity:
+    """Test reading adapter capacity from the Bluetooth manager."""
+
+    async def test_slots_held_by_other_integrations_are_not_ours(self, hass: HomeAssistant):
+        """Capacity is the free slots plus the slots our own beds occupy."""
+        scheduler = _scheduler(hass)
+        bed = FakeBed("bed", address="aa:bb:cc:dd:ee:01")
+        allocation = HaBluetoothSlotAllocations(
+            source="proxy",
+            slots=3,
+            free=1,
+            allocated=["AA:BB:CC:DD:EE:01", "11:22:33:44:55:66"],
+        )
+
+        with patch(
+            "custom_components.adjustable_bed.connection_slots.get_manager",
+            return_value=_manager(allocation),
+        ) as get_manager:
+            assert scheduler.capacity("proxy") == 1
+            await scheduler.async_acquire("proxy", bed, SlotPriority.USER)
+            # The bed's own connection counts towards our share again
+            assert scheduler.capacity("proxy") == 2
+
+        get_manager.return_value.async_current_allocations.assert_called_with("proxy")
+
+    async def test_full_adapter_still_allows_one_connect(self, hass: HomeAssistant):
+        """Other integrations holding every slot don't block beds for good."""
+        scheduler = _scheduler(hass)
+        allocation = HaBluetoothSlotAllocations(
+            source="proxy", slots=3, free=0, allocated=["11:22:33:44:55:66"] * 3
+        )
+
+        with patch(
+            "custom_components.adjustable_bed.connection_slots.get_manager",
+            return_value=_manager(allocation),
+        ):
+            assert scheduler.capacity("proxy") == 1
+
+    async def test_unreported_slots_use_default(self, hass: HomeAssistant):
+        """Adapters that haven't reported slots, or no manager, use the default."""
+        scheduler = _scheduler(hass)
+        unreported = HaBluetoothSlotAllocations(source="proxy", slots=0, free=0, allocated=[])
+
+        with patch(
+            "custom_components.adjustable_bed.connection_slots.get_manager",
+            return_value=_manager(unreported),
+        ):
+            assert scheduler.capacity("proxy") == SLOT_DEFAULT_CAPACITY
+        with patch(
+            "custom_components.adjustable_bed.connection_slots.get_manager",
+            side_effect=RuntimeError("BluetoothManager has not been set"),
+        ):
+            assert scheduler.capacity("proxy") == SLOT_DEFAULT_CAPACITY
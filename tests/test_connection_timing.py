@@ -0,0 +1,110 @@
+"""Tests for connection phase timings."""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import MagicMock, patch
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.adjustable_bed.connection_timing import (
+    CONNECT_PHASE_ESTABLISH,
+    CONNECT_PHASE_LOOKUP,
+    CONNECT_PHASE_NOTIFY,
+    CONNECT_PHASE_SETUP,
+    ConnectionTimingHistory,
+)
+from custom_components.adjustable_bed.coordinator import AdjustableBedCoordinator
+
+
+class TestConnectionTimingHistory:
+    """Test the bounded attempt ring."""
+
+    def test_ring_is_bounded(self):
+        """Only the most recent attempts should be kept."""
+        history = ConnectionTimingHistory(maxlen=3)
+        for attempt in range(5):
+            history.start(attempt + 1).finish("failed")
+
+        attempts = history.as_dict()["attempts"]
+        assert [timing["attempt"] for timing in attempts] == [3, 4, 5]
+
+    def test_last_success_outlives_ring(self):
+        """Sensors should keep the last successful connection after later failures."""
+        history = ConnectionTimingHistory(maxlen=2)
+        timing = history.start(1)
+        timing.record(CONNECT_PHASE_ESTABLISH, 1.5)
+        timing.record(CONNECT_PHASE_ESTABLISH, 0.5)
+        history.succeeded(timing)
+        for attempt in range(3):
+            history.start(attempt + 2).finish("failed", TimeoutError())
+
+        assert history.phase_ms(CONNECT_PHASE_ESTABLISH) == 2000.0
+        assert history.phase_ms(CONNECT_PHASE_LOOKUP) is None
+        stats = history.as_dict()
+        assert stats["attempts"][-1]["error"] == "TimeoutError"
+        assert stats["median_ms"] == {}
+
+    def test_phase_is_recorded_when_it_raises(self):
+        """A phase that fails should still show how long it took."""
+        history = ConnectionTimingHistory()
+        timing = history.start(1)
+        try:
+            with timing.phase(CONNECT_PHASE_ESTABLISH):
+                raise TimeoutError
+        except TimeoutError:
+            pass
+
+        assert CONNECT_PHASE_ESTABLISH in timing.phases
+
+    def test_total_is_wall_clock_not_sum_of_phases(self):
+        """Overlapping setup steps must not inflate the attempt total."""
+        with patch("custom_components.adjustable_bed.connection_timing.time.monotonic") as now:
+            now.return_value = 100.0
+            timing = ConnectionTimingHistory().start(1)
+            timing.record(CONNECT_PHASE_SETUP, 2.0)
+            # Two steps that ran side by side within the setup phase
+            timing.record(CONNECT_PHASE_NOTIFY, 1.5)
+            timing.record("send_pin", 1.8)
+            now.return_value = 103.0
+            timing.finish("connected")
+
+        assert timing.total == 3.0
+        attempt = timing.as_dict()
+        assert attempt["total_ms"] == 3000.0
+        # Known phases in reporting order, controller steps by name after them
+        assert list(attempt["phases_ms"]) == [CONNECT_PHASE_SETUP, CONNECT_PHASE_NOTIFY, "send_pin"]
+
+    def test_total_ignores_phases_recorded_after_finish(self):
+        """The initial position read runs after the attempt and isn't part of it."""
+        timing = ConnectionTimingHistory().start(1)
+        timing.finish("connected")
+        total = timing.total
+        time.sleep(0.01)
+        timing.record("initial_position_read", 5.0)
+
+        assert timing.total == total
+
+
+class TestCoordinatorConnectionTiming:
+    """Test phase timings recorded by the coordinator."""
+
+    async def test_connect_records_phases(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry,
+        mock_coordinator_connected,
+        mock_bleak_client: MagicMock,
+    ):
+        """A successful connect should record its phases in connection history."""
+        coordinator = AdjustableBedCoordinator(hass, mock_config_entry)
+
+        await coordinator.async_connect()
+
+        timings = coordinator.connection_history["phase_timings"]
+        assert timings["attempts"][-1]["outcome"] == "connected"
+        phases = timings["attempts"][-1]["phases_ms"]
+        assert CONNECT_PHASE_LOOKUP in phases
+        assert CONNECT_PHASE_ESTABLISH in phases
+        assert CONNECT_PHASE_SETUP in phases
+        assert coordinator.connection_phase_ms(CONNECT_PHASE_ESTABLISH) is not None
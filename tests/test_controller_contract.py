@@ -10,6 +10,11 @@ from typing import Any
 import pytest
 
 from custom_components.adjustable_bed.beds.base import BedController
+from custom_components.adjustable_bed.beds.capabilities import (
+    CAPABILITY_PROPERTIES,
+    Capability,
+)
+from custom_components.adjustable_bed.beds.octo import OCTO_FEATURE_MEMCOUNT, OctoController
 from custom_components.adjustable_bed.const import (
     BED_TYPE_LEGGETT_PLATT,
     BED_TYPE_OCTO,
@@ -291,3 +296,63 @@ async def test_overridden_stop_helpers_keep_finally_cleanup() -> None:
             assert (
                 "finally" in source
             ), f"{controller_cls.__name__}._preset_with_stop missing finally"
+
+
+def test_capability_snapshot_covers_base_capabilities() -> None:
+    """Every boolean capability property on the base has a snapshot flag."""
+    declared = {
+        name
+        for name, value in vars(BedController).items()
+        if isinstance(value, property) and name.startswith(("supports_", "has_"))
+    }
+    # supports_light is a backward-compatible alias of supports_lights
+    assert declared - {"supports_light"} == set(CAPABILITY_PROPERTIES)
+
+
+@pytest.mark.parametrize("bed_type", SUPPORTED_BED_TYPES)
+async def test_capability_snapshot_matches_properties(bed_type: str) -> None:
+    """The snapshot reports exactly what the controller properties report."""
+    controller = await _create_controller_for_bed_type(bed_type)
+    capabilities = controller.capabilities
+
+    for name in CAPABILITY_PROPERTIES:
+        assert capabilities.supports(name) == bool(getattr(controller, name)), name
+    assert capabilities.memory_slot_count == controller.memory_slot_count
+    assert list(capabilities.massage_intensity_zones) == controller.massage_intensity_zones
+    assert capabilities.massage_intensity_max == controller.massage_intensity_max
+    assert list(capabilities.massage_timer_options) == controller.massage_timer_options
+    assert capabilities.light_level_max == controller.light_level_max
+    assert list(capabilities.light_timer_options) == controller.light_timer_options
+    assert capabilities.light_auto_off_seconds == controller.light_auto_off_seconds
+    assert capabilities.fan_level_max == controller.fan_level_max
+    translation_keys = capabilities.motor_translation_keys
+    assert (dict(translation_keys) if translation_keys is not None else None) == (
+        controller.motor_translation_keys
+    )
+
+
+def test_capability_snapshot_is_cached_until_invalidated() -> None:
+    """The snapshot is built once and rebuilt only after invalidation."""
+    controller = _ContractController(_FactoryCoordinator())
+
+    first = controller.capabilities
+    assert controller.capabilities is first
+    assert first.has(Capability.PRESET_FLAT | Capability.MOTOR_CONTROL)
+    with pytest.raises(KeyError):
+        first.supports("supports_teleport")
+
+    controller.invalidate_capabilities()
+    assert controller.capabilities is not first
+    assert controller.capabilities == first
+
+
+def test_runtime_feature_discovery_refreshes_snapshot() -> None:
+    """Controllers that learn their features over BLE invalidate the snapshot."""
+    controller = OctoController(_FactoryCoordinator())
+    assert controller.capabilities.memory_slot_count == 0
+
+    memcount = OCTO_FEATURE_MEMCOUNT.to_bytes(3, "big")
+    controller._handle_feature_response([*memcount, 0x00, 0x00, 0x00, 0x02])
+
+    assert controller.capabilities.memory_slot_count == 2
+    assert controller.capabilities.has(Capability.MEMORY_PRESETS)
@@ -819,6 +819,27 @@ class TestStopAfterCancel:
         # Counter should NOT have incremented
         assert coordinator._cancel_counter == initial_counter
 
+    async def test_pulse_anchor_only_applies_to_its_command(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry,
+        mock_coordinator_connected,
+        mock_bleak_client: MagicMock,
+    ):
+        """A bed group's pulse anchor is seen by its command and no other."""
+        coordinator = AdjustableBedCoordinator(hass, mock_config_entry)
+        await coordinator.async_connect()
+        seen: list[float | None] = []
+
+        async def record_anchor(controller):
+            seen.append(coordinator.pulse_anchor)
+
+        await coordinator.async_execute_controller_command(record_anchor, pulse_anchor=12.5)
+        await coordinator.async_execute_controller_command(record_anchor)
+
+        assert seen == [12.5, None]
+        assert coordinator.pulse_anchor is None
+
     async def test_cancel_counter_prevents_stale_command_execution(
         self,
         hass: HomeAssistant,
@@ -889,3 +910,172 @@ class TestStopAfterCancel:
 
         # Verify that commands were sent (movement + stop)
         assert len(commands_sent) > 0
+
+
+class TestEventDrivenSeek:
+    """Test position seeking driven by position notifications."""
+
+    async def test_notifying_motor_seeks_without_polling(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry,
+        mock_coordinator_connected,
+        mock_bleak_client: MagicMock,
+    ):
+        """A motor that pushes its position should be followed without reads."""
+        import asyncio
+
+        coordinator = AdjustableBedCoordinator(hass, mock_config_entry)
+        await coordinator.async_connect()
+        coordinator._disable_angle_sensing = False
+        coordinator.controller._notifying_keys = frozenset({"back"})
+        coordinator._position_data["back"] = 0.0
+        reads = 0
+
+        async def read_positions(motor_count: int = 2) -> None:
+            nonlocal reads
+            reads += 1
+
+        coordinator.controller.read_positions = read_positions
+        coordinator.controller.read_non_notifying_positions = read_positions
+
+        async def push_updates() -> None:
+            for step in range(1, 11):
+                await asyncio.sleep(0.05)
+                coordinator._handle_position_update("back", step * 2.0)
+
+        pushes: list[asyncio.Task] = []
+
+        async def move_up(ctrl) -> None:
+            if not pushes:
+                pushes.append(asyncio.create_task(push_updates()))
+
+        async def noop(ctrl) -> None:
+            return
+
+        await coordinator.async_seek_position("back", 10.0, move_up, noop, noop)
+        pushes[0].cancel()
+
+        stats = coordinator.command_timing["last_seek"]
+        assert stats["reached"] is True
+        assert stats["event_driven"] is True
+        assert stats["notified_updates"] >= 1
+        assert stats["position_reads"] == 0
+        assert reads == 0
+
+    async def test_position_update_sets_seek_event(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry,
+    ):
+        """Updates should wake a waiter on that key only."""
+        coordinator = AdjustableBedCoordinator(hass, mock_config_entry)
+        back = coordinator._position_event("back")
+        legs = coordinator._position_event("legs")
+
+        coordinator._handle_position_update("back", 12.0)
+
+        assert back.is_set()
+        assert not legs.is_set()
+        assert await coordinator._async_wait_position_update(back, 0.1) is True
+        assert not back.is_set()
+        assert await coordinator._async_wait_position_update(legs, 0.01) is False
+
+
+class TestMultiMotorSeek:
+    """Test seeking several motors at once."""
+
+    async def test_linak_combines_only_all_motors_up(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry,
+        mock_coordinator_connected,
+        mock_bleak_client: MagicMock,
+    ):
+        """Linak has a combined frame for all motors moving up only."""
+        coordinator = AdjustableBedCoordinator(hass, mock_config_entry)
+        await coordinator.async_connect()
+        controller = coordinator.controller
+
+        assert controller.supports_combined_move({"back": True, "legs": True})
+        assert not controller.supports_combined_move({"back": True, "legs": False})
+        assert controller.supports_combined_move({"legs": False})
+
+    async def test_motors_move_together_and_stop_independently(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry,
+        mock_coordinator_connected,
+        mock_bleak_client: MagicMock,
+    ):
+        """Both motors should start in one burst and the nearer one drop out first."""
+        import asyncio
+
+        coordinator = AdjustableBedCoordinator(hass, mock_config_entry)
+        await coordinator.async_connect()
+        coordinator._position_data.update({"back": 0.0, "legs": 0.0})
+        groups: list[dict[str, bool]] = []
+
+        async def move_motors(directions) -> None:
+            groups.append(dict(directions))
+            for _ in range(15):
+                if coordinator.cancel_command.is_set():
+                    break
+                await asyncio.sleep(0.05)
+                for key, up in directions.items():
+                    coordinator._position_data[key] += 1.0 if up else -1.0
+
+        coordinator.controller.move_motors = move_motors
+
+        await coordinator.async_seek_positions({"back": 30.0, "legs": 15.0})
+
+        assert groups[0] == {"back": True, "legs": True}
+        assert all(group == {"back": True} for group in groups[1:])
+        stats = coordinator.command_timing["last_seek"]
+        assert stats["combined_bursts"] == 1
+        assert stats["reached"] is True
+        assert not coordinator.cancel_command.is_set()
+
+    async def test_trained_models_cut_bursts_without_settling(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry,
+        mock_coordinator_connected,
+        mock_bleak_client: MagicMock,
+    ):
+        """Motors driven in turn use predictive cuts and skip the coast wait."""
+        import asyncio
+
+        coordinator = AdjustableBedCoordinator(hass, mock_config_entry)
+        await coordinator.async_connect()
+        coordinator._position_data.update({"back": 0.0, "legs": 20.0})
+        # 20 degrees per second, no coast, in both directions
+        for key, up in (("back", True), ("legs", False)):
+            coordinator._motion_models.observe(key, up, 0.5, 10.0)
+            coordinator._motion_models.observe(key, up, 1.0, 20.0)
+        groups: list[dict[str, bool]] = []
+
+        async def move_motors(directions) -> None:
+            groups.append(dict(directions))
+            for _ in range(15):
+                if coordinator.cancel_command.is_set():
+                    break
+                await asyncio.sleep(0.05)
+                for key, up in directions.items():
+                    coordinator._position_data[key] += 1.0 if up else -1.0
+
+        coordinator.controller.move_motors = move_motors
+        coordinator.controller._notifying_keys = frozenset({"back", "legs"})
+
+        with patch.object(coordinator, "_async_read_positions", AsyncMock()) as read_positions:
+            await coordinator.async_seek_positions({"back": 30.0, "legs": 5.0})
+
+        # Back up and legs down have no combined Linak frame
+        assert all(len(group) == 1 for group in groups)
+        stats = coordinator.command_timing["last_seek"]
+        assert stats["combined_bursts"] == 0
+        assert stats["predicted_bursts"] >= 1
+        assert stats["reached"] is True
+        # Full-length bursts continued without a settle-and-read
+        assert read_positions.await_count < stats["bursts"]
+        assert not coordinator.cancel_command.is_set()
@@ -66,6 +66,8 @@ from custom_components.adjustable_bed.const import (
     VIBRADORM_SERVICE_UUID,
 )
 from custom_components.adjustable_bed.detection import (
+    DETECTION_CACHE,
+    DetectionCache,
     detect_bed_type,
     detect_bed_type_detailed,
     detect_richmat_remote_from_name,
@@ -1004,3 +1006,85 @@ class TestDetectionSignals:
         )
         result = detect_bed_type_detailed(service_info)
         assert f"manufacturer_id:{MANUFACTURER_ID_DEWERTOKIN}" in result.signals
+
+
+class TestDetectionCache:
+    """Test caching of detection results for repeated advertisements."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        """Start every test with an empty global cache."""
+        DETECTION_CACHE.clear()
+        yield
+        DETECTION_CACHE.clear()
+
+    def test_repeated_advertisement_hits(self):
+        """The same advertisement is only classified once."""
+        service_info = _make_service_info(
+            name="Test", service_uuids=[LINAK_CONTROL_SERVICE_UUID]
+        )
+
+        first = detect_bed_type_detailed(service_info)
+        second = detect_bed_type_detailed(service_info)
+
+        assert second == first
+        assert DETECTION_CACHE.stats == {"hits": 1, "misses": 1, "size": 1}
+
+    def test_different_name_misses(self):
+        """The name is part of the fingerprint."""
+        detect_bed_type_detailed(_make_service_info(name="JMC400"))
+        result = detect_bed_type_detailed(_make_service_info(name="Test"))
+
+        assert result.bed_type is None
+        assert DETECTION_CACHE.stats == {"hits": 0, "misses": 2, "size": 2}
+
+    def test_manufacturer_payload_not_in_key(self):
+        """Changing payload bytes under the same manufacturer ID still hits."""
+        detect_bed_type_detailed(
+            _make_service_info(
+                name="Test", manufacturer_data={MANUFACTURER_ID_DEWERTOKIN: b"\x01"}
+            )
+        )
+        result = detect_bed_type_detailed(
+            _make_service_info(
+                name="Test", manufacturer_data={MANUFACTURER_ID_DEWERTOKIN: b"\x02\x03"}
+            )
+        )
+
+        assert result.bed_type == BED_TYPE_DEWERTOKIN
+        assert DETECTION_CACHE.hits == 1
+
+    def test_uuid_order_and_case_ignored(self):
+        """UUIDs are compared as a lowercase set."""
+        uuids = [LINAK_CONTROL_SERVICE_UUID, SOLACE_SERVICE_UUID]
+        first = DetectionCache.key(_make_service_info(service_uuids=uuids))
+        second = DetectionCache.key(
+            _make_service_info(service_uuids=[uuid.upper() for uuid in reversed(uuids)])
+        )
+
+        assert first == second
+
+    def test_cached_result_is_a_copy(self):
+        """Changing a returned result doesn't change later hits."""
+        service_info = _make_service_info(name="JMC400")
+
+        detect_bed_type_detailed(service_info).signals.append("changed")
+        result = detect_bed_type_detailed(service_info)
+
+        assert "changed" not in result.signals
+
+    def test_least_recently_used_evicted(self):
+        """A full cache drops the entry that was used longest ago."""
+        cache = DetectionCache(maxsize=2)
+        result = detect_bed_type_detailed(_make_service_info(name="JMC400"))
+        keys = [DetectionCache.key(_make_service_info(name=f"Bed {n}")) for n in range(3)]
+
+        cache.put(keys[0], result)
+        cache.put(keys[1], result)
+        assert cache.get(keys[0]) is not None
+        cache.put(keys[2], result)
+
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is not None
+        assert cache.get(keys[2]) is not None
+        assert cache.stats == {"hits": 3, "misses": 1, "size": 2}
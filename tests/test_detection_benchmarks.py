@@ -0,0 +1,87 @@
+"""Regression checks for detection throughput and rule hit distribution."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from custom_components.adjustable_bed.detection import DETECTION_RULES
+
+from .codec_benchmarks import THROUGHPUT_REGRESSION, reference_seconds
+from .detection_benchmarks import (
+    EXCLUDED,
+    UNMATCHED,
+    build_cases,
+    cache_hit_rate,
+    load_baselines,
+    measure,
+    rule_hits,
+)
+from .detection_corpus import ServiceInfo, traffic_corpus
+
+BASELINES = load_baselines()
+
+# Timing is only meaningful on a quiet machine, so throughput checks are opt-in
+run_throughput = pytest.mark.skipif(
+    not os.environ.get("ADJUSTABLE_BED_BENCHMARK"),
+    reason="set ADJUSTABLE_BED_BENCHMARK=1 to run throughput benchmarks",
+)
+
+
+@pytest.fixture(scope="module")
+def corpus() -> list[ServiceInfo]:
+    """Return the traffic corpus."""
+    return traffic_corpus()
+
+
+@pytest.fixture(scope="module")
+def hits(corpus: list[ServiceInfo]) -> dict[str, int]:
+    """Return the rule hit distribution of the traffic corpus."""
+    return rule_hits(corpus)
+
+
+def test_corpus_is_deterministic() -> None:
+    """The same arguments always produce the same stream."""
+    assert traffic_corpus(size=2000) == traffic_corpus(size=2000)
+
+
+def test_corpus_mixes_beds_and_noise(corpus: list[ServiceInfo], hits: dict[str, int]) -> None:
+    """Most traffic isn't a bed, and excluded devices are part of it."""
+    assert len(corpus) == 50000
+    assert hits[UNMATCHED] > len(corpus) // 2
+    assert hits[EXCLUDED] > 0
+
+
+def test_corpus_reaches_every_bed_rule(hits: dict[str, int]) -> None:
+    """Every rule that detects a bed decides at least one advertisement."""
+    reached = {int(key.split(" ", 1)[0]) for key in hits if key not in (EXCLUDED, UNMATCHED)}
+    bed_rules = {
+        rule.priority for rule in DETECTION_RULES if rule.terminal and rule.bed_type is not None
+    }
+    assert bed_rules <= reached
+
+
+def test_rule_hits_match_baseline(hits: dict[str, int]) -> None:
+    """The rule table classifies the corpus exactly as recorded."""
+    assert hits == BASELINES["rule_hits"]
+
+
+def test_cache_answers_repeated_advertisements(corpus: list[ServiceInfo]) -> None:
+    """Devices advertising over and over are classified from the cache."""
+    assert cache_hit_rate(corpus) > 0.9
+
+
+@pytest.mark.benchmark
+@run_throughput
+@pytest.mark.xdist_group("benchmark")
+@pytest.mark.parametrize("name", sorted(BASELINES["cases"]))
+def test_throughput_within_baseline(name: str, corpus: list[ServiceInfo]) -> None:
+    """Per-classification cost relative to the reference doesn't regress."""
+    case = next(case for case in build_cases(corpus) if case.name == name)
+    result = measure(case, reference_seconds())
+    allowed = BASELINES["cases"][name]["relative_cost"] * THROUGHPUT_REGRESSION
+    assert result.relative_cost <= allowed, (
+        f"{name}: {result.per_second:,.0f} classifications/s, "
+        f"relative cost {result.relative_cost:.2f} > {allowed:.2f}"
+    )
@@ -0,0 +1,136 @@
+"""Tests for the indexed detection rule engine."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.adjustable_bed.const import (
+    BED_TYPE_LINAK,
+    LINAK_CONTROL_SERVICE_UUID,
+)
+from custom_components.adjustable_bed.detection import (
+    DETECTION_RULES,
+    detect_bed_type_detailed,
+)
+from custom_components.adjustable_bed.detection_engine import (
+    DetectionRule,
+    NameTrie,
+    RuleIndex,
+)
+
+from .detection_corpus import UNRELATED_UUID, coverage_corpus
+from .detection_reference import legacy_detect_bed_type_detailed
+
+
+class TestRuleEngineEquivalence:
+    """The rule table reproduces the original if-chain exactly."""
+
+    def test_matches_legacy_chain_over_corpus(self) -> None:
+        """Every advertisement yields the same DetectionResult as before."""
+        corpus = coverage_corpus()
+        assert len(corpus) > 30000
+
+        mismatches = []
+        for service_info in corpus:
+            expected = legacy_detect_bed_type_detailed(service_info)
+            actual = detect_bed_type_detailed(service_info)
+            if actual != expected:
+                mismatches.append((service_info, expected, actual))
+
+        assert not mismatches, mismatches[:5]
+
+    def test_corpus_reaches_every_rule(self) -> None:
+        """The corpus exercises every rule, so the comparison covers them all."""
+        index = RuleIndex(DETECTION_RULES)
+        matched: set[int] = set()
+        for service_info in coverage_corpus():
+            advertisement = index.advertisement(
+                service_info.address,
+                service_info.name,
+                service_info.service_uuids,
+                service_info.manufacturer_data,
+            )
+            for rule in index.candidates(advertisement):
+                if rule.matches(advertisement):
+                    matched.add(rule.priority)
+                    if rule.terminal:
+                        break
+
+        assert matched == {rule.priority for rule in DETECTION_RULES}
+
+
+class TestNameTrie:
+    """Test the name pattern trie."""
+
+    def test_scan_reports_prefixes_and_substrings(self) -> None:
+        """Prefix matches start at offset 0; substring matches anywhere."""
+        trie = NameTrie(["bed ", "ergo", "ergomotion", "serta", "serta-i"])
+
+        prefixes, substrings = trie.scan("serta-i490350 ergomotion")
+
+        assert prefixes == {"serta", "serta-i"}
+        assert substrings == {"serta", "serta-i", "ergo", "ergomotion"}
+
+    def test_scan_empty_name(self) -> None:
+        """An empty name matches nothing."""
+        assert NameTrie(["a"]).scan("") == (frozenset(), frozenset())
+
+    def test_empty_pattern_rejected(self) -> None:
+        """Empty patterns would match every name."""
+        with pytest.raises(ValueError):
+            NameTrie([""])
+
+
+class TestRuleIndex:
+    """Test rule compilation and candidate selection."""
+
+    def test_unique_uuid_only_evaluates_its_rules(self) -> None:
+        """A Linak advertisement doesn't touch unrelated rules."""
+        index = RuleIndex(DETECTION_RULES)
+        advertisement = index.advertisement(
+            "AA:BB:CC:DD:EE:FF", "Linak", [LINAK_CONTROL_SERVICE_UUID.upper()], None
+        )
+
+        candidates = index.candidates(advertisement)
+
+        assert len(candidates) < len(DETECTION_RULES) // 4
+        rule, result = index.evaluate(advertisement)
+        assert rule is not None
+        assert result.bed_type == BED_TYPE_LINAK
+
+    def test_duplicate_priorities_rejected(self) -> None:
+        """Priorities decide evaluation order and must be unique."""
+        rule = DetectionRule(priority=1, label="a", bed_type=None, confidence=0.0)
+
+        with pytest.raises(ValueError):
+            RuleIndex([rule, rule])
+
+    def test_non_terminal_signals_carry_into_result(self) -> None:
+        """Signals of non-terminal rules are kept when evaluation goes on."""
+        note = DetectionRule(
+            priority=1,
+            label="note",
+            bed_type=None,
+            confidence=0.0,
+            signals=("name:x",),
+            name_prefixes=frozenset({"x"}),
+            terminal=False,
+        )
+        final = DetectionRule(
+            priority=2,
+            label="final",
+            bed_type=BED_TYPE_LINAK,
+            confidence=0.5,
+            signals=("uuid:y",),
+            service_uuids=frozenset({UNRELATED_UUID}),
+        )
+        index = RuleIndex([final, note])
+
+        _, result = index.evaluate(
+            index.advertisement("AA:BB:CC:DD:EE:FF", "x1", [UNRELATED_UUID], None)
+        )
+        _, unmatched = index.evaluate(index.advertisement("AA:BB:CC:DD:EE:FF", "x1", [], None))
+
+        assert result.signals == ["name:x", "uuid:y"]
+        assert unmatched.bed_type is None
+        assert unmatched.signals == ["name:x"]
@@ -143,6 +143,7 @@ class TestDiagnosticsOutput:
         # Check coordinator
         assert "is_connected" in result["coordinator"]
         assert "is_connecting" in result["coordinator"]
+        assert "command_lock_wait" in result["coordinator"]["latency"]["phases"]
 
         # Check BLE info
         assert "connected" in result["ble"]
@@ -0,0 +1,144 @@
+"""Tests for the persistent GATT layout cache."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.adjustable_bed.const import DEVICE_INFO_CHARS, DEVICE_INFO_SERVICE_UUID
+from custom_components.adjustable_bed.coordinator import AdjustableBedCoordinator
+from custom_components.adjustable_bed.gatt_cache import GattServiceCache
+
+from .conftest import TEST_ADDRESS
+
+CONTROL_SERVICE_UUID = "99fa0001-338a-1024-8a49-009c0215f78a"
+CONTROL_CHAR_UUID = "99fa0002-338a-1024-8a49-009c0215f78a"
+
+
+def _service(uuid: str, handle: int, *chars: tuple[str, int, list[str]]) -> SimpleNamespace:
+    return SimpleNamespace(
+        uuid=uuid,
+        handle=handle,
+        characteristics=[
+            SimpleNamespace(
+                uuid=char_uuid, handle=char_handle, properties=props, descriptors=[]
+            )
+            for char_uuid, char_handle, props in chars
+        ],
+    )
+
+
+def _services(control_handle: int = 12) -> list[SimpleNamespace]:
+    return [
+        _service(
+            DEVICE_INFO_SERVICE_UUID,
+            1,
+            (DEVICE_INFO_CHARS["manufacturer_name"], 3, ["read"]),
+            (DEVICE_INFO_CHARS["model_number"], 5, ["read"]),
+        ),
+        _service(
+            CONTROL_SERVICE_UUID,
+            10,
+            (CONTROL_CHAR_UUID, control_handle, ["write", "write-without-response"]),
+        ),
+    ]
+
+
+class TestGattServiceCache:
+    """Test layout validation."""
+
+    async def test_validates_only_matching_layout(self, hass: HomeAssistant):
+        """A stored layout should match itself and reject changed handles."""
+        cache = GattServiceCache(hass, TEST_ADDRESS)
+        await cache.async_load()
+        assert not cache.validate(_services())
+
+        cache.store(_services(), "Linak", "DPG")
+
+        assert cache.validate(list(reversed(_services())))
+        assert not cache.validate(_services(control_handle=14))
+        assert cache.device_info == ("Linak", "DPG")
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    async def test_empty_layout_is_not_stored(self, hass: HomeAssistant):
+        """A connection without services must not become the stored layout."""
+        cache = GattServiceCache(hass, TEST_ADDRESS)
+        await cache.async_load()
+
+        cache.store([], None, None)
+
+        assert not cache.has_layout
+
+
+class TestCoordinatorGattCache:
+    """Test GATT layout reuse on reconnect."""
+
+    async def test_reconnect_reuses_device_info(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry,
+        mock_coordinator_connected,
+        mock_bleak_client: MagicMock,
+    ):
+        """A matching layout should skip the Device Information reads."""
+        mock_bleak_client.services.__iter__ = lambda self: iter(_services())
+        mock_bleak_client.read_gatt_char.return_value = b"Linak"
+        coordinator = AdjustableBedCoordinator(hass, mock_config_entry)
+
+        await coordinator.async_connect()
+        first_reads = mock_bleak_client.read_gatt_char.call_count
+        await coordinator.async_disconnect()
+        await coordinator.async_ensure_connected()
+
+        assert mock_bleak_client.read_gatt_char.call_count == first_reads
+        assert coordinator.gatt_cache_stats["hits"] == 1
+        assert coordinator.device_info["manufacturer"] == "Linak"
+
+        await coordinator.async_disconnect()
+
+    async def test_reconnect_reuses_controller(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry,
+        mock_coordinator_connected,
+        mock_bleak_client: MagicMock,
+    ):
+        """The controller should survive a reconnect while the GATT layout is unchanged."""
+        mock_bleak_client.services.__iter__ = lambda self: iter(_services())
+        coordinator = AdjustableBedCoordinator(hass, mock_config_entry)
+
+        await coordinator.async_connect()
+        controller = coordinator.controller
+        await coordinator.async_disconnect()
+        assert coordinator.controller is None
+        await coordinator.async_ensure_connected()
+
+        assert coordinator.controller is controller
+        assert coordinator.connection_history["controller_creations"] == 1
+
+        await coordinator.async_disconnect()
+
+    async def test_changed_layout_recreates_controller(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry,
+        mock_coordinator_connected,
+        mock_bleak_client: MagicMock,
+    ):
+        """A different GATT layout should invalidate the kept controller."""
+        mock_bleak_client.services.__iter__ = lambda self: iter(_services())
+        coordinator = AdjustableBedCoordinator(hass, mock_config_entry)
+
+        await coordinator.async_connect()
+        controller = coordinator.controller
+        await coordinator.async_disconnect()
+        mock_bleak_client.services.__iter__ = lambda self: iter(_services(control_handle=14))
+        await coordinator.async_ensure_connected()
+
+        assert coordinator.controller is not controller
+        assert coordinator.connection_history["controller_creations"] == 2
+
+        await coordinator.async_disconnect()
@@ -222,6 +222,30 @@ class TestKeesonMovement:
             KEESON_BASE_WRITE_CHAR_UUID, expected_stop, response=True
         )
 
+    async def test_move_motors_sends_combined_value(
+        self,
+        hass: HomeAssistant,
+        mock_keeson_config_entry,
+        mock_coordinator_connected,
+        mock_bleak_client: MagicMock,
+    ):
+        """Moving back up and legs down together should send one summed value."""
+        coordinator = AdjustableBedCoordinator(hass, mock_keeson_config_entry)
+        await coordinator.async_connect()
+        controller = coordinator.controller
+
+        assert controller.supports_combined_move({"back": True, "legs": False})
+        assert not controller.supports_combined_move({"back": True, "head": True})
+
+        await controller.move_motors({"back": True, "legs": False})
+
+        calls = mock_bleak_client.write_gatt_char.call_args_list
+        expected = controller._build_command(
+            KeesonCommands.MOTOR_HEAD_UP + KeesonCommands.MOTOR_FEET_DOWN
+        )
+        assert calls[0][0][1] == expected
+        assert calls[-1][0][1] == controller._build_command(0)
+
 
 class TestKeesonPresets:
     """Test Keeson preset commands."""
@@ -0,0 +1,107 @@
+"""Tests for command latency histograms."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.adjustable_bed.coordinator import AdjustableBedCoordinator
+from custom_components.adjustable_bed.latency import (
+    LATENCY_BUCKET_BOUNDS_MS,
+    LATENCY_PHASE_ENSURE_CONNECTED,
+    LATENCY_PHASE_GATT_WRITE,
+    LATENCY_PHASE_LOCK_WAIT,
+    LATENCY_PHASES,
+    CommandLatencyTracker,
+    LatencyHistogram,
+)
+
+
+class TestLatencyHistogram:
+    """Test LatencyHistogram bucketing and percentiles."""
+
+    def test_empty_histogram(self):
+        """An empty histogram reports no percentiles."""
+        histogram = LatencyHistogram()
+
+        assert histogram.count == 0
+        assert histogram.percentile(50) is None
+        assert histogram.as_dict()["mean_ms"] is None
+
+    def test_percentiles_use_bucket_upper_bounds(self):
+        """Percentiles should resolve to the bucket containing the rank."""
+        histogram = LatencyHistogram()
+        for value in range(1, 101):
+            histogram.record(value)
+
+        assert histogram.percentile(50) == 50.0
+        assert histogram.percentile(95) == 100.0
+        assert histogram.percentile(99) == 100.0
+
+    def test_overflow_reports_max(self):
+        """Samples above the last bucket report the largest observed value."""
+        histogram = LatencyHistogram()
+        histogram.record(LATENCY_BUCKET_BOUNDS_MS[-1] * 2)
+
+        assert histogram.percentile(50) == LATENCY_BUCKET_BOUNDS_MS[-1] * 2
+
+    def test_window_rotation_bounds_memory(self):
+        """Old samples should age out while the total count keeps growing."""
+        histogram = LatencyHistogram()
+        with patch("custom_components.adjustable_bed.latency.LATENCY_WINDOW_SIZE", 10):
+            for _ in range(10):
+                histogram.record(500)
+            for _ in range(25):
+                histogram.record(5)
+
+        data = histogram.as_dict()
+        assert data["count"] == 35
+        assert data["window_count"] <= 20
+        assert data["p99_ms"] == 5.0
+        assert len(data["buckets"]) == len(LATENCY_BUCKET_BOUNDS_MS) + 1
+
+
+class TestCommandLatencyTracker:
+    """Test the per-coordinator latency tracker."""
+
+    def test_measure_records_on_error(self):
+        """Failed operations should still be recorded."""
+        tracker = CommandLatencyTracker()
+
+        try:
+            with tracker.measure(LATENCY_PHASE_GATT_WRITE):
+                raise RuntimeError("write failed")
+        except RuntimeError:
+            pass
+
+        assert tracker.histogram(LATENCY_PHASE_GATT_WRITE).count == 1
+
+    def test_as_dict_lists_all_phases(self):
+        """Diagnostics output should include every tracked phase."""
+        tracker = CommandLatencyTracker()
+
+        assert set(tracker.as_dict()["phases"]) == set(LATENCY_PHASES)
+
+
+class TestCoordinatorLatency:
+    """Test latency collection on the coordinator."""
+
+    async def test_write_command_records_phases(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry,
+        mock_coordinator_connected,
+        mock_bleak_client: MagicMock,
+    ):
+        """A command should record lock wait, connection check and GATT writes."""
+        coordinator = AdjustableBedCoordinator(hass, mock_config_entry)
+        await coordinator.async_connect()
+
+        await coordinator.async_write_command(b"\x01", repeat_count=2, repeat_delay_ms=10)
+
+        phases = coordinator.latency_stats["phases"]
+        assert phases[LATENCY_PHASE_LOCK_WAIT]["count"] == 1
+        assert phases[LATENCY_PHASE_ENSURE_CONNECTED]["count"] >= 1
+        assert phases[LATENCY_PHASE_GATT_WRITE]["count"] == 2
+        assert phases[LATENCY_PHASE_GATT_WRITE]["p50_ms"] is not None
@@ -404,3 +404,51 @@ class TestLinakPositionData:
         controller._handle_position_data("back", data, 820, 68.0)
 
         callback.assert_not_called()
+
+
+class TestLinakReadPlanner:
+    """Test freshness-aware position reads."""
+
+    async def test_fresh_notifying_positions_are_not_read(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry,
+        mock_coordinator_connected,
+        mock_bleak_client: MagicMock,
+    ):
+        """Motors that just notified should be skipped; polled motors are always read."""
+        coordinator = AdjustableBedCoordinator(hass, mock_config_entry)
+        await coordinator.async_connect()
+        controller = coordinator.controller
+        controller._notifying_keys = frozenset({"legs"})
+        mock_bleak_client.read_gatt_char.reset_mock()
+
+        skipped_before = controller.position_read_stats["skipped_fresh"]
+
+        # Legs just reported its position via notification
+        controller._handle_position_data("legs", bytearray([0x00, 0x00]), 548, 45.0)
+        await controller.read_positions(2)
+
+        assert mock_bleak_client.read_gatt_char.call_count == 1
+        assert controller.position_read_stats["skipped_fresh"] == skipped_before + 1
+
+    async def test_stale_positions_are_read(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry,
+        mock_coordinator_connected,
+        mock_bleak_client: MagicMock,
+    ):
+        """Motors without a recent update should all be read."""
+        coordinator = AdjustableBedCoordinator(hass, mock_config_entry)
+        await coordinator.async_connect()
+        controller = coordinator.controller
+        controller._notifying_keys = frozenset({"legs"})
+        controller._position_updated_at["legs"] = 0.0
+        mock_bleak_client.read_gatt_char.reset_mock()
+        skipped_before = controller.position_read_stats["skipped_fresh"]
+
+        await controller.read_positions(2)
+
+        assert mock_bleak_client.read_gatt_char.call_count == 2
+        assert controller.position_read_stats["skipped_fresh"] == skipped_before
@@ -0,0 +1,113 @@
+"""Tests for the learned motor motion model and predictive seek stop."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.adjustable_bed.coordinator import AdjustableBedCoordinator
+from custom_components.adjustable_bed.motion_model import MotorMotionModel
+
+
+class TestMotorMotionModel:
+    """Test the least-squares motion fit."""
+
+    def test_untrained_model_has_no_estimate(self):
+        """A model needs at least two bursts before predicting."""
+        model = MotorMotionModel()
+        model.observe(1.0, 10.0)
+
+        assert model.estimate() is None
+
+    def test_fits_velocity_and_coast(self):
+        """Bursts of different lengths should separate velocity from coast."""
+        model = MotorMotionModel()
+        # 8 deg/s with 2 deg of coast
+        for run_time in (1.5, 0.5, 1.0, 0.75):
+            model.observe(run_time, 8 * run_time + 2)
+
+        estimate = model.estimate()
+        assert estimate is not None
+        assert abs(estimate.velocity - 8) < 0.01
+        assert abs(estimate.coast - 2) < 0.01
+        # 10 degrees to go: drive for (10 - 2) / 8 = 1s
+        assert abs(estimate.run_time_for(10) - 1.0) < 0.01
+
+    def test_equal_bursts_fall_back_to_velocity_only(self):
+        """With identical run times there is no coast information."""
+        model = MotorMotionModel()
+        model.observe(1.5, 15.0)
+        model.observe(1.5, 15.0)
+
+        estimate = model.estimate()
+        assert estimate is not None
+        assert estimate.coast == 0.0
+        assert abs(estimate.velocity - 10) < 0.01
+
+    def test_ignores_unusable_bursts(self):
+        """Bursts with no travel or negligible run time are not learned."""
+        model = MotorMotionModel()
+        model.observe(1.0, 0.0)
+        model.observe(0.01, 5.0)
+
+        assert model.as_dict()["samples"] == 0
+
+    def test_round_trips_through_storage_dict(self):
+        """Stored state should restore the same estimate."""
+        model = MotorMotionModel()
+        for run_time in (1.0, 0.5):
+            model.observe(run_time, 6 * run_time + 1)
+
+        restored = MotorMotionModel.from_dict(model.as_dict())
+
+        assert restored.estimate() == model.estimate()
+
+
+class TestPredictiveSeek:
+    """Test predictive stopping in async_seek_position."""
+
+    async def test_trained_model_cuts_burst_and_lands_on_target(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry,
+        mock_coordinator_connected,
+        mock_bleak_client: MagicMock,
+    ):
+        """A trained model should stop the motor early instead of overshooting."""
+        coordinator = AdjustableBedCoordinator(hass, mock_config_entry)
+        await coordinator.async_connect()
+        coordinator._disable_angle_sensing = False
+        coordinator._position_data["back"] = 0.0
+
+        velocity = 20.0  # deg/s
+        coast = 2.0
+        for run_time in (1.0, 0.5):
+            coordinator._motion_models.observe("back", True, run_time, velocity * run_time + coast)
+
+        async def move_up(ctrl) -> None:
+            # Simulated 1.5s pulse train that honours the cancel event
+            start = time.monotonic()
+            while time.monotonic() - start < 1.5:
+                if coordinator.cancel_command.is_set():
+                    break
+                await asyncio.sleep(0.01)
+            coordinator._position_data["back"] += velocity * (time.monotonic() - start) + coast
+
+        async def noop(ctrl) -> None:
+            return
+
+        async def read_positions(motor_count: int = 2) -> None:
+            return
+
+        coordinator.controller.read_positions = read_positions
+
+        await coordinator.async_seek_position("back", 12.0, move_up, noop, noop)
+
+        stats = coordinator.command_timing["last_seek"]
+        assert stats["bursts"] == 1
+        assert stats["predicted_bursts"] == 1
+        assert stats["reached"] is True
+        assert not coordinator.cancel_command.is_set()
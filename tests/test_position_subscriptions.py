@@ -0,0 +1,112 @@
+"""Tests for per-key, rate-limited position subscriptions."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.adjustable_bed.coordinator import AdjustableBedCoordinator
+from custom_components.adjustable_bed.position_subscriptions import PositionSubscriptions
+
+
+class TestPositionSubscriptions:
+    """Test PositionSubscriptions dispatch."""
+
+    async def test_only_changed_key_is_dispatched(self):
+        """Subscribers should only run when their own key changes."""
+        subscriptions = PositionSubscriptions(asyncio.get_running_loop(), 0)
+        back = MagicMock()
+        legs = MagicMock()
+        subscriptions.subscribe("back", back)
+        subscriptions.subscribe("legs", legs)
+
+        subscriptions.update("back", 10.0)
+        subscriptions.update("back", 10.0)
+        subscriptions.update("legs", 5.0)
+
+        assert back.call_count == 1
+        assert legs.call_count == 1
+        assert subscriptions.stats()["unchanged_updates"] == 1
+
+    async def test_updates_coalesce_within_interval(self):
+        """A burst of updates should produce one immediate and one trailing call."""
+        subscriptions = PositionSubscriptions(asyncio.get_running_loop(), 0.05)
+        back = MagicMock()
+        subscriptions.subscribe("back", back)
+
+        for value in range(10):
+            subscriptions.update("back", float(value))
+        assert back.call_count == 1
+
+        await asyncio.sleep(0.08)
+        assert back.call_count == 2
+        assert subscriptions.stats()["coalesced"] == 8
+
+    async def test_flush_runs_pending_calls(self):
+        """Flushing should write the final value without waiting for the interval."""
+        subscriptions = PositionSubscriptions(asyncio.get_running_loop(), 10)
+        back = MagicMock()
+        subscriptions.subscribe("back", back)
+
+        subscriptions.update("back", 1.0)
+        subscriptions.update("back", 2.0)
+        assert back.call_count == 1
+
+        subscriptions.flush()
+        assert back.call_count == 2
+        subscriptions.flush()
+        assert back.call_count == 2
+
+    async def test_wildcard_receives_unchanged_updates(self):
+        """Subscribers to None should see every update."""
+        subscriptions = PositionSubscriptions(asyncio.get_running_loop(), 0)
+        massage = MagicMock()
+        subscriptions.subscribe(None, massage)
+
+        subscriptions.update("back", 10.0)
+        subscriptions.update("back", 10.0)
+
+        assert massage.call_count == 2
+
+    async def test_unsubscribe_cancels_pending_call(self):
+        """Removing a subscription should drop its trailing call."""
+        subscriptions = PositionSubscriptions(asyncio.get_running_loop(), 0.02)
+        back = MagicMock()
+        unsubscribe = subscriptions.subscribe("back", back)
+
+        subscriptions.update("back", 1.0)
+        subscriptions.update("back", 2.0)
+        unsubscribe()
+        await asyncio.sleep(0.05)
+
+        assert back.call_count == 1
+
+
+class TestCoordinatorPositionSubscriptions:
+    """Test position subscriptions on the coordinator."""
+
+    async def test_command_end_flushes_final_position(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry,
+        mock_coordinator_connected,
+        mock_bleak_client: MagicMock,
+    ):
+        """Updates held back by the rate limit should be written when a command ends."""
+        coordinator = AdjustableBedCoordinator(hass, mock_config_entry)
+        await coordinator.async_connect()
+        written: list[float] = []
+        coordinator.subscribe_position(
+            "back", lambda: written.append(coordinator.position_data["back"])
+        )
+
+        async def move(controller) -> None:
+            for value in (1.0, 2.0, 3.0):
+                coordinator._handle_position_update("back", value)
+
+        await coordinator.async_execute_controller_command(move)
+
+        assert written == [1.0, 3.0]
+        assert coordinator.position_update_stats["coalesced"] == 1
@@ -0,0 +1,427 @@
+"""Tests for deadline-based pulse scheduling."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.adjustable_bed.beds.pulse import PulseTimeline
+from custom_components.adjustable_bed.const import (
+    BED_TYPE_JIECANG,
+    CONF_BED_TYPE,
+    CONF_BURST_MODE,
+    CONF_DISABLE_ANGLE_SENSING,
+    DOMAIN,
+)
+from custom_components.adjustable_bed.coordinator import AdjustableBedCoordinator
+from custom_components.adjustable_bed.latency import LATENCY_PHASE_POSITION_READ
+
+from .conftest import TEST_ADDRESS, TEST_NAME
+
+
+class TestPulseTimeline:
+    """Test PulseTimeline scheduling and statistics."""
+
+    async def test_single_pulse_has_no_stats(self):
+        """A single write is not a pulse train and produces no stats."""
+        timeline = PulseTimeline(100)
+        timeline.fire()
+
+        assert timeline.fired == 1
+        assert timeline.stats() is None
+
+    async def test_write_latency_is_absorbed(self):
+        """Slow writes should shorten the sleep instead of stretching the period."""
+        timeline = PulseTimeline(50)
+
+        for i in range(5):
+            timeline.fire()
+            # Simulate a write that takes most of the period
+            await asyncio.sleep(0.03)
+            if i < 4:
+                await timeline.wait_next()
+
+        stats = timeline.stats()
+        assert stats is not None
+        assert stats.pulse_count == 5
+        assert stats.target_period_ms == 50
+        # Sleep-after-write would give ~80ms; the timeline should stay near 50ms
+        assert stats.achieved_period_ms < 70
+        assert stats.slipped == 0
+
+    async def test_start_anchor_puts_pulses_on_shared_lattice(self):
+        """A late first pulse should rejoin the shared lattice a full period later."""
+        with patch("custom_components.adjustable_bed.beds.pulse.time.monotonic") as now:
+            now.return_value = 10.025
+            timeline = PulseTimeline(100, start_anchor=10.0)
+            timeline.fire()
+
+            assert timeline.next_deadline() == pytest.approx(10.2)
+
+    async def test_start_anchor_never_brings_second_pulse_early(self):
+        """A first pulse late in its slot must not be followed almost immediately."""
+        with patch("custom_components.adjustable_bed.beds.pulse.time.monotonic") as now:
+            now.return_value = 10.095
+            timeline = PulseTimeline(100, start_anchor=10.0)
+            timeline.fire()
+            deadline = timeline.next_deadline()
+
+            assert deadline is not None
+            assert deadline == pytest.approx(10.2)
+            assert deadline - 10.095 >= 0.1
+
+    async def test_start_anchor_on_lattice_keeps_one_period(self):
+        """A first pulse exactly on the lattice is followed one period later."""
+        with patch("custom_components.adjustable_bed.beds.pulse.time.monotonic") as now:
+            now.return_value = 10.5
+            timeline = PulseTimeline(250, start_anchor=10.0)
+            timeline.fire()
+
+            assert timeline.next_deadline() == 10.75
+
+    async def test_start_anchor_in_future_is_ignored(self):
+        """Firing before the shared anchor anchors at the first pulse instead."""
+        with patch("custom_components.adjustable_bed.beds.pulse.time.monotonic") as now:
+            now.return_value = 9.5
+            timeline = PulseTimeline(100, start_anchor=10.0)
+            timeline.fire()
+
+            assert timeline.next_deadline() == 9.6
+
+    async def test_missed_slot_reanchors_instead_of_bursting(self):
+        """A write that overruns a whole period should not trigger catch-up pulses."""
+        timeline = PulseTimeline(20)
+
+        timeline.fire()
+        await asyncio.sleep(0.06)  # Stall for three periods
+        await timeline.wait_next()
+        timeline.fire()
+        await timeline.wait_next()
+        timeline.fire()
+
+        stats = timeline.stats()
+        assert stats is not None
+        assert stats.slipped == 1
+        # The pulse after the stall is still spaced a full period from the previous one
+        assert stats.max_jitter_ms >= 30
+
+    async def test_as_dict_rounds_values(self):
+        """Stats dict should be JSON-friendly for diagnostics."""
+        timeline = PulseTimeline(10)
+        timeline.fire()
+        await timeline.wait_next()
+        timeline.fire()
+
+        data = timeline.stats().as_dict()
+
+        assert set(data) == {
+            "pulse_count",
+            "target_period_ms",
+            "achieved_period_ms",
+            "jitter_ms",
+            "max_jitter_ms",
+            "slipped",
+            "duration_ms",
+        }
+        assert data["pulse_count"] == 2
+
+
+class TestControllerPulseStats:
+    """Test pulse statistics recorded by BedController writes."""
+
+    async def test_write_command_records_pulse_stats(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry,
+        mock_coordinator_connected,
+        mock_bleak_client: MagicMock,
+    ):
+        """Repeated writes should record stats exposed through command_timing."""
+        coordinator = AdjustableBedCoordinator(hass, mock_config_entry)
+        await coordinator.async_connect()
+        mock_bleak_client.write_gatt_char = AsyncMock()
+
+        await coordinator.controller.write_command(b"\x01", repeat_count=3, repeat_delay_ms=10)
+
+        stats = coordinator.controller.last_pulse_stats
+        assert stats is not None
+        assert stats.pulse_count == 3
+        assert mock_bleak_client.write_gatt_char.call_count == 3
+        assert coordinator.command_timing["last_pulse_train"]["pulse_count"] == 3
+
+        await coordinator.async_disconnect()
+
+    async def test_cancelled_train_still_records_stats(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry,
+        mock_coordinator_connected,
+        mock_bleak_client: MagicMock,
+    ):
+        """Stats should cover the pulses sent before cancellation."""
+        coordinator = AdjustableBedCoordinator(hass, mock_config_entry)
+        await coordinator.async_connect()
+        cancel = asyncio.Event()
+        writes = 0
+
+        async def write_then_cancel(*args, **kwargs):
+            nonlocal writes
+            writes += 1
+            if writes == 2:
+                cancel.set()
+
+        mock_bleak_client.write_gatt_char = AsyncMock(side_effect=write_then_cancel)
+
+        await coordinator.controller.write_command(
+            b"\x01", repeat_count=10, repeat_delay_ms=5, cancel_event=cancel
+        )
+
+        assert writes == 2
+        assert coordinator.controller.last_pulse_stats.pulse_count == 2
+
+        await coordinator.async_disconnect()
+
+
+class TestBurstMode:
+    """Test burst-mode pulse trains that hold the BLE channel."""
+
+    @staticmethod
+    def _burst_entry(hass: HomeAssistant, data: dict) -> MockConfigEntry:
+        """Return a config entry with burst mode and angle sensing enabled."""
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            title=TEST_NAME,
+            data={**data, CONF_BURST_MODE: True, CONF_DISABLE_ANGLE_SENSING: False},
+            unique_id=TEST_ADDRESS,
+            entry_id="test_entry_burst",
+        )
+        entry.add_to_hass(hass)
+        return entry
+
+    async def test_burst_disabled_by_default(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry,
+        mock_coordinator_connected,
+        mock_bleak_client: MagicMock,
+    ):
+        """Without the option each write takes the BLE lock on its own."""
+        coordinator = AdjustableBedCoordinator(hass, mock_config_entry)
+        await coordinator.async_connect()
+        controller = coordinator.controller
+        burst_states: list[bool] = []
+
+        async def record_write(*args, **kwargs):
+            burst_states.append(controller.burst_active)
+
+        mock_bleak_client.write_gatt_char = AsyncMock(side_effect=record_write)
+
+        await controller.write_command(b"\x01", repeat_count=3, repeat_delay_ms=10)
+
+        assert coordinator.burst_mode is False
+        assert burst_states == [False, False, False]
+
+        await coordinator.async_disconnect()
+
+    async def test_burst_holds_lock_and_reads_in_gaps(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry_data: dict,
+        mock_coordinator_connected,
+        mock_bleak_client: MagicMock,
+    ):
+        """A burst train keeps the lock between frames and interleaves position reads."""
+        coordinator = AdjustableBedCoordinator(
+            hass, self._burst_entry(hass, mock_config_entry_data)
+        )
+        await coordinator.async_connect()
+        controller = coordinator.controller
+        lock_held_between_frames: list[bool] = []
+
+        async def record_write(*args, **kwargs):
+            lock_held_between_frames.append(controller.ble_lock.locked())
+
+        mock_bleak_client.write_gatt_char = AsyncMock(side_effect=record_write)
+        mock_bleak_client.read_gatt_char = AsyncMock(return_value=b"")
+        # Reads only go into gaps once their latency has been measured
+        coordinator.record_latency(LATENCY_PHASE_POSITION_READ, 0.001)
+
+        with patch("custom_components.adjustable_bed.beds.base.BURST_GAP_READ_INTERVAL", 0.0):
+            await controller.write_command(b"\x01", repeat_count=4, repeat_delay_ms=50)
+
+        assert coordinator.burst_mode is True
+        assert all(lock_held_between_frames)
+        assert not controller.burst_active
+        assert not controller.ble_lock.locked()
+        # One scheduled read in each of the three gaps
+        assert mock_bleak_client.read_gatt_char.call_count == 3
+        assert controller.last_burst_gap_reads == 3
+        assert coordinator.command_timing["last_burst_gap_reads"] == 3
+
+        await coordinator.async_disconnect()
+
+    async def test_burst_skips_reads_that_would_not_fit(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry_data: dict,
+        mock_coordinator_connected,
+        mock_bleak_client: MagicMock,
+    ):
+        """Without a measured read latency that fits the gap, no read is started."""
+        coordinator = AdjustableBedCoordinator(
+            hass, self._burst_entry(hass, mock_config_entry_data)
+        )
+        await coordinator.async_connect()
+        controller = coordinator.controller
+        mock_bleak_client.write_gatt_char = AsyncMock()
+        mock_bleak_client.read_gatt_char = AsyncMock(return_value=b"")
+
+        with patch("custom_components.adjustable_bed.beds.base.BURST_GAP_READ_INTERVAL", 0.0):
+            # Nothing measured yet
+            await controller.write_command(b"\x01", repeat_count=3, repeat_delay_ms=50)
+            assert mock_bleak_client.read_gatt_char.call_count == 0
+
+            # Reads measured at ~200ms can't fit in a 50ms gap
+            coordinator.record_latency(LATENCY_PHASE_POSITION_READ, 0.2)
+            await controller.write_command(b"\x01", repeat_count=3, repeat_delay_ms=50)
+            assert mock_bleak_client.read_gatt_char.call_count == 0
+            assert controller.last_burst_gap_reads == 0
+
+        await coordinator.async_disconnect()
+
+    async def test_burst_lets_started_read_finish(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry_data: dict,
+        mock_coordinator_connected,
+        mock_bleak_client: MagicMock,
+    ):
+        """A read that runs past the next pulse deadline completes before the next write."""
+        coordinator = AdjustableBedCoordinator(
+            hass, self._burst_entry(hass, mock_config_entry_data)
+        )
+        await coordinator.async_connect()
+        controller = coordinator.controller
+        events: list[str] = []
+
+        async def record_write(*args, **kwargs):
+            events.append("write")
+
+        async def slow_read(*args, **kwargs):
+            events.append("read_start")
+            await asyncio.sleep(0.08)
+            events.append("read_done")
+            return b""
+
+        mock_bleak_client.write_gatt_char = AsyncMock(side_effect=record_write)
+        mock_bleak_client.read_gatt_char = AsyncMock(side_effect=slow_read)
+        coordinator.record_latency(LATENCY_PHASE_POSITION_READ, 0.001)
+
+        with patch("custom_components.adjustable_bed.beds.base.BURST_GAP_READ_INTERVAL", 0.0):
+            await controller.write_command(b"\x01", repeat_count=2, repeat_delay_ms=50)
+
+        # The read overran the 50ms gap but was not cancelled
+        assert events[0] == "write"
+        assert events[-1] == "write"
+        assert events.count("read_start") == events.count("read_done") > 0
+        assert controller.last_burst_gap_reads == 1
+
+        await coordinator.async_disconnect()
+
+    async def test_burst_checks_cancel_between_frames(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry_data: dict,
+        mock_coordinator_connected,
+        mock_bleak_client: MagicMock,
+    ):
+        """Cancelling a burst stops it at the next frame and releases the channel."""
+        coordinator = AdjustableBedCoordinator(
+            hass, self._burst_entry(hass, mock_config_entry_data)
+        )
+        await coordinator.async_connect()
+        cancel = asyncio.Event()
+        writes = 0
+
+        async def write_then_cancel(*args, **kwargs):
+            nonlocal writes
+            writes += 1
+            if writes == 2:
+                cancel.set()
+
+        mock_bleak_client.write_gatt_char = AsyncMock(side_effect=write_then_cancel)
+
+        await coordinator.controller.write_command(
+            b"\x01", repeat_count=10, repeat_delay_ms=5, cancel_event=cancel
+        )
+
+        assert writes == 2
+        assert not coordinator.controller.burst_active
+        assert not coordinator.controller.ble_lock.locked()
+
+        await coordinator.async_disconnect()
+
+    async def test_burst_covers_controller_write_loops(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry_data: dict,
+        mock_coordinator_connected,
+        mock_bleak_client: MagicMock,
+    ):
+        """Controllers with their own repeat loop hold the channel for the whole train."""
+        coordinator = AdjustableBedCoordinator(
+            hass,
+            self._burst_entry(
+                hass, {**mock_config_entry_data, CONF_BED_TYPE: BED_TYPE_JIECANG}
+            ),
+        )
+        await coordinator.async_connect()
+        controller = coordinator.controller
+        burst_states: list[bool] = []
+
+        async def record_write(*args, **kwargs):
+            burst_states.append(controller.burst_active and controller.ble_lock.locked())
+
+        mock_bleak_client.write_gatt_char = AsyncMock(side_effect=record_write)
+
+        await asyncio.wait_for(
+            controller.write_command(b"\x01", repeat_count=3, repeat_delay_ms=10), timeout=1
+        )
+
+        assert burst_states == [True, True, True]
+        assert not controller.burst_active
+        assert not controller.ble_lock.locked()
+
+        await coordinator.async_disconnect()
+
+    async def test_burst_skips_gap_reads_without_position_polling(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry_data: dict,
+        mock_coordinator_connected,
+        mock_bleak_client: MagicMock,
+    ):
+        """Controllers that don't poll positions during movement get no gap reads."""
+        coordinator = AdjustableBedCoordinator(
+            hass,
+            self._burst_entry(
+                hass, {**mock_config_entry_data, CONF_BED_TYPE: BED_TYPE_JIECANG}
+            ),
+        )
+        await coordinator.async_connect()
+        controller = coordinator.controller
+        mock_bleak_client.write_gatt_char = AsyncMock()
+        mock_bleak_client.read_gatt_char = AsyncMock(return_value=b"")
+        coordinator.record_latency(LATENCY_PHASE_POSITION_READ, 0.001)
+
+        with patch("custom_components.adjustable_bed.beds.base.BURST_GAP_READ_INTERVAL", 0.0):
+            await controller.write_command(b"\x01", repeat_count=4, repeat_delay_ms=50)
+
+        assert mock_bleak_client.read_gatt_char.call_count == 0
+        assert controller.last_burst_gap_reads == 0
+
+        await coordinator.async_disconnect()
@@ -0,0 +1,164 @@
+"""Tests for the reconnect state machine."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.adjustable_bed.coordinator import AdjustableBedCoordinator
+from custom_components.adjustable_bed.reconnect import (
+    AdapterReconnectAccounting,
+    ReconnectPolicy,
+    ReconnectState,
+)
+
+
+class TestReconnectPolicy:
+    """Test backoff and circuit breaker transitions."""
+
+    def test_backoff_grows_to_cap(self):
+        """Each failure should double the delay until the cap."""
+        policy = ReconnectPolicy(jitter=0, base_delay=5, max_delay=30, failure_threshold=10)
+        policy.connected()
+
+        delays = [policy.connection_lost()]
+        for _ in range(4):
+            policy.attempt_started()
+            delays.append(policy.attempt_failed())
+
+        assert delays == [5, 5, 10, 20, 30]
+        assert policy.state == ReconnectState.BACKOFF
+
+    def test_circuit_opens_after_threshold(self):
+        """Repeated failures should stop timed retries."""
+        policy = ReconnectPolicy(jitter=0, failure_threshold=2)
+        policy.connection_lost()
+        policy.attempt_started()
+        assert policy.attempt_failed() is not None
+        policy.attempt_started()
+
+        assert policy.attempt_failed() is None
+        assert policy.state == ReconnectState.OPEN
+        assert policy.connection_lost() is None
+
+    def test_probe_reopens_or_closes_circuit(self):
+        """A failed probe reopens the circuit; a success closes it."""
+        policy = ReconnectPolicy(jitter=0, failure_threshold=1, probe_interval=0)
+        policy.connection_lost()
+        policy.attempt_started()
+        policy.attempt_failed()
+        assert policy.should_probe()
+
+        policy.attempt_started()
+        assert policy.state == ReconnectState.PROBING
+        assert policy.attempt_failed() is None
+        assert policy.state == ReconnectState.OPEN
+
+        policy.attempt_started()
+        policy.connected()
+        stats = policy.as_dict()
+        assert stats["state"] == "connected"
+        assert stats["consecutive_failures"] == 0
+        assert stats["transitions"]["open->probing"] == 2
+        assert stats["transitions"]["probing->connected"] == 1
+
+    def test_probes_are_rate_limited(self):
+        """Advertisements shortly after a probe should not trigger another one."""
+        policy = ReconnectPolicy(failure_threshold=1, probe_interval=60)
+        policy.connection_lost()
+        policy.attempt_started()
+        policy.attempt_failed()
+        policy.attempt_started()
+        policy.attempt_failed()
+
+        assert not policy.should_probe()
+
+
+class TestAdapterReconnectAccounting:
+    """Test per-adapter accounting."""
+
+    def test_one_reconnect_per_adapter(self):
+        """A second bed must wait while the adapter is busy reconnecting."""
+        accounting = AdapterReconnectAccounting()
+
+        assert accounting.try_acquire("proxy-1")
+        assert not accounting.try_acquire("proxy-1")
+        assert accounting.try_acquire("proxy-2")
+        accounting.release("proxy-1", success=False)
+
+        assert accounting.try_acquire("proxy-1")
+        assert accounting.as_dict()["proxy-1"] == {"attempts": 2, "failures": 1, "in_flight": True}
+
+
+class TestCoordinatorReconnect:
+    """Test reconnect handling on the coordinator."""
+
+    async def test_unexpected_disconnect_schedules_backoff(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry,
+        mock_coordinator_connected,
+        mock_bleak_client: MagicMock,
+    ):
+        """An unexpected disconnect should enter backoff and be visible in history."""
+        coordinator = AdjustableBedCoordinator(hass, mock_config_entry)
+        await coordinator.async_connect()
+        assert coordinator.connection_history["reconnect"]["state"] == "connected"
+
+        coordinator._on_disconnect(mock_bleak_client)
+
+        history = coordinator.connection_history
+        assert history["reconnect"]["state"] == "backoff"
+        assert history["reconnect"]["next_delay"] is not None
+        assert coordinator._reconnect_timer is not None
+
+        await coordinator.async_disconnect()
+        assert coordinator._reconnect_timer is None
+        assert coordinator.connection_history["reconnect"]["state"] == "idle"
+
+    async def test_reconnect_without_known_adapter_skips_accounting(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry,
+        mock_coordinator_connected,
+        mock_bleak_client: MagicMock,
+    ):
+        """Beds whose adapter can't be resolved aren't accounted to a shared placeholder."""
+        coordinator = AdjustableBedCoordinator(hass, mock_config_entry)
+        coordinator._reconnect.connection_lost()
+
+        with (
+            patch(
+                "custom_components.adjustable_bed.coordinator.select_adapter",
+                AsyncMock(return_value=MagicMock(source=None)),
+            ),
+            patch.object(coordinator, "async_connect", AsyncMock(return_value=False)) as connect,
+        ):
+            await coordinator._async_auto_reconnect()
+
+        connect.assert_awaited_once()
+        assert coordinator.connection_history["adapter_reconnects"] == {}
+
+        await coordinator.async_disconnect()
+
+    async def test_reconnect_accounted_to_last_adapter(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry,
+        mock_coordinator_connected,
+        mock_bleak_client: MagicMock,
+    ):
+        """A bed that was connected before is accounted to that adapter."""
+        coordinator = AdjustableBedCoordinator(hass, mock_config_entry)
+        coordinator._connection_source = "proxy-1"
+        coordinator._reconnect.connection_lost()
+
+        with patch.object(coordinator, "async_connect", AsyncMock(return_value=False)):
+            await coordinator._async_auto_reconnect()
+
+        assert coordinator.connection_history["adapter_reconnects"] == {
+            "proxy-1": {"attempts": 1, "failures": 1, "in_flight": False}
+        }
+
+        await coordinator.async_disconnect()
@@ -0,0 +1,130 @@
+"""Tests for the compact Richmat feature table."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from custom_components.adjustable_bed import richmat_feature_table
+from custom_components.adjustable_bed.const import (
+    RICHMAT_REMOTE_AUTO,
+    RICHMAT_REMOTE_FEATURES,
+    RichmatFeatures,
+    get_richmat_features,
+)
+from custom_components.adjustable_bed.richmat_feature_table import (
+    RECORD,
+    RichmatFeatureTable,
+    build_table,
+    lookup_richmat_features,
+    render_data_module,
+)
+from custom_components.adjustable_bed.richmat_feature_table_data import (
+    RICHMAT_FEATURE_TABLE,
+)
+from custom_components.adjustable_bed.richmat_features import (
+    RICHMAT_REMOTE_FEATURES_GENERATED,
+)
+
+from .richmat_table_benchmarks import measure
+
+# Timing is only meaningful on a quiet machine, so timing checks are opt-in
+run_throughput = pytest.mark.skipif(
+    not os.environ.get("ADJUSTABLE_BED_BENCHMARK"),
+    reason="set ADJUSTABLE_BED_BENCHMARK=1 to run throughput benchmarks",
+)
+
+
+class TestRichmatFeatureTable:
+    """Test the encoded table against the generated mapping."""
+
+    def test_data_module_is_up_to_date(self):
+        """The committed table is exactly what richmat_features.py encodes to."""
+        expected = render_data_module(RICHMAT_REMOTE_FEATURES_GENERATED)
+        assert Path(richmat_feature_table.DATA_MODULE_FILE).read_text() == expected
+
+    def test_every_code_round_trips(self):
+        """Every generated code returns the same flags as the dict."""
+        table = RichmatFeatureTable(RICHMAT_FEATURE_TABLE)
+
+        assert len(table) == len(RICHMAT_REMOTE_FEATURES_GENERATED)
+        assert dict(table) == RICHMAT_REMOTE_FEATURES_GENERATED
+        for code, features in RICHMAT_REMOTE_FEATURES_GENERATED.items():
+            assert table.lookup(code) == features
+            assert table.lookup(code.upper()) == features
+
+    def test_records_sorted(self):
+        """Binary search relies on strictly increasing codes."""
+        codes = [code for code, _ in RECORD.iter_unpack(RICHMAT_FEATURE_TABLE)]
+        assert codes == sorted(set(codes))
+
+    @pytest.mark.parametrize("code", ["", "a0r", "a0rmx", "zzzz", "00aa", "a0ré"])
+    def test_unknown_codes(self, code: str):
+        """Unknown and malformed codes return None."""
+        assert lookup_richmat_features(code) is None
+
+    def test_lookup_edges(self):
+        """The first and last records are found."""
+        table = RichmatFeatureTable(build_table({"aaaa": 1, "mmmm": 2, "zzzz": 3}))
+
+        assert table.lookup("AAAA") == RichmatFeatures(1)
+        assert table.lookup("zzzz") == RichmatFeatures(3)
+        assert table.lookup("bbbb") is None
+
+    def test_build_rejects_bad_codes(self):
+        """Codes must fit a record and stay unique."""
+        with pytest.raises(ValueError):
+            build_table({"abc": 1})
+        with pytest.raises(ValueError):
+            build_table({'ab"c': 1})
+        with pytest.raises(ValueError):
+            build_table({"abcd": 1, "ABCD": 2})
+
+    def test_truncated_table_rejected(self):
+        """A partial record means a corrupt table."""
+        with pytest.raises(ValueError):
+            RichmatFeatureTable(RICHMAT_FEATURE_TABLE[:-1])
+
+
+class TestGetRichmatFeatures:
+    """get_richmat_features returns the same values as the dict lookup did."""
+
+    def test_matches_dict_lookup(self):
+        """Manual overrides win, then generated codes, then all features."""
+        auto = RICHMAT_REMOTE_FEATURES[RICHMAT_REMOTE_AUTO]
+        codes = [*RICHMAT_REMOTE_FEATURES_GENERATED, *RICHMAT_REMOTE_FEATURES, "nope", ""]
+        for code in codes:
+            for variant in (code, code.upper()):
+                if not variant or variant.lower() == "auto":
+                    expected = auto
+                elif variant.upper() in RICHMAT_REMOTE_FEATURES:
+                    expected = RICHMAT_REMOTE_FEATURES[variant.upper()]
+                else:
+                    expected = RICHMAT_REMOTE_FEATURES_GENERATED.get(variant.lower(), auto)
+                assert get_richmat_features(variant) == expected, variant
+
+
+class TestImportCost:
+    """The table is cheaper to load than the generated dict."""
+
+    def test_lookup_does_not_import_generated_dict(self):
+        """Looking up a code leaves richmat_features.py unimported."""
+        cost = measure("compact_table", runs=1)
+
+        assert "custom_components.adjustable_bed.richmat_features" not in cost.modules
+
+    def test_table_allocates_less_than_dict(self):
+        """The table keeps far less memory alive than the dict."""
+        table = measure("compact_table", runs=1)
+        generated = measure("generated_dict", runs=1)
+
+        assert table.allocated_bytes * 4 < generated.allocated_bytes
+
+    @pytest.mark.benchmark
+    @run_throughput
+    @pytest.mark.xdist_group("benchmark")
+    def test_table_imports_faster_than_dict(self):
+        """Loading the table takes less time than importing the dict."""
+        assert measure("compact_table").seconds < measure("generated_dict").seconds
@@ -0,0 +1,88 @@
+"""Tests for the post-connect setup pipeline."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from custom_components.adjustable_bed.setup_pipeline import SetupStep, async_run_setup_steps
+
+
+class TestSetupPipeline:
+    """Test dependency ordering and concurrency of setup steps."""
+
+    async def test_dependencies_are_respected(self):
+        """A step should start only after the steps it depends on finished."""
+        order: list[str] = []
+
+        def step(name: str, *after: str) -> SetupStep:
+            async def run() -> None:
+                order.append(f"{name}:start")
+                await asyncio.sleep(0)
+                order.append(f"{name}:end")
+
+            return SetupStep(name, run, after=after)
+
+        await async_run_setup_steps(
+            [step("pin", "notify"), step("notify"), step("device_info"), step("config", "pin")]
+        )
+
+        assert order.index("notify:end") < order.index("pin:start")
+        assert order.index("pin:end") < order.index("config:start")
+        # Independent steps overlap
+        assert order.index("device_info:start") < order.index("notify:end")
+
+    async def test_concurrency_is_bounded(self):
+        """No more steps than the limit should run at once."""
+        running = 0
+        peak = 0
+
+        async def run() -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        durations: dict[str, float] = {}
+        await async_run_setup_steps(
+            [SetupStep(f"step_{index}", run) for index in range(5)],
+            concurrency=2,
+            on_step_done=lambda step, elapsed: durations.__setitem__(step.name, elapsed),
+        )
+
+        assert peak == 2
+        assert len(durations) == 5
+
+    async def test_failure_cancels_remaining_steps(self):
+        """The first failure should propagate unchanged and cancel the other steps."""
+        cancelled = asyncio.Event()
+
+        async def fail() -> None:
+            raise TimeoutError
+
+        async def slow() -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(TimeoutError):
+            await async_run_setup_steps([SetupStep("slow", slow), SetupStep("fail", fail)])
+
+        assert cancelled.is_set()
+
+    async def test_invalid_graph_is_rejected(self):
+        """Unknown dependencies and cycles should raise before anything runs."""
+
+        async def run() -> None:
+            raise AssertionError("should not run")
+
+        with pytest.raises(ValueError):
+            await async_run_setup_steps([SetupStep("a", run, after=("missing",))])
+        with pytest.raises(ValueError):
+            await async_run_setup_steps(
+                [SetupStep("a", run, after=("b",)), SetupStep("b", run, after=("a",))]
+            )
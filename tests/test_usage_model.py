@@ -0,0 +1,138 @@
+"""Tests for the learned usage model and adaptive connection policy."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.adjustable_bed.coordinator import AdjustableBedCoordinator
+from custom_components.adjustable_bed.latency import (
+    LATENCY_PHASE_FIRST_COMMAND_COLD,
+    LATENCY_PHASE_FIRST_COMMAND_WARM,
+)
+from custom_components.adjustable_bed.usage_model import (
+    ADAPTIVE_IDLE_MAX_SECONDS,
+    ADAPTIVE_IDLE_MIN_SECONDS,
+    UsageModel,
+)
+
+
+def _train_evenings(model: UsageModel, days: int = 5) -> datetime:
+    """Use the bed around 22:00 every day with commands 40s apart."""
+    start = datetime(2024, 1, 1, 22, 0)
+    for day in range(days):
+        session = start + timedelta(days=day)
+        for command in range(5):
+            model.observe(session + timedelta(seconds=40 * command))
+    return start + timedelta(days=days)
+
+
+class TestUsageModel:
+    """Test the usage model."""
+
+    def test_untrained_model_keeps_base_timeout(self):
+        """Nothing is adapted until enough commands were seen."""
+        model = UsageModel()
+        model.observe(datetime(2024, 1, 1, 22, 0))
+
+        assert model.idle_timeout(datetime(2024, 1, 1, 22, 1), 40) == 40
+        assert model.next_likely_use(datetime(2024, 1, 1, 12, 0)) is None
+
+    def test_stretches_timeout_in_likely_use_window(self):
+        """In a usual use window the timeout should cover the usual command gap."""
+        model = UsageModel()
+        day = _train_evenings(model)
+
+        timeout = model.idle_timeout(day.replace(hour=22, minute=10), 30)
+
+        assert timeout == 50  # 40s gap plus margin
+        assert timeout <= ADAPTIVE_IDLE_MAX_SECONDS
+
+    def test_shortens_timeout_outside_likely_use(self):
+        """Away from usual use the link should be released sooner."""
+        model = UsageModel()
+        day = _train_evenings(model)
+
+        assert model.idle_timeout(day.replace(hour=3), 120) == 50
+        assert model.idle_timeout(day.replace(hour=3), 5) == ADAPTIVE_IDLE_MIN_SECONDS
+
+    def test_predicts_next_window(self):
+        """The next likely-use window starts at the learned time of day."""
+        model = UsageModel()
+        day = _train_evenings(model)
+
+        next_use = model.next_likely_use(day.replace(hour=12))
+
+        assert next_use is not None
+        assert (next_use.hour, next_use.minute) == (22, 0)
+        assert model.is_likely_use(next_use)
+
+    def test_round_trips_through_storage_dict(self):
+        """Stored state should restore the same predictions."""
+        model = UsageModel()
+        day = _train_evenings(model)
+
+        restored = UsageModel.from_dict(model.as_dict())
+
+        assert restored.stats() == model.stats()
+        assert restored.next_likely_use(day.replace(hour=12)) == model.next_likely_use(
+            day.replace(hour=12)
+        )
+
+
+class TestAdaptiveConnection:
+    """Test usage tracking on the coordinator."""
+
+    async def test_first_command_latency_split_warm_and_cold(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry,
+        mock_coordinator_connected,
+        mock_bleak_client: MagicMock,
+    ):
+        """Only the first command of a session should be recorded, as warm or cold."""
+        coordinator = AdjustableBedCoordinator(hass, mock_config_entry)
+        await coordinator.async_connect()
+
+        await coordinator.async_write_command(b"\x01")
+        await coordinator.async_write_command(b"\x02")
+
+        phases = coordinator.latency_stats["phases"]
+        assert phases[LATENCY_PHASE_FIRST_COMMAND_WARM]["count"] == 1
+        assert phases[LATENCY_PHASE_FIRST_COMMAND_COLD]["count"] == 0
+
+    async def test_connect_ahead_of_command_counts_as_cold(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry,
+        mock_coordinator_connected,
+        mock_bleak_client: MagicMock,
+    ):
+        """A bed group connecting before the command still records a cold first command."""
+        coordinator = AdjustableBedCoordinator(hass, mock_config_entry)
+
+        assert await coordinator.async_prepare_command()
+        await coordinator.async_write_command(b"\x01")
+
+        phases = coordinator.latency_stats["phases"]
+        assert phases[LATENCY_PHASE_FIRST_COMMAND_COLD]["count"] == 1
+        assert phases[LATENCY_PHASE_FIRST_COMMAND_WARM]["count"] == 0
+
+    async def test_policy_reported_in_command_timing(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry,
+        mock_coordinator_connected,
+        mock_bleak_client: MagicMock,
+    ):
+        """The connection policy should be part of the diagnostics."""
+        coordinator = AdjustableBedCoordinator(hass, mock_config_entry)
+        await coordinator.async_connect()
+
+        policy = coordinator.command_timing["connection_policy"]
+
+        assert policy["adaptive"] is False
+        assert policy["current_idle_timeout"] == policy["configured_idle_timeout"]
+        assert policy["usage"] is None